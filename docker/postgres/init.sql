@@ -85,18 +85,71 @@ CREATE INDEX IF NOT EXISTS idx_streams_status ON streams(status);
 CREATE TABLE IF NOT EXISTS recordings (
     id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
     stream_id UUID NOT NULL,
+    camera_id UUID,
+    tenant_id UUID,
     retention_days INTEGER NOT NULL,
     status VARCHAR(20) DEFAULT 'RECORDING' CHECK (status IN ('RECORDING', 'COMPLETED', 'FAILED')),
     started_at TIMESTAMP DEFAULT NOW(),
     stopped_at TIMESTAMP,
     storage_path VARCHAR(500),
     file_size_mb DECIMAL(10,2) DEFAULT 0,
-    duration_seconds INTEGER DEFAULT 0
+    duration_seconds INTEGER DEFAULT 0,
+    incident BOOLEAN NOT NULL DEFAULT false,
+    legal_hold BOOLEAN NOT NULL DEFAULT false,
+    deleted_at TIMESTAMP,
+    deleted_by VARCHAR(100),
+    expires_at TIMESTAMP GENERATED ALWAYS AS (stopped_at + retention_days * INTERVAL '1 day') STORED
 );
 
-CREATE INDEX IF NOT EXISTS idx_recordings_stream ON recordings(stream_id);
 CREATE INDEX IF NOT EXISTS idx_recordings_stopped_at ON recordings(stopped_at);
+-- Keyset scan of expired recordings in expiry order
+CREATE INDEX IF NOT EXISTS idx_recordings_expiry ON recordings(expires_at, id)
+    WHERE deleted_at IS NULL AND NOT incident AND NOT legal_hold;
+-- Per-tenant next expiry for the retention scheduler
+CREATE INDEX IF NOT EXISTS idx_recordings_tenant_expiry ON recordings(tenant_id, expires_at)
+    WHERE deleted_at IS NULL AND NOT incident AND NOT legal_hold;
+-- Recordings on hold, whose segments belong under legal-hold/
+CREATE INDEX IF NOT EXISTS idx_recordings_held ON recordings(id)
+    WHERE deleted_at IS NULL AND (incident OR legal_hold);
+
+-- Every recording of the tenant expiring at or before expired_through has been handled
+CREATE TABLE IF NOT EXISTS retention_watermarks (
+    tenant_id UUID PRIMARY KEY,
+    expired_through TIMESTAMP NOT NULL,
+    updated_at TIMESTAMP NOT NULL DEFAULT NOW()
+);
 CREATE INDEX IF NOT EXISTS idx_recordings_status ON recordings(status);
+-- Keyset search: (filter, started_at DESC, id DESC)
+CREATE INDEX IF NOT EXISTS idx_recordings_started ON recordings(started_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_recordings_stream_started ON recordings(stream_id, started_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_recordings_camera_started ON recordings(camera_id, started_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_recordings_tenant_started ON recordings(tenant_id, started_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_recordings_status_started ON recordings(status, started_at DESC, id DESC);
+
+-- Recording segments table (one row per finished segment file)
+CREATE TABLE IF NOT EXISTS recording_segments (
+    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    stream_id UUID NOT NULL,
+    recording_id UUID NOT NULL,
+    camera_id UUID,
+    start_time TIMESTAMP NOT NULL,
+    end_time TIMESTAMP NOT NULL,
+    storage_path VARCHAR(500) NOT NULL UNIQUE,
+    size_bytes BIGINT DEFAULT 0,
+    created_at TIMESTAMP DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_segments_stream_start ON recording_segments(stream_id, start_time);
+CREATE INDEX IF NOT EXISTS idx_segments_camera_start ON recording_segments(camera_id, start_time);
+CREATE INDEX IF NOT EXISTS idx_segments_recording ON recording_segments(recording_id);
+-- Lifecycle layout: segments not yet under retention-<days>d/ or legal-hold/, those under legal-hold/,
+-- and arranged ones by start (per-segment expiry)
+CREATE INDEX IF NOT EXISTS idx_segments_unarranged ON recording_segments(id)
+    WHERE storage_path NOT LIKE 'retention-%' AND storage_path NOT LIKE 'legal-hold/%';
+CREATE INDEX IF NOT EXISTS idx_segments_legal_hold ON recording_segments(id)
+    WHERE storage_path LIKE 'legal-hold/%';
+CREATE INDEX IF NOT EXISTS idx_segments_managed_start ON recording_segments(start_time)
+    WHERE storage_path LIKE 'retention-%';
 
 -- Clips table
 CREATE TABLE IF NOT EXISTS clips (
@@ -113,6 +166,57 @@ CREATE TABLE IF NOT EXISTS clips (
 CREATE INDEX IF NOT EXISTS idx_clips_recording ON clips(recording_id);
 CREATE INDEX IF NOT EXISTS idx_clips_status ON clips(status);
 
+-- Clip export jobs (durable queue with priority lanes and deduplication)
+CREATE TABLE IF NOT EXISTS clip_jobs (
+    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    tenant_id VARCHAR(100) NOT NULL,
+    camera_id UUID NOT NULL,
+    start_time TIMESTAMP NOT NULL,
+    end_time TIMESTAMP NOT NULL,
+    reason VARCHAR(20) NOT NULL,
+    faststart BOOLEAN NOT NULL DEFAULT FALSE,
+    priority SMALLINT NOT NULL,
+    dedup_key VARCHAR(64) NOT NULL,
+    status VARCHAR(20) NOT NULL DEFAULT 'QUEUED' CHECK (status IN ('QUEUED', 'RUNNING', 'COMPLETED', 'FAILED')),
+    progress REAL NOT NULL DEFAULT 0,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    available_at TIMESTAMP NOT NULL DEFAULT NOW(),
+    lease_expires_at TIMESTAMP,
+    storage_bucket VARCHAR(100),
+    storage_key VARCHAR(500),
+    size_bytes BIGINT,
+    error TEXT,
+    created_at TIMESTAMP NOT NULL DEFAULT NOW(),
+    updated_at TIMESTAMP NOT NULL DEFAULT NOW(),
+    finished_at TIMESTAMP
+);
+
+-- One live job per identical request; failed jobs can be requested again
+CREATE UNIQUE INDEX IF NOT EXISTS idx_clip_jobs_dedup ON clip_jobs(dedup_key)
+    WHERE status IN ('QUEUED', 'RUNNING', 'COMPLETED');
+CREATE INDEX IF NOT EXISTS idx_clip_jobs_claim ON clip_jobs(priority, created_at)
+    WHERE status = 'QUEUED';
+CREATE INDEX IF NOT EXISTS idx_clip_jobs_lease ON clip_jobs(lease_expires_at)
+    WHERE status = 'RUNNING';
+
+-- Content-addressed clip cache (per-tenant LRU under a size budget)
+CREATE TABLE IF NOT EXISTS clip_cache (
+    cache_key VARCHAR(64) PRIMARY KEY,
+    tenant_id VARCHAR(100) NOT NULL,
+    camera_id UUID NOT NULL,
+    start_time TIMESTAMP NOT NULL,
+    end_time TIMESTAMP NOT NULL,
+    codec VARCHAR(50) NOT NULL,
+    storage_bucket VARCHAR(100) NOT NULL,
+    storage_key VARCHAR(500) NOT NULL,
+    size_bytes BIGINT NOT NULL,
+    created_at TIMESTAMP NOT NULL DEFAULT NOW(),
+    last_accessed_at TIMESTAMP NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_clip_cache_range ON clip_cache(tenant_id, camera_id, codec, start_time);
+CREATE INDEX IF NOT EXISTS idx_clip_cache_lru ON clip_cache(tenant_id, last_accessed_at);
+
 -- Mosaics table
 CREATE TABLE IF NOT EXISTS mosaics (
     id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
@@ -146,6 +250,23 @@ CREATE INDEX IF NOT EXISTS idx_lpr_camera ON lpr_events(camera_id);
 CREATE INDEX IF NOT EXISTS idx_lpr_city ON lpr_events(city_id);
 CREATE INDEX IF NOT EXISTS idx_lpr_detected_at ON lpr_events(detected_at);
 
+-- ============================================
+-- AUDIT
+-- ============================================
+
+-- Audit trail (retention deletions, LGPD actions)
+CREATE TABLE IF NOT EXISTS audit_logs (
+    id BIGSERIAL PRIMARY KEY,
+    tenant_id UUID,
+    action VARCHAR(100) NOT NULL,
+    resource_type VARCHAR(50) NOT NULL,
+    resource_id UUID,
+    metadata JSONB,
+    created_at TIMESTAMP NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_audit_logs_tenant_action ON audit_logs(tenant_id, action, created_at DESC);
+
 -- ============================================
 -- SEED DATA (Development)
 -- ============================================
@@ -0,0 +1,30 @@
+-- Recording search: camera/tenant filters and keyset pagination indexes.
+-- init.sql only runs on a fresh volume; apply this to existing databases:
+--   psql "$DATABASE_URL" -f docker/postgres/migrations/001_recording_search.sql
+
+ALTER TABLE recordings ADD COLUMN IF NOT EXISTS camera_id UUID;
+ALTER TABLE recordings ADD COLUMN IF NOT EXISTS tenant_id UUID;
+
+UPDATE recordings r
+SET camera_id = s.camera_id
+FROM streams s
+WHERE r.stream_id = s.id AND r.camera_id IS NULL;
+
+UPDATE recordings r
+SET tenant_id = c.cidade_id
+FROM cameras c
+WHERE r.camera_id = c.id AND r.tenant_id IS NULL;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_recordings_started
+    ON recordings(started_at DESC, id DESC);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_recordings_stream_started
+    ON recordings(stream_id, started_at DESC, id DESC);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_recordings_camera_started
+    ON recordings(camera_id, started_at DESC, id DESC);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_recordings_tenant_started
+    ON recordings(tenant_id, started_at DESC, id DESC);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_recordings_status_started
+    ON recordings(status, started_at DESC, id DESC);
+
+-- Superseded by idx_recordings_stream_started (same leading column)
+DROP INDEX CONCURRENTLY IF EXISTS idx_recordings_stream;
@@ -0,0 +1,36 @@
+-- Clip job queue.
+-- init.sql only runs on a fresh volume; apply this to existing databases:
+--   psql "$DATABASE_URL" -f docker/postgres/migrations/002_clip_jobs.sql
+
+-- Clip export jobs (durable queue with priority lanes and deduplication)
+CREATE TABLE IF NOT EXISTS clip_jobs (
+    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    tenant_id VARCHAR(100) NOT NULL,
+    camera_id UUID NOT NULL,
+    start_time TIMESTAMP NOT NULL,
+    end_time TIMESTAMP NOT NULL,
+    reason VARCHAR(20) NOT NULL,
+    faststart BOOLEAN NOT NULL DEFAULT FALSE,
+    priority SMALLINT NOT NULL,
+    dedup_key VARCHAR(64) NOT NULL,
+    status VARCHAR(20) NOT NULL DEFAULT 'QUEUED' CHECK (status IN ('QUEUED', 'RUNNING', 'COMPLETED', 'FAILED')),
+    progress REAL NOT NULL DEFAULT 0,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    available_at TIMESTAMP NOT NULL DEFAULT NOW(),
+    lease_expires_at TIMESTAMP,
+    storage_bucket VARCHAR(100),
+    storage_key VARCHAR(500),
+    size_bytes BIGINT,
+    error TEXT,
+    created_at TIMESTAMP NOT NULL DEFAULT NOW(),
+    updated_at TIMESTAMP NOT NULL DEFAULT NOW(),
+    finished_at TIMESTAMP
+);
+
+-- One live job per identical request; failed jobs can be requested again
+CREATE UNIQUE INDEX IF NOT EXISTS idx_clip_jobs_dedup ON clip_jobs(dedup_key)
+    WHERE status IN ('QUEUED', 'RUNNING', 'COMPLETED');
+CREATE INDEX IF NOT EXISTS idx_clip_jobs_claim ON clip_jobs(priority, created_at)
+    WHERE status = 'QUEUED';
+CREATE INDEX IF NOT EXISTS idx_clip_jobs_lease ON clip_jobs(lease_expires_at)
+    WHERE status = 'RUNNING';
@@ -0,0 +1,21 @@
+-- Clip cache index.
+-- init.sql only runs on a fresh volume; apply this to existing databases:
+--   psql "$DATABASE_URL" -f docker/postgres/migrations/003_clip_cache.sql
+
+-- Content-addressed clip cache (per-tenant LRU under a size budget)
+CREATE TABLE IF NOT EXISTS clip_cache (
+    cache_key VARCHAR(64) PRIMARY KEY,
+    tenant_id VARCHAR(100) NOT NULL,
+    camera_id UUID NOT NULL,
+    start_time TIMESTAMP NOT NULL,
+    end_time TIMESTAMP NOT NULL,
+    codec VARCHAR(50) NOT NULL,
+    storage_bucket VARCHAR(100) NOT NULL,
+    storage_key VARCHAR(500) NOT NULL,
+    size_bytes BIGINT NOT NULL,
+    created_at TIMESTAMP NOT NULL DEFAULT NOW(),
+    last_accessed_at TIMESTAMP NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_clip_cache_range ON clip_cache(tenant_id, camera_id, codec, start_time);
+CREATE INDEX IF NOT EXISTS idx_clip_cache_lru ON clip_cache(tenant_id, last_accessed_at);
@@ -0,0 +1,28 @@
+-- Retention cleanup.
+-- init.sql only runs on a fresh volume; apply this to existing databases:
+--   psql "$DATABASE_URL" -f docker/postgres/migrations/004_retention.sql
+
+-- Recordings under incident or legal hold are never expired; deleted ones are kept as tombstones
+ALTER TABLE recordings ADD COLUMN IF NOT EXISTS incident BOOLEAN NOT NULL DEFAULT false;
+ALTER TABLE recordings ADD COLUMN IF NOT EXISTS legal_hold BOOLEAN NOT NULL DEFAULT false;
+ALTER TABLE recordings ADD COLUMN IF NOT EXISTS deleted_at TIMESTAMP;
+ALTER TABLE recordings ADD COLUMN IF NOT EXISTS deleted_by VARCHAR(100);
+ALTER TABLE recordings ADD COLUMN IF NOT EXISTS expires_at TIMESTAMP
+    GENERATED ALWAYS AS (stopped_at + retention_days * INTERVAL '1 day') STORED;
+
+-- Keyset scan of expired recordings in expiry order
+CREATE INDEX IF NOT EXISTS idx_recordings_expiry ON recordings(expires_at, id)
+    WHERE deleted_at IS NULL AND NOT incident AND NOT legal_hold;
+
+-- Audit trail (retention deletions, LGPD actions)
+CREATE TABLE IF NOT EXISTS audit_logs (
+    id BIGSERIAL PRIMARY KEY,
+    tenant_id UUID,
+    action VARCHAR(100) NOT NULL,
+    resource_type VARCHAR(50) NOT NULL,
+    resource_id UUID,
+    metadata JSONB,
+    created_at TIMESTAMP NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_audit_logs_tenant_action ON audit_logs(tenant_id, action, created_at DESC);
@@ -0,0 +1,14 @@
+-- Retention scheduler watermarks.
+-- init.sql only runs on a fresh volume; apply this to existing databases:
+--   psql "$DATABASE_URL" -f docker/postgres/migrations/005_retention_watermarks.sql
+
+-- Per-tenant next expiry for the retention scheduler
+CREATE INDEX IF NOT EXISTS idx_recordings_tenant_expiry ON recordings(tenant_id, expires_at)
+    WHERE deleted_at IS NULL AND NOT incident AND NOT legal_hold;
+
+-- Every recording of the tenant expiring at or before expired_through has been handled
+CREATE TABLE IF NOT EXISTS retention_watermarks (
+    tenant_id UUID PRIMARY KEY,
+    expired_through TIMESTAMP NOT NULL,
+    updated_at TIMESTAMP NOT NULL DEFAULT NOW()
+);
@@ -0,0 +1,16 @@
+-- Recording lifecycle layout.
+-- init.sql only runs on a fresh volume; apply this to existing databases:
+--   psql "$DATABASE_URL" -f docker/postgres/migrations/006_recording_lifecycle.sql
+
+-- Segments not yet moved under a retention class (retention-<days>d/) or legal-hold/ prefix
+CREATE INDEX IF NOT EXISTS idx_segments_unarranged ON recording_segments(id)
+    WHERE storage_path NOT LIKE 'retention-%' AND storage_path NOT LIKE 'legal-hold/%';
+-- Segments under legal-hold/, to move back once the hold is released
+CREATE INDEX IF NOT EXISTS idx_segments_legal_hold ON recording_segments(id)
+    WHERE storage_path LIKE 'legal-hold/%';
+-- Arranged segments by start, to drop the rows of those past their retention class
+CREATE INDEX IF NOT EXISTS idx_segments_managed_start ON recording_segments(start_time)
+    WHERE storage_path LIKE 'retention-%';
+-- Recordings on hold, whose segments belong under legal-hold/
+CREATE INDEX IF NOT EXISTS idx_recordings_held ON recordings(id)
+    WHERE deleted_at IS NULL AND (incident OR legal_hold);
@@ -0,0 +1,67 @@
+"""Benchmark single-row save() against save_many() for recordings.
+
+Requires a PostgreSQL instance with docker/postgres/init.sql applied
+(DB_HOST, DB_PORT, DB_NAME, DB_USER, DB_PASSWORD) and the same import paths
+as the PostgreSQL integration tests. Inserted rows are removed at the end.
+
+    python scripts/benchmark_batch_writes.py --rows 5000 --batch-sizes 100 500 1000 5000
+"""
+import argparse
+import asyncio
+import time
+from uuid import uuid4
+
+from streaming.domain.entities.recording import Recording
+from streaming.domain.value_objects.retention_policy import RetentionPolicy
+from streaming.infrastructure.persistence.recording_repository_postgresql import RecordingRepositoryPostgreSQL
+from shared_kernel.infrastructure.persistence.connection import get_postgres_connection_string
+
+
+def make_recordings(count: int):
+    stream_id = uuid4()
+    return [
+        Recording(id=uuid4(), stream_id=stream_id, retention_policy=RetentionPolicy(7))
+        for _ in range(count)
+    ]
+
+
+async def timed(label: str, rows: int, coro):
+    start = time.perf_counter()
+    await coro
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} {rows:>8} rows  {elapsed:>8.2f}s  {rows / elapsed:>10.0f} rows/s")
+
+
+async def run(rows: int, batch_sizes):
+    repository = RecordingRepositoryPostgreSQL(get_postgres_connection_string())
+    created = []
+    try:
+        recordings = make_recordings(rows)
+        created.extend(recordings)
+
+        async def single_row():
+            for recording in recordings:
+                await repository.save(recording)
+
+        await timed("save() x N", rows, single_row())
+
+        for batch_size in batch_sizes:
+            recordings = make_recordings(rows)
+            created.extend(recordings)
+            await timed(f"save_many(batch={batch_size})", rows, repository.save_many(recordings, batch_size))
+
+        await timed("delete_many()", len(created), repository.delete_many([r.id for r in created]))
+    finally:
+        await repository.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[100, 1000, 5000])
+    args = parser.parse_args()
+    asyncio.run(run(args.rows, args.batch_sizes))
+
+
+if __name__ == "__main__":
+    main()
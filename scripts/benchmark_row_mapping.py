@@ -0,0 +1,81 @@
+"""Micro-benchmark of recording row hydration throughput.
+
+Compares the per-row `Recording(...)` constructor path the repositories used
+before the row mapper with RecordingRowMapper.to_entity (cached value objects,
+slot-based hydration) and to_read_model. Needs no database.
+
+    python scripts/benchmark_row_mapping.py --rows 100000
+"""
+import argparse
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+from uuid import uuid4
+
+from streaming.domain.entities.recording import Recording
+from streaming.domain.value_objects.recording_status import RecordingStatus
+from streaming.domain.value_objects.retention_policy import RetentionPolicy
+from streaming.infrastructure.persistence.recording_row_mapper import RecordingRowMapper
+
+
+def make_rows(count: int):
+    start = datetime(2025, 1, 1)
+    return [
+        {
+            "id": uuid4(),
+            "stream_id": uuid4(),
+            "camera_id": uuid4(),
+            "tenant_id": None,
+            "retention_days": (7, 15, 30)[i % 3],
+            "status": "STOPPED",
+            "started_at": start + timedelta(minutes=i),
+            "stopped_at": start + timedelta(minutes=i + 1),
+            "storage_path": f"/recordings/{i}.mp4",
+            "file_size_mb": Decimal("12.50"),
+            "duration_seconds": 60
+        }
+        for i in range(count)
+    ]
+
+
+def constructor_path(row) -> Recording:
+    return Recording(
+        id=row['id'],
+        stream_id=row['stream_id'],
+        retention_policy=RetentionPolicy(row['retention_days']),
+        status=RecordingStatus(row['status']),
+        started_at=row['started_at'],
+        stopped_at=row['stopped_at'],
+        storage_path=row['storage_path'],
+        file_size_mb=float(row['file_size_mb']) if row['file_size_mb'] else 0.0,
+        duration_seconds=row['duration_seconds'] or 0,
+        camera_id=row['camera_id'],
+        tenant_id=row['tenant_id']
+    )
+
+
+def measure(label: str, rows, fn, repeat: int):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for row in rows:
+            fn(row)
+        best = min(best, time.perf_counter() - start)
+    print(f"{label:<32} {len(rows) / best:>12,.0f} rows/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    mapper = RecordingRowMapper()
+    measure("Recording(...) per row", rows, constructor_path, args.repeat)
+    measure("RecordingRowMapper.to_entity", rows, mapper.to_entity, args.repeat)
+    measure("RecordingRowMapper.to_read_model", rows, mapper.to_read_model, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,15 @@
 """Create Camera Use Case."""
+from typing import Optional
+from uuid import uuid4
+
 from src.modules.cidades.application.dtos.camera_response_dto import CameraResponseDTO
 from src.modules.cidades.application.dtos.create_camera_dto import CreateCameraDTO
 from src.modules.cidades.domain.entities.camera import Camera
+from src.modules.cidades.domain.repositories.camera_repository import CameraRepository
 from src.modules.cidades.domain.repositories.cidade_repository import ICidadeRepository
 from src.modules.cidades.domain.value_objects.status_camera import StatusCamera
 from src.modules.cidades.domain.value_objects.url_camera import URLCamera
+from src.shared.application.event_bus import EventBus
 from src.shared.application.use_case import UseCase
 from src.shared.domain.domain_exception import EntityNotFoundException
 
@@ -12,9 +17,16 @@ from src.shared.domain.domain_exception import EntityNotFoundException
 class CreateCameraUseCase(UseCase[CreateCameraDTO, CameraResponseDTO]):
     """Use case for creating camera."""
 
-    def __init__(self, cidade_repository: ICidadeRepository) -> None:
+    def __init__(
+        self,
+        cidade_repository: ICidadeRepository,
+        camera_repository: CameraRepository,
+        event_bus: Optional[EventBus] = None,
+    ) -> None:
         """Initialize use case."""
         self.cidade_repository = cidade_repository
+        self.camera_repository = camera_repository
+        self.event_bus = event_bus
 
     async def execute(self, input_dto: CreateCameraDTO) -> CameraResponseDTO:
         """Execute use case."""
@@ -24,6 +36,7 @@ class CreateCameraUseCase(UseCase[CreateCameraDTO, CameraResponseDTO]):
 
         url = URLCamera(input_dto.url)
         camera = Camera(
+            id=uuid4(),
             nome=input_dto.nome,
             localizacao=input_dto.localizacao,
             url=url,
@@ -32,8 +45,14 @@ class CreateCameraUseCase(UseCase[CreateCameraDTO, CameraResponseDTO]):
         )
 
         cidade.add_camera(camera)
+        await self.camera_repository.save(camera)
         await self.cidade_repository.save(cidade)
 
+        if self.event_bus:
+            for event in cidade.domain_events:
+                await self.event_bus.publish(event)
+        cidade.clear_domain_events()
+
         return CameraResponseDTO(
             id=camera.id,
             nome=camera.nome,
@@ -5,6 +5,8 @@ from uuid import UUID
 from src.modules.cidades.domain.entities.camera import Camera
 from src.modules.cidades.domain.entities.plano import Plano
 from src.modules.cidades.domain.entities.usuario_cidade import TipoUsuarioCidade, UsuarioCidade
+from src.modules.cidades.domain.events.camera_removida import CameraRemovida
+from src.modules.cidades.domain.events.camera_salva import CameraSalva
 from src.modules.cidades.domain.events.cidade_criada import CidadeCriada
 from src.modules.cidades.domain.events.plano_atribuido import PlanoAtribuido
 from src.modules.cidades.domain.value_objects.cnpj import CNPJ
@@ -101,12 +103,14 @@ class Cidade(AggregateRoot):
             )
         self.cameras.append(camera)
         self._touch()
+        self.add_domain_event(CameraSalva(camera.id, self.id))
 
     def remove_camera(self, camera: Camera) -> None:
         """Remove camera from cidade."""
         if camera in self.cameras:
             self.cameras.remove(camera)
             self._touch()
+            self.add_domain_event(CameraRemovida(camera.id, self.id))
 
     def count_cameras(self) -> int:
         """Count cameras."""
@@ -0,0 +1,14 @@
+"""CameraSalva domain event."""
+from uuid import UUID
+
+from src.shared.domain.domain_event import DomainEvent
+
+
+class CameraSalva(DomainEvent):
+    """Event raised when a camera is added to or updated in a cidade."""
+
+    def __init__(self, camera_id: UUID, cidade_id: UUID) -> None:
+        """Initialize event."""
+        super().__init__()
+        self.camera_id = camera_id
+        self.cidade_id = cidade_id
@@ -0,0 +1,36 @@
+"""Domain event handlers that keep the camera cache consistent."""
+from src.modules.cidades.domain.events.camera_removida import CameraRemovida
+from src.modules.cidades.domain.events.camera_salva import CameraSalva
+from src.modules.cidades.domain.events.cidade_criada import CidadeCriada
+from src.modules.cidades.domain.events.plano_atribuido import PlanoAtribuido
+from src.modules.cidades.infrastructure.persistence.cached_camera_repository import (
+    CachedCameraRepository,
+)
+from src.shared.application.event_bus import EventBus
+
+
+class CameraCacheInvalidationHandler:
+    """Invalidates cached cameras when cameras or cidades change."""
+
+    def __init__(self, repository: CachedCameraRepository) -> None:
+        """Initialize handler."""
+        self.repository = repository
+
+    def register(self, event_bus: EventBus) -> None:
+        """Subscribe to the events that change cached data."""
+        event_bus.subscribe(CameraSalva, self.on_camera_saved)
+        event_bus.subscribe(CameraRemovida, self.on_camera_removed)
+        event_bus.subscribe(CidadeCriada, self.on_cidade_changed)
+        event_bus.subscribe(PlanoAtribuido, self.on_cidade_changed)
+
+    async def on_camera_saved(self, event: CameraSalva) -> None:
+        """Drop the cidade's list; the camera entry was written through on save."""
+        await self.repository.invalidate_cidade(event.cidade_id)
+
+    async def on_camera_removed(self, event: CameraRemovida) -> None:
+        """Drop the camera and its cidade's list."""
+        await self.repository.invalidate(event.camera_id, event.cidade_id)
+
+    async def on_cidade_changed(self, event: CidadeCriada | PlanoAtribuido) -> None:
+        """Drop every camera list of the cidade."""
+        await self.repository.invalidate_cidade(event.cidade_id)
@@ -0,0 +1,102 @@
+"""Camera repository with a Redis read-through cache in front."""
+from typing import List, Optional
+from uuid import UUID
+
+from src.modules.cidades.domain.entities.camera import Camera
+from src.modules.cidades.domain.repositories.camera_repository import CameraRepository
+from src.modules.cidades.domain.value_objects.status_camera import StatusCamera
+from src.modules.cidades.domain.value_objects.url_camera import URLCamera
+from src.shared.infrastructure.cache_service import CacheService
+
+
+def _camera_to_dict(camera: Camera) -> dict:
+    return {
+        "id": camera.id,
+        "nome": camera.nome,
+        "localizacao": camera.localizacao,
+        "url": camera.url.value,
+        "status": camera.status.value,
+        "cidade_id": camera.cidade_id,
+    }
+
+
+def _camera_from_dict(data: dict) -> Camera:
+    return Camera(
+        id=data["id"],
+        nome=data["nome"],
+        localizacao=data["localizacao"],
+        url=URLCamera(data["url"]),
+        status=StatusCamera(data["status"]),
+        cidade_id=data["cidade_id"],
+    )
+
+
+class CachedCameraRepository(CameraRepository):
+    """Read-through/write-through cache over another camera repository.
+
+    Single cameras live in the `camera` namespace; per-cidade lists live in
+    `cameras_by_cidade` with the cidade as tenant, so a cidade's entries can
+    be dropped together. Both keep an in-process tier, when the service has
+    one, so hot cameras are served without a Redis round trip.
+    """
+
+    def __init__(
+        self,
+        inner: CameraRepository,
+        cache: CacheService,
+        ttl: int = 300,
+        local_ttl: float = 30.0,
+        local_max_entries: int = 10000,
+    ) -> None:
+        """Initialize repository."""
+        self.inner = inner
+        self.cameras = cache.namespace(
+            "camera",
+            ttl=ttl,
+            encode=_camera_to_dict,
+            decode=_camera_from_dict,
+            local_ttl=local_ttl,
+            local_max_entries=local_max_entries,
+        )
+        self.cameras_by_cidade = cache.namespace(
+            "cameras_by_cidade",
+            ttl=ttl,
+            encode=lambda cameras: [_camera_to_dict(c) for c in cameras],
+            decode=lambda items: [_camera_from_dict(i) for i in items],
+            local_ttl=local_ttl,
+            local_max_entries=local_max_entries,
+        )
+
+    async def save(self, camera: Camera) -> None:
+        """Save camera and refresh its cache entry."""
+        await self.inner.save(camera)
+        await self.cameras.set(None, camera.id, camera)
+        await self.cameras_by_cidade.invalidate(camera.cidade_id, camera.cidade_id)
+
+    async def find_by_id(self, camera_id: UUID) -> Optional[Camera]:
+        """Find camera by ID."""
+        return await self.cameras.get_or_load(
+            None, camera_id, lambda: self.inner.find_by_id(camera_id)
+        )
+
+    async def find_by_cidade(self, cidade_id: UUID) -> List[Camera]:
+        """Find all cameras by cidade."""
+        return await self.cameras_by_cidade.get_or_load(
+            cidade_id, cidade_id, lambda: self.inner.find_by_cidade(cidade_id)
+        ) or []
+
+    async def delete(self, camera_id: UUID) -> None:
+        """Delete camera and drop its cache entries."""
+        camera = await self.find_by_id(camera_id)
+        await self.inner.delete(camera_id)
+        await self.invalidate(camera_id, camera.cidade_id if camera else None)
+
+    async def invalidate(self, camera_id: UUID, cidade_id: Optional[UUID]) -> None:
+        """Drop one camera and, if known, its cidade's camera list."""
+        await self.cameras.invalidate(None, camera_id)
+        if cidade_id:
+            await self.invalidate_cidade(cidade_id)
+
+    async def invalidate_cidade(self, cidade_id: UUID) -> None:
+        """Drop every cached camera list of a cidade."""
+        await self.cameras_by_cidade.invalidate_tenant(cidade_id)
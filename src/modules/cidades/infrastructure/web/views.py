@@ -1,4 +1,7 @@
 """API views for Cidades."""
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
@@ -10,6 +13,12 @@ from src.modules.cidades.application.dtos.create_camera_dto import CreateCameraD
 from src.modules.cidades.application.use_cases.add_usuario_cidade import AddUsuarioCidadeUseCase
 from src.modules.cidades.application.use_cases.create_cidade import CreateCidadeUseCase
 from src.modules.cidades.application.use_cases.create_camera import CreateCameraUseCase
+from src.modules.cidades.infrastructure.messaging.cache_invalidation import (
+    CameraCacheInvalidationHandler,
+)
+from src.modules.cidades.infrastructure.persistence.cached_camera_repository import (
+    CachedCameraRepository,
+)
 from src.modules.cidades.infrastructure.persistence.cidade_repository_impl import CidadeRepository
 from src.modules.cidades.infrastructure.persistence.camera_repository_impl import CameraRepositoryImpl
 from src.modules.cidades.infrastructure.web.serializers import (
@@ -20,6 +29,28 @@ from src.modules.cidades.infrastructure.web.serializers import (
     CameraResponseSerializer,
 )
 from src.shared.application.event_bus import EventBus
+from src.shared.infrastructure.cache_service import CacheService
+
+
+@asynccontextmanager
+async def _camera_repository() -> AsyncIterator[CachedCameraRepository]:
+    """Camera repository behind the Redis cache, for one request.
+
+    Under WSGI each request runs on its own event loop, so the cache has no
+    in-process tier and its connection is closed with the request.
+    """
+    cache = CacheService.from_env(local_tier=False)
+    try:
+        yield CachedCameraRepository(CameraRepositoryImpl(), cache)
+    finally:
+        await cache.close()
+
+
+def _event_bus(camera_repository: CachedCameraRepository) -> EventBus:
+    """Event bus that invalidates cached cameras on cidade/camera changes."""
+    event_bus = EventBus()
+    CameraCacheInvalidationHandler(camera_repository).register(event_bus)
+    return event_bus
 
 
 @api_view(["POST"])
@@ -32,11 +63,11 @@ async def create_cidade(request):
 
     try:
         cidade_repository = CidadeRepository()
-        event_bus = EventBus()
-        use_case = CreateCidadeUseCase(cidade_repository, event_bus)
+        async with _camera_repository() as camera_repository:
+            use_case = CreateCidadeUseCase(cidade_repository, _event_bus(camera_repository))
 
-        input_dto = CreateCidadeDTO(**serializer.validated_data)
-        result = await use_case.execute(input_dto)
+            input_dto = CreateCidadeDTO(**serializer.validated_data)
+            result = await use_case.execute(input_dto)
 
         response_serializer = CidadeResponseSerializer(result.model_dump())
         return Response(response_serializer.data, status=status.HTTP_201_CREATED)
@@ -106,11 +137,13 @@ async def create_camera(request, cidade_id):
 
     try:
         cidade_repository = CidadeRepository()
-        camera_repository = CameraRepositoryImpl()
-        use_case = CreateCameraUseCase(cidade_repository, camera_repository)
+        async with _camera_repository() as camera_repository:
+            use_case = CreateCameraUseCase(
+                cidade_repository, camera_repository, _event_bus(camera_repository)
+            )
 
-        input_dto = CreateCameraDTO(cidade_id=cidade_id, **serializer.validated_data)
-        result = await use_case.execute(input_dto)
+            input_dto = CreateCameraDTO(cidade_id=cidade_id, **serializer.validated_data)
+            result = await use_case.execute(input_dto)
 
         response_serializer = CameraResponseSerializer(result.model_dump())
         return Response(response_serializer.data, status=status.HTTP_201_CREATED)
@@ -124,8 +157,8 @@ async def create_camera(request, cidade_id):
 async def list_cameras(request, cidade_id):
     """List cameras by cidade endpoint."""
     try:
-        camera_repository = CameraRepositoryImpl()
-        cameras = await camera_repository.find_by_cidade(cidade_id)
+        async with _camera_repository() as camera_repository:
+            cameras = await camera_repository.find_by_cidade(cidade_id)
 
         results = [
             {
@@ -150,8 +183,8 @@ async def list_cameras(request, cidade_id):
 async def delete_camera(request, cidade_id, camera_id):
     """Delete camera endpoint."""
     try:
-        camera_repository = CameraRepositoryImpl()
-        await camera_repository.delete(camera_id)
+        async with _camera_repository() as camera_repository:
+            await camera_repository.delete(camera_id)
         return Response(status=status.HTTP_204_NO_CONTENT)
 
     except Exception as e:
@@ -0,0 +1,20 @@
+"""Batch timeline response DTO."""
+from datetime import datetime
+from pydantic import BaseModel
+from typing import Dict, Any
+
+
+class BatchTimelineResponseDTO(BaseModel):
+    """Batch timeline response DTO.
+    
+    Each timeline carries `runs`: run-length encoded coverage as
+    `[[has_recording, bucket_count], ...]` over `buckets` buckets of
+    `bucket_seconds` each, starting at `start_date`. Runs stop at the
+    current time: buckets still in the future are not counted, so the
+    runs of a window ending later cover fewer than `buckets` buckets.
+    """
+    start_date: datetime
+    end_date: datetime
+    buckets: int
+    bucket_seconds: float
+    timelines: Dict[str, Dict[str, Any]]
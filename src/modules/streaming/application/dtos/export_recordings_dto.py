@@ -0,0 +1,17 @@
+"""Export recordings DTO."""
+from uuid import UUID
+from datetime import datetime
+from pydantic import BaseModel, Field
+from typing import Literal, Optional
+
+
+class ExportRecordingsDTO(BaseModel):
+    """Export recordings DTO (same filters as search, no pagination)."""
+    stream_id: Optional[UUID] = None
+    camera_id: Optional[UUID] = None
+    tenant_id: Optional[UUID] = None
+    status: Optional[Literal["RECORDING", "STOPPED", "ERROR"]] = None
+    start_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
+    format: Literal["ndjson", "csv"] = "ndjson"
+    batch_size: int = Field(default=1000, gt=0, le=10000)
@@ -1,5 +1,6 @@
 """Generate thumbnails DTO."""
 from uuid import UUID
+from typing import Literal
 from pydantic import BaseModel, Field
 
 
@@ -7,3 +8,5 @@ class GenerateThumbnailsDTO(BaseModel):
     """Generate thumbnails DTO."""
     recording_id: UUID
     interval_seconds: int = Field(default=60, ge=10, le=300)
+    mode: Literal["images", "sprite"] = "images"
+    columns: int = Field(default=10, ge=1, le=30)
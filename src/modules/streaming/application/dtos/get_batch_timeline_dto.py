@@ -0,0 +1,13 @@
+"""Get batch timeline DTO."""
+from uuid import UUID
+from datetime import datetime
+from typing import List
+from pydantic import BaseModel, Field
+
+
+class GetBatchTimelineDTO(BaseModel):
+    """Get batch timeline DTO (one window, many streams)."""
+    stream_ids: List[UUID] = Field(..., min_length=1, max_length=64)
+    start_date: datetime
+    end_date: datetime
+    buckets: int = Field(default=1440, gt=0, le=5000)
@@ -1,7 +1,8 @@
 """Get timeline DTO."""
 from uuid import UUID
 from datetime import datetime
-from pydantic import BaseModel
+from typing import Literal, Optional
+from pydantic import BaseModel, Field
 
 
 class GetTimelineDTO(BaseModel):
@@ -9,3 +10,5 @@ class GetTimelineDTO(BaseModel):
     stream_id: UUID
     start_date: datetime
     end_date: datetime
+    resolution: Optional[Literal["minute", "hour", "day"]] = None
+    buckets: Optional[int] = Field(default=None, gt=0, le=5000)
@@ -1,6 +1,7 @@
 """Playback URL response DTO."""
 from uuid import UUID
 from pydantic import BaseModel
+from typing import List, Dict, Any
 
 
 class PlaybackUrlResponseDTO(BaseModel):
@@ -8,3 +9,4 @@ class PlaybackUrlResponseDTO(BaseModel):
     recording_id: UUID
     playback_url: str
     expires_in: int
+    segments: List[Dict[str, Any]] = []
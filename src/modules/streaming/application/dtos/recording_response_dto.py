@@ -9,6 +9,7 @@ class RecordingResponseDTO(BaseModel):
     """Recording response DTO."""
     recording_id: UUID
     stream_id: UUID
+    camera_id: Optional[UUID] = None
     status: str
     started_at: datetime
     stopped_at: Optional[datetime] = None
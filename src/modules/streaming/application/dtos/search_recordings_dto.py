@@ -1,12 +1,24 @@
 """Search recordings DTO."""
 from uuid import UUID
 from datetime import datetime
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, Field
+from typing import Optional, List
+from src.streaming.application.dtos.recording_response_dto import RecordingResponseDTO
 
 
 class SearchRecordingsDTO(BaseModel):
     """Search recordings DTO."""
     stream_id: Optional[UUID] = None
+    camera_id: Optional[UUID] = None
+    tenant_id: Optional[UUID] = None
+    status: Optional[str] = None
     start_date: Optional[datetime] = None
     end_date: Optional[datetime] = None
+    limit: int = Field(default=50, gt=0, le=500)
+    cursor: Optional[str] = None
+
+
+class SearchRecordingsResultDTO(BaseModel):
+    """Search recordings page."""
+    recordings: List[RecordingResponseDTO]
+    next_cursor: Optional[str] = None
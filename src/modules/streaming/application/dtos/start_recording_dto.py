@@ -1,5 +1,6 @@
 """Start recording DTO."""
 from uuid import UUID
+from typing import Optional
 from pydantic import BaseModel, Field
 
 
@@ -7,3 +8,4 @@ class StartRecordingDTO(BaseModel):
     """Start recording DTO."""
     stream_id: UUID
     retention_days: int = Field(default=7, ge=7, le=30)
+    tenant_id: Optional[UUID] = None
@@ -1,6 +1,7 @@
 """Thumbnail response DTO."""
 from uuid import UUID
 from datetime import datetime
+from typing import List, Optional
 from pydantic import BaseModel
 
 
@@ -9,3 +10,22 @@ class ThumbnailResponseDTO(BaseModel):
     recording_id: UUID
     url: str
     timestamp: datetime
+
+
+class SpriteSheetResponseDTO(BaseModel):
+    """Sprite sheet response DTO."""
+    path: str
+    url: Optional[str] = None
+    start_time: datetime
+    count: int
+    columns: int
+    rows: int
+
+
+class ScrubTrackResponseDTO(BaseModel):
+    """Sprite sheets plus the WebVTT track that maps time ranges to tiles."""
+    recording_id: UUID
+    interval_seconds: int
+    vtt_path: str
+    vtt_url: Optional[str] = None
+    sprites: List[SpriteSheetResponseDTO]
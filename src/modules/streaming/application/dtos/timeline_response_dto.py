@@ -2,7 +2,7 @@
 from uuid import UUID
 from datetime import datetime
 from pydantic import BaseModel
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 
 class TimelineResponseDTO(BaseModel):
@@ -14,3 +14,4 @@ class TimelineResponseDTO(BaseModel):
     segments: List[Dict[str, Any]]
     total_duration_seconds: int
     has_gaps: bool
+    bucket_seconds: Optional[int] = None
@@ -0,0 +1,21 @@
+"""Cameras that background capture workers should cover."""
+from abc import ABC, abstractmethod
+from typing import List, NamedTuple
+from uuid import UUID
+
+
+class CameraTarget(NamedTuple):
+    """A camera to capture from and whether it is currently reachable."""
+    camera_id: UUID
+    tenant_id: str
+    source_url: str
+    online: bool
+
+
+class ActiveCameraQuery(ABC):
+    """Lists active cameras with their health."""
+    
+    @abstractmethod
+    async def list_active(self) -> List[CameraTarget]:
+        """Enabled cameras; `online` is False when the camera or its latest stream reports an error."""
+        pass
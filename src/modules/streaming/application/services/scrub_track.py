@@ -0,0 +1,40 @@
+"""WebVTT thumbnail tracks for timeline scrubbing."""
+from datetime import datetime
+from typing import List
+from src.streaming.domain.value_objects.thumbnail import SpriteSheet
+
+
+def format_vtt_time(seconds: float) -> str:
+    """Format seconds as a WebVTT timestamp (HH:MM:SS.mmm)."""
+    millis = int(round(seconds * 1000))
+    hours, millis = divmod(millis, 3_600_000)
+    minutes, millis = divmod(millis, 60_000)
+    secs, millis = divmod(millis, 1000)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}.{millis:03d}"
+
+
+def build_scrub_track(
+    sheets: List[SpriteSheet],
+    sprite_names: List[str],
+    origin: datetime,
+    end_time: datetime
+) -> str:
+    """Render one cue per tile, `<sprite>#xywh=x,y,w,h`, timed from `origin`.
+    
+    `sprite_names[i]` is how the track refers to `sheets[i]`, usually a
+    path relative to the track itself.
+    """
+    duration = (end_time - origin).total_seconds()
+    lines = ["WEBVTT", ""]
+    for sheet, name in zip(sheets, sprite_names):
+        sheet_offset = (sheet.start_time - origin).total_seconds()
+        for index in range(sheet.count):
+            start = sheet_offset + index * sheet.interval_seconds
+            if start >= duration:
+                break
+            end = min(start + sheet.interval_seconds, duration)
+            x, y = sheet.tile_position(index)
+            lines.append(f"{format_vtt_time(start)} --> {format_vtt_time(end)}")
+            lines.append(f"{name}#xywh={x},{y},{sheet.width},{sheet.height}")
+            lines.append("")
+    return "\n".join(lines)
@@ -0,0 +1,22 @@
+"""Opaque keyset cursors for paginated searches."""
+import base64
+import json
+from datetime import datetime
+from typing import Tuple
+from uuid import UUID
+
+
+def encode_cursor(started_at: datetime, id: UUID) -> str:
+    """Encode the (started_at, id) keyset of the last row of a page."""
+    raw = json.dumps([started_at.isoformat(), str(id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """Decode a cursor produced by `encode_cursor`."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        started_at, id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(started_at), UUID(id)
+    except (ValueError, TypeError) as e:
+        raise ValueError("Invalid cursor") from e
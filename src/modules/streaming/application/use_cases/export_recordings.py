@@ -0,0 +1,86 @@
+"""Export recordings use case."""
+import csv
+import io
+import json
+from typing import AsyncIterator, List
+from src.shared.application.use_case import UseCase
+from src.streaming.application.dtos.export_recordings_dto import ExportRecordingsDTO
+from src.streaming.domain.entities.recording_read_model import RecordingReadModel
+from src.streaming.domain.repositories.recording_repository import RecordingRepository
+from src.streaming.domain.value_objects.recording_status import RecordingStatus
+
+EXPORT_FIELDS = [
+    "recording_id", "stream_id", "camera_id", "tenant_id", "status",
+    "started_at", "stopped_at", "retention_days", "storage_path",
+    "file_size_mb", "duration_seconds"
+]
+
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv"
+}
+
+
+class ExportRecordingsUseCase(UseCase[ExportRecordingsDTO, AsyncIterator[str]]):
+    """Export recording metadata as NDJSON or CSV text chunks.
+    
+    Chunks are produced lazily from the repository iterator: the next batch
+    is only read from the database once the previous chunk was consumed.
+    """
+    
+    def __init__(self, recording_repository: RecordingRepository):
+        self.recording_repository = recording_repository
+    
+    async def execute(self, dto: ExportRecordingsDTO) -> AsyncIterator[str]:
+        """Execute use case, yielding one chunk per `batch_size` rows."""
+        status = RecordingStatus(dto.status) if dto.status else None
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        if dto.format == "csv":
+            writer.writerow(EXPORT_FIELDS)
+        
+        rows = 0
+        async for recording in self.recording_repository.iter_search(
+            stream_id=dto.stream_id,
+            start_date=dto.start_date,
+            end_date=dto.end_date,
+            camera_id=dto.camera_id,
+            tenant_id=dto.tenant_id,
+            status=status,
+            batch_size=dto.batch_size
+        ):
+            values = self._row(recording)
+            if dto.format == "csv":
+                writer.writerow(values)
+            else:
+                buffer.write(json.dumps(dict(zip(EXPORT_FIELDS, values))))
+                buffer.write("\n")
+            rows += 1
+            if rows % dto.batch_size == 0:
+                yield self._drain(buffer)
+        
+        if buffer.tell():
+            yield self._drain(buffer)
+    
+    @staticmethod
+    def _row(recording: RecordingReadModel) -> List:
+        return [
+            str(recording.id),
+            str(recording.stream_id),
+            str(recording.camera_id) if recording.camera_id else None,
+            str(recording.tenant_id) if recording.tenant_id else None,
+            recording.status,
+            recording.started_at.isoformat(),
+            recording.stopped_at.isoformat() if recording.stopped_at else None,
+            recording.retention_days,
+            recording.storage_path,
+            recording.file_size_mb,
+            recording.duration_seconds
+        ]
+    
+    @staticmethod
+    def _drain(buffer: io.StringIO) -> str:
+        chunk = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return chunk
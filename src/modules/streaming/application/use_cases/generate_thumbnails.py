@@ -1,46 +1,137 @@
 """Generate thumbnails use case."""
+import os
+import tempfile
 from uuid import UUID
-from typing import List
+from typing import List, Optional, Union
 from src.shared.application.use_case import UseCase
 from src.streaming.application.dtos.generate_thumbnails_dto import GenerateThumbnailsDTO
-from src.streaming.application.dtos.thumbnail_response_dto import ThumbnailResponseDTO
+from src.streaming.application.dtos.thumbnail_response_dto import (
+    ScrubTrackResponseDTO,
+    SpriteSheetResponseDTO,
+    ThumbnailResponseDTO,
+)
+from src.streaming.application.services.scrub_track import build_scrub_track
+from src.streaming.domain.entities.recording import Recording
 from src.streaming.domain.repositories.recording_repository import RecordingRepository
+from src.streaming.domain.services.storage_service import StorageService
 from src.streaming.domain.services.thumbnail_service import ThumbnailService
 from src.shared.domain.domain_exception import DomainException
 
+# Sprites and tracks of a finished recording never change
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+CONTENT_TYPES = {"jpg": "image/jpeg", "webp": "image/webp"}
+
+
+class GenerateThumbnailsUseCase(
+    UseCase[GenerateThumbnailsDTO, Union[List[ThumbnailResponseDTO], ScrubTrackResponseDTO]]
+):
+    """Generate thumbnails use case.
+
+    `images` mode returns one file per thumbnail. `sprite` mode tiles them
+    into one sheet per recording hour and writes a WebVTT track mapping
+    each interval to its tile, so a scrub preview needs two requests
+    instead of one per thumbnail. Both go to storage under
+    `thumbnails/<recording>/<interval>s/` with immutable cache headers; the
+    track references the sheets by relative name.
+    """
 
-class GenerateThumbnailsUseCase(UseCase[GenerateThumbnailsDTO, List[ThumbnailResponseDTO]]):
-    """Generate thumbnails use case."""
-    
     def __init__(
         self,
         recording_repository: RecordingRepository,
-        thumbnail_service: ThumbnailService
+        thumbnail_service: ThumbnailService,
+        storage_service: Optional[StorageService] = None
     ):
         self.recording_repository = recording_repository
         self.thumbnail_service = thumbnail_service
-    
-    async def execute(self, dto: GenerateThumbnailsDTO) -> List[ThumbnailResponseDTO]:
+        self.storage_service = storage_service
+
+    async def execute(
+        self,
+        dto: GenerateThumbnailsDTO
+    ) -> Union[List[ThumbnailResponseDTO], ScrubTrackResponseDTO]:
         """Execute use case."""
         recording = await self.recording_repository.find_by_id(dto.recording_id)
         if not recording:
             raise DomainException("Recording not found")
-        
+
         if not recording.storage_path:
             raise DomainException("Recording has no storage path")
-        
-        thumbnail_urls = await self.thumbnail_service.generate_thumbnails(
+
+        if dto.mode == "sprite":
+            return await self._generate_sprites(recording, dto)
+
+        thumbnails = await self.thumbnail_service.generate_thumbnails(
             video_path=recording.storage_path,
             start_time=recording.started_at,
             end_time=recording.stopped_at or recording.started_at,
             interval_seconds=dto.interval_seconds
         )
-        
+
         return [
             ThumbnailResponseDTO(
                 recording_id=recording.id,
-                url=url,
-                timestamp=recording.started_at
+                url=thumbnail.url,
+                timestamp=thumbnail.timestamp
             )
-            for url in thumbnail_urls
+            for thumbnail in thumbnails
         ]
+
+    async def _generate_sprites(self, recording: Recording, dto: GenerateThumbnailsDTO) -> ScrubTrackResponseDTO:
+        if not self.storage_service:
+            raise DomainException("Sprite mode requires a storage service")
+        if not recording.stopped_at:
+            raise DomainException("Recording is still in progress")
+
+        sheets = await self.thumbnail_service.generate_sprites(
+            video_path=recording.storage_path,
+            start_time=recording.started_at,
+            end_time=recording.stopped_at,
+            interval_seconds=dto.interval_seconds,
+            columns=dto.columns
+        )
+        if not sheets:
+            raise DomainException("Failed to generate sprite sheets")
+
+        prefix = f"thumbnails/{recording.id}/{dto.interval_seconds}s"
+        names = [f"sprite_{i:03d}{os.path.splitext(sheet.url)[1]}" for i, sheet in enumerate(sheets)]
+        sprites = []
+        for sheet, name in zip(sheets, names):
+            ext = os.path.splitext(name)[1].lstrip(".")
+            path = f"{prefix}/{name}"
+            await self.storage_service.upload_file(
+                sheet.url,
+                path,
+                content_type=CONTENT_TYPES.get(ext, "application/octet-stream"),
+                cache_control=IMMUTABLE_CACHE_CONTROL
+            )
+            sprites.append(SpriteSheetResponseDTO(
+                path=path,
+                url=await self.storage_service.get_file_url(path),
+                start_time=sheet.start_time,
+                count=sheet.count,
+                columns=sheet.columns,
+                rows=sheet.rows
+            ))
+
+        track = build_scrub_track(sheets, names, recording.started_at, recording.stopped_at)
+        vtt_path = f"{prefix}/scrub.vtt"
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".vtt", delete=False) as f:
+            f.write(track)
+        try:
+            await self.storage_service.upload_file(
+                f.name,
+                vtt_path,
+                content_type="text/vtt",
+                cache_control=IMMUTABLE_CACHE_CONTROL
+            )
+        finally:
+            os.unlink(f.name)
+
+        return ScrubTrackResponseDTO(
+            recording_id=recording.id,
+            interval_seconds=dto.interval_seconds,
+            vtt_path=vtt_path,
+            vtt_url=await self.storage_service.get_file_url(vtt_path),
+            sprites=sprites
+        )
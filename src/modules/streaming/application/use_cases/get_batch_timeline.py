@@ -0,0 +1,84 @@
+"""Get batch timeline use case."""
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+from datetime import datetime
+from src.shared.application.use_case import UseCase
+from src.streaming.application.dtos.get_batch_timeline_dto import GetBatchTimelineDTO
+from src.streaming.application.dtos.batch_timeline_response_dto import BatchTimelineResponseDTO
+from src.streaming.domain.services.timeline_engine import TimelineEngine, run_length_encode
+from src.streaming.domain.repositories.recording_repository import RecordingRepository
+from src.streaming.domain.repositories.segment_repository import SegmentRepository
+from src.shared.domain.domain_exception import DomainException
+
+
+class GetBatchTimelineUseCase(UseCase[GetBatchTimelineDTO, BatchTimelineResponseDTO]):
+    """Timelines for many streams over one window (mosaic scrubbing)."""
+    
+    def __init__(
+        self,
+        recording_repository: RecordingRepository,
+        segment_repository: Optional[SegmentRepository] = None
+    ):
+        self.recording_repository = recording_repository
+        self.segment_repository = segment_repository
+    
+    async def execute(self, dto: GetBatchTimelineDTO) -> BatchTimelineResponseDTO:
+        """Execute use case."""
+        if dto.end_date <= dto.start_date:
+            raise DomainException("end_date must be after start_date")
+        
+        stream_ids = list(dict.fromkeys(dto.stream_ids))
+        intervals = await self._load_intervals(stream_ids, dto.start_date, dto.end_date)
+        
+        timelines = {}
+        for stream_id in stream_ids:
+            engine = TimelineEngine(dto.start_date, dto.end_date)
+            for start_time, end_time in intervals.get(stream_id, []):
+                engine.add(start_time, end_time)
+            
+            runs = run_length_encode(engine.coverage_bitmap(dto.buckets))
+            timelines[str(stream_id)] = {
+                "runs": runs,
+                "total_duration_seconds": engine.total_recorded_seconds(),
+                "has_gaps": any(bit == 0 for bit, _ in runs)
+            }
+        
+        return BatchTimelineResponseDTO(
+            start_date=dto.start_date,
+            end_date=dto.end_date,
+            buckets=dto.buckets,
+            bucket_seconds=(dto.end_date - dto.start_date).total_seconds() / dto.buckets,
+            timelines=timelines
+        )
+    
+    async def _load_intervals(
+        self,
+        stream_ids: List[UUID],
+        start_date: datetime,
+        end_date: datetime
+    ) -> Dict[UUID, List[Tuple[datetime, datetime]]]:
+        """One set-based query for all streams; recordings only for streams missing from the catalog.
+        
+        Streams found in the catalog also get their open recordings up to
+        now, which cover the segment still being written.
+        """
+        intervals: Dict[UUID, List[Tuple[datetime, datetime]]] = {}
+        if self.segment_repository:
+            intervals = await self.segment_repository.find_intervals_by_stream_ids(
+                stream_ids, start_date, end_date
+            )
+        
+        cataloged = [sid for sid in stream_ids if sid in intervals]
+        if cataloged:
+            open_recordings = await self.recording_repository.find_intervals_by_stream_ids(
+                cataloged, start_date, end_date, open_only=True
+            )
+            for stream_id, spans in open_recordings.items():
+                intervals[stream_id] = list(intervals[stream_id]) + spans
+        
+        missing = [sid for sid in stream_ids if sid not in intervals]
+        if missing:
+            intervals.update(await self.recording_repository.find_intervals_by_stream_ids(
+                missing, start_date, end_date
+            ))
+        return intervals
@@ -1,8 +1,10 @@
 """Get playback URL use case."""
 from uuid import UUID
+from typing import Optional
 from src.shared.application.use_case import UseCase
 from src.streaming.application.dtos.playback_url_response_dto import PlaybackUrlResponseDTO
 from src.streaming.domain.repositories.recording_repository import RecordingRepository
+from src.streaming.domain.repositories.segment_repository import SegmentRepository
 from src.streaming.domain.services.storage_service import StorageService
 from src.shared.domain.domain_exception import DomainException
 
@@ -13,10 +15,12 @@ class GetPlaybackUrlUseCase(UseCase[UUID, PlaybackUrlResponseDTO]):
     def __init__(
         self,
         recording_repository: RecordingRepository,
-        storage_service: StorageService
+        storage_service: StorageService,
+        segment_repository: Optional[SegmentRepository] = None
     ):
         self.recording_repository = recording_repository
         self.storage_service = storage_service
+        self.segment_repository = segment_repository
     
     async def execute(self, recording_id: UUID) -> PlaybackUrlResponseDTO:
         """Execute use case."""
@@ -27,10 +31,24 @@ class GetPlaybackUrlUseCase(UseCase[UUID, PlaybackUrlResponseDTO]):
         if not recording.storage_path:
             raise DomainException("Recording has no storage path")
         
-        playback_url = await self.storage_service.get_file_url(
-            recording.storage_path,
-            expires_in=3600
-        )
+        segments = []
+        if self.segment_repository:
+            for segment in await self.segment_repository.find_by_recording_id(recording_id):
+                url = await self.storage_service.get_file_url(segment.storage_path, expires_in=3600)
+                if url:
+                    segments.append({
+                        "start_time": segment.start_time,
+                        "end_time": segment.end_time,
+                        "url": url
+                    })
+        
+        if segments:
+            playback_url = segments[0]["url"]
+        else:
+            playback_url = await self.storage_service.get_file_url(
+                recording.storage_path,
+                expires_in=3600
+            )
         
         if not playback_url:
             raise DomainException("Failed to generate playback URL")
@@ -38,5 +56,6 @@ class GetPlaybackUrlUseCase(UseCase[UUID, PlaybackUrlResponseDTO]):
         return PlaybackUrlResponseDTO(
             recording_id=recording.id,
             playback_url=playback_url,
-            expires_in=3600
+            expires_in=3600,
+            segments=segments
         )
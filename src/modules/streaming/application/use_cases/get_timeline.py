@@ -1,47 +1,56 @@
 """Get timeline use case."""
 from uuid import UUID, uuid4
 from datetime import datetime
+from typing import Optional
 from src.shared.application.use_case import UseCase
 from src.streaming.application.dtos.get_timeline_dto import GetTimelineDTO
 from src.streaming.application.dtos.timeline_response_dto import TimelineResponseDTO
 from src.streaming.domain.entities.timeline import Timeline
-from src.streaming.domain.value_objects.timeline_segment import TimelineSegment
+from src.streaming.domain.value_objects.timeline_resolution import TimelineResolution
+from src.streaming.domain.services.timeline_engine import TimelineEngine
 from src.streaming.domain.repositories.recording_repository import RecordingRepository
+from src.streaming.domain.repositories.segment_repository import SegmentRepository
 from src.shared.domain.domain_exception import DomainException
 
 
 class GetTimelineUseCase(UseCase[GetTimelineDTO, TimelineResponseDTO]):
     """Get timeline use case."""
     
-    def __init__(self, recording_repository: RecordingRepository):
+    MAX_SEGMENTS = 500
+    
+    def __init__(
+        self,
+        recording_repository: RecordingRepository,
+        segment_repository: Optional[SegmentRepository] = None
+    ):
         self.recording_repository = recording_repository
+        self.segment_repository = segment_repository
     
     async def execute(self, dto: GetTimelineDTO) -> TimelineResponseDTO:
         """Execute use case."""
-        recordings = await self.recording_repository.search(
-            stream_id=dto.stream_id,
-            start_date=dto.start_date,
-            end_date=dto.end_date
-        )
+        intervals = await self._load_intervals(dto)
         
-        if not recordings:
+        if not intervals:
             raise DomainException("No recordings found for this period")
         
+        engine = TimelineEngine(dto.start_date, dto.end_date)
+        for start_time, end_time in intervals:
+            engine.add(start_time, end_time)
+        
+        bucket_seconds = self._bucket_seconds(dto, engine)
+        segments = (
+            engine.bucketed(bucket_seconds) if bucket_seconds
+            else engine.downsample(self.MAX_SEGMENTS)
+        )
+        
         timeline = Timeline(
             id=uuid4(),
             stream_id=dto.stream_id,
             start_date=dto.start_date,
-            end_date=dto.end_date
+            end_date=dto.end_date,
+            segments=segments
         )
         
-        for recording in recordings:
-            segment = TimelineSegment(
-                start_time=recording.started_at,
-                end_time=recording.stopped_at or datetime.utcnow(),
-                has_recording=True
-            )
-            timeline.add_segment(segment)
-        
         return TimelineResponseDTO(
             timeline_id=timeline.id,
             stream_id=timeline.stream_id,
@@ -56,6 +65,40 @@ class GetTimelineUseCase(UseCase[GetTimelineDTO, TimelineResponseDTO]):
                 }
                 for s in timeline.segments
             ],
-            total_duration_seconds=timeline.get_total_duration(),
-            has_gaps=timeline.has_gaps()
+            total_duration_seconds=engine.total_recorded_seconds(),
+            has_gaps=timeline.has_gaps(),
+            bucket_seconds=bucket_seconds
+        )
+    
+    def _bucket_seconds(self, dto: GetTimelineDTO, engine: TimelineEngine) -> Optional[int]:
+        """Requested bucket size, coarsened so the payload stays bounded."""
+        if dto.resolution:
+            requested = TimelineResolution[dto.resolution.upper()].value
+        elif dto.buckets:
+            requested = engine.bucket_seconds_for(dto.buckets)
+        else:
+            return None
+        return int(max(requested, engine.bucket_seconds_for(self.MAX_SEGMENTS)))
+    
+    async def _load_intervals(self, dto: GetTimelineDTO):
+        """Load recorded intervals, preferring the segment catalog.
+        
+        Segments are cataloged once closed, so open recordings are added up
+        to now to cover the segment still being written.
+        """
+        if self.segment_repository:
+            segments = await self.segment_repository.find_by_stream_range(
+                dto.stream_id, dto.start_date, dto.end_date
+            )
+            if segments:
+                recording = await self.recording_repository.find_intervals_by_stream_ids(
+                    [dto.stream_id], dto.start_date, dto.end_date, open_only=True
+                )
+                return [(s.start_time, s.end_time) for s in segments] + recording.get(dto.stream_id, [])
+        
+        recordings = await self.recording_repository.search(
+            stream_id=dto.stream_id,
+            start_date=dto.start_date,
+            end_date=dto.end_date
         )
+        return [(r.started_at, r.stopped_at or datetime.utcnow()) for r in recordings]
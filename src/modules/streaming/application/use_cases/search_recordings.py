@@ -1,36 +1,56 @@
 """Search recordings use case."""
-from typing import List
 from src.shared.application.use_case import UseCase
-from src.streaming.application.dtos.search_recordings_dto import SearchRecordingsDTO
+from src.streaming.application.dtos.search_recordings_dto import SearchRecordingsDTO, SearchRecordingsResultDTO
 from src.streaming.application.dtos.recording_response_dto import RecordingResponseDTO
+from src.streaming.application.services.search_cursor import decode_cursor, encode_cursor
 from src.streaming.domain.repositories.recording_repository import RecordingRepository
+from src.streaming.domain.value_objects.recording_status import RecordingStatus
 
 
-class SearchRecordingsUseCase(UseCase[SearchRecordingsDTO, List[RecordingResponseDTO]]):
+class SearchRecordingsUseCase(UseCase[SearchRecordingsDTO, SearchRecordingsResultDTO]):
     """Search recordings use case."""
     
     def __init__(self, recording_repository: RecordingRepository):
         self.recording_repository = recording_repository
     
-    async def execute(self, dto: SearchRecordingsDTO) -> List[RecordingResponseDTO]:
-        """Execute use case."""
+    async def execute(self, dto: SearchRecordingsDTO) -> SearchRecordingsResultDTO:
+        """Execute use case.
+        
+        Fetches one row beyond the page size to know whether a next page exists
+        without counting the whole result set.
+        """
         recordings = await self.recording_repository.search(
             stream_id=dto.stream_id,
             start_date=dto.start_date,
-            end_date=dto.end_date
+            end_date=dto.end_date,
+            camera_id=dto.camera_id,
+            tenant_id=dto.tenant_id,
+            status=RecordingStatus(dto.status) if dto.status else None,
+            limit=dto.limit + 1,
+            after=decode_cursor(dto.cursor) if dto.cursor else None
         )
         
-        return [
-            RecordingResponseDTO(
-                recording_id=r.id,
-                stream_id=r.stream_id,
-                status=r.status.value,
-                started_at=r.started_at,
-                stopped_at=r.stopped_at,
-                retention_days=r.retention_policy.days,
-                storage_path=r.storage_path,
-                file_size_mb=r.file_size_mb,
-                duration_seconds=r.duration_seconds
-            )
-            for r in recordings
-        ]
+        page = recordings[:dto.limit]
+        next_cursor = None
+        if len(recordings) > dto.limit:
+            last = page[-1]
+            next_cursor = encode_cursor(last.started_at, last.id)
+        
+        return SearchRecordingsResultDTO(
+            recordings=[
+                RecordingResponseDTO(
+                    recording_id=r.id,
+                    stream_id=r.stream_id,
+                    camera_id=r.camera_id,
+                    status=r.status.value,
+                    started_at=r.started_at,
+                    stopped_at=r.stopped_at,
+                    retention_days=r.retention_policy.days,
+                    storage_path=r.storage_path,
+                    file_size_mb=r.file_size_mb,
+                    duration_seconds=r.duration_seconds
+                )
+                for r in page
+            ],
+            next_cursor=next_cursor
+        )
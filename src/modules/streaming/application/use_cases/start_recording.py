@@ -42,7 +42,9 @@ class StartRecordingUseCase(UseCase[StartRecordingDTO, RecordingResponseDTO]):
         recording = Recording(
             id=uuid4(),
             stream_id=dto.stream_id,
-            retention_policy=retention_policy
+            retention_policy=retention_policy,
+            camera_id=stream.camera_id,
+            tenant_id=dto.tenant_id
         )
         
         await self.recording_repository.save(recording)
@@ -53,6 +55,7 @@ class StartRecordingUseCase(UseCase[StartRecordingDTO, RecordingResponseDTO]):
             message={
                 "recording_id": str(recording.id),
                 "stream_id": str(recording.stream_id),
+                "camera_id": str(stream.camera_id),
                 "source_url": stream.source_url
             }
         )
@@ -0,0 +1,84 @@
+"""Clip job entity."""
+import hashlib
+from uuid import UUID
+from datetime import datetime
+from typing import Optional
+from src.shared.domain.entity import Entity
+from src.modules.streaming.domain.value_objects.clip_job_status import ClipJobStatus
+
+
+class ClipJob(Entity):
+    """A queued clip export request and its progress.
+
+    Lower `priority` runs first: incident and evidence clips go ahead of
+    plain exports. Requests for the same tenant, camera, range and output
+    format share a `dedup_key`, so they resolve to one job.
+    """
+
+    PRIORITY_URGENT = 0
+    PRIORITY_EXPORT = 10
+    URGENT_REASONS = ("incident", "evidence")
+
+    def __init__(
+        self,
+        id: UUID,
+        tenant_id: str,
+        camera_id: UUID,
+        start_time: datetime,
+        end_time: datetime,
+        reason: str,
+        faststart: bool = False,
+        priority: Optional[int] = None,
+        status: ClipJobStatus = ClipJobStatus.QUEUED,
+        progress: float = 0.0,
+        attempts: int = 0,
+        storage_bucket: Optional[str] = None,
+        storage_key: Optional[str] = None,
+        size_bytes: Optional[int] = None,
+        error: Optional[str] = None,
+        finished_at: Optional[datetime] = None
+    ):
+        super().__init__(id)
+        self.tenant_id = tenant_id
+        self.camera_id = camera_id
+        self.start_time = start_time
+        self.end_time = end_time
+        self.reason = reason
+        self.faststart = faststart
+        self.priority = self.priority_for(reason) if priority is None else priority
+        self.status = status
+        self.progress = progress
+        self.attempts = attempts
+        self.storage_bucket = storage_bucket
+        self.storage_key = storage_key
+        self.size_bytes = size_bytes
+        self.error = error
+        self.finished_at = finished_at
+
+    @classmethod
+    def priority_for(cls, reason: str, incident_flag: bool = False) -> int:
+        """Priority lane of a request."""
+        if incident_flag or reason in cls.URGENT_REASONS:
+            return cls.PRIORITY_URGENT
+        return cls.PRIORITY_EXPORT
+
+    @property
+    def dedup_key(self) -> str:
+        """Identity of the requested output."""
+        raw = "|".join((
+            str(self.tenant_id),
+            str(self.camera_id),
+            self.start_time.isoformat(),
+            self.end_time.isoformat(),
+            "faststart" if self.faststart else "fragmented"
+        ))
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    @property
+    def duration_seconds(self) -> float:
+        """Get requested clip duration in seconds."""
+        return (self.end_time - self.start_time).total_seconds()
+
+    def is_finished(self) -> bool:
+        """Check if the job reached a terminal state."""
+        return self.status in (ClipJobStatus.COMPLETED, ClipJobStatus.FAILED)
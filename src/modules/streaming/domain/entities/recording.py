@@ -1,6 +1,7 @@
 """Recording entity."""
 from uuid import UUID
 from datetime import datetime
+from typing import Optional
 from src.shared.domain.entity import Entity
 from src.streaming.domain.value_objects.recording_status import RecordingStatus
 from src.streaming.domain.value_objects.retention_policy import RetentionPolicy
@@ -9,6 +10,11 @@ from src.streaming.domain.value_objects.retention_policy import RetentionPolicy
 class Recording(Entity):
     """Recording entity."""
     
+    __slots__ = (
+        "stream_id", "retention_policy", "status", "started_at", "stopped_at",
+        "storage_path", "file_size_mb", "duration_seconds", "camera_id", "tenant_id"
+    )
+    
     def __init__(
         self,
         id: UUID,
@@ -19,7 +25,9 @@ class Recording(Entity):
         stopped_at: datetime = None,
         storage_path: str = None,
         file_size_mb: float = 0.0,
-        duration_seconds: int = 0
+        duration_seconds: int = 0,
+        camera_id: Optional[UUID] = None,
+        tenant_id: Optional[UUID] = None
     ):
         super().__init__(id)
         self.stream_id = stream_id
@@ -30,6 +38,44 @@ class Recording(Entity):
         self.storage_path = storage_path
         self.file_size_mb = file_size_mb
         self.duration_seconds = duration_seconds
+        self.camera_id = camera_id
+        self.tenant_id = tenant_id
+    
+    @classmethod
+    def hydrate(
+        cls,
+        id: UUID,
+        stream_id: UUID,
+        retention_policy: RetentionPolicy,
+        status: RecordingStatus,
+        started_at: datetime,
+        stopped_at: Optional[datetime],
+        storage_path: Optional[str],
+        file_size_mb: float,
+        duration_seconds: int,
+        camera_id: Optional[UUID] = None,
+        tenant_id: Optional[UUID] = None
+    ) -> "Recording":
+        """Rebuild a persisted recording without running `__init__`.
+        
+        Skips id generation and clock reads; persistence adapters pass every
+        field explicitly, so no defaults need resolving.
+        """
+        recording = cls.__new__(cls)
+        recording._id = id
+        recording._created_at = started_at
+        recording._updated_at = stopped_at or started_at
+        recording.stream_id = stream_id
+        recording.retention_policy = retention_policy
+        recording.status = status
+        recording.started_at = started_at
+        recording.stopped_at = stopped_at
+        recording.storage_path = storage_path
+        recording.file_size_mb = file_size_mb
+        recording.duration_seconds = duration_seconds
+        recording.camera_id = camera_id
+        recording.tenant_id = tenant_id
+        return recording
     
     def stop(self):
         """Stop recording."""
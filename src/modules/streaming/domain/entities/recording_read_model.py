@@ -0,0 +1,36 @@
+"""Recording read model."""
+from uuid import UUID
+from datetime import datetime
+from typing import NamedTuple, Optional
+from src.streaming.domain.entities.recording import Recording
+
+
+class RecordingReadModel(NamedTuple):
+    """Immutable, behaviour-free view of a recording for bulk reads (exports, reports)."""
+    id: UUID
+    stream_id: UUID
+    camera_id: Optional[UUID]
+    tenant_id: Optional[UUID]
+    status: str
+    started_at: datetime
+    stopped_at: Optional[datetime]
+    retention_days: int
+    storage_path: Optional[str]
+    file_size_mb: float
+    duration_seconds: int
+    
+    @classmethod
+    def from_entity(cls, recording: Recording) -> "RecordingReadModel":
+        return cls(
+            recording.id,
+            recording.stream_id,
+            recording.camera_id,
+            recording.tenant_id,
+            recording.status.value,
+            recording.started_at,
+            recording.stopped_at,
+            recording.retention_policy.days,
+            recording.storage_path,
+            recording.file_size_mb,
+            recording.duration_seconds
+        )
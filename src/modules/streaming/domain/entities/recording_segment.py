@@ -0,0 +1,38 @@
+"""Recording segment entity."""
+from uuid import UUID
+from datetime import datetime
+from typing import Optional
+from src.shared.domain.entity import Entity
+
+
+class RecordingSegment(Entity):
+    """A finished segment file written by the recorder and the time range it covers."""
+    
+    def __init__(
+        self,
+        id: UUID,
+        stream_id: UUID,
+        recording_id: UUID,
+        start_time: datetime,
+        end_time: datetime,
+        storage_path: str,
+        size_bytes: int = 0,
+        camera_id: Optional[UUID] = None
+    ):
+        super().__init__(id)
+        self.stream_id = stream_id
+        self.recording_id = recording_id
+        self.camera_id = camera_id
+        self.start_time = start_time
+        self.end_time = end_time
+        self.storage_path = storage_path
+        self.size_bytes = size_bytes
+    
+    @property
+    def duration_seconds(self) -> float:
+        """Get segment duration in seconds."""
+        return (self.end_time - self.start_time).total_seconds()
+    
+    def overlaps(self, start: datetime, end: datetime) -> bool:
+        """Check if segment overlaps [start, end)."""
+        return self.start_time < end and self.end_time > start
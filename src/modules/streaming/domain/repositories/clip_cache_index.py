@@ -0,0 +1,70 @@
+"""Clip cache index interface."""
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List, NamedTuple, Optional
+from uuid import UUID
+
+
+class ClipCacheEntry(NamedTuple):
+    """A cached clip object and the (aligned) range it covers."""
+    cache_key: str
+    tenant_id: str
+    camera_id: UUID
+    start_time: datetime
+    end_time: datetime
+    codec: str
+    storage_bucket: str
+    storage_key: str
+    size_bytes: int
+    last_accessed_at: datetime
+
+
+class ClipCacheIndex(ABC):
+    """Catalog of cached clips with per-tenant LRU bookkeeping."""
+
+    @abstractmethod
+    async def get(self, cache_key: str) -> Optional[ClipCacheEntry]:
+        """Find an entry by its content key."""
+        pass
+
+    @abstractmethod
+    async def find_overlapping(
+        self,
+        tenant_id: str,
+        camera_id: UUID,
+        codec: str,
+        start_time: datetime,
+        end_time: datetime
+    ) -> List[ClipCacheEntry]:
+        """Entries of the same camera and codec overlapping the range, by start time."""
+        pass
+
+    @abstractmethod
+    async def put(self, entry: ClipCacheEntry) -> None:
+        """Insert or replace an entry."""
+        pass
+
+    @abstractmethod
+    async def touch(self, cache_keys: List[str]) -> None:
+        """Mark entries as used now."""
+        pass
+
+    @abstractmethod
+    async def total_size(self, tenant_id: str) -> int:
+        """Bytes cached for a tenant."""
+        pass
+
+    @abstractmethod
+    async def least_recently_used(
+        self,
+        tenant_id: str,
+        idle_since: datetime,
+        limit: int
+    ) -> List[ClipCacheEntry]:
+        """Oldest-first entries not used since `idle_since`."""
+        pass
+
+    @abstractmethod
+    async def remove(self, cache_keys: List[str]) -> None:
+        """Drop entries."""
+        pass
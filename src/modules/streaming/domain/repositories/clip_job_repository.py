@@ -0,0 +1,57 @@
+"""Clip job repository interface."""
+from abc import abstractmethod
+from uuid import UUID
+from typing import Optional, Tuple
+from src.shared.domain.repository import Repository
+from src.modules.streaming.domain.entities.clip_job import ClipJob
+
+
+class ClipJobRepository(Repository[ClipJob]):
+    """Durable clip job queue.
+
+    A claim is identified by the job's `attempts` after claiming it: a job
+    whose lease expired can be requeued and claimed again, so heartbeat,
+    complete and fail only apply while the job is still RUNNING under the
+    given `attempt`, and return whether they did.
+    """
+
+    @abstractmethod
+    async def enqueue(self, job: ClipJob) -> Tuple[ClipJob, bool]:
+        """Queue a job unless an identical one is queued, running or completed.
+
+        Returns the stored job and whether it was created. A duplicate
+        request with a more urgent priority raises the existing job's priority.
+        """
+        pass
+
+    @abstractmethod
+    async def claim(self, lease_seconds: float) -> Optional[ClipJob]:
+        """Take the most urgent due job and mark it RUNNING for `lease_seconds`."""
+        pass
+
+    @abstractmethod
+    async def heartbeat(self, job_id: UUID, attempt: int, progress: float, lease_seconds: float) -> bool:
+        """Record progress (0-100) and extend the lease of a running job."""
+        pass
+
+    @abstractmethod
+    async def complete(
+        self,
+        job_id: UUID,
+        attempt: int,
+        storage_bucket: str,
+        storage_key: str,
+        size_bytes: int
+    ) -> bool:
+        """Mark a job COMPLETED."""
+        pass
+
+    @abstractmethod
+    async def fail(self, job_id: UUID, attempt: int, error: str, retry_in_seconds: Optional[float] = None) -> bool:
+        """Requeue a job after `retry_in_seconds`, or mark it FAILED when None."""
+        pass
+
+    @abstractmethod
+    async def requeue_expired(self) -> int:
+        """Requeue RUNNING jobs whose lease expired (worker died). Returns count."""
+        pass
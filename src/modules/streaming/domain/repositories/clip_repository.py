@@ -9,6 +9,16 @@ from src.streaming.domain.entities.clip import Clip
 class ClipRepository(Repository[Clip]):
     """Clip repository interface."""
     
+    @abstractmethod
+    async def save_many(self, clips: List[Clip], batch_size: Optional[int] = None) -> int:
+        """Insert or update many clips. Returns rows written."""
+        pass
+    
+    @abstractmethod
+    async def delete_many(self, ids: List[UUID], batch_size: Optional[int] = None) -> int:
+        """Delete many clips. Returns rows deleted."""
+        pass
+    
     @abstractmethod
     async def find_by_recording_id(self, recording_id: UUID) -> List[Clip]:
         """Find clips by recording ID."""
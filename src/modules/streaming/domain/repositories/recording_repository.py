@@ -1,15 +1,27 @@
 """Recording repository interface."""
 from abc import abstractmethod
 from uuid import UUID
-from typing import List, Optional
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 from datetime import datetime
 from src.shared.domain.repository import Repository
 from src.streaming.domain.entities.recording import Recording
+from src.streaming.domain.entities.recording_read_model import RecordingReadModel
+from src.streaming.domain.value_objects.recording_status import RecordingStatus
 
 
 class RecordingRepository(Repository[Recording]):
     """Recording repository interface."""
     
+    @abstractmethod
+    async def save_many(self, recordings: List[Recording], batch_size: Optional[int] = None) -> int:
+        """Insert or update many recordings. Returns rows written."""
+        pass
+    
+    @abstractmethod
+    async def delete_many(self, ids: List[UUID], batch_size: Optional[int] = None) -> int:
+        """Delete many recordings. Returns rows deleted."""
+        pass
+    
     @abstractmethod
     async def find_by_stream_id(self, stream_id: UUID) -> List[Recording]:
         """Find recordings by stream ID."""
@@ -25,9 +37,45 @@ class RecordingRepository(Repository[Recording]):
         self,
         stream_id: Optional[UUID] = None,
         start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None
+        end_date: Optional[datetime] = None,
+        camera_id: Optional[UUID] = None,
+        tenant_id: Optional[UUID] = None,
+        status: Optional[RecordingStatus] = None,
+        limit: Optional[int] = None,
+        after: Optional[Tuple[datetime, UUID]] = None
     ) -> List[Recording]:
-        """Search recordings by filters."""
+        """Search recordings by filters, ordered by (started_at, id) descending.
+        
+        `after` is the (started_at, id) keyset of the last row already seen.
+        """
+        pass
+    
+    @abstractmethod
+    def iter_search(
+        self,
+        stream_id: Optional[UUID] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        camera_id: Optional[UUID] = None,
+        tenant_id: Optional[UUID] = None,
+        status: Optional[RecordingStatus] = None,
+        batch_size: int = 1000
+    ) -> AsyncIterator[RecordingReadModel]:
+        """Iterate over read models of all matching recordings without loading them at once."""
+        pass
+    
+    @abstractmethod
+    async def find_intervals_by_stream_ids(
+        self,
+        stream_ids: List[UUID],
+        start_date: datetime,
+        end_date: datetime,
+        open_only: bool = False
+    ) -> Dict[UUID, List[Tuple[datetime, datetime]]]:
+        """Find (started_at, stopped_at) of recordings overlapping the range for many streams.
+        
+        Open recordings end now; `open_only` returns only those.
+        """
         pass
     
     @abstractmethod
@@ -0,0 +1,133 @@
+"""Retention repository interface."""
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from uuid import UUID
+
+
+class ExpiredRecording(NamedTuple):
+    """A recording past its retention window and the objects it owns."""
+    id: UUID
+    tenant_id: Optional[UUID]
+    camera_id: Optional[UUID]
+    started_at: datetime
+    expires_at: datetime
+    retention_days: int
+    size_bytes: int
+    object_keys: List[str]
+
+
+class MisplacedSegment(NamedTuple):
+    """A segment object whose key is outside the prefix its recording belongs under."""
+    id: UUID
+    recording_id: UUID
+    tenant_id: Optional[UUID]
+    storage_path: str
+    start_time: datetime
+    retention_days: int
+    held: bool
+
+
+# Keyset position: (expires_at, id) of the last recording seen
+RetentionCursor = Tuple[datetime, UUID]
+
+
+def cursor_after(through: datetime) -> RetentionCursor:
+    """Cursor past every recording expiring at or before `through`."""
+    return (through, UUID(int=2 ** 128 - 1))
+
+
+class RetentionRepository(ABC):
+    """Expired-recording scans and set-based retention deletes.
+
+    Recordings flagged `incident` or `legal_hold` are never returned.
+
+    Each tenant has a watermark: every recording expiring at or before it
+    has already been handled, so incremental runs start after it.
+
+    Segment objects belong under their retention class prefix
+    (`RetentionPolicy.storage_prefix`), or under LEGAL_HOLD_PREFIX while
+    the recording is on hold; `find_misplaced` lists the ones that are not.
+    Segments under a class prefix also expire one by one, `retention_days`
+    after their own start (`expire_segments`), like the bucket rule that
+    removes their objects.
+    """
+
+    @abstractmethod
+    async def find_expired(
+        self,
+        now: datetime,
+        after: Optional[RetentionCursor] = None,
+        limit: int = 1000,
+        tenant_id: Optional[UUID] = None
+    ) -> List[ExpiredRecording]:
+        """Next chunk of recordings expired at `now`, in (expires_at, id) order after `after`.
+
+        With `tenant_id` only that tenant's recordings, otherwise all of them.
+        """
+        pass
+
+    @abstractmethod
+    async def next_expirations(self) -> Dict[UUID, datetime]:
+        """Earliest pending expiry per tenant, after the tenant's watermark.
+
+        Recordings without a tenant are left to full sweeps.
+        """
+        pass
+
+    @abstractmethod
+    async def next_expiration(self, tenant_id: UUID) -> Optional[datetime]:
+        """Earliest pending expiry of one tenant after its watermark."""
+        pass
+
+    @abstractmethod
+    async def get_watermark(self, tenant_id: UUID) -> Optional[datetime]:
+        """Time through which the tenant's expirations were handled."""
+        pass
+
+    @abstractmethod
+    async def set_watermark(self, tenant_id: UUID, through: datetime) -> None:
+        """Persist the tenant's watermark."""
+        pass
+
+    @abstractmethod
+    async def find_misplaced(
+        self,
+        now: datetime,
+        after: Optional[UUID] = None,
+        limit: int = 1000
+    ) -> List[MisplacedSegment]:
+        """Next page of misplaced segments of live recordings, in id order after `after`.
+
+        Segments of recordings already expired at `now` and not on hold are
+        left where they are for the cleanup to delete.
+        """
+        pass
+
+    @abstractmethod
+    async def move_segments(self, moves: Dict[UUID, str]) -> int:
+        """Point segments (by id) at their new object keys. Returns rows updated."""
+        pass
+
+    @abstractmethod
+    async def expire_segments(self, now: datetime, limit: int = 1000) -> int:
+        """Drop the rows of segments under a retention class prefix started `retention_days` before `now`.
+
+        Segments of recordings on hold are kept. At most `limit` rows per
+        call; returns rows dropped.
+        """
+        pass
+
+    @abstractmethod
+    async def mark_deleted(
+        self,
+        recordings: List[ExpiredRecording],
+        deleted_by: str,
+        reason: str = "retention_policy"
+    ) -> List[UUID]:
+        """Tombstone the recordings, drop their segment rows and audit each one.
+
+        One transaction per call. Returns the ids actually marked; rows
+        already deleted (or put on hold meanwhile) are skipped.
+        """
+        pass
@@ -0,0 +1,56 @@
+"""Recording segment repository interface."""
+from abc import abstractmethod
+from uuid import UUID
+from typing import Dict, List, Tuple
+from datetime import datetime
+from src.shared.domain.repository import Repository
+from src.modules.streaming.domain.entities.recording_segment import RecordingSegment
+
+
+class SegmentRepository(Repository[RecordingSegment]):
+    """Segment catalog: which segment files exist and what time they cover."""
+    
+    @abstractmethod
+    async def save_many(self, segments: List[RecordingSegment]) -> int:
+        """Insert segments, ignoring already indexed files. Returns rows inserted."""
+        pass
+    
+    @abstractmethod
+    async def find_by_stream_range(
+        self,
+        stream_id: UUID,
+        start_time: datetime,
+        end_time: datetime
+    ) -> List[RecordingSegment]:
+        """Find segments of a stream overlapping [start_time, end_time), ordered by start."""
+        pass
+    
+    @abstractmethod
+    async def find_by_camera_range(
+        self,
+        camera_id: UUID,
+        start_time: datetime,
+        end_time: datetime
+    ) -> List[RecordingSegment]:
+        """Find segments of a camera overlapping [start_time, end_time), ordered by start."""
+        pass
+    
+    @abstractmethod
+    async def find_intervals_by_stream_ids(
+        self,
+        stream_ids: List[UUID],
+        start_time: datetime,
+        end_time: datetime
+    ) -> Dict[UUID, List[Tuple[datetime, datetime]]]:
+        """Find (start, end) of segments overlapping the range for many streams at once."""
+        pass
+    
+    @abstractmethod
+    async def find_by_recording_id(self, recording_id: UUID) -> List[RecordingSegment]:
+        """Find segments of a recording, ordered by start."""
+        pass
+    
+    @abstractmethod
+    async def delete_by_recording_id(self, recording_id: UUID) -> int:
+        """Delete segments of a recording. Returns rows deleted."""
+        pass
@@ -1,6 +1,6 @@
 """Stream repository interface."""
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 from src.streaming.domain.entities.stream import Stream
 
@@ -27,3 +27,13 @@ class StreamRepository(ABC):
     async def delete(self, stream_id: UUID) -> None:
         """Delete stream."""
         pass
+
+    @abstractmethod
+    async def save_many(self, streams: List[Stream], batch_size: Optional[int] = None) -> int:
+        """Insert or update many streams. Returns rows written."""
+        pass
+
+    @abstractmethod
+    async def delete_many(self, stream_ids: List[UUID], batch_size: Optional[int] = None) -> int:
+        """Delete many streams. Returns rows deleted."""
+        pass
@@ -1,6 +1,7 @@
 """FFmpeg service interface."""
 from abc import ABC, abstractmethod
 from uuid import UUID
+from typing import Optional
 
 
 class FFmpegService(ABC):
@@ -20,3 +21,8 @@ class FFmpegService(ABC):
     async def is_recording(self, recording_id: UUID) -> bool:
         """Check if recording is active."""
         pass
+    
+    @abstractmethod
+    async def get_recording_health(self, recording_id: UUID) -> Optional[dict]:
+        """Get recorder health."""
+        pass
@@ -7,8 +7,14 @@ class StorageService(ABC):
     """Storage service interface."""
     
     @abstractmethod
-    async def upload_file(self, local_path: str, remote_path: str) -> str:
-        """Upload file to storage."""
+    async def upload_file(
+        self,
+        local_path: str,
+        remote_path: str,
+        content_type: Optional[str] = None,
+        cache_control: Optional[str] = None
+    ) -> str:
+        """Upload file to storage, optionally with Content-Type and Cache-Control headers."""
         pass
     
     @abstractmethod
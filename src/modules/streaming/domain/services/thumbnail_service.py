@@ -2,14 +2,15 @@
 from abc import ABC, abstractmethod
 from typing import List
 from datetime import datetime
+from src.streaming.domain.value_objects.thumbnail import SpriteSheet, Thumbnail
 
 
 class ThumbnailService(ABC):
     """Thumbnail service interface."""
     
     @abstractmethod
-    async def generate_thumbnail(self, video_path: str, timestamp: datetime, output_path: str) -> str:
-        """Generate single thumbnail from video."""
+    async def generate_thumbnail(self, video_path: str, offset_seconds: float, output_path: str) -> str:
+        """Generate single thumbnail `offset_seconds` into the video."""
         pass
     
     @abstractmethod
@@ -19,6 +20,21 @@ class ThumbnailService(ABC):
         start_time: datetime,
         end_time: datetime,
         interval_seconds: int = 60
-    ) -> List[str]:
-        """Generate multiple thumbnails at intervals."""
+    ) -> List[Thumbnail]:
+        """Generate thumbnails every `interval_seconds`, stamped with wall-clock time.
+        
+        `start_time` is the wall-clock time of the first frame of the video.
+        """
+        pass
+    
+    @abstractmethod
+    async def generate_sprites(
+        self,
+        video_path: str,
+        start_time: datetime,
+        end_time: datetime,
+        interval_seconds: int = 60,
+        columns: int = 10
+    ) -> List[SpriteSheet]:
+        """Tile thumbnails every `interval_seconds` into one sprite sheet per hour."""
         pass
@@ -0,0 +1,191 @@
+"""Timeline engine: merges recorded intervals, emits gaps and aggregates by bucket."""
+import math
+from array import array
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Tuple
+from src.streaming.domain.value_objects.timeline_segment import TimelineSegment
+
+EPOCH = datetime(1970, 1, 1)
+
+
+def to_epoch(value: datetime) -> float:
+    """Convert a naive-UTC or aware datetime to epoch seconds."""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return (value - EPOCH).total_seconds()
+
+
+def from_epoch(value: float) -> datetime:
+    """Convert epoch seconds to a naive-UTC datetime."""
+    return EPOCH + timedelta(seconds=value)
+
+
+def run_length_encode(bits: bytes) -> List[List[int]]:
+    """Encode a 0/1 sequence as `[[value, count], ...]`."""
+    runs: List[List[int]] = []
+    for bit in bits:
+        if runs and runs[-1][0] == bit:
+            runs[-1][1] += 1
+        else:
+            runs.append([bit, 1])
+    return runs
+
+
+class TimelineEngine:
+    """Interval set over a time window, stored as parallel float arrays.
+
+    Intervals are appended unsorted; `merged()` sorts them once and collapses
+    overlapping or touching intervals (within `merge_tolerance_seconds`).
+    Everything after that is a linear sweep, so a 30-day window with
+    thousands of hourly segments stays cheap.
+    """
+
+    def __init__(
+        self,
+        window_start: datetime,
+        window_end: datetime,
+        merge_tolerance_seconds: float = 1.0,
+        now: Optional[datetime] = None
+    ):
+        self.window_start = to_epoch(window_start)
+        self.window_end = to_epoch(window_end)
+        self.merge_tolerance_seconds = merge_tolerance_seconds
+        # Gaps are only reported up to "now": the future is not missing footage
+        self.now = to_epoch(now or datetime.utcnow())
+        self._starts = array("d")
+        self._ends = array("d")
+        self._merged: Optional[List[Tuple[float, float]]] = None
+
+    def add(self, start_time: datetime, end_time: datetime):
+        """Add a recorded interval, clipped to the window."""
+        start = max(to_epoch(start_time), self.window_start)
+        end = min(to_epoch(end_time), self.window_end)
+        if end <= start:
+            return
+        self._starts.append(start)
+        self._ends.append(end)
+        self._merged = None
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def merged(self) -> List[Tuple[float, float]]:
+        """Sorted, non-overlapping recorded intervals as epoch pairs."""
+        if self._merged is not None:
+            return self._merged
+
+        order = sorted(range(len(self._starts)), key=self._starts.__getitem__)
+        merged: List[Tuple[float, float]] = []
+        for i in order:
+            start, end = self._starts[i], self._ends[i]
+            if merged and start <= merged[-1][1] + self.merge_tolerance_seconds:
+                if end > merged[-1][1]:
+                    merged[-1] = (merged[-1][0], end)
+            else:
+                merged.append((start, end))
+
+        self._merged = merged
+        return merged
+
+    def total_recorded_seconds(self) -> int:
+        """Total recorded time inside the window."""
+        return int(sum(end - start for start, end in self.merged()))
+
+    def segments(self) -> List[TimelineSegment]:
+        """Recorded intervals with explicit gap segments between them."""
+        return [
+            TimelineSegment(from_epoch(start), from_epoch(end), has_recording)
+            for start, end, has_recording in self._runs()
+        ]
+
+    def bucketed(self, bucket_seconds: float, min_coverage: float = 0.5) -> List[TimelineSegment]:
+        """Aggregate into fixed buckets, run-length merging buckets of equal state.
+
+        A bucket counts as recorded when at least `min_coverage` of its
+        (past) duration is covered. The result has at most
+        `ceil(window / bucket_seconds)` segments whatever the input size.
+        """
+        horizon = min(self.window_end, max(self.now, self.window_start))
+        recorded_end = max((end for _, end in self.merged()), default=self.window_start)
+        limit = max(horizon, recorded_end)
+
+        runs: List[List] = []
+        intervals = self.merged()
+        idx = 0
+        bucket_start = self.window_start
+        while bucket_start < limit:
+            bucket_end = min(bucket_start + bucket_seconds, limit)
+            while idx < len(intervals) and intervals[idx][1] <= bucket_start:
+                idx += 1
+            covered = 0.0
+            j = idx
+            while j < len(intervals) and intervals[j][0] < bucket_end:
+                covered += min(intervals[j][1], bucket_end) - max(intervals[j][0], bucket_start)
+                j += 1
+            has_recording = covered >= (bucket_end - bucket_start) * min_coverage and covered > 0
+
+            if runs and runs[-1][2] == has_recording:
+                runs[-1][1] = bucket_end
+            else:
+                runs.append([bucket_start, bucket_end, has_recording])
+            bucket_start = bucket_end
+
+        return [
+            TimelineSegment(from_epoch(start), from_epoch(end), has_recording)
+            for start, end, has_recording in runs
+        ]
+
+    def coverage_bitmap(self, buckets: int, min_coverage: float = 0.5) -> bytearray:
+        """One byte (0/1) per bucket of the window, up to "now".
+
+        Buckets starting after now (or after the last recording, if later)
+        are left out instead of being reported as gaps; the bucket holding
+        now is judged on its past part only, like `bucketed`.
+        """
+        bucket_seconds = (self.window_end - self.window_start) / max(buckets, 1)
+        horizon = min(self.window_end, max(self.now, self.window_start))
+        recorded_end = max((end for _, end in self.merged()), default=self.window_start)
+        limit = max(horizon, recorded_end)
+        if bucket_seconds <= 0:
+            return bytearray()
+        bitmap = bytearray(min(buckets, math.ceil((limit - self.window_start) / bucket_seconds)))
+        intervals = self.merged()
+        idx = 0
+        for i in range(len(bitmap)):
+            bucket_start = self.window_start + i * bucket_seconds
+            bucket_end = min(bucket_start + bucket_seconds, limit)
+            while idx < len(intervals) and intervals[idx][1] <= bucket_start:
+                idx += 1
+            covered = 0.0
+            j = idx
+            while j < len(intervals) and intervals[j][0] < bucket_end:
+                covered += min(intervals[j][1], bucket_end) - max(intervals[j][0], bucket_start)
+                j += 1
+            if covered > 0 and covered >= (bucket_end - bucket_start) * min_coverage:
+                bitmap[i] = 1
+        return bitmap
+
+    def downsample(self, max_segments: int) -> List[TimelineSegment]:
+        """Exact segments when they fit in `max_segments`, buckets otherwise."""
+        exact = self._runs()
+        if len(exact) <= max_segments:
+            return self.segments()
+        return self.bucketed(self.bucket_seconds_for(max_segments))
+
+    def bucket_seconds_for(self, buckets: int) -> float:
+        """Bucket size that splits the window into `buckets` pixels."""
+        return max(1.0, math.ceil((self.window_end - self.window_start) / max(buckets, 1)))
+
+    def _runs(self) -> List[Tuple[float, float, bool]]:
+        """Recorded runs interleaved with gaps, gaps limited to the past."""
+        horizon = min(self.window_end, max(self.now, self.window_start))
+        runs: List[Tuple[float, float, bool]] = []
+        cursor = self.window_start
+        for start, end in self.merged():
+            if start > cursor and cursor < horizon:
+                runs.append((cursor, min(start, horizon), False))
+            runs.append((start, end, True))
+            cursor = end
+        if cursor < horizon:
+            runs.append((cursor, horizon, False))
+        return runs
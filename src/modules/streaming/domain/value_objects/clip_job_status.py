@@ -0,0 +1,10 @@
+"""Clip job status enum."""
+from enum import Enum
+
+
+class ClipJobStatus(Enum):
+    """Clip export job status."""
+    QUEUED = "QUEUED"
+    RUNNING = "RUNNING"
+    COMPLETED = "COMPLETED"
+    FAILED = "FAILED"
@@ -3,6 +3,11 @@ from src.shared.domain.value_object import ValueObject
 from src.shared.domain.domain_exception import DomainException
 
 
+# Recordings on incident/legal hold are kept under this prefix, which no
+# lifecycle rule expires
+LEGAL_HOLD_PREFIX = "legal-hold/"
+
+
 class RetentionPolicy(ValueObject):
     """Retention policy for recordings."""
     
@@ -17,5 +22,10 @@ class RetentionPolicy(ValueObject):
     def days(self) -> int:
         return self._days
     
+    @property
+    def storage_prefix(self) -> str:
+        """Object-key prefix of this retention class, expired by a bucket lifecycle rule."""
+        return f"retention-{self._days}d/"
+    
     def _get_equality_components(self):
         return [self._days]
@@ -30,3 +30,69 @@ class Thumbnail(ValueObject):
     
     def _get_equality_components(self):
         return [self._timestamp, self._url]
+
+
+class SpriteSheet(ValueObject):
+    """Grid of thumbnails in one image, filled row by row.
+    
+    Tile `i` shows the frame at `start_time + i * interval_seconds`.
+    """
+    
+    def __init__(
+        self,
+        url: str,
+        start_time: datetime,
+        interval_seconds: int,
+        count: int,
+        columns: int,
+        rows: int,
+        width: int = 160,
+        height: int = 90
+    ):
+        self._url = url
+        self._start_time = start_time
+        self._interval_seconds = interval_seconds
+        self._count = count
+        self._columns = columns
+        self._rows = rows
+        self._width = width
+        self._height = height
+    
+    @property
+    def url(self) -> str:
+        return self._url
+    
+    @property
+    def start_time(self) -> datetime:
+        return self._start_time
+    
+    @property
+    def interval_seconds(self) -> int:
+        return self._interval_seconds
+    
+    @property
+    def count(self) -> int:
+        return self._count
+    
+    @property
+    def columns(self) -> int:
+        return self._columns
+    
+    @property
+    def rows(self) -> int:
+        return self._rows
+    
+    @property
+    def width(self) -> int:
+        return self._width
+    
+    @property
+    def height(self) -> int:
+        return self._height
+    
+    def tile_position(self, index: int) -> tuple:
+        """Pixel (x, y) of tile `index`."""
+        return (index % self._columns) * self._width, (index // self._columns) * self._height
+    
+    def _get_equality_components(self):
+        return [self._url, self._start_time, self._interval_seconds, self._count]
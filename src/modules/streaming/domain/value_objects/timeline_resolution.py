@@ -0,0 +1,9 @@
+"""Timeline resolution enum."""
+from enum import Enum
+
+
+class TimelineResolution(Enum):
+    """Bucket size for timeline aggregation, in seconds."""
+    MINUTE = 60
+    HOUR = 3600
+    DAY = 86400
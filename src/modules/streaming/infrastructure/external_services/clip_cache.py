@@ -0,0 +1,222 @@
+"""Content-addressed cache of exported clips."""
+import asyncio
+import hashlib
+import os
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+
+from botocore.exceptions import ClientError
+from prometheus_client import Counter
+
+from src.modules.streaming.domain.repositories.clip_cache_index import ClipCacheEntry, ClipCacheIndex
+from src.shared.infrastructure.logger import Logger
+
+
+CACHE_PREFIX = "cache/"
+DELETE_BATCH = 1000  # S3 DeleteObjects limit
+
+clip_cache_requests_total = Counter(
+    'clip_cache_requests_total',
+    'Clip exports by cache outcome (hit, partial, miss)',
+    ['result']
+)
+
+clip_cache_evicted_bytes_total = Counter(
+    'clip_cache_evicted_bytes_total',
+    'Bytes of cached clips evicted to stay under the tenant budget'
+)
+
+
+def align_range(start_time: datetime, end_time: datetime, align_seconds: float) -> Tuple[datetime, datetime]:
+    """Widen a range to multiples of `align_seconds` (start down, end up).
+
+    Stream copy cuts on keyframes anyway, so requests that differ by less
+    than a GOP produce the same clip and should share a cache key.
+    """
+    step = timedelta(seconds=align_seconds)
+    epoch = datetime(1970, 1, 1, tzinfo=start_time.tzinfo)
+    aligned_start = start_time - (start_time - epoch) % step
+    remainder = (end_time - epoch) % step
+    aligned_end = end_time + (step - remainder) if remainder else end_time
+    return aligned_start, aligned_end
+
+
+def clip_cache_key(
+    tenant_id: str,
+    camera_id: UUID,
+    start_time: datetime,
+    end_time: datetime,
+    codec: str
+) -> str:
+    """Content key of a clip: same inputs and codec params, same bytes."""
+    raw = "|".join((tenant_id, str(camera_id), start_time.isoformat(), end_time.isoformat(), codec))
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+def cover_range(
+    cached: List[ClipCacheEntry],
+    start_time: datetime,
+    end_time: datetime,
+    min_reuse_seconds: float = 0
+) -> List[Tuple[Optional[ClipCacheEntry], datetime, datetime]]:
+    """Split a range into pieces served by cached clips or, where None, by segments.
+
+    Greedy: at each point the cached clip reaching furthest is used, as
+    long as it contributes at least `min_reuse_seconds` (shorter pieces
+    would only add concat junctions).
+    """
+    min_reuse = timedelta(seconds=min_reuse_seconds)
+    pieces = []
+    t = start_time
+    while t < end_time:
+        covering = [
+            e for e in cached
+            if e.start_time <= t < e.end_time and min(e.end_time, end_time) - t >= min_reuse
+        ]
+        if covering:
+            best = max(covering, key=lambda e: e.end_time)
+            piece_end = min(best.end_time, end_time)
+        else:
+            best = None
+            piece_end = min([e.start_time for e in cached if e.start_time > t] + [end_time])
+        if pieces and best is None and pieces[-1][0] is None:
+            pieces[-1] = (None, pieces[-1][1], piece_end)
+        else:
+            pieces.append((best, t, piece_end))
+        t = piece_end
+    return pieces
+
+
+class ClipCache:
+    """Exported clips stored once per content key under `cache/` in the clips bucket.
+
+    An export first looks up its key; on a hit the stored object is copied
+    server-side and ffmpeg does not run. On a miss, cached clips overlapping
+    the range are reused as concat inputs and only the gaps are read from
+    the recording segments.
+
+    Each tenant has a size budget (`CLIP_CACHE_TENANT_BUDGET_GB`). Over it,
+    least recently used entries are deleted, skipping those used in the
+    last `CLIP_CACHE_MIN_IDLE_SECONDS` since a running export may still be
+    reading them.
+    """
+
+    def __init__(
+        self,
+        index: ClipCacheIndex,
+        s3_client,
+        tenant_budget_bytes: Optional[int] = None,
+        align_seconds: Optional[float] = None,
+        min_reuse_seconds: Optional[float] = None,
+        min_idle_seconds: Optional[float] = None
+    ):
+        self.logger = Logger(__name__)
+        self.index = index
+        self.s3_client = s3_client
+        self.tenant_budget_bytes = tenant_budget_bytes or int(
+            float(os.getenv("CLIP_CACHE_TENANT_BUDGET_GB", "50")) * 1024 ** 3
+        )
+        self.align_seconds = align_seconds or float(os.getenv("CLIP_CACHE_ALIGN_SECONDS", "2"))
+        self.min_reuse_seconds = (
+            min_reuse_seconds if min_reuse_seconds is not None
+            else float(os.getenv("CLIP_CACHE_MIN_REUSE_SECONDS", "10"))
+        )
+        self.min_idle_seconds = (
+            min_idle_seconds if min_idle_seconds is not None
+            else float(os.getenv("CLIP_CACHE_MIN_IDLE_SECONDS", "600"))
+        )
+
+    def key_for(
+        self,
+        tenant_id: str,
+        camera_id: UUID,
+        start_time: datetime,
+        end_time: datetime,
+        codec: str
+    ) -> Tuple[str, datetime, datetime]:
+        """Cache key and the aligned range the cached clip covers."""
+        start_time, end_time = align_range(start_time, end_time, self.align_seconds)
+        return clip_cache_key(tenant_id, camera_id, start_time, end_time, codec), start_time, end_time
+
+    @staticmethod
+    def object_key(camera_id: UUID, cache_key: str) -> str:
+        return f"{CACHE_PREFIX}{camera_id}/{cache_key}.mp4"
+
+    async def lookup(self, cache_key: str) -> Optional[ClipCacheEntry]:
+        """Return the entry if its object still exists, marking it used."""
+        entry = await self.index.get(cache_key)
+        if entry is None:
+            return None
+        try:
+            await asyncio.to_thread(
+                self.s3_client.head_object, Bucket=entry.storage_bucket, Key=entry.storage_key
+            )
+        except ClientError:
+            self.logger.warning(f"Cached clip {entry.storage_key} is gone, dropping entry")
+            await self.index.remove([cache_key])
+            return None
+        await self.index.touch([cache_key])
+        return entry
+
+    async def overlapping(
+        self,
+        tenant_id: str,
+        camera_id: UUID,
+        codec: str,
+        start_time: datetime,
+        end_time: datetime
+    ) -> List[ClipCacheEntry]:
+        """Cached clips usable as inputs for the range, marked used."""
+        entries = await self.index.find_overlapping(tenant_id, camera_id, codec, start_time, end_time)
+        await self.index.touch([e.cache_key for e in entries])
+        return entries
+
+    async def store(self, entry: ClipCacheEntry) -> None:
+        """Record a freshly exported clip and enforce the tenant budget."""
+        await self.index.put(entry)
+        try:
+            await self.evict(entry.tenant_id)
+        except Exception as e:
+            self.logger.error(f"Clip cache eviction failed for tenant {entry.tenant_id}: {e}")
+
+    async def evict(self, tenant_id: str) -> int:
+        """Delete LRU idle entries until the tenant is under budget. Returns bytes freed."""
+        excess = await self.index.total_size(tenant_id) - self.tenant_budget_bytes
+        if excess <= 0:
+            return 0
+
+        idle_since = datetime.utcnow() - timedelta(seconds=self.min_idle_seconds)
+        freed = 0
+        evicted = 0
+        while freed < excess:
+            victims = []
+            batch = await self.index.least_recently_used(tenant_id, idle_since, DELETE_BATCH)
+            for entry in batch:
+                victims.append(entry)
+                freed += entry.size_bytes
+                if freed >= excess:
+                    break
+            if not victims:
+                break
+            await asyncio.to_thread(self._delete_objects, victims)
+            await self.index.remove([e.cache_key for e in victims])
+            evicted += len(victims)
+            if len(batch) < DELETE_BATCH:
+                break
+
+        if evicted:
+            clip_cache_evicted_bytes_total.inc(freed)
+            self.logger.info(f"Evicted {evicted} cached clips ({freed} bytes) for tenant {tenant_id}")
+        return freed
+
+    def _delete_objects(self, entries: List[ClipCacheEntry]) -> None:
+        by_bucket: Dict[str, List[str]] = {}
+        for entry in entries:
+            by_bucket.setdefault(entry.storage_bucket, []).append(entry.storage_key)
+        for bucket, keys in by_bucket.items():
+            for i in range(0, len(keys), DELETE_BATCH):
+                self.s3_client.delete_objects(
+                    Bucket=bucket,
+                    Delete={'Objects': [{'Key': key} for key in keys[i:i + DELETE_BATCH]], 'Quiet': True}
+                )
@@ -0,0 +1,274 @@
+"""Keyframe-aligned clip extraction from indexed recording segments."""
+import asyncio
+import os
+import re
+import tempfile
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Iterable, List, NamedTuple, Optional, Tuple
+
+from src.modules.streaming.infrastructure.workers.segment_indexer import parse_segment_timestamp
+from src.shared.infrastructure.logger import Logger
+
+
+PROGRESS_LINE = re.compile(r"^[a-z0-9_]+=\S*$")
+
+
+class ClipExtractionError(Exception):
+    """ffmpeg failed or timed out while cutting a clip."""
+
+
+class SegmentSpan(NamedTuple):
+    """A stored segment object and the wall-clock range it covers."""
+    key: str
+    start_time: datetime
+    end_time: datetime
+
+
+class ClipPart(NamedTuple):
+    """One input of the concat list; points are seconds from the segment start."""
+    key: str
+    inpoint: Optional[float]
+    outpoint: Optional[float]
+
+
+def spans_from_listing(
+    keys: Iterable[str],
+    start_time: datetime,
+    end_time: datetime,
+    segment_seconds: float = 3600
+) -> List[SegmentSpan]:
+    """Time-filter a raw object listing using the timestamps in the file names.
+
+    Fallback for recordings that are not in the segment catalog: each segment
+    is assumed to end where the next one starts, the last one after
+    `segment_seconds`. Keys without a timestamp are skipped.
+    """
+    timed = sorted(
+        (ts, key) for key in keys
+        if (ts := parse_segment_timestamp(key)) is not None
+    )
+    spans = []
+    for i, (ts, key) in enumerate(timed):
+        ends = timed[i + 1][0] if i + 1 < len(timed) else ts + timedelta(seconds=segment_seconds)
+        if ts < end_time and ends > start_time:
+            spans.append(SegmentSpan(key, ts, ends))
+    return spans
+
+
+def plan_clip(spans: List[SegmentSpan], start_time: datetime, end_time: datetime) -> List[ClipPart]:
+    """Pick the segments overlapping [start_time, end_time) and where to cut them.
+
+    Only the first and last segments get in/out points; segments fully
+    inside the range are copied whole.
+    """
+    parts = []
+    for span in sorted(spans, key=lambda s: s.start_time):
+        if span.start_time >= end_time or span.end_time <= start_time:
+            continue
+        inpoint = (start_time - span.start_time).total_seconds()
+        outpoint = (end_time - span.start_time).total_seconds()
+        parts.append(ClipPart(
+            span.key,
+            inpoint if inpoint > 0 else None,
+            outpoint if span.start_time + timedelta(seconds=outpoint) < span.end_time else None
+        ))
+    return parts
+
+
+def build_concat_list(parts: List[ClipPart], url_for: Callable[[str], str]) -> str:
+    """Render an ffconcat script reading every part from its (presigned) URL."""
+    lines = ["ffconcat version 1.0"]
+    for part in parts:
+        url = url_for(part.key).replace("'", "'\\''")
+        lines.append(f"file '{url}'")
+        if part.inpoint is not None:
+            lines.append(f"inpoint {part.inpoint:.3f}")
+        if part.outpoint is not None:
+            lines.append(f"outpoint {part.outpoint:.3f}")
+    return "\n".join(lines) + "\n"
+
+
+class ClipEngine:
+    """Cuts clips with stream copy in a bounded pool of ffmpeg processes.
+
+    Segments are read straight from object storage over HTTP. ffmpeg seeks
+    with range requests, so only the moov box and the media around the
+    in/out points of the edge segments are fetched instead of whole
+    one-hour files. With `-c copy` the concat demuxer starts each part at
+    the keyframe preceding its inpoint, so clips may begin up to one GOP
+    early but are never re-encoded.
+
+    `cut_to_stream` writes fragmented MP4 to stdout instead of a file so the
+    output can be uploaded while ffmpeg is still running.
+
+    With an `on_progress` callback ffmpeg also reports `-progress` on
+    stderr; the callback receives the output position in seconds.
+    """
+
+    STDERR_TAIL_LINES = 20
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        timeout_seconds: Optional[float] = None,
+        ffmpeg_binary: str = "ffmpeg"
+    ):
+        self.logger = Logger(__name__)
+        self.max_workers = max_workers or int(os.getenv("CLIP_MAX_WORKERS", "4"))
+        self.timeout_seconds = timeout_seconds or float(os.getenv("CLIP_FFMPEG_TIMEOUT", "300"))
+        self.ffmpeg_binary = ffmpeg_binary
+        self._slots = asyncio.Semaphore(self.max_workers)
+        self.active = 0
+
+    def build_command(
+        self,
+        list_path: str,
+        output_path: str,
+        faststart: bool = True,
+        fragmented: bool = False,
+        progress: bool = False
+    ) -> List[str]:
+        """Build the concat + stream copy command.
+
+        Fragmented output needs no seek back to write the moov box, so it can
+        go to a pipe; faststart output has to be a regular file.
+        """
+        cmd = [
+            self.ffmpeg_binary,
+            "-nostdin",
+            "-hide_banner",
+            "-loglevel", "error",
+        ]
+        if progress:
+            cmd += ["-nostats", "-progress", "pipe:2"]
+        cmd += [
+            "-f", "concat",
+            "-safe", "0",
+            "-protocol_whitelist", "file,http,https,tcp,tls,crypto",
+            "-i", list_path,
+            "-c", "copy",
+            "-avoid_negative_ts", "make_zero",
+        ]
+        if fragmented:
+            cmd += ["-movflags", "frag_keyframe+empty_moov+default_base_moof", "-f", "mp4"]
+        elif faststart:
+            cmd += ["-movflags", "+faststart"]
+        return cmd + ["-y", output_path]
+
+    async def cut(
+        self,
+        parts: List[ClipPart],
+        url_for: Callable[[str], str],
+        output_path: str,
+        faststart: bool = True,
+        on_progress: Optional[Callable[[float], None]] = None
+    ) -> None:
+        """Write the clip described by `parts` to `output_path`."""
+        list_path = self._write_concat_list(parts, url_for)
+        try:
+            await self.run(
+                self.build_command(list_path, output_path, faststart, progress=on_progress is not None),
+                on_progress=on_progress
+            )
+        finally:
+            os.unlink(list_path)
+
+    async def cut_to_stream(
+        self,
+        parts: List[ClipPart],
+        url_for: Callable[[str], str],
+        consume: Callable[[asyncio.StreamReader], Awaitable[Any]],
+        on_progress: Optional[Callable[[float], None]] = None
+    ) -> Any:
+        """Pipe the clip as fragmented MP4 into `consume` and return its result.
+
+        Raises ClipExtractionError if ffmpeg fails, even after `consume` has
+        read everything, so callers must not commit the output before this
+        returns.
+        """
+        list_path = self._write_concat_list(parts, url_for)
+        try:
+            return await self.run(
+                self.build_command(
+                    list_path, "pipe:1", fragmented=True, progress=on_progress is not None
+                ),
+                consume,
+                on_progress
+            )
+        finally:
+            os.unlink(list_path)
+
+    async def run(
+        self,
+        cmd: List[str],
+        consume: Optional[Callable[[asyncio.StreamReader], Awaitable[Any]]] = None,
+        on_progress: Optional[Callable[[float], None]] = None
+    ) -> Any:
+        """Run one ffmpeg invocation once a worker slot is free."""
+        async with self._slots:
+            self.active += 1
+            try:
+                exit_code, stderr_tail, result = await self._run_process(cmd, consume, on_progress)
+            finally:
+                self.active -= 1
+
+        if exit_code != 0:
+            raise ClipExtractionError(
+                f"ffmpeg exited with {exit_code}: {' | '.join(stderr_tail)}"
+            )
+        return result
+
+    @staticmethod
+    def _write_concat_list(parts: List[ClipPart], url_for: Callable[[str], str]) -> str:
+        if not parts:
+            raise ClipExtractionError("No segments to cut")
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".ffconcat", delete=False) as f:
+            f.write(build_concat_list(parts, url_for))
+            return f.name
+
+    async def _run_process(
+        self,
+        cmd: List[str],
+        consume: Optional[Callable[[asyncio.StreamReader], Awaitable[Any]]],
+        on_progress: Optional[Callable[[float], None]]
+    ) -> Tuple[int, List[str], Any]:
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE if consume else asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE
+        )
+        stderr_tail = deque(maxlen=self.STDERR_TAIL_LINES)
+
+        async def drain():
+            async for raw in process.stderr:
+                line = raw.decode(errors="replace").strip()
+                if not PROGRESS_LINE.match(line):
+                    stderr_tail.append(line)
+                    continue
+                key, _, value = line.partition("=")
+                if on_progress and key == "out_time_us" and value.isdigit():
+                    on_progress(int(value) / 1_000_000)
+
+        async def read_output():
+            return await consume(process.stdout) if consume else None
+
+        try:
+            _, result, _ = await asyncio.wait_for(
+                asyncio.gather(drain(), read_output(), process.wait()),
+                timeout=self.timeout_seconds
+            )
+        except asyncio.TimeoutError:
+            await self._kill(process)
+            raise ClipExtractionError(f"ffmpeg timed out after {self.timeout_seconds:.0f}s")
+        except BaseException:
+            await self._kill(process)
+            raise
+        return process.returncode, list(stderr_tail), result
+
+    @staticmethod
+    async def _kill(process: asyncio.subprocess.Process) -> None:
+        if process.returncode is None:
+            process.kill()
+            await process.wait()
@@ -0,0 +1,286 @@
+"""Exportação de clipes MP4 a partir dos segmentos gravados no MinIO."""
+import asyncio
+import os
+import tempfile
+from datetime import datetime
+from typing import Callable, List, Optional, Tuple
+from uuid import UUID
+
+import boto3
+
+from src.modules.streaming.domain.repositories.clip_cache_index import ClipCacheEntry
+from src.modules.streaming.domain.repositories.segment_repository import SegmentRepository
+from src.modules.streaming.infrastructure.external_services.clip_cache import (
+    CACHE_PREFIX,
+    ClipCache,
+    clip_cache_requests_total,
+    cover_range,
+)
+from src.modules.streaming.infrastructure.external_services.clip_engine import (
+    ClipEngine,
+    ClipPart,
+    SegmentSpan,
+    plan_clip,
+    spans_from_listing,
+)
+from src.modules.streaming.infrastructure.external_services.multipart_upload import MultipartUpload
+
+s3_client = boto3.client(
+    's3',
+    endpoint_url='http://minio:9000',
+    aws_access_key_id='minioadmin',
+    aws_secret_access_key='minioadmin'
+)
+
+
+def _progress_reporter(
+    on_progress: Optional[Callable[[float], None]],
+    duration: float
+) -> Optional[Callable[[float], None]]:
+    """Converte segundos processados pelo FFmpeg em percentual (até 99 antes do upload terminar)."""
+    if not on_progress:
+        return None
+    
+    def report(seconds: float) -> None:
+        on_progress(min(99.0, 100.0 * seconds / duration) if duration > 0 else 0.0)
+    return report
+
+
+class ClipExportService:
+    """Serviço para exportação de clipes MP4 a partir do índice de segmentos."""
+    
+    def __init__(
+        self,
+        segment_repository: Optional[SegmentRepository] = None,
+        engine: Optional[ClipEngine] = None,
+        cache: Optional[ClipCache] = None
+    ):
+        self.segment_repository = segment_repository
+        self.engine = engine or ClipEngine()
+        self.cache = cache
+    
+    async def export_clip(
+        self,
+        tenant_id: str,
+        camera_id: str,
+        start_time: datetime,
+        end_time: datetime,
+        clip_id: str,
+        faststart: bool = False,
+        on_progress: Optional[Callable[[float], None]] = None
+    ) -> dict:
+        """
+        Exporta clipe MP4 cortando apenas os segmentos do período.
+        
+        Processo:
+        1. Seleciona no índice os segmentos que cobrem o período
+        2. FFmpeg lê os segmentos via URL pré-assinada (range GETs) e corta
+           nos keyframes com stream copy, num pool limitado de processos
+        3. Por padrão o MP4 fragmentado sai do stdout do FFmpeg direto para
+           um multipart upload no MinIO, sem tocar o disco local; com
+           `faststart` o MP4 é gerado em arquivo temporário e enviado depois
+        
+        Com `cache`, o período é alinhado e vira uma chave de conteúdo: se
+        o clipe já existe no MinIO é copiado no servidor sem rodar o FFmpeg;
+        senão, clipes em cache que se sobrepõem ao período entram como
+        partes do concat e só as lacunas são lidas dos segmentos.
+        
+        `on_progress` recebe o percentual (0-100) conforme o FFmpeg avança.
+        """
+        
+        try:
+            recordings_bucket = f"gtvision-recordings-{tenant_id}"
+            bucket = f"gtvision-clips-{tenant_id}"
+            key = f"{camera_id}/clips/{clip_id}.mp4"
+            codec = "copy:faststart" if faststart else "copy:fmp4"
+            
+            pieces = [(None, start_time, end_time)]
+            if self.cache:
+                cache_key, start_time, end_time = self.cache.key_for(
+                    tenant_id, UUID(camera_id), start_time, end_time, codec
+                )
+                hit = await self.cache.lookup(cache_key)
+                if hit:
+                    return await self._serve_cached(hit, bucket, key)
+                pieces = await self._cover_with_cache(tenant_id, camera_id, codec, start_time, end_time)
+            
+            parts = await self._plan(tenant_id, camera_id, pieces)
+            
+            if not parts:
+                raise Exception("No segments found for the specified period")
+            
+            def url_for(part_key: str) -> str:
+                # Clipes em cache ficam no bucket de clipes, segmentos no de gravações
+                source_bucket = bucket if part_key.startswith(CACHE_PREFIX) else recordings_bucket
+                return s3_client.generate_presigned_url(
+                    'get_object',
+                    Params={'Bucket': source_bucket, 'Key': part_key},
+                    ExpiresIn=3600
+                )
+            
+            output_key = self.cache.object_key(camera_id, cache_key) if self.cache else key
+            metadata = {
+                'camera_id': camera_id,
+                'start_time': start_time.isoformat(),
+                'end_time': end_time.isoformat(),
+                'clip_id': clip_id
+            }
+            
+            report = _progress_reporter(on_progress, (end_time - start_time).total_seconds())
+            
+            if faststart:
+                size_bytes = await self._export_via_file(parts, url_for, bucket, output_key, metadata, report)
+            else:
+                async with MultipartUpload(
+                    s3_client, bucket, output_key, content_type='video/mp4', metadata=metadata
+                ) as upload:
+                    size_bytes = await self.engine.cut_to_stream(
+                        parts, url_for, upload.write_from, report
+                    )
+            
+            if self.cache:
+                await self._store_in_cache(ClipCacheEntry(
+                    cache_key, tenant_id, UUID(camera_id), start_time, end_time, codec,
+                    bucket, output_key, size_bytes, datetime.utcnow()
+                ), key)
+            
+            return self._completed(bucket, key, size_bytes)
+            
+        except Exception as e:
+            return {
+                "status": "failed",
+                "error": str(e)
+            }
+    
+    async def _serve_cached(self, hit: ClipCacheEntry, bucket: str, key: str) -> dict:
+        """Clipe inteiro já em cache: cópia no servidor, sem FFmpeg."""
+        clip_cache_requests_total.labels(result="hit").inc()
+        await self._copy(hit.storage_bucket, hit.storage_key, bucket, key)
+        return self._completed(bucket, key, hit.size_bytes, cached=True)
+    
+    async def _cover_with_cache(
+        self,
+        tenant_id: str,
+        camera_id: str,
+        codec: str,
+        start_time: datetime,
+        end_time: datetime
+    ) -> List[Tuple[Optional[ClipCacheEntry], datetime, datetime]]:
+        """Cobre o período com clipes em cache que se sobrepõem; lacunas ficam com entry None."""
+        cached = await self.cache.overlapping(tenant_id, UUID(camera_id), codec, start_time, end_time)
+        pieces = cover_range(cached, start_time, end_time, self.cache.min_reuse_seconds)
+        reused = any(entry for entry, _, _ in pieces)
+        clip_cache_requests_total.labels(result="partial" if reused else "miss").inc()
+        return pieces
+    
+    async def _store_in_cache(self, entry: ClipCacheEntry, key: str) -> None:
+        """Registra o clipe gerado no cache e copia para a chave pedida."""
+        await self.cache.store(entry)
+        await self._copy(entry.storage_bucket, entry.storage_key, entry.storage_bucket, key)
+    
+    def _completed(self, bucket: str, key: str, size_bytes: int, cached: bool = False) -> dict:
+        # Gerar URL de download (válida por 7 dias)
+        download_url = s3_client.generate_presigned_url(
+            'get_object',
+            Params={'Bucket': bucket, 'Key': key},
+            ExpiresIn=604800  # 7 dias
+        )
+        
+        return {
+            "status": "completed",
+            "bucket": bucket,
+            "key": key,
+            "download_url": download_url,
+            "size_bytes": size_bytes,
+            "cached": cached
+        }
+    
+    async def _copy(self, source_bucket: str, source_key: str, bucket: str, key: str) -> None:
+        """Cópia no servidor (multipart para objetos grandes), sem trafegar pelo worker."""
+        await asyncio.to_thread(
+            s3_client.copy,
+            {'Bucket': source_bucket, 'Key': source_key},
+            bucket,
+            key
+        )
+    
+    async def _plan(
+        self,
+        tenant_id: str,
+        camera_id: str,
+        pieces: List[Tuple[Optional[ClipCacheEntry], datetime, datetime]]
+    ) -> List[ClipPart]:
+        """Monta as partes do concat: clipes em cache onde houver, segmentos nas lacunas."""
+        
+        gaps = [(start, end) for entry, start, end in pieces if entry is None]
+        spans = []
+        if gaps:
+            spans = await self._list_segments(tenant_id, camera_id, gaps[0][0], gaps[-1][1])
+        
+        parts = []
+        for entry, start, end in pieces:
+            if entry:
+                parts.extend(plan_clip(
+                    [SegmentSpan(entry.storage_key, entry.start_time, entry.end_time)], start, end
+                ))
+            else:
+                parts.extend(plan_clip(spans, start, end))
+        return parts
+    
+    async def _export_via_file(
+        self,
+        parts: List[ClipPart],
+        url_for: Callable[[str], str],
+        bucket: str,
+        key: str,
+        metadata: dict,
+        on_progress: Optional[Callable[[float], None]] = None
+    ) -> int:
+        """Gera MP4 com faststart em arquivo temporário e faz upload (fora do event loop)."""
+        
+        output_path = os.path.join(tempfile.gettempdir(), os.path.basename(key))
+        try:
+            await self.engine.cut(parts, url_for, output_path, faststart=True, on_progress=on_progress)
+            size_bytes = os.path.getsize(output_path)
+            await asyncio.to_thread(
+                s3_client.upload_file,
+                output_path,
+                bucket,
+                key,
+                ExtraArgs={'ContentType': 'video/mp4', 'Metadata': metadata}
+            )
+            return size_bytes
+        finally:
+            if os.path.exists(output_path):
+                os.unlink(output_path)
+    
+    async def _list_segments(
+        self,
+        tenant_id: str,
+        camera_id: str,
+        start_time: datetime,
+        end_time: datetime
+    ) -> List[SegmentSpan]:
+        """Lista segmentos do período via catálogo de segmentos (range query)."""
+        
+        if self.segment_repository:
+            indexed = await self.segment_repository.find_by_camera_range(
+                UUID(camera_id), start_time, end_time
+            )
+            return [
+                SegmentSpan(seg.storage_path, seg.start_time, seg.end_time)
+                for seg in indexed
+            ]
+        
+        # Sem catálogo: listagem do prefixo filtrada pelo horário no nome do arquivo
+        bucket = f"gtvision-recordings-{tenant_id}"
+        paginator = s3_client.get_paginator('list_objects_v2')
+        
+        def list_keys() -> List[str]:
+            return [
+                obj['Key']
+                for page in paginator.paginate(Bucket=bucket, Prefix=f"{camera_id}/segments/")
+                for obj in page.get('Contents', [])
+            ]
+        
+        return spans_from_listing(await asyncio.to_thread(list_keys), start_time, end_time)
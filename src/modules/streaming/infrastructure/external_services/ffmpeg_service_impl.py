@@ -1,43 +1,55 @@
 """FFmpeg service implementation."""
-import asyncio
 import os
 from uuid import UUID
-from typing import Dict
+from typing import List, Optional
 from src.streaming.domain.services.ffmpeg_service import FFmpegService
+from src.streaming.infrastructure.external_services.recorder_supervisor import RecorderSupervisor
 from src.shared.infrastructure.logger import Logger
 
 
 class FFmpegServiceImpl(FFmpegService):
     """FFmpeg service implementation."""
     
-    def __init__(self):
+    def __init__(self, supervisor: Optional[RecorderSupervisor] = None):
         self.logger = Logger(__name__)
-        self.processes: Dict[UUID, asyncio.subprocess.Process] = {}
+        self.supervisor = supervisor or RecorderSupervisor()
+    
+    @staticmethod
+    def segment_list_path(output_path: str) -> str:
+        """Path of the CSV list ffmpeg appends to as each segment closes."""
+        return f"{output_path}_segments.csv"
+    
+    def build_command(self, source_url: str, output_path: str) -> List[str]:
+        """Build ffmpeg segment recording command."""
+        return [
+            "ffmpeg",
+            "-nostdin",
+            "-hide_banner",
+            "-loglevel", "error",
+            "-nostats",
+            "-progress", "pipe:1",
+            "-i", source_url,
+            "-c:v", "copy",
+            "-c:a", "copy",
+            "-f", "segment",
+            "-segment_time", "3600",
+            "-strftime", "1",
+            "-reset_timestamps", "1",
+            "-segment_list", self.segment_list_path(output_path),
+            "-segment_list_type", "csv",
+            f"{output_path}_%Y%m%d_%H%M%S.mp4"
+        ]
     
     async def start_recording(self, recording_id: UUID, source_url: str, output_path: str) -> bool:
         """Start recording from RTSP source."""
         try:
             os.makedirs(os.path.dirname(output_path), exist_ok=True)
             
-            cmd = [
-                "ffmpeg",
-                "-i", source_url,
-                "-c:v", "copy",
-                "-c:a", "copy",
-                "-f", "segment",
-                "-segment_time", "3600",
-                "-strftime", "1",
-                "-reset_timestamps", "1",
-                f"{output_path}_%Y%m%d_%H%M%S.mp4"
-            ]
-            
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
+            cmd = self.build_command(source_url, output_path)
+            if not await self.supervisor.start(recording_id, cmd):
+                self.logger.error(f"Recorder pool full, cannot start recording {recording_id}")
+                return False
             
-            self.processes[recording_id] = process
             self.logger.info(f"Started recording {recording_id}")
             return True
             
@@ -48,14 +60,9 @@ class FFmpegServiceImpl(FFmpegService):
     async def stop_recording(self, recording_id: UUID) -> bool:
         """Stop recording."""
         try:
-            process = self.processes.get(recording_id)
-            if not process:
+            if not await self.supervisor.stop(recording_id):
                 return False
             
-            process.terminate()
-            await process.wait()
-            del self.processes[recording_id]
-            
             self.logger.info(f"Stopped recording {recording_id}")
             return True
             
@@ -65,5 +72,12 @@ class FFmpegServiceImpl(FFmpegService):
     
     async def is_recording(self, recording_id: UUID) -> bool:
         """Check if recording is active."""
-        process = self.processes.get(recording_id)
-        return process is not None and process.returncode is None
+        return self.supervisor.is_running(recording_id)
+    
+    async def get_recording_health(self, recording_id: UUID) -> Optional[dict]:
+        """Get recorder health (state, restarts, ffmpeg progress)."""
+        return self.supervisor.health(recording_id)
+    
+    async def wait_until_running(self, recording_id: UUID, timeout: float = 15.0) -> Optional[dict]:
+        """Wait for the recorder to report progress and return its health."""
+        return await self.supervisor.wait_until_running(recording_id, timeout)
@@ -0,0 +1,292 @@
+"""Live frames from the MediaMTX paths the cameras already publish to."""
+import asyncio
+import os
+import time
+from collections import deque
+from datetime import datetime
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from prometheus_client import Counter, Gauge
+
+from src.shared.infrastructure.logger import Logger
+
+
+JPEG_SOI = b"\xff\xd8"
+JPEG_EOI = b"\xff\xd9"
+
+frame_grab_decoders = Gauge(
+    'frame_grab_decoders',
+    'Persistent MediaMTX decoders currently running'
+)
+
+frame_grab_requests_total = Counter(
+    'frame_grab_requests_total',
+    'Frame requests by result (memory, waited, timeout)',
+    ['result']
+)
+
+
+class FrameGrabError(Exception):
+    """No frame of the path is available in time."""
+
+
+class Frame(NamedTuple):
+    """Latest decoded JPEG of a path."""
+    image: bytes
+    captured_at: datetime
+    received_at: float  # time.monotonic() when the frame arrived
+
+    @property
+    def age_seconds(self) -> float:
+        return time.monotonic() - self.received_at
+
+
+def split_jpegs(buffer: bytes) -> Tuple[List[bytes], bytes]:
+    """Cut complete JPEGs out of an MJPEG byte stream.
+
+    Returns the complete images and the unconsumed tail. Entropy-coded data
+    byte-stuffs 0xFF, so an EOI marker only appears at the end of an image.
+    """
+    images = []
+    while True:
+        start = buffer.find(JPEG_SOI)
+        if start < 0:
+            return images, b""
+        end = buffer.find(JPEG_EOI, start + 2)
+        if end < 0:
+            return images, buffer[start:]
+        images.append(buffer[start:end + 2])
+        buffer = buffer[end + 2:]
+
+
+class PathDecoder:
+    """One long-running ffmpeg that keeps the latest keyframe of a path in memory.
+
+    Only keyframes are decoded (`-skip_frame nokey`), so a decoder costs
+    one JPEG encode per GOP. The process is restarted with backoff when
+    the path goes away and stopped by its owner once nobody asks for
+    frames.
+    """
+
+    READ_CHUNK = 256 * 1024
+    STDERR_TAIL_LINES = 5
+
+    def __init__(
+        self,
+        path: str,
+        source_url: str,
+        ffmpeg_binary: str = "ffmpeg",
+        width: Optional[int] = None,
+        quality: int = 3,
+        restart_backoff_seconds: float = 1.0,
+        max_backoff_seconds: float = 30.0
+    ):
+        self.logger = Logger(__name__)
+        self.path = path
+        self.source_url = source_url
+        self.ffmpeg_binary = ffmpeg_binary
+        self.width = width
+        self.quality = quality
+        self.restart_backoff_seconds = restart_backoff_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+        self.latest: Optional[Frame] = None
+        self.last_used = time.monotonic()
+        self._frame_event = asyncio.Event()
+        self._process: Optional[asyncio.subprocess.Process] = None
+        self._task: Optional[asyncio.Task] = None
+        self._stopped = False
+
+    def build_command(self) -> List[str]:
+        cmd = [self.ffmpeg_binary, "-nostdin", "-hide_banner", "-loglevel", "error"]
+        if self.source_url.startswith("rtsp"):
+            cmd += ["-rtsp_transport", "tcp"]
+        cmd += ["-skip_frame", "nokey", "-i", self.source_url, "-an", "-fps_mode", "passthrough"]
+        if self.width:
+            cmd += ["-vf", f"scale={self.width}:-2"]
+        return cmd + ["-f", "image2pipe", "-vcodec", "mjpeg", "-q:v", str(self.quality), "-"]
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        if not self.running:
+            self._stopped = False
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        self._stopped = True
+        if self._process and self._process.returncode is None:
+            self._process.kill()
+        if self._task:
+            await asyncio.gather(self._task, return_exceptions=True)
+
+    async def wait_frame(self, timeout: float) -> Optional[Frame]:
+        """Latest frame, waiting up to `timeout` for the first one."""
+        self.last_used = time.monotonic()
+        if self.latest is None:
+            try:
+                await asyncio.wait_for(self._frame_event.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                return None
+        return self.latest
+
+    async def _run(self) -> None:
+        backoff = self.restart_backoff_seconds
+        while not self._stopped:
+            started = time.monotonic()
+            try:
+                stderr_tail = await self._decode()
+                if not self._stopped:
+                    self.logger.warning(f"Decoder for {self.path} exited: {' | '.join(stderr_tail)}")
+            except Exception as e:
+                self.logger.error(f"Decoder for {self.path} failed: {e}")
+            if self._stopped:
+                break
+            # A decoder that ran for a while earned a fresh backoff
+            if time.monotonic() - started > self.max_backoff_seconds:
+                backoff = self.restart_backoff_seconds
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, self.max_backoff_seconds)
+
+    async def _decode(self) -> List[str]:
+        self._process = await asyncio.create_subprocess_exec(
+            *self.build_command(),
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        stderr_tail = deque(maxlen=self.STDERR_TAIL_LINES)
+
+        async def drain_stderr():
+            async for line in self._process.stderr:
+                stderr_tail.append(line.decode(errors="replace").strip())
+
+        stderr_task = asyncio.create_task(drain_stderr())
+        buffer = b""
+        try:
+            while chunk := await self._process.stdout.read(self.READ_CHUNK):
+                images, buffer = split_jpegs(buffer + chunk)
+                if images:
+                    self.latest = Frame(images[-1], datetime.utcnow(), time.monotonic())
+                    self._frame_event.set()
+        finally:
+            if self._process.returncode is None:
+                self._process.kill()
+            await self._process.wait()
+            await stderr_task
+        return list(stderr_tail)
+
+
+class FrameGrabber:
+    """Snapshots served from RAM instead of a new camera session per frame.
+
+    Frames are read from the MediaMTX path the camera already publishes to
+    (RTSP by default, or HLS), so MediaMTX keeps the single upstream
+    session and the camera's limited session slots are left alone. The
+    first request for a path starts a persistent decoder; later requests
+    get its latest frame immediately. Decoders unused for
+    `idle_seconds` are stopped, and at most `max_decoders` run at once
+    (least recently used is stopped first).
+    """
+
+    def __init__(
+        self,
+        rtsp_base_url: Optional[str] = None,
+        hls_base_url: Optional[str] = None,
+        source: Optional[str] = None,
+        ffmpeg_binary: str = "ffmpeg",
+        width: Optional[int] = None,
+        idle_seconds: Optional[float] = None,
+        stale_seconds: float = 30.0,
+        max_decoders: Optional[int] = None
+    ):
+        self.logger = Logger(__name__)
+        host = os.getenv("MEDIAMTX_HOST", "mediamtx")
+        self.rtsp_base_url = rtsp_base_url or f"rtsp://{host}:{os.getenv('MEDIAMTX_RTSP_PORT', '8554')}"
+        self.hls_base_url = hls_base_url or f"http://{host}:{os.getenv('MEDIAMTX_HLS_PORT', '8888')}"
+        self.source = source or os.getenv("FRAME_GRAB_SOURCE", "rtsp")
+        self.ffmpeg_binary = ffmpeg_binary
+        self.width = width
+        self.idle_seconds = idle_seconds or float(os.getenv("FRAME_GRAB_IDLE_SECONDS", "120"))
+        self.stale_seconds = stale_seconds
+        self.max_decoders = max_decoders or int(os.getenv("FRAME_GRAB_MAX_DECODERS", "256"))
+        self.decoders: Dict[str, PathDecoder] = {}
+        self._reaper: Optional[asyncio.Task] = None
+
+    @staticmethod
+    def path_for(tenant_id: str, camera_id: str) -> str:
+        """MediaMTX path a camera's live stream is published on."""
+        return f"{tenant_id}_{camera_id}_live"
+
+    def source_url(self, path: str) -> str:
+        if self.source == "hls":
+            return f"{self.hls_base_url}/{path}/index.m3u8"
+        return f"{self.rtsp_base_url}/{path}"
+
+    async def grab(self, path: str, timeout: float = 5.0) -> Frame:
+        """Latest frame of `path`; waits for the decoder only on a cold start."""
+        decoder = self.decoders.get(path)
+        if decoder is None:
+            decoder = await self._open(path)
+        elif not decoder.running:
+            decoder.start()
+
+        warm = decoder.latest is not None
+        frame = await decoder.wait_frame(timeout)
+        if frame is None:
+            frame_grab_requests_total.labels(result="timeout").inc()
+            raise FrameGrabError(f"No frame from {path} within {timeout}s")
+        if frame.age_seconds > self.stale_seconds:
+            frame_grab_requests_total.labels(result="timeout").inc()
+            raise FrameGrabError(f"Latest frame of {path} is {frame.age_seconds:.0f}s old")
+        frame_grab_requests_total.labels(result="memory" if warm else "waited").inc()
+        return frame
+
+    async def release(self, path: str) -> None:
+        """Stop the decoder of a path (camera removed or stream stopped)."""
+        decoder = self.decoders.pop(path, None)
+        if decoder:
+            await decoder.stop()
+            frame_grab_decoders.set(len(self.decoders))
+
+    async def reap_idle(self) -> None:
+        """Stop decoders nobody asked a frame from for `idle_seconds`."""
+        cutoff = time.monotonic() - self.idle_seconds
+        for path in [p for p, d in self.decoders.items() if d.last_used < cutoff]:
+            await self.release(path)
+
+    def start(self, reap_interval: float = 30.0) -> None:
+        """Start the idle-decoder reaper."""
+        async def reap_loop():
+            while True:
+                await asyncio.sleep(reap_interval)
+                await self.reap_idle()
+
+        if self._reaper is None:
+            self._reaper = asyncio.create_task(reap_loop())
+
+    async def stop(self) -> None:
+        if self._reaper:
+            self._reaper.cancel()
+            await asyncio.gather(self._reaper, return_exceptions=True)
+            self._reaper = None
+        for path in list(self.decoders):
+            await self.release(path)
+
+    async def _open(self, path: str) -> PathDecoder:
+        if len(self.decoders) >= self.max_decoders:
+            oldest = min(self.decoders.values(), key=lambda d: d.last_used)
+            await self.release(oldest.path)
+            if path in self.decoders:
+                return self.decoders[path]  # opened by a concurrent request meanwhile
+        decoder = PathDecoder(
+            path,
+            self.source_url(path),
+            ffmpeg_binary=self.ffmpeg_binary,
+            width=self.width
+        )
+        self.decoders[path] = decoder
+        decoder.start()
+        frame_grab_decoders.set(len(self.decoders))
+        return decoder
@@ -0,0 +1,121 @@
+"""Streaming S3 multipart upload fed from an asyncio stream."""
+import asyncio
+import os
+from typing import Dict, List, Optional
+
+
+class MultipartUpload:
+    """Uploads a byte stream of unknown length as an S3 multipart upload.
+
+    Used as an async context manager: the upload is created on enter,
+    completed on a clean exit and aborted if anything raised, so no orphan
+    parts are left behind. At most `max_in_flight` parts are uploading at
+    once; while they are, the stream is not read, which pushes back on the
+    producer. Memory is bounded by `(max_in_flight + 1) * part_size`.
+
+    boto3 is blocking, so every S3 call runs in a worker thread.
+    """
+
+    MIN_PART_SIZE = 5 * 1024 * 1024
+
+    def __init__(
+        self,
+        s3_client,
+        bucket: str,
+        key: str,
+        content_type: str = "application/octet-stream",
+        metadata: Optional[Dict[str, str]] = None,
+        part_size: Optional[int] = None,
+        max_in_flight: Optional[int] = None
+    ):
+        self.s3_client = s3_client
+        self.bucket = bucket
+        self.key = key
+        self.content_type = content_type
+        self.metadata = metadata or {}
+        self.part_size = max(
+            part_size or int(os.getenv("CLIP_UPLOAD_PART_SIZE_MB", "8")) * 1024 * 1024,
+            self.MIN_PART_SIZE
+        )
+        self.max_in_flight = max_in_flight or int(os.getenv("CLIP_UPLOAD_MAX_IN_FLIGHT", "4"))
+        self.upload_id: Optional[str] = None
+        self.parts: List[dict] = []
+        self.bytes_written = 0
+
+    async def __aenter__(self) -> "MultipartUpload":
+        response = await asyncio.to_thread(
+            self.s3_client.create_multipart_upload,
+            Bucket=self.bucket,
+            Key=self.key,
+            ContentType=self.content_type,
+            Metadata=self.metadata
+        )
+        self.upload_id = response["UploadId"]
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            await asyncio.to_thread(
+                self.s3_client.complete_multipart_upload,
+                Bucket=self.bucket,
+                Key=self.key,
+                UploadId=self.upload_id,
+                MultipartUpload={"Parts": sorted(self.parts, key=lambda p: p["PartNumber"])}
+            )
+        else:
+            await asyncio.to_thread(
+                self.s3_client.abort_multipart_upload,
+                Bucket=self.bucket,
+                Key=self.key,
+                UploadId=self.upload_id
+            )
+
+    async def write_from(self, stream: asyncio.StreamReader) -> int:
+        """Upload everything until EOF. Returns the number of bytes written."""
+        slots = asyncio.Semaphore(self.max_in_flight)
+        tasks: List[asyncio.Task] = []
+        part_number = 0
+        try:
+            while True:
+                data = await self._read_part(stream)
+                if not data and part_number:
+                    break
+                await slots.acquire()
+                for task in tasks:
+                    if task.done() and task.exception():
+                        raise task.exception()
+                part_number += 1
+                self.bytes_written += len(data)
+                tasks.append(asyncio.create_task(self._upload_part(part_number, data, slots)))
+                if len(data) < self.part_size:
+                    break
+            self.parts = list(await asyncio.gather(*tasks))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        return self.bytes_written
+
+    async def _read_part(self, stream: asyncio.StreamReader) -> bytes:
+        buffer = bytearray()
+        while len(buffer) < self.part_size:
+            chunk = await stream.read(self.part_size - len(buffer))
+            if not chunk:
+                break
+            buffer += chunk
+        return bytes(buffer)
+
+    async def _upload_part(self, part_number: int, data: bytes, slots: asyncio.Semaphore) -> dict:
+        try:
+            response = await asyncio.to_thread(
+                self.s3_client.upload_part,
+                Bucket=self.bucket,
+                Key=self.key,
+                UploadId=self.upload_id,
+                PartNumber=part_number,
+                Body=data
+            )
+            return {"PartNumber": part_number, "ETag": response["ETag"]}
+        finally:
+            slots.release()
@@ -0,0 +1,332 @@
+"""Supervised pool of FFmpeg recorder processes."""
+import asyncio
+import os
+import random
+from collections import deque
+from datetime import datetime
+from enum import Enum
+from typing import Awaitable, Callable, Deque, Dict, List, Optional
+from uuid import UUID
+from src.shared.infrastructure.logger import Logger
+
+
+class RecorderState(Enum):
+    """Recorder process state."""
+    STARTING = "STARTING"
+    RUNNING = "RUNNING"
+    BACKOFF = "BACKOFF"
+    STOPPED = "STOPPED"
+    FAILED = "FAILED"
+
+
+class FFmpegProgress:
+    """Last progress block reported by ffmpeg `-progress`."""
+
+    def __init__(self):
+        self.frame = 0
+        self.fps = 0.0
+        self.bitrate_kbps = 0.0
+        self.drop_frames = 0
+        self.dup_frames = 0
+        self.out_time_seconds = 0.0
+        self.speed = 0.0
+        self.updated_at: Optional[datetime] = None
+
+    def update(self, values: Dict[str, str]):
+        """Apply a complete `key=value` progress block."""
+        self.frame = _parse_int(values.get("frame"), self.frame)
+        self.fps = _parse_float(values.get("fps"), self.fps)
+        self.bitrate_kbps = _parse_float(
+            values.get("bitrate", "").replace("kbits/s", ""), self.bitrate_kbps
+        )
+        self.drop_frames = _parse_int(values.get("drop_frames"), self.drop_frames)
+        self.dup_frames = _parse_int(values.get("dup_frames"), self.dup_frames)
+        out_time_us = _parse_int(values.get("out_time_us") or values.get("out_time_ms"), -1)
+        if out_time_us >= 0:
+            self.out_time_seconds = out_time_us / 1_000_000
+        self.speed = _parse_float(values.get("speed", "").rstrip("x"), self.speed)
+        self.updated_at = datetime.utcnow()
+
+    def to_dict(self) -> dict:
+        return {
+            "frame": self.frame,
+            "fps": self.fps,
+            "bitrate_kbps": self.bitrate_kbps,
+            "drop_frames": self.drop_frames,
+            "dup_frames": self.dup_frames,
+            "out_time_seconds": self.out_time_seconds,
+            "speed": self.speed,
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None
+        }
+
+
+def _parse_int(value: Optional[str], default: int) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _parse_float(value: Optional[str], default: float) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def compute_backoff(attempt: int, base_seconds: float, max_seconds: float) -> float:
+    """Exponential backoff with jitter (50-100% of the capped delay)."""
+    delay = min(max_seconds, base_seconds * (2 ** max(attempt - 1, 0)))
+    return delay * random.uniform(0.5, 1.0)
+
+
+class RecorderProcess:
+    """A single supervised ffmpeg recorder."""
+
+    STDERR_TAIL_LINES = 20
+
+    def __init__(self, recording_id: UUID, cmd: List[str]):
+        self.recording_id = recording_id
+        self.cmd = cmd
+        self.state = RecorderState.STARTING
+        self.process: Optional[asyncio.subprocess.Process] = None
+        self.progress = FFmpegProgress()
+        self.restarts = 0
+        self.attempt = 0
+        self.last_exit_code: Optional[int] = None
+        self.started_at: Optional[datetime] = None
+        self.stderr_tail: Deque[str] = deque(maxlen=self.STDERR_TAIL_LINES)
+        self.task: Optional[asyncio.Task] = None
+        self.running = asyncio.Event()
+        self.stopping = False
+
+    @property
+    def pid(self) -> Optional[int]:
+        return self.process.pid if self.process else None
+
+    def is_alive(self) -> bool:
+        return self.process is not None and self.process.returncode is None
+
+    def health(self) -> dict:
+        """Get recorder health snapshot."""
+        return {
+            "recording_id": str(self.recording_id),
+            "state": self.state.value,
+            "pid": self.pid,
+            "restarts": self.restarts,
+            "last_exit_code": self.last_exit_code,
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "progress": self.progress.to_dict(),
+            "last_error": self.stderr_tail[-1] if self.stderr_tail else None
+        }
+
+
+class RecorderSupervisor:
+    """Runs ffmpeg recorders, drains their pipes and restarts them on crash.
+
+    Each recorder is spawned with `-progress pipe:1` so stdout carries
+    machine-readable progress blocks; stderr is drained continuously and only
+    the last lines are kept for diagnostics. Crashed recorders are restarted
+    with jittered exponential backoff until `max_restarts` is reached; a
+    recorder that gives up is dropped so it no longer holds a slot, and its
+    last health is handed to `on_failed`.
+    """
+
+    STDERR_CHUNK_BYTES = 4096
+
+    def __init__(
+        self,
+        max_recorders: Optional[int] = None,
+        backoff_base_seconds: float = 1.0,
+        backoff_max_seconds: float = 60.0,
+        stable_after_seconds: float = 60.0,
+        max_restarts: Optional[int] = None,
+        on_failed: Optional[Callable[[UUID, dict], Awaitable[None]]] = None
+    ):
+        self.logger = Logger(__name__)
+        self.max_recorders = max_recorders or int(os.getenv("FFMPEG_MAX_RECORDERS", "200"))
+        self.backoff_base_seconds = backoff_base_seconds
+        self.backoff_max_seconds = backoff_max_seconds
+        self.stable_after_seconds = stable_after_seconds
+        self.max_restarts = max_restarts if max_restarts is not None else int(
+            os.getenv("FFMPEG_MAX_RESTARTS", "10")
+        )
+        self.on_failed = on_failed
+        self.recorders: Dict[UUID, RecorderProcess] = {}
+
+    def active_count(self) -> int:
+        """Count recorders that still hold a slot."""
+        return sum(
+            1 for r in self.recorders.values()
+            if r.state not in (RecorderState.STOPPED, RecorderState.FAILED)
+        )
+
+    def has_capacity(self) -> bool:
+        return self.active_count() < self.max_recorders
+
+    async def start(self, recording_id: UUID, cmd: List[str]) -> bool:
+        """Start supervising a recorder. Returns False when the node is full."""
+        existing = self.recorders.get(recording_id)
+        if existing and existing.state not in (RecorderState.STOPPED, RecorderState.FAILED):
+            return True
+
+        if not self.has_capacity():
+            self.logger.warning(
+                f"Recorder limit reached ({self.max_recorders}), rejecting {recording_id}"
+            )
+            return False
+
+        recorder = RecorderProcess(recording_id, cmd)
+        self.recorders[recording_id] = recorder
+        recorder.task = asyncio.create_task(self._supervise(recorder))
+        return True
+
+    async def stop(self, recording_id: UUID, timeout: float = 10.0) -> bool:
+        """Stop a recorder gracefully, killing it after `timeout`."""
+        recorder = self.recorders.pop(recording_id, None)
+        if not recorder:
+            return False
+
+        recorder.stopping = True
+        if recorder.is_alive():
+            recorder.process.terminate()
+            try:
+                await asyncio.wait_for(recorder.process.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                recorder.process.kill()
+                await recorder.process.wait()
+
+        if recorder.task:
+            recorder.task.cancel()
+            try:
+                await recorder.task
+            except asyncio.CancelledError:
+                pass
+
+        recorder.state = RecorderState.STOPPED
+        return True
+
+    async def shutdown(self):
+        """Stop all recorders."""
+        await asyncio.gather(*(self.stop(rid) for rid in list(self.recorders)))
+
+    def is_running(self, recording_id: UUID) -> bool:
+        recorder = self.recorders.get(recording_id)
+        return recorder is not None and recorder.state == RecorderState.RUNNING and recorder.is_alive()
+
+    def health(self, recording_id: UUID) -> Optional[dict]:
+        """Get health for one recorder."""
+        recorder = self.recorders.get(recording_id)
+        return recorder.health() if recorder else None
+
+    def health_all(self) -> List[dict]:
+        """Get health for all recorders."""
+        return [r.health() for r in self.recorders.values()]
+
+    async def wait_until_running(self, recording_id: UUID, timeout: float = 15.0) -> Optional[dict]:
+        """Wait for the first progress block (or failure) and return health."""
+        recorder = self.recorders.get(recording_id)
+        if not recorder:
+            return None
+        try:
+            await asyncio.wait_for(recorder.running.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+        return recorder.health()
+
+    async def _supervise(self, recorder: RecorderProcess):
+        """Spawn/restart loop for one recorder."""
+        while not recorder.stopping:
+            recorder.state = RecorderState.STARTING
+            try:
+                exit_code, ran_for = await self._run_once(recorder)
+            except Exception as e:
+                self.logger.error(f"Recorder {recorder.recording_id} failed: {e}")
+                recorder.stderr_tail.append(str(e))
+                exit_code, ran_for = None, 0.0
+
+            if recorder.stopping:
+                break
+
+            recorder.last_exit_code = exit_code
+            recorder.running.clear()
+            if ran_for >= self.stable_after_seconds:
+                recorder.attempt = 0
+            recorder.attempt += 1
+
+            if self.max_restarts and recorder.attempt > self.max_restarts:
+                recorder.state = RecorderState.FAILED
+                self.logger.error(
+                    f"Recorder {recorder.recording_id} gave up after {recorder.restarts} restarts"
+                )
+                recorder.running.set()
+                if self.recorders.get(recorder.recording_id) is recorder:
+                    del self.recorders[recorder.recording_id]
+                if self.on_failed:
+                    await self.on_failed(recorder.recording_id, recorder.health())
+                return
+
+            delay = compute_backoff(recorder.attempt, self.backoff_base_seconds, self.backoff_max_seconds)
+            recorder.state = RecorderState.BACKOFF
+            self.logger.warning(
+                f"Recorder {recorder.recording_id} exited with {exit_code}, "
+                f"restarting in {delay:.1f}s"
+            )
+            await asyncio.sleep(delay)
+            recorder.restarts += 1
+
+    async def _run_once(self, recorder: RecorderProcess):
+        """Run the process until it exits, draining both pipes."""
+        recorder.process = await asyncio.create_subprocess_exec(
+            *recorder.cmd,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        recorder.started_at = datetime.utcnow()
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+
+        try:
+            await asyncio.gather(
+                self._read_progress(recorder, recorder.process.stdout),
+                self._drain_stderr(recorder, recorder.process.stderr)
+            )
+        except Exception:
+            if recorder.is_alive():
+                recorder.process.kill()
+            raise
+        exit_code = await recorder.process.wait()
+        return exit_code, loop.time() - started
+
+    async def _read_progress(self, recorder: RecorderProcess, stream: asyncio.StreamReader):
+        """Parse `key=value` blocks terminated by `progress=...`."""
+        block: Dict[str, str] = {}
+        async for raw in stream:
+            key, sep, value = raw.decode(errors="replace").strip().partition("=")
+            if not sep:
+                continue
+            block[key] = value
+            if key == "progress":
+                recorder.progress.update(block)
+                block = {}
+                if recorder.state == RecorderState.STARTING:
+                    recorder.state = RecorderState.RUNNING
+                    recorder.running.set()
+
+    async def _drain_stderr(self, recorder: RecorderProcess, stream: asyncio.StreamReader):
+        """Keep stderr from filling the pipe buffer; retain only the tail.
+
+        Reads fixed-size chunks instead of lines because ffmpeg may emit long
+        `\r`-separated status output that would overrun the line limit.
+        """
+        pending = ""
+        while True:
+            chunk = await stream.read(self.STDERR_CHUNK_BYTES)
+            if not chunk:
+                break
+            lines = (pending + chunk.decode(errors="replace")).replace("\r", "\n").split("\n")
+            pending = lines.pop()[-self.STDERR_CHUNK_BYTES:]
+            recorder.stderr_tail.extend(line.strip() for line in lines if line.strip())
+        if pending.strip():
+            recorder.stderr_tail.append(pending.strip())
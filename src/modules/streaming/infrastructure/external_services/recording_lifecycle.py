@@ -0,0 +1,239 @@
+"""Bucket lifecycle rules for recordings and the key layout they expire."""
+import asyncio
+import os
+import re
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Set
+from uuid import UUID
+
+from botocore.exceptions import ClientError
+
+from src.modules.streaming.domain.repositories.retention_repository import MisplacedSegment, RetentionRepository
+from src.modules.streaming.domain.value_objects.retention_policy import LEGAL_HOLD_PREFIX, RetentionPolicy
+from src.shared.infrastructure.logger import Logger
+
+
+# Rules we own are recognised by ID; other rules in the bucket are left alone
+RULE_ID_PREFIX = "gtv-retention-"
+
+# S3 DeleteObjects accepts at most 1000 keys per request
+DELETE_BATCH = 1000
+
+# Recording objects live in one bucket per tenant, keyed by their path under the recordings root
+RECORDINGS_BUCKET_PREFIX = "gtvision-recordings-"
+
+LAYOUT_PREFIX = re.compile(r"^(?:retention-\d+d|legal-hold)/\d{4}/\d{2}/\d{2}/")
+MANAGED_PREFIX = re.compile(r"^retention-\d+d/")
+
+
+def recordings_bucket(tenant_id: UUID) -> str:
+    """Bucket holding the tenant's recording objects."""
+    return f"{RECORDINGS_BUCKET_PREFIX}{tenant_id}"
+
+
+def object_key(storage_path: str, recordings_root: str) -> str:
+    """Object key of a stored path: local paths under the recordings root map to their relative path."""
+    if os.path.isabs(storage_path):
+        return os.path.relpath(storage_path, recordings_root)
+    return storage_path
+
+
+def is_lifecycle_managed(key: str) -> bool:
+    """Whether a bucket lifecycle rule expires this key."""
+    return bool(MANAGED_PREFIX.match(key))
+
+
+def lifecycle_key(segment: MisplacedSegment) -> str:
+    """Key the segment belongs under: `<class or legal-hold>/<YYYY/MM/DD of its start>/<original key>`."""
+    prefix = LEGAL_HOLD_PREFIX if segment.held else RetentionPolicy(segment.retention_days).storage_prefix
+    base = LAYOUT_PREFIX.sub("", segment.storage_path, count=1)
+    return f"{prefix}{segment.start_time:%Y/%m/%d}/{base}"
+
+
+def lifecycle_rules(allowed_days: Iterable[int], grace_days: int = 0) -> List[dict]:
+    """One expiration rule per retention class."""
+    return [
+        {
+            "ID": f"{RULE_ID_PREFIX}{days}d",
+            "Status": "Enabled",
+            "Filter": {"Prefix": RetentionPolicy(days).storage_prefix},
+            "Expiration": {"Days": days + grace_days},
+        }
+        for days in allowed_days
+    ]
+
+
+def _rule_signature(rule: dict) -> tuple:
+    prefix = rule.get("Filter", {}).get("Prefix", rule.get("Prefix"))
+    return rule.get("Status"), prefix, rule.get("Expiration", {}).get("Days")
+
+
+class RecordingLifecycle:
+    """Delegates recording expiry to the object store.
+
+    Segment objects are arranged under `retention-<days>d/YYYY/MM/DD/`
+    inside their tenant's recordings bucket, and every recordings bucket
+    (all `gtvision-recordings-*` buckets, or `buckets` when given) gets
+    one lifecycle rule per retention class, so expired objects are removed
+    by the store without any request from us.
+
+    The store ages every segment on its own, from the copy that put it
+    under its prefix (rounded to the next midnight UTC), while a recording
+    row only expires `retention_days` after the recording stops, and a
+    24/7 recording never does. So segments expire one by one in the
+    database as well: `expire_segments` drops the row of each arranged
+    segment `retention_days` after the segment started. A copy is never
+    older than its segment and each rule waits `days + grace_days`, so
+    the row always goes first, at least `grace_days` before the object:
+    timelines and clip exports never list a segment the store removed.
+
+    Segments of recordings on incident/legal hold are moved under
+    LEGAL_HOLD_PREFIX, which no rule covers, and back once released (the
+    copy restarts the store's clock, so the object outlives its row). A
+    hold keeps every segment still listed when the recording is arranged
+    within `grace_days` of the hold; the scheduler does it every few
+    minutes. Moves copy first, repoint the segment rows, then delete the
+    old keys, so a crash leaves at worst an orphan copy. Segments are only
+    moved in buckets whose rules were reconciled.
+    """
+
+    def __init__(
+        self,
+        s3_client,
+        repository: RetentionRepository,
+        buckets: Optional[List[str]] = None,
+        allowed_days: Optional[Iterable[int]] = None,
+        grace_days: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+        move_workers: Optional[int] = None
+    ):
+        self.logger = Logger(__name__)
+        self.s3_client = s3_client
+        self.repository = repository
+        self.buckets = buckets
+        self.allowed_days = list(allowed_days or RetentionPolicy.ALLOWED_DAYS)
+        self.grace_days = grace_days if grace_days is not None else int(
+            os.getenv("RETENTION_LIFECYCLE_GRACE_DAYS", "1")
+        )
+        self.chunk_size = chunk_size or int(os.getenv("RETENTION_CHUNK_SIZE", "1000"))
+        self.move_workers = move_workers or int(os.getenv("RETENTION_DELETE_WORKERS", "4"))
+        self._ruled: Set[str] = set()
+
+    async def reconcile_rules(self) -> List[str]:
+        """Install or update our rules in every recordings bucket; returns the buckets changed."""
+        changed = []
+        for bucket in self.buckets or await asyncio.to_thread(self._recordings_buckets):
+            try:
+                if await asyncio.to_thread(self._reconcile_bucket, bucket):
+                    changed.append(bucket)
+            except Exception as e:
+                self._ruled.discard(bucket)
+                self.logger.error(f"Failed to reconcile lifecycle rules of {bucket}: {e}")
+                continue
+            self._ruled.add(bucket)
+        if changed:
+            self.logger.info(f"Lifecycle rules updated for {', '.join(changed)}")
+        return changed
+
+    def _recordings_buckets(self) -> List[str]:
+        return [
+            b["Name"] for b in self.s3_client.list_buckets().get("Buckets", [])
+            if b["Name"].startswith(RECORDINGS_BUCKET_PREFIX)
+        ]
+
+    def _reconcile_bucket(self, bucket: str) -> bool:
+        try:
+            current = self.s3_client.get_bucket_lifecycle_configuration(Bucket=bucket).get("Rules", [])
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") != "NoSuchLifecycleConfiguration":
+                raise
+            current = []
+
+        desired = lifecycle_rules(self.allowed_days, self.grace_days)
+        desired_ids = {rule["ID"] for rule in desired}
+        installed = {rule.get("ID"): _rule_signature(rule) for rule in current if rule.get("ID") in desired_ids}
+        if installed == {rule["ID"]: _rule_signature(rule) for rule in desired}:
+            return False
+
+        # Rules of classes no longer offered stay: recordings in them still have to expire
+        kept = [rule for rule in current if rule.get("ID") not in desired_ids]
+        self.s3_client.put_bucket_lifecycle_configuration(
+            Bucket=bucket,
+            LifecycleConfiguration={"Rules": kept + desired}
+        )
+        return True
+
+    async def arrange(self, now: Optional[datetime] = None) -> int:
+        """Move every misplaced segment under its prefix; returns segments moved."""
+        now = now or datetime.utcnow()
+        moved = 0
+        after: Optional[UUID] = None
+        while True:
+            page = await self.repository.find_misplaced(now, after, self.chunk_size)
+            if not page:
+                break
+            moved += await self.move(page)
+            after = page[-1].id
+            if len(page) < self.chunk_size:
+                break
+        if moved:
+            self.logger.info(f"Arranged {moved} recording segments under lifecycle prefixes")
+        return moved
+
+    async def expire_segments(self, now: Optional[datetime] = None) -> int:
+        """Drop the rows of arranged segments past their own retention; returns rows dropped."""
+        now = now or datetime.utcnow()
+        dropped = 0
+        while True:
+            count = await self.repository.expire_segments(now, self.chunk_size)
+            dropped += count
+            if count < self.chunk_size:
+                break
+        if dropped:
+            self.logger.info(f"Expired {dropped} recording segments past their retention")
+        return dropped
+
+    async def move(self, segments: List[MisplacedSegment]) -> int:
+        """Copy, repoint and delete a page of segments; failed copies are retried next pass."""
+        slots = asyncio.Semaphore(self.move_workers)
+
+        async def copy(segment: MisplacedSegment) -> Optional[str]:
+            bucket = recordings_bucket(segment.tenant_id) if segment.tenant_id else None
+            if bucket not in self._ruled:
+                return None  # never under a prefix whose rule isn't installed
+            target = lifecycle_key(segment)
+            async with slots:
+                try:
+                    await asyncio.to_thread(
+                        self.s3_client.copy_object,
+                        Bucket=bucket,
+                        Key=target,
+                        CopySource={"Bucket": bucket, "Key": segment.storage_path}
+                    )
+                except Exception as e:
+                    self.logger.warning(f"Failed to move {segment.storage_path} to {target}: {e}")
+                    return None
+            return target
+
+        targets = await asyncio.gather(*(copy(segment) for segment in segments))
+        moves: Dict[UUID, str] = {s.id: target for s, target in zip(segments, targets) if target}
+        updated = await self.repository.move_segments(moves)
+
+        await self._delete_moved([s for s in segments if s.id in moves])
+        return updated
+
+    async def _delete_moved(self, segments: List[MisplacedSegment]) -> None:
+        old_keys: Dict[str, List[str]] = {}
+        for s in segments:
+            old_keys.setdefault(recordings_bucket(s.tenant_id), []).append(s.storage_path)
+        for bucket, keys in old_keys.items():
+            for i in range(0, len(keys), DELETE_BATCH):
+                try:
+                    await asyncio.to_thread(
+                        self.s3_client.delete_objects,
+                        Bucket=bucket,
+                        Delete={"Objects": [{"Key": key} for key in keys[i:i + DELETE_BATCH]], "Quiet": True}
+                    )
+                except Exception as e:
+                    # Only leaves orphans behind; the nightly sanity check reports them
+                    self.logger.warning(f"Failed to delete moved recording objects from {bucket}: {e}")
@@ -0,0 +1,152 @@
+"""Two-tier snapshot cache with single-flight captures."""
+import asyncio
+import hashlib
+import os
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, NamedTuple, Optional
+
+from prometheus_client import Counter, Gauge
+
+from src.shared.infrastructure.cache_service import pack, unpack
+from src.shared.infrastructure.local_cache import LocalCache
+from src.shared.infrastructure.logger import Logger
+from src.modules.streaming.infrastructure.external_services.frame_grabber import Frame
+
+
+snapshot_requests_total = Counter(
+    'snapshot_requests_total',
+    'Snapshot requests by where they were served from (memory, redis, capture, coalesced)',
+    ['source']
+)
+
+snapshot_captures_in_flight = Gauge(
+    'snapshot_captures_in_flight',
+    'Snapshot captures currently running'
+)
+
+
+class SnapshotUnavailableError(Exception):
+    """No snapshot fresh enough and the capture failed or timed out."""
+
+
+class Snapshot(NamedTuple):
+    """A camera image and when it was captured (UTC)."""
+    image: bytes
+    captured_at: datetime
+    etag: str
+
+    @property
+    def age_seconds(self) -> float:
+        return (datetime.utcnow() - self.captured_at).total_seconds()
+
+
+def snapshot_etag(image: bytes) -> str:
+    return f'"{hashlib.sha1(image).hexdigest()[:20]}"'
+
+
+class SnapshotCache:
+    """Latest snapshot per camera, in process memory and in Redis.
+
+    `get(..., max_age)` returns the cached image when it was captured at
+    most `max_age` seconds ago, checking memory first and Redis second
+    (shared by all API processes). Otherwise it captures a new one:
+    concurrent requests for the same camera wait on the same capture
+    (single-flight), and at most `max_in_flight` captures run at once
+    across all cameras. Redis errors only cost the shared tier.
+    """
+
+    def __init__(
+        self,
+        redis=None,
+        prefix: str = "gtv:snapshot",
+        ttl: int = 60,
+        local_max_entries: int = 1024,
+        max_in_flight: Optional[int] = None,
+        capture_timeout: float = 5.0
+    ):
+        self.logger = Logger(__name__)
+        self.redis = redis
+        self.prefix = prefix
+        self.ttl = ttl
+        self.local = LocalCache(local_max_entries, ttl)
+        self.max_in_flight = max_in_flight or int(os.getenv("SNAPSHOT_MAX_IN_FLIGHT", "32"))
+        self.capture_timeout = capture_timeout
+        self._slots = asyncio.Semaphore(self.max_in_flight)
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+    def key(self, tenant_id: str, camera_id: str) -> str:
+        return f"{self.prefix}:{tenant_id}:{camera_id}"
+
+    async def get(
+        self,
+        tenant_id: str,
+        camera_id: str,
+        max_age: float,
+        capture: Callable[[], Awaitable[Frame]]
+    ) -> Snapshot:
+        """Snapshot at most `max_age` seconds old, capturing one if needed."""
+        key = self.key(tenant_id, camera_id)
+
+        snapshot = self.local.get(key)
+        if snapshot is not None and snapshot.age_seconds <= max_age:
+            snapshot_requests_total.labels(source="memory").inc()
+            return snapshot
+
+        snapshot = await self._read_shared(key)
+        if snapshot is not None and snapshot.age_seconds <= max_age:
+            self.local.set(key, snapshot)
+            snapshot_requests_total.labels(source="redis").inc()
+            return snapshot
+
+        task = self._inflight.get(key)
+        if task is None:
+            snapshot_requests_total.labels(source="capture").inc()
+            task = asyncio.ensure_future(self._capture(key, capture))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            snapshot_requests_total.labels(source="coalesced").inc()
+        # Shielded: a client that goes away must not cancel the others' capture
+        return await asyncio.shield(task)
+
+    async def _capture(self, key: str, capture: Callable[[], Awaitable[Frame]]) -> Snapshot:
+        try:
+            frame = await asyncio.wait_for(self._bounded(capture), timeout=self.capture_timeout)
+        except asyncio.TimeoutError:
+            raise SnapshotUnavailableError(f"Snapshot capture timed out after {self.capture_timeout}s")
+        except Exception as e:
+            raise SnapshotUnavailableError(str(e)) from e
+
+        snapshot = Snapshot(frame.image, frame.captured_at, snapshot_etag(frame.image))
+        self.local.set(key, snapshot)
+        await self._write_shared(key, snapshot)
+        return snapshot
+
+    async def _bounded(self, capture: Callable[[], Awaitable[Frame]]) -> Frame:
+        async with self._slots:
+            snapshot_captures_in_flight.inc()
+            try:
+                return await capture()
+            finally:
+                snapshot_captures_in_flight.dec()
+
+    async def _read_shared(self, key: str) -> Optional[Snapshot]:
+        if self.redis is None:
+            return None
+        try:
+            raw = await self.redis.get(key)
+        except Exception as e:
+            self.logger.warning(f"Snapshot cache read failed: {e}")
+            return None
+        if raw is None:
+            return None
+        image, captured_at, etag = unpack(raw)
+        return Snapshot(image, captured_at, etag)
+
+    async def _write_shared(self, key: str, snapshot: Snapshot) -> None:
+        if self.redis is None:
+            return
+        try:
+            await self.redis.set(key, pack(list(snapshot)), ex=self.ttl)
+        except Exception as e:
+            self.logger.warning(f"Snapshot cache write failed: {e}")
@@ -0,0 +1,108 @@
+"""Composite camera snapshots into one grid JPEG."""
+import asyncio
+import math
+import os
+import shutil
+import tempfile
+from typing import List, Optional, Tuple
+
+from src.modules.streaming.infrastructure.external_services.clip_engine import ClipEngine
+
+
+def grid_shape(count: int, columns: Optional[int] = None) -> Tuple[int, int]:
+    """(columns, rows) for `count` tiles; square-ish unless `columns` is given."""
+    columns = columns or math.ceil(math.sqrt(count))
+    columns = max(1, min(columns, count))
+    return columns, math.ceil(count / columns)
+
+
+async def read_all(stream: asyncio.StreamReader) -> bytes:
+    return await stream.read()
+
+
+class SnapshotMosaic:
+    """Tiles snapshots into a grid in one ffmpeg run.
+
+    The images are written as a numbered sequence and packed by the `tile`
+    filter, the way sprite sheets are built. Each one is scaled to fit its
+    tile and padded; missing cameras become black tiles so positions keep
+    matching the requested order (row-major). Snapshots come at each
+    camera's resolution, so the filter graph is kept across size changes
+    (`-reinit_filter 0`): rebuilding it would drop the tiles already
+    buffered in `tile`.
+    """
+
+    def __init__(
+        self,
+        engine: Optional[ClipEngine] = None,
+        tile_width: int = 480,
+        tile_height: int = 270,
+        quality: int = 4
+    ):
+        self.engine = engine or ClipEngine(
+            max_workers=int(os.getenv("SNAPSHOT_MOSAIC_MAX_WORKERS", "2")),
+            timeout_seconds=10
+        )
+        self.tile_width = tile_width
+        self.tile_height = tile_height
+        self.quality = quality
+
+    def build_command(self, input_pattern: str, columns: int, rows: int) -> List[str]:
+        w, h = self.tile_width, self.tile_height
+        filters = (
+            f"scale={w}:{h}:force_original_aspect_ratio=decrease,"
+            f"pad={w}:{h}:(ow-iw)/2:(oh-ih)/2:black,"
+            f"tile={columns}x{rows}"
+        )
+        return [
+            self.engine.ffmpeg_binary,
+            "-nostdin",
+            "-hide_banner",
+            "-loglevel", "error",
+            "-start_number", "0",
+            "-reinit_filter", "0",
+            "-i", input_pattern,
+            "-vf", filters,
+            "-frames:v", "1",
+            "-f", "image2pipe",
+            "-vcodec", "mjpeg",
+            "-q:v", str(self.quality),
+            "-"
+        ]
+
+    async def compose(self, images: List[Optional[bytes]], columns: Optional[int] = None) -> Tuple[bytes, int]:
+        """Grid JPEG of `images` (None = black tile) and its column count."""
+        columns, rows = grid_shape(len(images), columns)
+        target_dir = tempfile.mkdtemp(prefix="mosaic_")
+        try:
+            placeholder = None
+            for i, image in enumerate(images):
+                path = os.path.join(target_dir, f"{i:03d}.jpg")
+                if image is None:
+                    placeholder = placeholder or await self._placeholder(target_dir)
+                    shutil.copyfile(placeholder, path)
+                else:
+                    with open(path, "wb") as f:
+                        f.write(image)
+            grid = await self.engine.run(
+                self.build_command(os.path.join(target_dir, "%03d.jpg"), columns, rows),
+                consume=read_all
+            )
+            return grid, columns
+        finally:
+            shutil.rmtree(target_dir, ignore_errors=True)
+
+    async def _placeholder(self, target_dir: str) -> str:
+        path = os.path.join(target_dir, "placeholder.jpeg")
+        await self.engine.run([
+            self.engine.ffmpeg_binary,
+            "-nostdin",
+            "-hide_banner",
+            "-loglevel", "error",
+            "-f", "lavfi",
+            "-i", f"color=c=black:s={self.tile_width}x{self.tile_height}",
+            "-frames:v", "1",
+            "-y",
+            path
+        ])
+        return path
@@ -33,10 +33,22 @@ class MinIOStorageService(StorageService):
         except S3Error as e:
             self.logger.error(f"Failed to create bucket: {e}")
     
-    async def upload_file(self, local_path: str, remote_path: str) -> str:
+    async def upload_file(
+        self,
+        local_path: str,
+        remote_path: str,
+        content_type: Optional[str] = None,
+        cache_control: Optional[str] = None
+    ) -> str:
         """Upload file to storage."""
         try:
-            self.client.fput_object(self.bucket, remote_path, local_path)
+            self.client.fput_object(
+                self.bucket,
+                remote_path,
+                local_path,
+                content_type=content_type or "application/octet-stream",
+                metadata={"Cache-Control": cache_control} if cache_control else None
+            )
             return f"s3://{self.bucket}/{remote_path}"
         except S3Error as e:
             self.logger.error(f"Failed to upload file: {e}")
@@ -1,73 +1,191 @@
 """Thumbnail service implementation using FFmpeg."""
+import math
 import os
-import asyncio
-from typing import List
+import tempfile
+from typing import List, Optional, Tuple
 from datetime import datetime, timedelta
 from src.streaming.domain.services.thumbnail_service import ThumbnailService
+from src.streaming.domain.value_objects.thumbnail import SpriteSheet, Thumbnail
+from src.streaming.infrastructure.external_services.clip_engine import ClipEngine, ClipExtractionError
 from src.shared.infrastructure.logger import Logger
 
 
 class ThumbnailServiceImpl(ThumbnailService):
-    """Thumbnail service implementation."""
-    
-    def __init__(self):
+    """Thumbnail service implementation.
+
+    All thumbnails of a recording come from a single ffmpeg pass: the `fps`
+    filter emits one frame every `interval_seconds`, so image `k` of the
+    sequence is `k * interval_seconds` into the file. With keyframe-only
+    decoding (`-skip_frame nokey`, the default) only I-frames are decoded,
+    so each thumbnail is the last keyframe at or before its offset (at most
+    one GOP early). Processes run in the ClipEngine's bounded pool.
+
+    Sprite sheets come from the same pass with a `tile` filter appended,
+    one grid per hour of recording.
+    """
+
+    def __init__(
+        self,
+        output_dir: Optional[str] = None,
+        engine: Optional[ClipEngine] = None,
+        keyframes_only: Optional[bool] = None,
+        width: int = 160,
+        height: int = 90,
+        sprite_format: Optional[str] = None
+    ):
         self.logger = Logger(__name__)
-        self.output_dir = "/thumbnails"
+        self.output_dir = output_dir or os.getenv("THUMBNAIL_OUTPUT_DIR", "/thumbnails")
+        self.engine = engine or ClipEngine(max_workers=int(os.getenv("THUMBNAIL_MAX_WORKERS", "2")))
+        self.keyframes_only = (
+            keyframes_only if keyframes_only is not None
+            else os.getenv("THUMBNAIL_KEYFRAMES_ONLY", "true").lower() == "true"
+        )
+        self.width = width
+        self.height = height
+        self.sprite_format = sprite_format or os.getenv("THUMBNAIL_SPRITE_FORMAT", "jpg")
         os.makedirs(self.output_dir, exist_ok=True)
-    
-    async def generate_thumbnail(self, video_path: str, timestamp: datetime, output_path: str) -> str:
-        """Generate single thumbnail from video."""
+
+    def build_command(
+        self,
+        video_path: str,
+        output_pattern: str,
+        duration_seconds: float,
+        interval_seconds: float,
+        tile: Optional[Tuple[int, int]] = None
+    ) -> List[str]:
+        """One pass over the first `duration_seconds`, one image per interval.
+
+        With `tile=(columns, rows)` the images are packed into grids instead
+        and each output file is one sprite sheet.
+        """
+        frames = math.ceil(duration_seconds / interval_seconds)
+        filters = f"fps=1/{interval_seconds},scale={self.width}:{self.height}"
+        if tile:
+            columns, rows = tile
+            filters += f",tile={columns}x{rows}"
+            frames = math.ceil(frames / (columns * rows))
+
+        cmd = [self.engine.ffmpeg_binary, "-nostdin", "-hide_banner", "-loglevel", "error"]
+        if self.keyframes_only:
+            cmd += ["-skip_frame", "nokey"]
+        return cmd + [
+            "-t", f"{duration_seconds:.3f}",
+            "-i", video_path,
+            "-vf", filters,
+            "-frames:v", str(frames),
+            "-start_number", "0",
+            "-q:v", "5",
+            "-y",
+            output_pattern
+        ]
+
+    async def generate_thumbnail(self, video_path: str, offset_seconds: float, output_path: str) -> str:
+        """Generate single thumbnail from video (input-side seek to the offset)."""
+        cmd = [
+            self.engine.ffmpeg_binary,
+            "-nostdin",
+            "-hide_banner",
+            "-loglevel", "error",
+            "-ss", f"{offset_seconds:.3f}",
+            "-i", video_path,
+            "-frames:v", "1",
+            "-vf", f"scale={self.width}:{self.height}",
+            "-y",
+            output_path
+        ]
         try:
-            cmd = [
-                "ffmpeg",
-                "-i", video_path,
-                "-ss", timestamp.strftime("%H:%M:%S"),
-                "-vframes", "1",
-                "-vf", "scale=160:90",
-                "-y",
-                output_path
-            ]
-            
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            
-            await process.wait()
-            
-            if process.returncode == 0:
-                self.logger.info(f"Thumbnail generated: {output_path}")
-                return output_path
-            else:
-                self.logger.error(f"Failed to generate thumbnail: {process.returncode}")
-                return ""
-                
-        except Exception as e:
-            self.logger.error(f"Error generating thumbnail: {e}")
+            await self.engine.run(cmd)
+            self.logger.info(f"Thumbnail generated: {output_path}")
+            return output_path
+        except ClipExtractionError as e:
+            self.logger.error(f"Failed to generate thumbnail: {e}")
             return ""
-    
+
     async def generate_thumbnails(
         self,
         video_path: str,
         start_time: datetime,
         end_time: datetime,
         interval_seconds: int = 60
-    ) -> List[str]:
-        """Generate multiple thumbnails at intervals."""
+    ) -> List[Thumbnail]:
+        """Generate thumbnails at intervals in one ffmpeg pass."""
+        duration = (end_time - start_time).total_seconds()
+        if duration <= 0:
+            return []
+
+        target_dir = tempfile.mkdtemp(prefix="thumbs_", dir=self.output_dir)
+        try:
+            await self.engine.run(self.build_command(
+                video_path,
+                os.path.join(target_dir, "%05d.jpg"),
+                duration,
+                interval_seconds
+            ))
+        except ClipExtractionError as e:
+            self.logger.error(f"Failed to generate thumbnails for {video_path}: {e}")
+
+        return self._collect(target_dir, start_time, interval_seconds)
+
+    async def generate_sprites(
+        self,
+        video_path: str,
+        start_time: datetime,
+        end_time: datetime,
+        interval_seconds: int = 60,
+        columns: int = 10
+    ) -> List[SpriteSheet]:
+        """Generate one sprite sheet per hour of recording (full grid) in one ffmpeg pass."""
+        duration = (end_time - start_time).total_seconds()
+        if duration <= 0:
+            return []
+
+        per_hour = max(1, 3600 // interval_seconds)
+        columns = min(columns, per_hour)
+        rows = math.ceil(per_hour / columns)
+        per_sheet = columns * rows
+        total = math.ceil(duration / interval_seconds)
+
+        target_dir = tempfile.mkdtemp(prefix="sprites_", dir=self.output_dir)
+        try:
+            await self.engine.run(self.build_command(
+                video_path,
+                os.path.join(target_dir, f"%03d.{self.sprite_format}"),
+                duration,
+                interval_seconds,
+                tile=(columns, rows)
+            ))
+        except ClipExtractionError as e:
+            self.logger.error(f"Failed to generate sprites for {video_path}: {e}")
+            return []
+
+        sheets = []
+        for sheet in range(math.ceil(total / per_sheet)):
+            path = os.path.join(target_dir, f"{sheet:03d}.{self.sprite_format}")
+            if not os.path.exists(path):
+                break
+            sheets.append(SpriteSheet(
+                url=path,
+                start_time=start_time + timedelta(seconds=sheet * per_sheet * interval_seconds),
+                interval_seconds=interval_seconds,
+                count=min(per_sheet, total - sheet * per_sheet),
+                columns=columns,
+                rows=rows,
+                width=self.width,
+                height=self.height
+            ))
+        return sheets
+
+    def _collect(self, target_dir: str, start_time: datetime, interval_seconds: float) -> List[Thumbnail]:
+        """Map image `k` of the sequence to `start_time + k * interval`."""
         thumbnails = []
-        current_time = start_time
-        
-        while current_time < end_time:
-            output_path = os.path.join(
-                self.output_dir,
-                f"thumb_{current_time.strftime('%Y%m%d_%H%M%S')}.jpg"
-            )
-            
-            thumbnail = await self.generate_thumbnail(video_path, current_time, output_path)
-            if thumbnail:
-                thumbnails.append(thumbnail)
-            
-            current_time += timedelta(seconds=interval_seconds)
-        
+        for name in sorted(os.listdir(target_dir)):
+            index, ext = os.path.splitext(name)
+            if ext != ".jpg" or not index.isdigit():
+                continue
+            thumbnails.append(Thumbnail(
+                timestamp=start_time + timedelta(seconds=int(index) * interval_seconds),
+                url=os.path.join(target_dir, name),
+                width=self.width,
+                height=self.height
+            ))
         return thumbnails
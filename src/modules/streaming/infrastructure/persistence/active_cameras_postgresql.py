@@ -0,0 +1,29 @@
+"""PostgreSQL active camera query."""
+from typing import List
+
+from src.modules.streaming.application.queries.active_cameras import ActiveCameraQuery, CameraTarget
+from src.shared.infrastructure.persistence.postgresql_repository import PostgreSQLConnection
+
+# Health comes from the camera status and the status of its latest stream
+ACTIVE_CAMERAS = """
+    SELECT c.id AS camera_id, c.cidade_id::text AS tenant_id, c.url_rtsp AS source_url,
+           c.status = 'ATIVA' AND COALESCE(s.status, 'RUNNING') <> 'ERROR' AS online
+    FROM cameras c
+    LEFT JOIN LATERAL (
+        SELECT status FROM streams
+        WHERE camera_id = c.id
+        ORDER BY created_at DESC
+        LIMIT 1
+    ) s ON TRUE
+    WHERE c.status IN ('ATIVA', 'ERRO')
+"""
+
+
+class ActiveCameraQueryPostgreSQL(PostgreSQLConnection, ActiveCameraQuery):
+    """Active cameras straight from the cameras and streams tables."""
+    
+    async def list_active(self) -> List[CameraTarget]:
+        """Cameras marked active or in error, with their health."""
+        async with self._connection() as conn:
+            rows = await conn.fetch(ACTIVE_CAMERAS)
+        return [CameraTarget(**dict(row)) for row in rows]
@@ -0,0 +1,70 @@
+"""In-memory clip cache index."""
+from datetime import datetime
+from typing import Dict, List, Optional
+from uuid import UUID
+from src.streaming.domain.repositories.clip_cache_index import ClipCacheEntry, ClipCacheIndex
+
+
+class ClipCacheIndexImpl(ClipCacheIndex):
+    """Clip cache index kept in a dict."""
+
+    def __init__(self):
+        self._entries: Dict[str, ClipCacheEntry] = {}
+
+    async def get(self, cache_key: str) -> Optional[ClipCacheEntry]:
+        """Find an entry by its content key."""
+        return self._entries.get(cache_key)
+
+    async def find_overlapping(
+        self,
+        tenant_id: str,
+        camera_id: UUID,
+        codec: str,
+        start_time: datetime,
+        end_time: datetime
+    ) -> List[ClipCacheEntry]:
+        """Entries overlapping the range."""
+        return sorted(
+            (
+                entry for entry in self._entries.values()
+                if entry.tenant_id == tenant_id
+                and entry.camera_id == camera_id
+                and entry.codec == codec
+                and entry.start_time < end_time
+                and entry.end_time > start_time
+            ),
+            key=lambda entry: entry.start_time
+        )
+
+    async def put(self, entry: ClipCacheEntry) -> None:
+        """Insert or replace an entry."""
+        self._entries[entry.cache_key] = entry
+
+    async def touch(self, cache_keys: List[str]) -> None:
+        """Mark entries as used now."""
+        now = datetime.utcnow()
+        for key in cache_keys:
+            if key in self._entries:
+                self._entries[key] = self._entries[key]._replace(last_accessed_at=now)
+
+    async def total_size(self, tenant_id: str) -> int:
+        """Bytes cached for a tenant."""
+        return sum(e.size_bytes for e in self._entries.values() if e.tenant_id == tenant_id)
+
+    async def least_recently_used(
+        self,
+        tenant_id: str,
+        idle_since: datetime,
+        limit: int
+    ) -> List[ClipCacheEntry]:
+        """Oldest-first idle entries."""
+        idle = [
+            e for e in self._entries.values()
+            if e.tenant_id == tenant_id and e.last_accessed_at < idle_since
+        ]
+        return sorted(idle, key=lambda e: e.last_accessed_at)[:limit]
+
+    async def remove(self, cache_keys: List[str]) -> None:
+        """Drop entries."""
+        for key in cache_keys:
+            self._entries.pop(key, None)
@@ -0,0 +1,115 @@
+"""PostgreSQL clip cache index."""
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+
+from src.modules.streaming.domain.repositories.clip_cache_index import ClipCacheEntry, ClipCacheIndex
+from src.shared.infrastructure.persistence.postgresql_repository import PostgreSQLConnection
+
+CLIP_CACHE_COLUMNS = """
+    cache_key, tenant_id, camera_id, start_time, end_time, codec,
+    storage_bucket, storage_key, size_bytes, last_accessed_at
+"""
+
+
+class ClipCacheIndexPostgreSQL(PostgreSQLConnection, ClipCacheIndex):
+    """Clip cache index on the `clip_cache` table."""
+
+    async def get(self, cache_key: str) -> Optional[ClipCacheEntry]:
+        """Find an entry by its content key."""
+        async with self._connection() as conn:
+            row = await conn.fetchrow(
+                f"SELECT {CLIP_CACHE_COLUMNS} FROM clip_cache WHERE cache_key = $1",
+                cache_key
+            )
+        return ClipCacheEntry(**dict(row)) if row else None
+
+    async def find_overlapping(
+        self,
+        tenant_id: str,
+        camera_id: UUID,
+        codec: str,
+        start_time: datetime,
+        end_time: datetime
+    ) -> List[ClipCacheEntry]:
+        """Entries overlapping the range."""
+        async with self._connection() as conn:
+            rows = await conn.fetch(
+                f"""
+                SELECT {CLIP_CACHE_COLUMNS} FROM clip_cache
+                WHERE tenant_id = $1 AND camera_id = $2 AND codec = $3
+                  AND start_time < $5 AND end_time > $4
+                ORDER BY start_time
+                """,
+                tenant_id,
+                camera_id,
+                codec,
+                start_time,
+                end_time
+            )
+        return [ClipCacheEntry(**dict(row)) for row in rows]
+
+    async def put(self, entry: ClipCacheEntry) -> None:
+        """Insert or replace an entry."""
+        async with self._connection() as conn:
+            await conn.execute(
+                f"""
+                INSERT INTO clip_cache ({CLIP_CACHE_COLUMNS})
+                VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10)
+                ON CONFLICT (cache_key) DO UPDATE SET
+                    storage_bucket = EXCLUDED.storage_bucket,
+                    storage_key = EXCLUDED.storage_key,
+                    size_bytes = EXCLUDED.size_bytes,
+                    last_accessed_at = EXCLUDED.last_accessed_at
+                """,
+                *entry
+            )
+
+    async def touch(self, cache_keys: List[str]) -> None:
+        """Mark entries as used now."""
+        if not cache_keys:
+            return
+        async with self._connection() as conn:
+            await conn.execute(
+                "UPDATE clip_cache SET last_accessed_at = NOW() WHERE cache_key = ANY($1::varchar[])",
+                cache_keys
+            )
+
+    async def total_size(self, tenant_id: str) -> int:
+        """Bytes cached for a tenant."""
+        async with self._connection() as conn:
+            return await conn.fetchval(
+                "SELECT COALESCE(SUM(size_bytes), 0)::bigint FROM clip_cache WHERE tenant_id = $1",
+                tenant_id
+            )
+
+    async def least_recently_used(
+        self,
+        tenant_id: str,
+        idle_since: datetime,
+        limit: int
+    ) -> List[ClipCacheEntry]:
+        """Oldest-first idle entries."""
+        async with self._connection() as conn:
+            rows = await conn.fetch(
+                f"""
+                SELECT {CLIP_CACHE_COLUMNS} FROM clip_cache
+                WHERE tenant_id = $1 AND last_accessed_at < $2
+                ORDER BY last_accessed_at
+                LIMIT $3
+                """,
+                tenant_id,
+                idle_since,
+                limit
+            )
+        return [ClipCacheEntry(**dict(row)) for row in rows]
+
+    async def remove(self, cache_keys: List[str]) -> None:
+        """Drop entries."""
+        if not cache_keys:
+            return
+        async with self._connection() as conn:
+            await conn.execute(
+                "DELETE FROM clip_cache WHERE cache_key = ANY($1::varchar[])",
+                cache_keys
+            )
@@ -0,0 +1,127 @@
+"""Clip job repository implementation."""
+from datetime import datetime, timedelta
+from uuid import UUID
+from typing import Dict, List, Optional, Tuple
+from src.modules.streaming.domain.entities.clip_job import ClipJob
+from src.modules.streaming.domain.repositories.clip_job_repository import ClipJobRepository
+from src.modules.streaming.domain.value_objects.clip_job_status import ClipJobStatus
+
+
+class ClipJobRepositoryImpl(ClipJobRepository):
+    """In-memory clip job queue."""
+
+    LIVE_STATUSES = (ClipJobStatus.QUEUED, ClipJobStatus.RUNNING, ClipJobStatus.COMPLETED)
+
+    def __init__(self):
+        self._jobs: Dict[UUID, ClipJob] = {}
+        self._available_at: Dict[UUID, datetime] = {}
+        self._lease_expires_at: Dict[UUID, datetime] = {}
+
+    async def save(self, entity: ClipJob) -> ClipJob:
+        """Save job."""
+        self._jobs[entity.id] = entity
+        self._available_at.setdefault(entity.id, datetime.utcnow())
+        return entity
+
+    async def find_by_id(self, id: UUID) -> Optional[ClipJob]:
+        """Find job by ID."""
+        return self._jobs.get(id)
+
+    async def find_all(self) -> List[ClipJob]:
+        """Find all jobs."""
+        return list(self._jobs.values())
+
+    async def delete(self, id: UUID) -> bool:
+        """Delete job."""
+        self._available_at.pop(id, None)
+        self._lease_expires_at.pop(id, None)
+        return self._jobs.pop(id, None) is not None
+
+    async def enqueue(self, job: ClipJob) -> Tuple[ClipJob, bool]:
+        """Queue a job unless an identical live one exists."""
+        for existing in self._jobs.values():
+            if existing.dedup_key == job.dedup_key and existing.status in self.LIVE_STATUSES:
+                existing.priority = min(existing.priority, job.priority)
+                return existing, False
+        await self.save(job)
+        return job, True
+
+    async def claim(self, lease_seconds: float) -> Optional[ClipJob]:
+        """Take the most urgent due job."""
+        now = datetime.utcnow()
+        due = [
+            job for job in self._jobs.values()
+            if job.status == ClipJobStatus.QUEUED and self._available_at[job.id] <= now
+        ]
+        if not due:
+            return None
+        job = min(due, key=lambda j: (j.priority, j.created_at))
+        job.status = ClipJobStatus.RUNNING
+        job.attempts += 1
+        self._lease_expires_at[job.id] = now + timedelta(seconds=lease_seconds)
+        return job
+
+    def _claimed(self, job_id: UUID, attempt: int) -> Optional[ClipJob]:
+        job = self._jobs.get(job_id)
+        if job and job.status == ClipJobStatus.RUNNING and job.attempts == attempt:
+            return job
+        return None
+
+    async def heartbeat(self, job_id: UUID, attempt: int, progress: float, lease_seconds: float) -> bool:
+        """Record progress and extend the lease."""
+        job = self._claimed(job_id, attempt)
+        if job:
+            job.progress = progress
+            self._lease_expires_at[job_id] = datetime.utcnow() + timedelta(seconds=lease_seconds)
+        return job is not None
+
+    async def complete(
+        self,
+        job_id: UUID,
+        attempt: int,
+        storage_bucket: str,
+        storage_key: str,
+        size_bytes: int
+    ) -> bool:
+        """Mark a job COMPLETED."""
+        job = self._claimed(job_id, attempt)
+        if not job:
+            return False
+        job.status = ClipJobStatus.COMPLETED
+        job.progress = 100.0
+        job.storage_bucket = storage_bucket
+        job.storage_key = storage_key
+        job.size_bytes = size_bytes
+        job.error = None
+        job.finished_at = datetime.utcnow()
+        self._lease_expires_at.pop(job_id, None)
+        return True
+
+    async def fail(self, job_id: UUID, attempt: int, error: str, retry_in_seconds: Optional[float] = None) -> bool:
+        """Requeue or mark a job FAILED."""
+        job = self._claimed(job_id, attempt)
+        if not job:
+            return False
+        job.error = error
+        self._lease_expires_at.pop(job_id, None)
+        if retry_in_seconds is None:
+            job.status = ClipJobStatus.FAILED
+            job.finished_at = datetime.utcnow()
+        else:
+            job.status = ClipJobStatus.QUEUED
+            job.progress = 0.0
+            self._available_at[job_id] = datetime.utcnow() + timedelta(seconds=retry_in_seconds)
+        return True
+
+    async def requeue_expired(self) -> int:
+        """Requeue RUNNING jobs whose lease expired."""
+        now = datetime.utcnow()
+        expired = [
+            job for job in self._jobs.values()
+            if job.status == ClipJobStatus.RUNNING and self._lease_expires_at.get(job.id, now) < now
+        ]
+        for job in expired:
+            job.status = ClipJobStatus.QUEUED
+            self._available_at[job.id] = now
+            self._lease_expires_at.pop(job.id, None)
+        return len(expired)
@@ -0,0 +1,274 @@
+"""Clip job repository PostgreSQL implementation."""
+from typing import Callable, List, Optional, Tuple
+from uuid import UUID
+
+from src.modules.streaming.domain.entities.clip_job import ClipJob
+from src.modules.streaming.domain.repositories.clip_job_repository import ClipJobRepository
+from src.modules.streaming.domain.value_objects.clip_job_status import ClipJobStatus
+from src.shared.infrastructure.persistence.postgresql_repository import PostgreSQLRepository
+
+
+CLIP_JOB_COLUMNS = """
+    id, tenant_id, camera_id, start_time, end_time, reason, faststart,
+    priority, status, progress, attempts, storage_bucket, storage_key,
+    size_bytes, error, finished_at
+"""
+
+NOTIFY_CHANNEL = "clip_jobs"
+
+
+class ClipJobRepositoryPostgreSQL(PostgreSQLRepository[ClipJob], ClipJobRepository):
+    """Clip job queue on PostgreSQL.
+
+    Workers claim jobs with `FOR UPDATE SKIP LOCKED`, so any number of them
+    can poll the table without blocking each other. Enqueueing sends a
+    NOTIFY on `clip_jobs` so idle workers wake up immediately. Updates of a
+    claimed job match `attempts` too, so a worker whose job was reaped and
+    claimed again cannot touch the new claim.
+    """
+
+    def __init__(self, connection_string: str, batch_size: Optional[int] = None):
+        super().__init__(connection_string, batch_size)
+        self._listen_conn = None
+        self._listen_callback = None
+
+    async def save(self, entity: ClipJob) -> ClipJob:
+        """Save job."""
+        async with self._transaction() as conn:
+            await conn.execute(
+                f"""
+                INSERT INTO clip_jobs (
+                    {CLIP_JOB_COLUMNS}, dedup_key
+                )
+                VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15, $16, $17)
+                ON CONFLICT (id) DO UPDATE SET
+                    priority = EXCLUDED.priority,
+                    status = EXCLUDED.status,
+                    progress = EXCLUDED.progress,
+                    attempts = EXCLUDED.attempts,
+                    storage_bucket = EXCLUDED.storage_bucket,
+                    storage_key = EXCLUDED.storage_key,
+                    size_bytes = EXCLUDED.size_bytes,
+                    error = EXCLUDED.error,
+                    finished_at = EXCLUDED.finished_at,
+                    updated_at = NOW()
+                """,
+                *self._to_record(entity),
+                entity.dedup_key
+            )
+        return entity
+
+    async def enqueue(self, job: ClipJob) -> Tuple[ClipJob, bool]:
+        """Insert the job or return the live duplicate, raising its priority."""
+        async with self._transaction() as conn:
+            row = await conn.fetchrow(
+                f"""
+                INSERT INTO clip_jobs ({CLIP_JOB_COLUMNS}, dedup_key)
+                VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15, $16, $17)
+                ON CONFLICT (dedup_key) WHERE status IN ('QUEUED', 'RUNNING', 'COMPLETED')
+                DO UPDATE SET
+                    priority = LEAST(clip_jobs.priority, EXCLUDED.priority),
+                    updated_at = NOW()
+                RETURNING {CLIP_JOB_COLUMNS}, (xmax = 0) AS created
+                """,
+                *self._to_record(job),
+                job.dedup_key
+            )
+            if row["created"]:
+                await conn.execute("SELECT pg_notify($1, $2)", NOTIFY_CHANNEL, str(row["id"]))
+        return self._to_entity(row), row["created"]
+
+    async def claim(self, lease_seconds: float) -> Optional[ClipJob]:
+        """Take the most urgent due job."""
+        async with self._transaction() as conn:
+            row = await conn.fetchrow(
+                f"""
+                UPDATE clip_jobs SET
+                    status = 'RUNNING',
+                    attempts = attempts + 1,
+                    lease_expires_at = NOW() + make_interval(secs => $1),
+                    updated_at = NOW()
+                WHERE id = (
+                    SELECT id FROM clip_jobs
+                    WHERE status = 'QUEUED' AND available_at <= NOW()
+                    ORDER BY priority, created_at
+                    FOR UPDATE SKIP LOCKED
+                    LIMIT 1
+                )
+                RETURNING {CLIP_JOB_COLUMNS}
+                """,
+                float(lease_seconds)
+            )
+        return self._to_entity(row) if row else None
+
+    async def heartbeat(self, job_id: UUID, attempt: int, progress: float, lease_seconds: float) -> bool:
+        """Record progress and extend the lease."""
+        async with self._connection() as conn:
+            result = await conn.execute(
+                """
+                UPDATE clip_jobs SET
+                    progress = $3,
+                    lease_expires_at = NOW() + make_interval(secs => $4),
+                    updated_at = NOW()
+                WHERE id = $1 AND status = 'RUNNING' AND attempts = $2
+                """,
+                job_id,
+                attempt,
+                progress,
+                float(lease_seconds)
+            )
+        return result.split()[-1] == "1"
+
+    async def complete(
+        self,
+        job_id: UUID,
+        attempt: int,
+        storage_bucket: str,
+        storage_key: str,
+        size_bytes: int
+    ) -> bool:
+        """Mark a job COMPLETED."""
+        async with self._connection() as conn:
+            result = await conn.execute(
+                """
+                UPDATE clip_jobs SET
+                    status = 'COMPLETED',
+                    progress = 100,
+                    storage_bucket = $3,
+                    storage_key = $4,
+                    size_bytes = $5,
+                    error = NULL,
+                    lease_expires_at = NULL,
+                    finished_at = NOW(),
+                    updated_at = NOW()
+                WHERE id = $1 AND status = 'RUNNING' AND attempts = $2
+                """,
+                job_id,
+                attempt,
+                storage_bucket,
+                storage_key,
+                size_bytes
+            )
+        return result.split()[-1] == "1"
+
+    async def fail(self, job_id: UUID, attempt: int, error: str, retry_in_seconds: Optional[float] = None) -> bool:
+        """Requeue or mark a job FAILED."""
+        async with self._connection() as conn:
+            if retry_in_seconds is None:
+                result = await conn.execute(
+                    """
+                    UPDATE clip_jobs SET
+                        status = 'FAILED',
+                        error = $3,
+                        lease_expires_at = NULL,
+                        finished_at = NOW(),
+                        updated_at = NOW()
+                    WHERE id = $1 AND status = 'RUNNING' AND attempts = $2
+                    """,
+                    job_id,
+                    attempt,
+                    error
+                )
+            else:
+                result = await conn.execute(
+                    """
+                    UPDATE clip_jobs SET
+                        status = 'QUEUED',
+                        progress = 0,
+                        error = $3,
+                        lease_expires_at = NULL,
+                        available_at = NOW() + make_interval(secs => $4),
+                        updated_at = NOW()
+                    WHERE id = $1 AND status = 'RUNNING' AND attempts = $2
+                    """,
+                    job_id,
+                    attempt,
+                    error,
+                    float(retry_in_seconds)
+                )
+        return result.split()[-1] == "1"
+
+    async def requeue_expired(self) -> int:
+        """Requeue RUNNING jobs whose lease expired."""
+        async with self._connection() as conn:
+            result = await conn.execute(
+                """
+                UPDATE clip_jobs SET
+                    status = 'QUEUED',
+                    progress = 0,
+                    lease_expires_at = NULL,
+                    available_at = NOW(),
+                    updated_at = NOW()
+                WHERE status = 'RUNNING' AND lease_expires_at < NOW()
+                """
+            )
+        return int(result.split()[-1])
+
+    async def find_by_id(self, id: UUID) -> Optional[ClipJob]:
+        """Find job by ID."""
+        async with self._connection() as conn:
+            row = await conn.fetchrow(
+                f"SELECT {CLIP_JOB_COLUMNS} FROM clip_jobs WHERE id = $1",
+                id
+            )
+            return self._to_entity(row) if row else None
+
+    async def find_all(self) -> List[ClipJob]:
+        """Find all jobs."""
+        async with self._connection() as conn:
+            rows = await conn.fetch(
+                f"SELECT {CLIP_JOB_COLUMNS} FROM clip_jobs ORDER BY created_at DESC"
+            )
+            return [self._to_entity(row) for row in rows]
+
+    async def delete(self, id: UUID) -> None:
+        """Delete job by ID."""
+        async with self._transaction() as conn:
+            await conn.execute("DELETE FROM clip_jobs WHERE id = $1", id)
+
+    async def listen(self, on_enqueued: Callable[[], None]) -> None:
+        """Call `on_enqueued` whenever a job is queued, on a dedicated connection."""
+        if self._listen_conn is not None:
+            return
+        pool = await self._get_pool()
+        self._listen_conn = await pool.acquire()
+        self._listen_callback = lambda *_: on_enqueued()
+        await self._listen_conn.add_listener(NOTIFY_CHANNEL, self._listen_callback)
+
+    async def close(self):
+        """Stop listening and release the pool reference."""
+        if self._listen_conn is not None:
+            await self._listen_conn.remove_listener(NOTIFY_CHANNEL, self._listen_callback)
+            await self._pool.release(self._listen_conn)
+            self._listen_conn = None
+        await super().close()
+
+    @staticmethod
+    def _to_record(job: ClipJob) -> tuple:
+        return (
+            job.id, job.tenant_id, job.camera_id, job.start_time, job.end_time,
+            job.reason, job.faststart, job.priority, job.status.value, job.progress,
+            job.attempts, job.storage_bucket, job.storage_key, job.size_bytes,
+            job.error, job.finished_at
+        )
+
+    @staticmethod
+    def _to_entity(row) -> ClipJob:
+        return ClipJob(
+            id=row["id"],
+            tenant_id=row["tenant_id"],
+            camera_id=row["camera_id"],
+            start_time=row["start_time"],
+            end_time=row["end_time"],
+            reason=row["reason"],
+            faststart=row["faststart"],
+            priority=row["priority"],
+            status=ClipJobStatus(row["status"]),
+            progress=row["progress"],
+            attempts=row["attempts"],
+            storage_bucket=row["storage_bucket"],
+            storage_key=row["storage_key"],
+            size_bytes=row["size_bytes"],
+            error=row["error"],
+            finished_at=row["finished_at"]
+        )
@@ -32,6 +32,16 @@ class ClipRepositoryImpl(ClipRepository):
             return True
         return False
     
+    async def save_many(self, clips: List[Clip], batch_size: Optional[int] = None) -> int:
+        """Save many clips."""
+        for clip in clips:
+            self._clips[clip.id] = clip
+        return len({c.id for c in clips})
+    
+    async def delete_many(self, ids: List[UUID], batch_size: Optional[int] = None) -> int:
+        """Delete many clips."""
+        return sum(1 for id in set(ids) if self._clips.pop(id, None) is not None)
+    
     async def find_by_recording_id(self, recording_id: UUID) -> List[Clip]:
         """Find clips by recording ID."""
         return [c for c in self._clips.values() if c.recording_id == recording_id]
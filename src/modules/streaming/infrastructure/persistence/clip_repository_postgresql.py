@@ -38,6 +38,30 @@ class ClipRepositoryPostgreSQL(PostgreSQLRepository[Clip], ClipRepository):
             )
         return entity
     
+    async def save_many(self, clips: List[Clip], batch_size: Optional[int] = None) -> int:
+        """Bulk upsert clips through COPY + set-based ON CONFLICT."""
+        now = datetime.now()
+        return await self._copy_upsert(
+            "clips",
+            [
+                "id", "recording_id", "start_time", "end_time",
+                "status", "storage_path", "file_size_mb", "created_at"
+            ],
+            [
+                (
+                    c.id, c.recording_id, c.start_time, c.end_time,
+                    c.status.value, c.storage_path, c.file_size_mb, now
+                )
+                for c in clips
+            ],
+            ["status", "storage_path", "file_size_mb"],
+            batch_size
+        )
+    
+    async def delete_many(self, ids: List[UUID], batch_size: Optional[int] = None) -> int:
+        """Delete clips in batches."""
+        return await self._delete_many("clips", ids, batch_size)
+    
     async def find_by_id(self, id: UUID) -> Optional[Clip]:
         """Find clip by ID."""
         async with self._connection() as conn:
@@ -1,8 +1,9 @@
 """Recording repository implementation."""
 from uuid import UUID
-from typing import List, Optional
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 from datetime import datetime
 from src.streaming.domain.entities.recording import Recording
+from src.streaming.domain.entities.recording_read_model import RecordingReadModel
 from src.streaming.domain.repositories.recording_repository import RecordingRepository
 from src.streaming.domain.value_objects.recording_status import RecordingStatus
 from src.streaming.domain.value_objects.retention_policy import RetentionPolicy
@@ -34,6 +35,16 @@ class RecordingRepositoryImpl(RecordingRepository):
             return True
         return False
     
+    async def save_many(self, recordings: List[Recording], batch_size: Optional[int] = None) -> int:
+        """Save many recordings."""
+        for recording in recordings:
+            self._recordings[recording.id] = recording
+        return len({r.id for r in recordings})
+    
+    async def delete_many(self, ids: List[UUID], batch_size: Optional[int] = None) -> int:
+        """Delete many recordings."""
+        return sum(1 for id in set(ids) if self._recordings.pop(id, None) is not None)
+    
     async def find_by_stream_id(self, stream_id: UUID) -> List[Recording]:
         """Find recordings by stream ID."""
         return [r for r in self._recordings.values() if r.stream_id == stream_id]
@@ -49,7 +60,12 @@ class RecordingRepositoryImpl(RecordingRepository):
         self,
         stream_id: Optional[UUID] = None,
         start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None
+        end_date: Optional[datetime] = None,
+        camera_id: Optional[UUID] = None,
+        tenant_id: Optional[UUID] = None,
+        status: Optional[RecordingStatus] = None,
+        limit: Optional[int] = None,
+        after: Optional[Tuple[datetime, UUID]] = None
     ) -> List[Recording]:
         """Search recordings by filters."""
         results = list(self._recordings.values())
@@ -57,13 +73,67 @@ class RecordingRepositoryImpl(RecordingRepository):
         if stream_id:
             results = [r for r in results if r.stream_id == stream_id]
         
+        if camera_id:
+            results = [r for r in results if r.camera_id == camera_id]
+        
+        if tenant_id:
+            results = [r for r in results if r.tenant_id == tenant_id]
+        
+        if status:
+            results = [r for r in results if r.status == status]
+        
         if start_date:
             results = [r for r in results if r.started_at >= start_date]
         
         if end_date:
             results = [r for r in results if r.started_at <= end_date]
         
-        return results
+        if after:
+            results = [r for r in results if (r.started_at, r.id) < after]
+        
+        results.sort(key=lambda r: (r.started_at, r.id), reverse=True)
+        return results[:limit] if limit else results
+    
+    async def iter_search(
+        self,
+        stream_id: Optional[UUID] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        camera_id: Optional[UUID] = None,
+        tenant_id: Optional[UUID] = None,
+        status: Optional[RecordingStatus] = None,
+        batch_size: int = 1000
+    ) -> AsyncIterator[RecordingReadModel]:
+        """Iterate over recordings matching the filters."""
+        results = await self.search(
+            stream_id=stream_id,
+            start_date=start_date,
+            end_date=end_date,
+            camera_id=camera_id,
+            tenant_id=tenant_id,
+            status=status
+        )
+        for recording in results:
+            yield RecordingReadModel.from_entity(recording)
+    
+    async def find_intervals_by_stream_ids(
+        self,
+        stream_ids: List[UUID],
+        start_date: datetime,
+        end_date: datetime,
+        open_only: bool = False
+    ) -> Dict[UUID, List[Tuple[datetime, datetime]]]:
+        """Find recording intervals for many streams."""
+        wanted = set(stream_ids)
+        now = datetime.utcnow()
+        result: Dict[UUID, List[Tuple[datetime, datetime]]] = {}
+        for r in self._recordings.values():
+            if open_only and r.stopped_at is not None:
+                continue
+            stopped_at = r.stopped_at or now
+            if r.stream_id in wanted and r.started_at < end_date and stopped_at > start_date:
+                result.setdefault(r.stream_id, []).append((r.started_at, stopped_at))
+        return result
     
     async def find_expired(self) -> List[Recording]:
         """Find recordings that should be deleted."""
@@ -1,14 +1,20 @@
 """Recording repository PostgreSQL implementation."""
-from typing import List, Optional
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 from uuid import UUID
 from datetime import datetime
 
 from streaming.domain.entities.recording import Recording
+from streaming.domain.entities.recording_read_model import RecordingReadModel
 from streaming.domain.value_objects.recording_status import RecordingStatus
-from streaming.domain.value_objects.retention_policy import RetentionPolicy
 from streaming.domain.repositories.recording_repository import RecordingRepository
+from streaming.infrastructure.persistence.recording_row_mapper import recording_row_mapper
 from shared_kernel.infrastructure.persistence.postgresql_repository import PostgreSQLRepository
 
+RECORDING_COLUMNS = (
+    "id, stream_id, camera_id, tenant_id, retention_days, status, "
+    "started_at, stopped_at, storage_path, file_size_mb, duration_seconds"
+)
+
 
 class RecordingRepositoryPostgreSQL(PostgreSQLRepository[Recording], RecordingRepository):
     """PostgreSQL implementation of RecordingRepository."""
@@ -21,9 +27,9 @@ class RecordingRepositoryPostgreSQL(PostgreSQLRepository[Recording], RecordingRe
                 INSERT INTO recordings (
                     id, stream_id, retention_days, status, 
                     started_at, stopped_at, storage_path, 
-                    file_size_mb, duration_seconds
+                    file_size_mb, duration_seconds, camera_id, tenant_id
                 )
-                VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)
+                VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11)
                 ON CONFLICT (id) DO UPDATE SET
                     status = EXCLUDED.status,
                     stopped_at = EXCLUDED.stopped_at,
@@ -39,96 +45,127 @@ class RecordingRepositoryPostgreSQL(PostgreSQLRepository[Recording], RecordingRe
                 entity.stopped_at,
                 entity.storage_path,
                 entity.file_size_mb,
-                entity.duration_seconds
+                entity.duration_seconds,
+                entity.camera_id,
+                entity.tenant_id
             )
         return entity
     
+    async def save_many(self, recordings: List[Recording], batch_size: Optional[int] = None) -> int:
+        """Bulk upsert recordings through COPY + set-based ON CONFLICT."""
+        return await self._copy_upsert(
+            "recordings",
+            [
+                "id", "stream_id", "camera_id", "tenant_id", "retention_days", "status",
+                "started_at", "stopped_at", "storage_path", "file_size_mb", "duration_seconds"
+            ],
+            [
+                (
+                    r.id, r.stream_id, r.camera_id, r.tenant_id, r.retention_policy.days,
+                    r.status.value, r.started_at, r.stopped_at, r.storage_path,
+                    r.file_size_mb, r.duration_seconds
+                )
+                for r in recordings
+            ],
+            ["status", "stopped_at", "storage_path", "file_size_mb", "duration_seconds"],
+            batch_size
+        )
+    
+    async def delete_many(self, ids: List[UUID], batch_size: Optional[int] = None) -> int:
+        """Delete recordings in batches."""
+        return await self._delete_many("recordings", ids, batch_size)
+    
     async def find_by_id(self, id: UUID) -> Optional[Recording]:
         """Find recording by ID."""
         async with self._connection() as conn:
             row = await conn.fetchrow(
-                "SELECT * FROM recordings WHERE id = $1",
+                f"SELECT {RECORDING_COLUMNS} FROM recordings WHERE id = $1",
                 id
             )
             
             if not row:
                 return None
             
-            return Recording(
-                id=row['id'],
-                stream_id=row['stream_id'],
-                retention_policy=RetentionPolicy(row['retention_days']),
-                status=RecordingStatus(row['status']),
-                started_at=row['started_at'],
-                stopped_at=row['stopped_at'],
-                storage_path=row['storage_path'],
-                file_size_mb=float(row['file_size_mb']) if row['file_size_mb'] else 0.0,
-                duration_seconds=row['duration_seconds'] or 0
-            )
+            return recording_row_mapper.to_entity(row)
     
     async def find_by_stream_id(self, stream_id: UUID) -> List[Recording]:
         """Find recordings by stream ID."""
         async with self._connection() as conn:
             rows = await conn.fetch(
-                "SELECT * FROM recordings WHERE stream_id = $1 ORDER BY started_at DESC",
+                f"SELECT {RECORDING_COLUMNS} FROM recordings WHERE stream_id = $1 ORDER BY started_at DESC",
                 stream_id
             )
             
-            return [
-                Recording(
-                    id=row['id'],
-                    stream_id=row['stream_id'],
-                    retention_policy=RetentionPolicy(row['retention_days']),
-                    status=RecordingStatus(row['status']),
-                    started_at=row['started_at'],
-                    stopped_at=row['stopped_at'],
-                    storage_path=row['storage_path'],
-                    file_size_mb=float(row['file_size_mb']) if row['file_size_mb'] else 0.0,
-                    duration_seconds=row['duration_seconds'] or 0
-                )
-                for row in rows
-            ]
+            return recording_row_mapper.to_entities(rows)
     
     async def search(
         self,
-        camera_id: Optional[UUID] = None,
+        stream_id: Optional[UUID] = None,
         start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None
+        end_date: Optional[datetime] = None,
+        camera_id: Optional[UUID] = None,
+        tenant_id: Optional[UUID] = None,
+        status: Optional[RecordingStatus] = None,
+        limit: Optional[int] = None,
+        after: Optional[Tuple[datetime, UUID]] = None
     ) -> List[Recording]:
-        """Search recordings with filters."""
-        query = "SELECT * FROM recordings WHERE 1=1"
-        params = []
-        param_count = 1
+        """Search recordings with filters, newest first.
         
-        if start_date:
-            query += f" AND started_at >= ${param_count}"
-            params.append(start_date)
-            param_count += 1
+        Pagination is keyset-based on (started_at, id): `after` is the last
+        row of the previous page, so each page is an index range scan on the
+        composite (<filter>, started_at DESC, id DESC) indexes instead of an
+        OFFSET that re-reads every skipped row.
+        """
+        conditions, params = self._search_conditions(
+            stream_id, start_date, end_date, camera_id, tenant_id, status
+        )
+        if after:
+            params.extend(after)
+            conditions.append(f"(started_at, id) < (${len(params) - 1}, ${len(params)})")
         
-        if end_date:
-            query += f" AND started_at <= ${param_count}"
-            params.append(end_date)
-            param_count += 1
-        
-        query += " ORDER BY started_at DESC"
+        query = f"SELECT {RECORDING_COLUMNS} FROM recordings"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY started_at DESC, id DESC"
+        if limit:
+            params.append(limit)
+            query += f" LIMIT ${len(params)}"
         
         async with self._connection() as conn:
             rows = await conn.fetch(query, *params)
             
-            return [
-                Recording(
-                    id=row['id'],
-                    stream_id=row['stream_id'],
-                    retention_policy=RetentionPolicy(row['retention_days']),
-                    status=RecordingStatus(row['status']),
-                    started_at=row['started_at'],
-                    stopped_at=row['stopped_at'],
-                    storage_path=row['storage_path'],
-                    file_size_mb=float(row['file_size_mb']) if row['file_size_mb'] else 0.0,
-                    duration_seconds=row['duration_seconds'] or 0
-                )
-                for row in rows
-            ]
+            return recording_row_mapper.to_entities(rows)
+    
+    async def iter_search(
+        self,
+        stream_id: Optional[UUID] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        camera_id: Optional[UUID] = None,
+        tenant_id: Optional[UUID] = None,
+        status: Optional[RecordingStatus] = None,
+        batch_size: int = 1000
+    ) -> AsyncIterator[RecordingReadModel]:
+        """Stream search results through a server-side cursor.
+        
+        Rows are fetched `batch_size` at a time inside a read-only repeatable
+        read transaction, so memory stays constant and the export is a
+        consistent snapshot. The connection is held until the consumer
+        finishes or closes the iterator.
+        """
+        conditions, params = self._search_conditions(
+            stream_id, start_date, end_date, camera_id, tenant_id, status
+        )
+        query = f"SELECT {RECORDING_COLUMNS} FROM recordings"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY started_at DESC, id DESC"
+        
+        to_read_model = recording_row_mapper.to_read_model
+        async with self._connection() as conn:
+            async with conn.transaction(isolation="repeatable_read", readonly=True):
+                async for row in conn.cursor(query, *params, prefetch=batch_size):
+                    yield to_read_model(row)
     
     async def delete(self, id: UUID) -> None:
         """Delete recording by ID."""
@@ -141,28 +178,15 @@ class RecordingRepositoryPostgreSQL(PostgreSQLRepository[Recording], RecordingRe
     async def find_all(self) -> List[Recording]:
         """Find all recordings."""
         async with self._connection() as conn:
-            rows = await conn.fetch("SELECT * FROM recordings ORDER BY started_at DESC")
+            rows = await conn.fetch(f"SELECT {RECORDING_COLUMNS} FROM recordings ORDER BY started_at DESC")
             
-            return [
-                Recording(
-                    id=row['id'],
-                    stream_id=row['stream_id'],
-                    retention_policy=RetentionPolicy(row['retention_days']),
-                    status=RecordingStatus(row['status']),
-                    started_at=row['started_at'],
-                    stopped_at=row['stopped_at'],
-                    storage_path=row['storage_path'],
-                    file_size_mb=float(row['file_size_mb']) if row['file_size_mb'] else 0.0,
-                    duration_seconds=row['duration_seconds'] or 0
-                )
-                for row in rows
-            ]
+            return recording_row_mapper.to_entities(rows)
     
     async def find_active_by_stream_id(self, stream_id: UUID) -> Optional[Recording]:
         """Find active recording by stream ID."""
         async with self._connection() as conn:
             row = await conn.fetchrow(
-                "SELECT * FROM recordings WHERE stream_id = $1 AND status = $2 LIMIT 1",
+                f"SELECT {RECORDING_COLUMNS} FROM recordings WHERE stream_id = $1 AND status = $2 LIMIT 1",
                 stream_id,
                 RecordingStatus.RECORDING.value
             )
@@ -170,39 +194,50 @@ class RecordingRepositoryPostgreSQL(PostgreSQLRepository[Recording], RecordingRe
             if not row:
                 return None
             
-            return Recording(
-                id=row['id'],
-                stream_id=row['stream_id'],
-                retention_policy=RetentionPolicy(row['retention_days']),
-                status=RecordingStatus(row['status']),
-                started_at=row['started_at'],
-                stopped_at=row['stopped_at'],
-                storage_path=row['storage_path'],
-                file_size_mb=float(row['file_size_mb']) if row['file_size_mb'] else 0.0,
-                duration_seconds=row['duration_seconds'] or 0
+            return recording_row_mapper.to_entity(row)
+    
+    async def find_intervals_by_stream_ids(
+        self,
+        stream_ids: List[UUID],
+        start_date: datetime,
+        end_date: datetime,
+        open_only: bool = False
+    ) -> Dict[UUID, List[Tuple[datetime, datetime]]]:
+        """Find recording intervals for many streams in one set-based query."""
+        if not stream_ids:
+            return {}
+        
+        async with self._connection() as conn:
+            rows = await conn.fetch(
+                """
+                SELECT stream_id, started_at, stopped_at FROM recordings
+                WHERE stream_id = ANY($1::uuid[])
+                    AND started_at < $3
+                    AND (stopped_at IS NULL OR (NOT $4 AND stopped_at > $2))
+                ORDER BY stream_id, started_at
+                """,
+                stream_ids,
+                start_date,
+                end_date,
+                open_only
             )
+        
+        now = datetime.utcnow()
+        result: Dict[UUID, List[Tuple[datetime, datetime]]] = {}
+        for row in rows:
+            result.setdefault(row['stream_id'], []).append(
+                (row['started_at'], row['stopped_at'] or now)
+            )
+        return result
     
     async def find_expired(self) -> List[Recording]:
         """Find expired recordings."""
         async with self._connection() as conn:
             rows = await conn.fetch(
-                "SELECT * FROM recordings WHERE stopped_at < NOW() - (retention_days || ' days')::INTERVAL"
+                f"SELECT {RECORDING_COLUMNS} FROM recordings WHERE stopped_at < NOW() - (retention_days || ' days')::INTERVAL"
             )
             
-            return [
-                Recording(
-                    id=row['id'],
-                    stream_id=row['stream_id'],
-                    retention_policy=RetentionPolicy(row['retention_days']),
-                    status=RecordingStatus(row['status']),
-                    started_at=row['started_at'],
-                    stopped_at=row['stopped_at'],
-                    storage_path=row['storage_path'],
-                    file_size_mb=float(row['file_size_mb']) if row['file_size_mb'] else 0.0,
-                    duration_seconds=row['duration_seconds'] or 0
-                )
-                for row in rows
-            ]
+            return recording_row_mapper.to_entities(rows)
 
     async def count_active(self) -> int:
         """Count active recordings."""
@@ -212,3 +247,28 @@ class RecordingRepositoryPostgreSQL(PostgreSQLRepository[Recording], RecordingRe
                 RecordingStatus.RECORDING.value
             )
             return row['count'] if row else 0
+
+    @staticmethod
+    def _search_conditions(
+        stream_id: Optional[UUID],
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+        camera_id: Optional[UUID],
+        tenant_id: Optional[UUID],
+        status: Optional[RecordingStatus]
+    ) -> Tuple[List[str], list]:
+        """Build WHERE conditions and positional params for search filters."""
+        conditions: List[str] = []
+        params: list = []
+        for clause, value in (
+            ("stream_id = ${}", stream_id),
+            ("camera_id = ${}", camera_id),
+            ("tenant_id = ${}", tenant_id),
+            ("status = ${}", status.value if status else None),
+            ("started_at >= ${}", start_date),
+            ("started_at <= ${}", end_date),
+        ):
+            if value:
+                params.append(value)
+                conditions.append(clause.format(len(params)))
+        return conditions, params
@@ -0,0 +1,51 @@
+"""Recording row mapper."""
+from streaming.domain.entities.recording import Recording
+from streaming.domain.entities.recording_read_model import RecordingReadModel
+from streaming.domain.value_objects.recording_status import RecordingStatus
+from streaming.domain.value_objects.retention_policy import RetentionPolicy
+from shared_kernel.infrastructure.persistence.row_mapper import RowMapper, ValueCache
+
+
+class RecordingRowMapper(RowMapper[Recording]):
+    """Maps `recordings` rows selected with RECORDING_COLUMNS."""
+    
+    def __init__(self):
+        self.retention_policy = ValueCache(RetentionPolicy)
+        self.status = ValueCache(RecordingStatus)
+    
+    def to_entity(self, row) -> Recording:
+        """Hydrate a Recording entity."""
+        file_size_mb = row['file_size_mb']
+        return Recording.hydrate(
+            row['id'],
+            row['stream_id'],
+            self.retention_policy(row['retention_days']),
+            self.status(row['status']),
+            row['started_at'],
+            row['stopped_at'],
+            row['storage_path'],
+            float(file_size_mb) if file_size_mb else 0.0,
+            row['duration_seconds'] or 0,
+            row['camera_id'],
+            row['tenant_id']
+        )
+    
+    def to_read_model(self, row) -> RecordingReadModel:
+        """Map a row straight to a read model, skipping the entity."""
+        file_size_mb = row['file_size_mb']
+        return RecordingReadModel(
+            row['id'],
+            row['stream_id'],
+            row['camera_id'],
+            row['tenant_id'],
+            row['status'],
+            row['started_at'],
+            row['stopped_at'],
+            row['retention_days'],
+            row['storage_path'],
+            float(file_size_mb) if file_size_mb else 0.0,
+            row['duration_seconds'] or 0
+        )
+
+
+recording_row_mapper = RecordingRowMapper()
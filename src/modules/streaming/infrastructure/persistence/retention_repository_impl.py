@@ -0,0 +1,169 @@
+"""In-memory retention repository."""
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+from uuid import NAMESPACE_URL, UUID, uuid5
+from src.streaming.domain.repositories.retention_repository import (
+    ExpiredRecording,
+    MisplacedSegment,
+    RetentionCursor,
+    RetentionRepository,
+    cursor_after,
+)
+from src.streaming.domain.value_objects.retention_policy import LEGAL_HOLD_PREFIX, RetentionPolicy
+
+
+class RetentionRepositoryImpl(RetentionRepository):
+    """Retention repository kept in dicts."""
+
+    def __init__(self):
+        self._recordings: Dict[UUID, ExpiredRecording] = {}
+        self._holds: Dict[UUID, bool] = {}
+        self._segments: Dict[UUID, List[UUID]] = {}
+        self.segment_keys: Dict[UUID, str] = {}
+        self.segment_starts: Dict[UUID, datetime] = {}
+        self.deleted: Dict[UUID, str] = {}
+        self.audit: List[dict] = []
+        self.watermarks: Dict[UUID, datetime] = {}
+
+    def add(
+        self,
+        recording: ExpiredRecording,
+        incident: bool = False,
+        legal_hold: bool = False,
+        segment_starts: Optional[List[datetime]] = None
+    ) -> None:
+        """Register a recording (test/bootstrap helper); segments start with it unless given."""
+        self._recordings[recording.id] = recording
+        self._holds[recording.id] = incident or legal_hold
+        self._segments[recording.id] = []
+        starts = segment_starts or [recording.started_at] * len(recording.object_keys)
+        for key, start in zip(recording.object_keys, starts):
+            segment_id = uuid5(NAMESPACE_URL, key)
+            self._segments[recording.id].append(segment_id)
+            self.segment_keys[segment_id] = key
+            self.segment_starts[segment_id] = start
+
+    def object_keys(self, recording_id: UUID) -> List[str]:
+        """Current keys of a recording's segments."""
+        return [self.segment_keys[segment_id] for segment_id in self._segments[recording_id]]
+
+    def set_hold(self, recording_id: UUID, held: bool) -> None:
+        """Put a recording on (or release it from) incident/legal hold."""
+        self._holds[recording_id] = held
+
+    def _pending(self):
+        return (
+            r._replace(object_keys=self.object_keys(r.id)) for r in self._recordings.values()
+            if r.id not in self.deleted and not self._holds[r.id]
+        )
+
+    async def find_expired(
+        self,
+        now: datetime,
+        after: Optional[RetentionCursor] = None,
+        limit: int = 1000,
+        tenant_id: Optional[UUID] = None
+    ) -> List[ExpiredRecording]:
+        """Next chunk of expired recordings after the cursor."""
+        expired = sorted(
+            (
+                r for r in self._pending()
+                if r.expires_at <= now
+                and (tenant_id is None or r.tenant_id == tenant_id)
+                and (after is None or (r.expires_at, r.id) > after)
+            ),
+            key=lambda r: (r.expires_at, r.id)
+        )
+        return expired[:limit]
+
+    async def next_expirations(self) -> Dict[UUID, datetime]:
+        """Earliest pending expiry per tenant after its watermark."""
+        expirations: Dict[UUID, datetime] = {}
+        for r in self._pending():
+            if r.tenant_id is None or not self._after_watermark(r):
+                continue
+            if r.tenant_id not in expirations or r.expires_at < expirations[r.tenant_id]:
+                expirations[r.tenant_id] = r.expires_at
+        return expirations
+
+    async def next_expiration(self, tenant_id: UUID) -> Optional[datetime]:
+        """Earliest pending expiry of one tenant after its watermark."""
+        return (await self.next_expirations()).get(tenant_id)
+
+    async def get_watermark(self, tenant_id: UUID) -> Optional[datetime]:
+        """Time through which the tenant's expirations were handled."""
+        return self.watermarks.get(tenant_id)
+
+    async def set_watermark(self, tenant_id: UUID, through: datetime) -> None:
+        """Persist the tenant's watermark."""
+        self.watermarks[tenant_id] = through
+
+    async def find_misplaced(
+        self,
+        now: datetime,
+        after: Optional[UUID] = None,
+        limit: int = 1000
+    ) -> List[MisplacedSegment]:
+        """Segments of live recordings outside their retention class or hold prefix."""
+        misplaced = []
+        for r in self._recordings.values():
+            held = self._holds[r.id]
+            if r.id in self.deleted or (not held and r.expires_at <= now):
+                continue
+            prefix = LEGAL_HOLD_PREFIX if held else RetentionPolicy(r.retention_days).storage_prefix
+            for segment_id in self._segments[r.id]:
+                key = self.segment_keys[segment_id]
+                if not key.startswith(prefix) and (after is None or segment_id > after):
+                    misplaced.append(MisplacedSegment(
+                        segment_id, r.id, r.tenant_id, key, self.segment_starts[segment_id], r.retention_days, held
+                    ))
+        return sorted(misplaced, key=lambda m: m.id)[:limit]
+
+    async def move_segments(self, moves: Dict[UUID, str]) -> int:
+        """Point segments at their new keys."""
+        moved = [segment_id for segment_id in moves if segment_id in self.segment_keys]
+        for segment_id in moved:
+            self.segment_keys[segment_id] = moves[segment_id]
+        return len(moved)
+
+    async def expire_segments(self, now: datetime, limit: int = 1000) -> int:
+        """Drop segments under their class prefix that started `retention_days` before `now`."""
+        dropped = 0
+        for r in self._recordings.values():
+            if r.id in self.deleted or self._holds[r.id]:
+                continue
+            prefix = RetentionPolicy(r.retention_days).storage_prefix
+            for segment_id in list(self._segments[r.id]):
+                if dropped == limit:
+                    return dropped
+                expired = self.segment_starts[segment_id] + timedelta(days=r.retention_days) <= now
+                if expired and self.segment_keys[segment_id].startswith(prefix):
+                    self._segments[r.id].remove(segment_id)
+                    del self.segment_keys[segment_id]
+                    dropped += 1
+        return dropped
+
+    def _after_watermark(self, recording: ExpiredRecording) -> bool:
+        watermark = self.watermarks.get(recording.tenant_id)
+        return watermark is None or (recording.expires_at, recording.id) > cursor_after(watermark)
+
+    async def mark_deleted(
+        self,
+        recordings: List[ExpiredRecording],
+        deleted_by: str,
+        reason: str = "retention_policy"
+    ) -> List[UUID]:
+        """Tombstone recordings and audit each one."""
+        marked = []
+        for recording in recordings:
+            if recording.id in self.deleted or self._holds.get(recording.id):
+                continue
+            self.deleted[recording.id] = deleted_by
+            self.audit.append({
+                "tenant_id": recording.tenant_id,
+                "action": "recording.deleted",
+                "resource_id": recording.id,
+                "reason": reason
+            })
+            marked.append(recording.id)
+        return marked
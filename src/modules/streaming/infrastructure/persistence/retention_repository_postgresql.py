@@ -0,0 +1,248 @@
+"""PostgreSQL retention repository."""
+import json
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+from uuid import UUID
+
+from src.modules.streaming.domain.repositories.retention_repository import (
+    ExpiredRecording,
+    MisplacedSegment,
+    RetentionCursor,
+    RetentionRepository,
+)
+from src.modules.streaming.domain.value_objects.retention_policy import RetentionPolicy
+from src.shared.infrastructure.persistence.postgresql_repository import PostgreSQLConnection
+
+# Sorts before every real (expires_at, id)
+FIRST_CURSOR = (datetime.min, UUID(int=0))
+
+# Literal prefixes (RetentionPolicy.storage_prefix, LEGAL_HOLD_PREFIX) so the
+# partial indexes of migration 006 apply. Segments of one class never move to
+# another: a recording's retention_days doesn't change.
+MISPLACED_SEGMENTS_SQL = """
+    SELECT * FROM (
+        -- New segments, not arranged yet
+        SELECT s.id, s.recording_id, r.tenant_id, s.storage_path, s.start_time, r.retention_days, false AS held
+        FROM recording_segments s
+        JOIN recordings r ON r.id = s.recording_id
+        WHERE s.storage_path NOT LIKE 'retention-%' AND s.storage_path NOT LIKE 'legal-hold/%'
+          AND s.id > $2
+          AND r.deleted_at IS NULL AND NOT r.incident AND NOT r.legal_hold
+          AND (r.expires_at IS NULL OR r.expires_at > $1)
+        UNION ALL
+        -- Recordings put on hold
+        SELECT s.id, s.recording_id, r.tenant_id, s.storage_path, s.start_time, r.retention_days, true AS held
+        FROM recordings r
+        JOIN recording_segments s ON s.recording_id = r.id
+        WHERE r.deleted_at IS NULL AND (r.incident OR r.legal_hold)
+          AND s.storage_path NOT LIKE 'legal-hold/%'
+          AND s.id > $2
+        UNION ALL
+        -- Released from hold and still within retention
+        SELECT s.id, s.recording_id, r.tenant_id, s.storage_path, s.start_time, r.retention_days, false AS held
+        FROM recording_segments s
+        JOIN recordings r ON r.id = s.recording_id
+        WHERE s.storage_path LIKE 'legal-hold/%'
+          AND s.id > $2
+          AND r.deleted_at IS NULL AND NOT r.incident AND NOT r.legal_hold
+          AND (r.expires_at IS NULL OR r.expires_at > $1)
+    ) misplaced
+    ORDER BY id
+    LIMIT $3
+"""
+
+# $3 is the bound of the shortest retention class, so idx_segments_managed_start
+# narrows the scan before each segment is checked against its own class.
+EXPIRED_SEGMENTS_SQL = """
+    DELETE FROM recording_segments
+    WHERE id IN (
+        SELECT s.id
+        FROM recording_segments s
+        JOIN recordings r ON r.id = s.recording_id
+        WHERE s.storage_path LIKE 'retention-%'
+          AND s.start_time <= $3
+          AND s.start_time <= $1 - make_interval(days => r.retention_days)
+          AND NOT r.incident AND NOT r.legal_hold
+        LIMIT $2
+    )
+"""
+
+
+def audit_record(recording: ExpiredRecording, reason: str, now: datetime) -> tuple:
+    """Row for `audit_logs`; metadata matches what the retention report reads."""
+    metadata = {
+        "reason": reason,
+        "retention_days": recording.retention_days,
+        "size_bytes": recording.size_bytes,
+        "camera_id": str(recording.camera_id) if recording.camera_id else None,
+        "start_time": recording.started_at.isoformat()
+    }
+    return (recording.tenant_id, "recording.deleted", "recording", recording.id, json.dumps(metadata), now)
+
+
+class RetentionRepositoryPostgreSQL(PostgreSQLConnection, RetentionRepository):
+    """Retention scans and deletes on `recordings`, `recording_segments` and `audit_logs`.
+
+    Watermarks live in `retention_watermarks`.
+    """
+
+    async def find_expired(
+        self,
+        now: datetime,
+        after: Optional[RetentionCursor] = None,
+        limit: int = 1000,
+        tenant_id: Optional[UUID] = None
+    ) -> List[ExpiredRecording]:
+        """Keyset page over idx_recordings_expiry, with each recording's segment keys."""
+        after_expires, after_id = after or FIRST_CURSOR
+        async with self._connection() as conn:
+            rows = await conn.fetch(
+                """
+                SELECT r.id, r.tenant_id, r.camera_id, r.started_at, r.expires_at, r.retention_days,
+                       COALESCE(s.size_bytes, (r.file_size_mb * 1048576)::bigint, 0) AS size_bytes,
+                       array_remove(COALESCE(s.keys, '{}') || r.storage_path::text, NULL) AS object_keys
+                FROM recordings r
+                LEFT JOIN LATERAL (
+                    SELECT array_agg(storage_path::text) AS keys, SUM(size_bytes)::bigint AS size_bytes
+                    FROM recording_segments
+                    WHERE recording_id = r.id
+                ) s ON true
+                WHERE r.deleted_at IS NULL AND NOT r.incident AND NOT r.legal_hold
+                  AND r.expires_at <= $1
+                  AND (r.expires_at, r.id) > ($2, $3)
+                  AND ($5::uuid IS NULL OR r.tenant_id = $5)
+                ORDER BY r.expires_at, r.id
+                LIMIT $4
+                """,
+                now,
+                after_expires,
+                after_id,
+                limit,
+                tenant_id
+            )
+        return [ExpiredRecording(**dict(row)) for row in rows]
+
+    async def next_expirations(self) -> Dict[UUID, datetime]:
+        """MIN(expires_at) per tenant past its watermark (idx_recordings_tenant_expiry)."""
+        async with self._connection() as conn:
+            rows = await conn.fetch(
+                """
+                SELECT r.tenant_id, MIN(r.expires_at) AS expires_at
+                FROM recordings r
+                LEFT JOIN retention_watermarks w ON w.tenant_id = r.tenant_id
+                WHERE r.deleted_at IS NULL AND NOT r.incident AND NOT r.legal_hold
+                  AND r.tenant_id IS NOT NULL AND r.expires_at IS NOT NULL
+                  AND r.expires_at > COALESCE(w.expired_through, '-infinity')
+                GROUP BY r.tenant_id
+                """
+            )
+        return {row["tenant_id"]: row["expires_at"] for row in rows}
+
+    async def next_expiration(self, tenant_id: UUID) -> Optional[datetime]:
+        """Earliest pending expiry of one tenant after its watermark."""
+        async with self._connection() as conn:
+            return await conn.fetchval(
+                """
+                SELECT MIN(r.expires_at)
+                FROM recordings r
+                LEFT JOIN retention_watermarks w ON w.tenant_id = r.tenant_id
+                WHERE r.tenant_id = $1
+                  AND r.deleted_at IS NULL AND NOT r.incident AND NOT r.legal_hold
+                  AND r.expires_at > COALESCE(w.expired_through, '-infinity')
+                """,
+                tenant_id
+            )
+
+    async def get_watermark(self, tenant_id: UUID) -> Optional[datetime]:
+        """Time through which the tenant's expirations were handled."""
+        async with self._connection() as conn:
+            return await conn.fetchval(
+                "SELECT expired_through FROM retention_watermarks WHERE tenant_id = $1",
+                tenant_id
+            )
+
+    async def set_watermark(self, tenant_id: UUID, through: datetime) -> None:
+        """Persist the tenant's watermark."""
+        async with self._connection() as conn:
+            await conn.execute(
+                """
+                INSERT INTO retention_watermarks (tenant_id, expired_through, updated_at)
+                VALUES ($1, $2, NOW())
+                ON CONFLICT (tenant_id) DO UPDATE SET
+                    expired_through = EXCLUDED.expired_through,
+                    updated_at = NOW()
+                """,
+                tenant_id,
+                through
+            )
+
+    async def find_misplaced(
+        self,
+        now: datetime,
+        after: Optional[UUID] = None,
+        limit: int = 1000
+    ) -> List[MisplacedSegment]:
+        """Keyset page (by segment id) over the three ways a segment ends up misplaced."""
+        async with self._connection() as conn:
+            rows = await conn.fetch(MISPLACED_SEGMENTS_SQL, now, after or UUID(int=0), limit)
+        return [MisplacedSegment(**dict(row)) for row in rows]
+
+    async def move_segments(self, moves: Dict[UUID, str]) -> int:
+        """One UPDATE ... FROM unnest() for the whole batch."""
+        if not moves:
+            return 0
+        async with self._connection() as conn:
+            result = await conn.execute(
+                """
+                UPDATE recording_segments s SET storage_path = m.storage_path
+                FROM unnest($1::uuid[], $2::text[]) AS m(id, storage_path)
+                WHERE s.id = m.id
+                """,
+                list(moves),
+                list(moves.values())
+            )
+        return int(result.split()[-1])
+
+    async def expire_segments(self, now: datetime, limit: int = 1000) -> int:
+        """One DELETE of at most `limit` segment rows past their own retention."""
+        shortest = now - timedelta(days=min(RetentionPolicy.ALLOWED_DAYS))
+        async with self._connection() as conn:
+            result = await conn.execute(EXPIRED_SEGMENTS_SQL, now, limit, shortest)
+        return int(result.split()[-1])
+
+    async def mark_deleted(
+        self,
+        recordings: List[ExpiredRecording],
+        deleted_by: str,
+        reason: str = "retention_policy"
+    ) -> List[UUID]:
+        """One UPDATE ... = ANY($1), one segment DELETE and one COPY of audit rows."""
+        if not recordings:
+            return []
+        async with self._connection() as conn:
+            async with conn.transaction():
+                rows = await conn.fetch(
+                    """
+                    UPDATE recordings SET deleted_at = NOW(), deleted_by = $2
+                    WHERE id = ANY($1::uuid[])
+                      AND deleted_at IS NULL AND NOT incident AND NOT legal_hold
+                    RETURNING id
+                    """,
+                    [r.id for r in recordings],
+                    deleted_by
+                )
+                marked = [row["id"] for row in rows]
+                if not marked:
+                    return []
+                await conn.execute(
+                    "DELETE FROM recording_segments WHERE recording_id = ANY($1::uuid[])",
+                    marked
+                )
+                now = datetime.utcnow()
+                marked_set = set(marked)
+                await conn.copy_records_to_table(
+                    "audit_logs",
+                    records=[audit_record(r, reason, now) for r in recordings if r.id in marked_set],
+                    columns=["tenant_id", "action", "resource_type", "resource_id", "metadata", "created_at"]
+                )
+        return marked
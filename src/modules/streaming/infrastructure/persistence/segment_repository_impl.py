@@ -0,0 +1,98 @@
+"""Segment repository implementation."""
+from bisect import insort
+from uuid import UUID
+from typing import Dict, List, Optional, Tuple
+from datetime import datetime
+from src.streaming.domain.repositories.segment_repository import SegmentRepository
+from src.streaming.domain.entities.recording_segment import RecordingSegment
+
+
+class SegmentRepositoryImpl(SegmentRepository):
+    """In-memory segment repository implementation."""
+    
+    def __init__(self):
+        self._segments: List[RecordingSegment] = []
+        self._by_path: Dict[str, RecordingSegment] = {}
+    
+    async def save(self, entity: RecordingSegment) -> RecordingSegment:
+        """Save segment."""
+        await self.save_many([entity])
+        return entity
+    
+    async def find_by_id(self, id: UUID) -> Optional[RecordingSegment]:
+        """Find segment by ID."""
+        return next((s for s in self._segments if s.id == id), None)
+    
+    async def find_all(self) -> List[RecordingSegment]:
+        """Find all segments."""
+        return list(self._segments)
+    
+    async def delete(self, id: UUID) -> bool:
+        """Delete segment."""
+        segment = await self.find_by_id(id)
+        if not segment:
+            return False
+        self._segments.remove(segment)
+        del self._by_path[segment.storage_path]
+        return True
+    
+    async def save_many(self, segments: List[RecordingSegment]) -> int:
+        """Insert segments, ignoring already indexed files."""
+        inserted = 0
+        for segment in segments:
+            if segment.storage_path in self._by_path:
+                continue
+            self._by_path[segment.storage_path] = segment
+            insort(self._segments, segment, key=lambda s: s.start_time)
+            inserted += 1
+        return inserted
+    
+    async def find_by_stream_range(
+        self,
+        stream_id: UUID,
+        start_time: datetime,
+        end_time: datetime
+    ) -> List[RecordingSegment]:
+        """Find segments of a stream overlapping the range."""
+        return [
+            s for s in self._segments
+            if s.stream_id == stream_id and s.overlaps(start_time, end_time)
+        ]
+    
+    async def find_by_camera_range(
+        self,
+        camera_id: UUID,
+        start_time: datetime,
+        end_time: datetime
+    ) -> List[RecordingSegment]:
+        """Find segments of a camera overlapping the range."""
+        return [
+            s for s in self._segments
+            if s.camera_id == camera_id and s.overlaps(start_time, end_time)
+        ]
+    
+    async def find_intervals_by_stream_ids(
+        self,
+        stream_ids: List[UUID],
+        start_time: datetime,
+        end_time: datetime
+    ) -> Dict[UUID, List[Tuple[datetime, datetime]]]:
+        """Find segment intervals for many streams."""
+        wanted = set(stream_ids)
+        result: Dict[UUID, List[Tuple[datetime, datetime]]] = {}
+        for s in self._segments:
+            if s.stream_id in wanted and s.overlaps(start_time, end_time):
+                result.setdefault(s.stream_id, []).append((s.start_time, s.end_time))
+        return result
+    
+    async def find_by_recording_id(self, recording_id: UUID) -> List[RecordingSegment]:
+        """Find segments of a recording."""
+        return [s for s in self._segments if s.recording_id == recording_id]
+    
+    async def delete_by_recording_id(self, recording_id: UUID) -> int:
+        """Delete segments of a recording."""
+        kept = [s for s in self._segments if s.recording_id != recording_id]
+        deleted = len(self._segments) - len(kept)
+        self._segments = kept
+        self._by_path = {s.storage_path: s for s in kept}
+        return deleted
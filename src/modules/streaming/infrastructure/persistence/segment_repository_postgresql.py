@@ -0,0 +1,174 @@
+"""Recording segment repository PostgreSQL implementation."""
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+from datetime import datetime
+
+from src.modules.streaming.domain.entities.recording_segment import RecordingSegment
+from src.modules.streaming.domain.repositories.segment_repository import SegmentRepository
+from src.shared.infrastructure.persistence.postgresql_repository import PostgreSQLRepository
+
+
+SEGMENT_COLUMNS = """
+    id, stream_id, recording_id, camera_id,
+    start_time, end_time, storage_path, size_bytes
+"""
+
+
+class SegmentRepositoryPostgreSQL(PostgreSQLRepository[RecordingSegment], SegmentRepository):
+    """PostgreSQL implementation of SegmentRepository."""
+    
+    async def save(self, entity: RecordingSegment) -> RecordingSegment:
+        """Save segment to database."""
+        await self.save_many([entity])
+        return entity
+    
+    async def save_many(self, segments: List[RecordingSegment]) -> int:
+        """Bulk insert segments in one round trip, skipping already indexed files."""
+        if not segments:
+            return 0
+        
+        async with self._transaction() as conn:
+            rows = await conn.fetch(
+                f"""
+                INSERT INTO recording_segments ({SEGMENT_COLUMNS})
+                SELECT * FROM unnest(
+                    $1::uuid[], $2::uuid[], $3::uuid[], $4::uuid[],
+                    $5::timestamp[], $6::timestamp[], $7::varchar[], $8::bigint[]
+                )
+                ON CONFLICT DO NOTHING
+                RETURNING id
+                """,
+                [s.id for s in segments],
+                [s.stream_id for s in segments],
+                [s.recording_id for s in segments],
+                [s.camera_id for s in segments],
+                [s.start_time for s in segments],
+                [s.end_time for s in segments],
+                [s.storage_path for s in segments],
+                [s.size_bytes for s in segments]
+            )
+        return len(rows)
+    
+    async def find_by_id(self, id: UUID) -> Optional[RecordingSegment]:
+        """Find segment by ID."""
+        async with self._connection() as conn:
+            row = await conn.fetchrow(
+                f"SELECT {SEGMENT_COLUMNS} FROM recording_segments WHERE id = $1",
+                id
+            )
+            return self._to_entity(row) if row else None
+    
+    async def find_by_stream_range(
+        self,
+        stream_id: UUID,
+        start_time: datetime,
+        end_time: datetime
+    ) -> List[RecordingSegment]:
+        """Find segments of a stream overlapping the range."""
+        async with self._connection() as conn:
+            rows = await conn.fetch(
+                f"""
+                SELECT {SEGMENT_COLUMNS} FROM recording_segments
+                WHERE stream_id = $1 AND start_time < $3 AND end_time > $2
+                ORDER BY start_time
+                """,
+                stream_id,
+                start_time,
+                end_time
+            )
+            return [self._to_entity(row) for row in rows]
+    
+    async def find_by_camera_range(
+        self,
+        camera_id: UUID,
+        start_time: datetime,
+        end_time: datetime
+    ) -> List[RecordingSegment]:
+        """Find segments of a camera overlapping the range."""
+        async with self._connection() as conn:
+            rows = await conn.fetch(
+                f"""
+                SELECT {SEGMENT_COLUMNS} FROM recording_segments
+                WHERE camera_id = $1 AND start_time < $3 AND end_time > $2
+                ORDER BY start_time
+                """,
+                camera_id,
+                start_time,
+                end_time
+            )
+            return [self._to_entity(row) for row in rows]
+    
+    async def find_intervals_by_stream_ids(
+        self,
+        stream_ids: List[UUID],
+        start_time: datetime,
+        end_time: datetime
+    ) -> Dict[UUID, List[Tuple[datetime, datetime]]]:
+        """Find segment intervals for many streams in one set-based query."""
+        if not stream_ids:
+            return {}
+        
+        async with self._connection() as conn:
+            rows = await conn.fetch(
+                """
+                SELECT stream_id, start_time, end_time FROM recording_segments
+                WHERE stream_id = ANY($1::uuid[]) AND start_time < $3 AND end_time > $2
+                ORDER BY stream_id, start_time
+                """,
+                stream_ids,
+                start_time,
+                end_time
+            )
+        
+        result: Dict[UUID, List[Tuple[datetime, datetime]]] = {}
+        for row in rows:
+            result.setdefault(row['stream_id'], []).append((row['start_time'], row['end_time']))
+        return result
+    
+    async def find_by_recording_id(self, recording_id: UUID) -> List[RecordingSegment]:
+        """Find segments of a recording."""
+        async with self._connection() as conn:
+            rows = await conn.fetch(
+                f"""
+                SELECT {SEGMENT_COLUMNS} FROM recording_segments
+                WHERE recording_id = $1
+                ORDER BY start_time
+                """,
+                recording_id
+            )
+            return [self._to_entity(row) for row in rows]
+    
+    async def find_all(self) -> List[RecordingSegment]:
+        """Find all segments."""
+        async with self._connection() as conn:
+            rows = await conn.fetch(
+                f"SELECT {SEGMENT_COLUMNS} FROM recording_segments ORDER BY start_time"
+            )
+            return [self._to_entity(row) for row in rows]
+    
+    async def delete(self, id: UUID) -> None:
+        """Delete segment by ID."""
+        async with self._transaction() as conn:
+            await conn.execute("DELETE FROM recording_segments WHERE id = $1", id)
+    
+    async def delete_by_recording_id(self, recording_id: UUID) -> int:
+        """Delete segments of a recording."""
+        async with self._transaction() as conn:
+            result = await conn.execute(
+                "DELETE FROM recording_segments WHERE recording_id = $1",
+                recording_id
+            )
+        return int(result.split()[-1])
+    
+    @staticmethod
+    def _to_entity(row) -> RecordingSegment:
+        return RecordingSegment(
+            id=row['id'],
+            stream_id=row['stream_id'],
+            recording_id=row['recording_id'],
+            camera_id=row['camera_id'],
+            start_time=row['start_time'],
+            end_time=row['end_time'],
+            storage_path=row['storage_path'],
+            size_bytes=row['size_bytes'] or 0
+        )
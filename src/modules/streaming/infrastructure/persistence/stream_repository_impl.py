@@ -1,5 +1,5 @@
 """Stream repository implementation."""
-from typing import Optional, Dict
+from typing import Dict, List, Optional
 from uuid import UUID
 from src.streaming.domain.entities.stream import Stream
 from src.streaming.domain.repositories.stream_repository import StreamRepository
@@ -30,3 +30,13 @@ class StreamRepositoryImpl(StreamRepository):
         """Delete stream."""
         if stream_id in self._streams:
             del self._streams[stream_id]
+
+    async def save_many(self, streams: List[Stream], batch_size: Optional[int] = None) -> int:
+        """Save many streams."""
+        for stream in streams:
+            self._streams[stream.id] = stream
+        return len({s.id for s in streams})
+
+    async def delete_many(self, stream_ids: List[UUID], batch_size: Optional[int] = None) -> int:
+        """Delete many streams."""
+        return sum(1 for id in set(stream_ids) if self._streams.pop(id, None) is not None)
@@ -33,6 +33,24 @@ class StreamRepositoryPostgreSQL(PostgreSQLRepository[Stream], StreamRepository)
             )
         return entity
     
+    async def save_many(self, streams: List[Stream], batch_size: Optional[int] = None) -> int:
+        """Bulk upsert streams through COPY + set-based ON CONFLICT."""
+        now = datetime.now()
+        return await self._copy_upsert(
+            "streams",
+            ["id", "camera_id", "source_url", "status", "started_at", "stopped_at", "created_at"],
+            [
+                (s.id, s.camera_id, s.source_url, s.status.value, s.started_at, s.stopped_at, now)
+                for s in streams
+            ],
+            ["status", "stopped_at"],
+            batch_size
+        )
+    
+    async def delete_many(self, ids: List[UUID], batch_size: Optional[int] = None) -> int:
+        """Delete streams in batches."""
+        return await self._delete_many("streams", ids, batch_size)
+    
     async def find_by_id(self, id: UUID) -> Optional[Stream]:
         """Find stream by ID."""
         async with self._connection() as conn:
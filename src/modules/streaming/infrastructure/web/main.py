@@ -1,7 +1,7 @@
 """FastAPI application for Streaming."""
-from typing import Annotated
+from typing import Annotated, Optional
 from fastapi import FastAPI, HTTPException, status, Query, Response, Depends
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from prometheus_client import generate_latest
 from uuid import UUID
@@ -9,7 +9,9 @@ from datetime import datetime
 from src.streaming.application.dtos.start_stream_dto import StartStreamDTO
 from src.streaming.application.dtos.start_recording_dto import StartRecordingDTO
 from src.streaming.application.dtos.search_recordings_dto import SearchRecordingsDTO
+from src.streaming.application.dtos.export_recordings_dto import ExportRecordingsDTO
 from src.streaming.application.dtos.get_timeline_dto import GetTimelineDTO
+from src.streaming.application.dtos.get_batch_timeline_dto import GetBatchTimelineDTO
 from src.streaming.application.dtos.generate_thumbnails_dto import GenerateThumbnailsDTO
 from src.streaming.application.dtos.create_clip_dto import CreateClipDTO
 from src.streaming.application.dtos.create_mosaic_dto import CreateMosaicDTO
@@ -19,7 +21,9 @@ from src.streaming.application.use_cases.stop_stream import StopStreamUseCase
 from src.streaming.application.use_cases.start_recording import StartRecordingUseCase
 from src.streaming.application.use_cases.stop_recording import StopRecordingUseCase
 from src.streaming.application.use_cases.search_recordings import SearchRecordingsUseCase
+from src.streaming.application.use_cases.export_recordings import ExportRecordingsUseCase, MEDIA_TYPES
 from src.streaming.application.use_cases.get_timeline import GetTimelineUseCase
+from src.streaming.application.use_cases.get_batch_timeline import GetBatchTimelineUseCase
 from src.streaming.application.use_cases.generate_thumbnails import GenerateThumbnailsUseCase
 from src.streaming.application.use_cases.get_playback_url import GetPlaybackUrlUseCase
 from src.streaming.application.use_cases.create_clip import CreateClipUseCase
@@ -29,12 +33,14 @@ from src.streaming.infrastructure.persistence.stream_repository_impl import Stre
 from src.streaming.infrastructure.persistence.recording_repository_impl import RecordingRepositoryImpl
 from src.streaming.infrastructure.persistence.clip_repository_impl import ClipRepositoryImpl
 from src.streaming.infrastructure.persistence.mosaic_repository_impl import MosaicRepositoryImpl
+from src.streaming.infrastructure.persistence.segment_repository_impl import SegmentRepositoryImpl
 from src.streaming.infrastructure.external_services.mediamtx_client_impl import MediaMTXClientImpl
 from src.streaming.infrastructure.external_services.thumbnail_service_impl import ThumbnailServiceImpl
 from src.streaming.infrastructure.external_services.storage_service_impl import MinIOStorageService
 from src.streaming.infrastructure.web.auth_routes import router as auth_router
 from src.streaming.infrastructure.web.lgpd_routes import router as lgpd_router
 from src.streaming.infrastructure.web.middleware import LoggingMiddleware
+from src.streaming.infrastructure.web.responses import ORJSONResponse
 from src.shared.infrastructure.message_broker import MessageBroker
 from src.shared.infrastructure.observability import prometheus_middleware
 from src.shared.infrastructure.security.dependencies import User, get_current_user, require_permission
@@ -107,6 +113,7 @@ stream_repository = StreamRepositoryImpl()
 recording_repository = RecordingRepositoryImpl()
 clip_repository = ClipRepositoryImpl()
 mosaic_repository = MosaicRepositoryImpl()
+segment_repository = SegmentRepositoryImpl()
 mediamtx_client = MediaMTXClientImpl()
 
 # MessageBroker with RabbitMQ URL
@@ -161,14 +168,14 @@ async def get_stream(
     if not stream:
         raise HTTPException(status_code=404, detail="Stream not found")
     
-    return {
-        "id": str(stream.id),
-        "camera_id": str(stream.camera_id),
+    return ORJSONResponse({
+        "id": stream.id,
+        "camera_id": stream.camera_id,
         "source_url": stream.source_url,
         "status": stream.status.value,
-        "started_at": stream.started_at.isoformat() if stream.started_at else None,
-        "stopped_at": stream.stopped_at.isoformat() if stream.stopped_at else None
-    }
+        "started_at": stream.started_at,
+        "stopped_at": stream.stopped_at
+    })
 
 
 @app.post("/api/recordings/start", status_code=status.HTTP_201_CREATED, tags=["Gravações"], summary="Iniciar gravação")
@@ -202,6 +209,77 @@ async def stop_recording(
         raise HTTPException(status_code=400, detail=str(e))
 
 
+@app.get("/api/recordings/search", tags=["Gravações"], summary="Buscar gravações")
+async def search_recordings(
+    user: Annotated[User, Depends(require_permission(Permission.READ_RECORDINGS))],
+    stream_id: Optional[UUID] = Query(None, description="ID do stream"),
+    camera_id: Optional[UUID] = Query(None, description="ID da câmera"),
+    tenant_id: Optional[UUID] = Query(None, description="ID do tenant (cidade)"),
+    status: Optional[str] = Query(None, description="Status da gravação"),
+    start_date: Optional[datetime] = Query(None, description="Data inicial"),
+    end_date: Optional[datetime] = Query(None, description="Data final"),
+    limit: int = Query(50, gt=0, le=500, description="Tamanho da página"),
+    cursor: Optional[str] = Query(None, description="Cursor retornado pela página anterior")
+):
+    """Busca gravações por filtros, paginada por cursor (mais recentes primeiro).
+    
+    Use o **next_cursor** da resposta para obter a próxima página; ele é nulo na última.
+    """
+    try:
+        dto = SearchRecordingsDTO(
+            stream_id=stream_id,
+            camera_id=camera_id,
+            tenant_id=tenant_id,
+            status=status,
+            start_date=start_date,
+            end_date=end_date,
+            limit=limit,
+            cursor=cursor
+        )
+        use_case = SearchRecordingsUseCase(recording_repository)
+        result = await use_case.execute(dto)
+        return result.model_dump()
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@app.get("/api/recordings/export", tags=["Gravações"], summary="Exportar inventário de gravações")
+async def export_recordings(
+    user: Annotated[User, Depends(require_permission(Permission.READ_RECORDINGS))],
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$", description="ndjson ou csv"),
+    stream_id: Optional[UUID] = Query(None, description="ID do stream"),
+    camera_id: Optional[UUID] = Query(None, description="ID da câmera"),
+    tenant_id: Optional[UUID] = Query(None, description="ID do tenant (cidade)"),
+    status: Optional[str] = Query(None, description="Status da gravação"),
+    start_date: Optional[datetime] = Query(None, description="Data inicial"),
+    end_date: Optional[datetime] = Query(None, description="Data final")
+):
+    """Exporta metadados de gravações em streaming (memória constante).
+    
+    Aceita os mesmos filtros da busca, sem paginação.
+    """
+    try:
+        dto = ExportRecordingsDTO(
+            stream_id=stream_id,
+            camera_id=camera_id,
+            tenant_id=tenant_id,
+            status=status,
+            start_date=start_date,
+            end_date=end_date,
+            format=format
+        )
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    use_case = ExportRecordingsUseCase(recording_repository)
+    filename = f"recordings-{datetime.utcnow():%Y%m%dT%H%M%S}.{dto.format}"
+    return StreamingResponse(
+        use_case.execute(dto),
+        media_type=MEDIA_TYPES[dto.format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+
 @app.get("/api/recordings/{recording_id}", tags=["Gravações"], summary="Obter gravação")
 async def get_recording(
     recording_id: UUID,
@@ -212,43 +290,53 @@ async def get_recording(
     if not recording:
         raise HTTPException(status_code=404, detail="Recording not found")
     
-    return {
-        "recording_id": str(recording.id),
-        "stream_id": str(recording.stream_id),
+    return ORJSONResponse({
+        "recording_id": recording.id,
+        "stream_id": recording.stream_id,
         "status": recording.status.value,
-        "started_at": recording.started_at.isoformat(),
-        "stopped_at": recording.stopped_at.isoformat() if recording.stopped_at else None,
+        "started_at": recording.started_at,
+        "stopped_at": recording.stopped_at,
         "retention_days": recording.retention_policy.days,
         "storage_path": recording.storage_path,
         "file_size_mb": recording.file_size_mb,
         "duration_seconds": recording.duration_seconds
-    }
-
-
-@app.get("/api/recordings/search", tags=["Gravações"], summary="Buscar gravações")
-async def search_recordings(
-    dto: SearchRecordingsDTO,
-    user: Annotated[User, Depends(require_permission(Permission.READ_RECORDINGS))]
-):
-    """Busca gravações por filtros."""
-    try:
-        use_case = SearchRecordingsUseCase(recording_repository)
-        results = await use_case.execute(dto)
-        return {"recordings": [r.model_dump() for r in results], "total": len(results)}
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    })
 
 
 @app.get("/api/timeline", tags=["Timeline"], summary="Obter timeline")
 async def get_timeline(
     stream_id: UUID = Query(..., description="ID do stream"),
     start_date: datetime = Query(..., description="Data inicial"),
-    end_date: datetime = Query(..., description="Data final")
+    end_date: datetime = Query(..., description="Data final"),
+    resolution: Optional[str] = Query(None, description="Agregação: minute, hour ou day"),
+    buckets: Optional[int] = Query(None, description="Número de buckets (largura em pixels)")
 ):
     """Obtém timeline de gravações com segmentos e gaps."""
     try:
-        dto = GetTimelineDTO(stream_id=stream_id, start_date=start_date, end_date=end_date)
-        use_case = GetTimelineUseCase(recording_repository)
+        dto = GetTimelineDTO(
+            stream_id=stream_id,
+            start_date=start_date,
+            end_date=end_date,
+            resolution=resolution,
+            buckets=buckets
+        )
+        use_case = GetTimelineUseCase(recording_repository, segment_repository)
+        result = await use_case.execute(dto)
+        return result.model_dump()
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@app.post("/api/timeline/batch", tags=["Timeline"], summary="Obter timelines de várias câmeras")
+async def get_batch_timeline(dto: GetBatchTimelineDTO):
+    """Obtém a cobertura de gravação de vários streams numa única consulta (mosaicos).
+    
+    - **stream_ids**: IDs dos streams (máx 64)
+    - **start_date** / **end_date**: Janela de tempo
+    - **buckets**: Número de buckets da janela (ex: largura em pixels)
+    """
+    try:
+        use_case = GetBatchTimelineUseCase(recording_repository, segment_repository)
         result = await use_case.execute(dto)
         return result.model_dump()
     except Exception as e:
@@ -257,11 +345,19 @@ async def get_timeline(
 
 @app.post("/api/recordings/{recording_id}/thumbnails", tags=["Timeline"], summary="Gerar thumbnails")
 async def generate_thumbnails(recording_id: UUID, dto: GenerateThumbnailsDTO):
-    """Gera thumbnails de uma gravação."""
+    """
+    Gera thumbnails de uma gravação.
+    
+    - **mode=images**: um arquivo por thumbnail
+    - **mode=sprite**: uma sprite sheet por hora + trilha WebVTT (`scrub.vtt`)
+      para preview no hover da timeline, salvas no MinIO com cache longo
+    """
     try:
         dto.recording_id = recording_id
-        use_case = GenerateThumbnailsUseCase(recording_repository, thumbnail_service)
+        use_case = GenerateThumbnailsUseCase(recording_repository, thumbnail_service, storage_service)
         results = await use_case.execute(dto)
+        if dto.mode == "sprite":
+            return results.model_dump()
         return {"thumbnails": [r.model_dump() for r in results]}
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -271,7 +367,7 @@ async def generate_thumbnails(recording_id: UUID, dto: GenerateThumbnailsDTO):
 async def get_playback_url(recording_id: UUID):
     """Obtém URL presigned para playback de gravação."""
     try:
-        use_case = GetPlaybackUrlUseCase(recording_repository, storage_service)
+        use_case = GetPlaybackUrlUseCase(recording_repository, storage_service, segment_repository)
         result = await use_case.execute(recording_id)
         return result.model_dump()
     except Exception as e:
@@ -301,17 +397,17 @@ async def get_clip(clip_id: UUID):
     if not clip:
         raise HTTPException(status_code=404, detail="Clip not found")
     
-    return {
-        "clip_id": str(clip.id),
-        "recording_id": str(clip.recording_id),
-        "start_time": clip.start_time.isoformat(),
-        "end_time": clip.end_time.isoformat(),
+    return ORJSONResponse({
+        "clip_id": clip.id,
+        "recording_id": clip.recording_id,
+        "start_time": clip.start_time,
+        "end_time": clip.end_time,
         "status": clip.status.value,
         "storage_path": clip.storage_path,
         "file_size_mb": clip.file_size_mb,
         "duration_seconds": clip.duration_seconds,
-        "created_at": clip.created_at.isoformat()
-    }
+        "created_at": clip.created_at
+    })
 
 
 @app.get("/api/clips/{clip_id}/download", tags=["Clipes"], summary="Download clipe")
@@ -0,0 +1,27 @@
+"""Response classes."""
+from decimal import Decimal
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson.
+    
+    Serializes UUID, datetime, date and Enum natively, so handlers can put
+    entity attributes in the body as-is instead of converting every value to
+    str first. Return it directly: declaring it as `response_class` would
+    still run the body through jsonable_encoder.
+    """
+    
+    media_type = "application/json"
+    
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
@@ -11,6 +11,12 @@ router = APIRouter()
 SECRET_KEY = "GT_VISION_SECRET_2025"
 ALGORITHM = "HS256"
 
+# Routing key do RabbitMQ -> tipo da mensagem enviada ao cliente
+MESSAGE_TYPES = {
+    "deteccoes.lpr": "lpr_detection",
+    "clips.progress": "clip_progress",
+}
+
 
 class ConnectionManager:
     """Gerencia conexões WebSocket por tenant."""
@@ -62,9 +68,16 @@ class ConnectionManager:
             durable=True
         )
         
+        clips_exchange = await self.rabbitmq_channel.declare_exchange(
+            "clips.events",
+            aio_pika.ExchangeType.TOPIC,
+            durable=True
+        )
+        
         # Criar fila temporária
         queue = await self.rabbitmq_channel.declare_queue("", exclusive=True)
         await queue.bind(exchange, routing_key="deteccoes.lpr")
+        await queue.bind(clips_exchange, routing_key="clips.progress")
         
         async with queue.iterator() as queue_iter:
             async for message in queue_iter:
@@ -79,7 +92,7 @@ class ConnectionManager:
                             
                             # Broadcast para tenant
                             await self.broadcast_to_tenant(tenant_id, {
-                                "type": "lpr_detection",
+                                "type": MESSAGE_TYPES.get(message.routing_key, "lpr_detection"),
                                 "data": data
                             })
                     except Exception as e:
@@ -0,0 +1,247 @@
+"""Clip job worker: runs queued clip exports from the clip_jobs table."""
+import asyncio
+import os
+from typing import List, Optional
+
+from src.modules.streaming.domain.entities.clip_job import ClipJob
+from src.modules.streaming.domain.repositories.clip_job_repository import ClipJobRepository
+from src.modules.streaming.domain.value_objects.clip_job_status import ClipJobStatus
+from src.shared.infrastructure.logger import Logger
+
+
+class JobProgress:
+    """Latest progress reported by ffmpeg for the running job."""
+
+    def __init__(self):
+        self.percent = 0.0
+
+    def update(self, percent: float):
+        self.percent = percent
+
+
+class ClipJobWorker:
+    """Claims clip jobs by priority and runs up to `concurrency` at once.
+
+    Each slot claims the most urgent due job, so incident/evidence clips
+    overtake queued exports. While a job runs its progress is written back
+    every `progress_interval` seconds, which also renews the lease; jobs of a
+    worker that died are requeued once their lease expires. Failed exports
+    are retried with exponential backoff up to `max_attempts`.
+
+    Status and progress changes are published to the `clips.events`
+    exchange (`clips.progress`), where the WebSocket gateway forwards them to
+    the tenant's clients.
+    """
+
+    EVENTS_EXCHANGE = "clips.events"
+    PROGRESS_ROUTING_KEY = "clips.progress"
+
+    def __init__(
+        self,
+        job_repository: ClipJobRepository,
+        export_service,
+        message_broker=None,
+        concurrency: Optional[int] = None,
+        lease_seconds: float = 120.0,
+        poll_interval: float = 5.0,
+        progress_interval: float = 2.0,
+        max_attempts: int = 3,
+        retry_base_seconds: float = 10.0
+    ):
+        self.logger = Logger(__name__)
+        self.job_repository = job_repository
+        self.export_service = export_service
+        self.message_broker = message_broker
+        self.concurrency = concurrency or int(os.getenv("CLIP_JOB_CONCURRENCY", "4"))
+        self.lease_seconds = lease_seconds
+        self.poll_interval = poll_interval
+        self.progress_interval = progress_interval
+        self.max_attempts = max_attempts
+        self.retry_base_seconds = retry_base_seconds
+        self._wakeup = asyncio.Event()
+        self._stopped = asyncio.Event()
+        self._tasks: List[asyncio.Task] = []
+
+    async def start(self):
+        """Start the worker slots and the lease reaper."""
+        self.logger.info(f"Starting ClipJobWorker with {self.concurrency} slots...")
+        listen = getattr(self.job_repository, "listen", None)
+        if listen:
+            await listen(self._wakeup.set)
+        self._tasks = [asyncio.create_task(self._run_slot()) for _ in range(self.concurrency)]
+        self._tasks.append(asyncio.create_task(self._reap_expired()))
+
+    async def stop(self, timeout: float = 30.0):
+        """Stop claiming jobs and wait for running ones to finish."""
+        self.logger.info("Stopping ClipJobWorker...")
+        self._stopped.set()
+        self._wakeup.set()
+        _, pending = await asyncio.wait(self._tasks, timeout=timeout)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        self._tasks = []
+
+    async def _run_slot(self):
+        while not self._stopped.is_set():
+            self._wakeup.clear()
+            try:
+                job = await self.job_repository.claim(self.lease_seconds)
+            except Exception as e:
+                self.logger.error(f"Failed to claim clip job: {e}")
+                job = None
+
+            if job is None:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            await self.process(job)
+
+    async def process(self, job: ClipJob):
+        """Run one claimed job to completion, retry or failure."""
+        attempt = job.attempts
+        self.logger.info(f"Processing clip job {job.id} (priority {job.priority}, attempt {attempt})")
+        await self._publish(job, ClipJobStatus.RUNNING, 0.0)
+
+        progress = JobProgress()
+        heartbeat = asyncio.create_task(self._heartbeat(job, attempt, progress))
+        try:
+            result = await self.export_service.export_clip(
+                job.tenant_id,
+                str(job.camera_id),
+                job.start_time,
+                job.end_time,
+                str(job.id),
+                job.faststart,
+                on_progress=progress.update
+            )
+        except Exception as e:
+            result = {"status": "failed", "error": str(e)}
+        finally:
+            heartbeat.cancel()
+            await asyncio.gather(heartbeat, return_exceptions=True)
+
+        if result.get("status") == "completed":
+            if not await self.job_repository.complete(
+                job.id, attempt, result["bucket"], result["key"], result["size_bytes"]
+            ):
+                self._lease_lost(job, attempt)
+                return
+            await self._publish(job, ClipJobStatus.COMPLETED, 100.0)
+            self.logger.info(f"Clip job {job.id} completed")
+            return
+
+        error = result.get("error", "unknown error")
+        if attempt < self.max_attempts:
+            delay = self.retry_base_seconds * (2 ** (attempt - 1))
+            if not await self.job_repository.fail(job.id, attempt, error, retry_in_seconds=delay):
+                self._lease_lost(job, attempt)
+                return
+            await self._publish(job, ClipJobStatus.QUEUED, 0.0, error)
+            self.logger.warning(f"Clip job {job.id} failed, retrying in {delay:.0f}s: {error}")
+        else:
+            if not await self.job_repository.fail(job.id, attempt, error):
+                self._lease_lost(job, attempt)
+                return
+            await self._publish(job, ClipJobStatus.FAILED, progress.percent, error)
+            self.logger.error(f"Clip job {job.id} failed after {attempt} attempts: {error}")
+
+    def _lease_lost(self, job: ClipJob, attempt: int):
+        self.logger.warning(
+            f"Clip job {job.id} was requeued after its lease expired; result of attempt {attempt} discarded"
+        )
+
+    async def _heartbeat(self, job: ClipJob, attempt: int, progress: JobProgress):
+        """Persist and publish progress; keeps the lease alive."""
+        reported = None
+        while True:
+            await asyncio.sleep(self.progress_interval)
+            percent = round(progress.percent, 1)
+            try:
+                if not await self.job_repository.heartbeat(job.id, attempt, percent, self.lease_seconds):
+                    self.logger.warning(f"Clip job {job.id} lost its lease during attempt {attempt}")
+                    return
+            except Exception as e:
+                self.logger.warning(f"Failed to record progress of clip job {job.id}: {e}")
+            if percent != reported:
+                reported = percent
+                await self._publish(job, ClipJobStatus.RUNNING, percent)
+
+    async def _reap_expired(self):
+        """Requeue jobs whose worker stopped renewing the lease."""
+        while not self._stopped.is_set():
+            try:
+                requeued = await self.job_repository.requeue_expired()
+                if requeued:
+                    self.logger.warning(f"Requeued {requeued} clip jobs with expired leases")
+                    self._wakeup.set()
+            except Exception as e:
+                self.logger.error(f"Failed to requeue expired clip jobs: {e}")
+            try:
+                await asyncio.wait_for(self._stopped.wait(), timeout=self.lease_seconds / 2)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _publish(
+        self,
+        job: ClipJob,
+        status: ClipJobStatus,
+        progress: float,
+        error: Optional[str] = None
+    ):
+        if not self.message_broker:
+            return
+        try:
+            await self.message_broker.publish(
+                exchange=self.EVENTS_EXCHANGE,
+                routing_key=self.PROGRESS_ROUTING_KEY,
+                message={
+                    "tenant_id": job.tenant_id,
+                    "clip_id": str(job.id),
+                    "camera_id": str(job.camera_id),
+                    "status": status.value,
+                    "progress": progress,
+                    "error": error
+                }
+            )
+        except Exception as e:
+            self.logger.warning(f"Failed to publish clip job event: {e}")
+
+
+async def main():
+    """Main worker entry point."""
+    from src.shared.infrastructure.message_broker import MessageBrokerConfig
+    from src.shared.infrastructure.rabbitmq_connection import get_rabbitmq_url
+    from src.shared.infrastructure.persistence.connection import get_postgres_connection_string
+    from src.modules.streaming.infrastructure.external_services.clip_cache import ClipCache
+    from src.modules.streaming.infrastructure.external_services.clip_export_service import ClipExportService, s3_client
+    from src.modules.streaming.infrastructure.persistence.clip_cache_index_postgresql import ClipCacheIndexPostgreSQL
+    from src.modules.streaming.infrastructure.persistence.clip_job_repository_postgresql import ClipJobRepositoryPostgreSQL
+    from src.modules.streaming.infrastructure.persistence.segment_repository_postgresql import SegmentRepositoryPostgreSQL
+
+    dsn = get_postgres_connection_string()
+    job_repository = ClipJobRepositoryPostgreSQL(dsn)
+    message_broker = MessageBrokerConfig(get_rabbitmq_url())
+    await message_broker.connect()
+    worker = ClipJobWorker(
+        job_repository,
+        ClipExportService(
+            SegmentRepositoryPostgreSQL(dsn),
+            cache=ClipCache(ClipCacheIndexPostgreSQL(dsn), s3_client)
+        ),
+        message_broker
+    )
+    try:
+        await worker.start()
+        await asyncio.Event().wait()
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        await worker.stop()
+        await job_repository.close()
+        await message_broker.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,5 +1,6 @@
 """RabbitMQ worker for clip processing."""
 import asyncio
+import os
 from uuid import UUID
 from datetime import datetime
 
@@ -16,7 +17,11 @@ class ClipWorker:
     
     def __init__(self):
         self.logger = Logger(__name__)
-        self.message_broker = MessageBrokerConfig(get_rabbitmq_url(), max_retries=3)
+        self.message_broker = MessageBrokerConfig(
+            get_rabbitmq_url(),
+            max_retries=3,
+            prefetch_count=int(os.getenv("CLIP_WORKER_CONCURRENCY", "1"))
+        )
         self.clip_service = ClipServiceImpl()
         self.clip_repository = ClipRepositoryPostgreSQL(get_postgres_connection_string())
     
@@ -1,13 +1,18 @@
 """RabbitMQ worker for recording processing."""
 import asyncio
+from typing import Set
 from uuid import UUID
 
 from shared_kernel.infrastructure.message_broker import MessageBrokerConfig
 from shared_kernel.infrastructure.rabbitmq_connection import get_rabbitmq_url
 from shared_kernel.infrastructure.persistence.connection import get_postgres_connection_string
 from streaming.infrastructure.external_services.ffmpeg_service_impl import FFmpegServiceImpl
+from streaming.infrastructure.external_services.recorder_supervisor import RecorderSupervisor, RecorderState
 from streaming.infrastructure.persistence.recording_repository_postgresql import RecordingRepositoryPostgreSQL
+from streaming.infrastructure.persistence.segment_repository_postgresql import SegmentRepositoryPostgreSQL
+from streaming.infrastructure.workers.segment_indexer import SegmentIndexer
 from shared_kernel.infrastructure.logger import Logger
+from shared_kernel.infrastructure.observability import BusinessMetrics
 
 
 class RecordingWorker:
@@ -16,13 +21,18 @@ class RecordingWorker:
     def __init__(self):
         self.logger = Logger(__name__)
         self.message_broker = MessageBrokerConfig(get_rabbitmq_url(), max_retries=3)
-        self.ffmpeg_service = FFmpegServiceImpl()
+        self.ffmpeg_service = FFmpegServiceImpl(RecorderSupervisor(on_failed=self.on_recorder_failed))
         self.recording_repository = RecordingRepositoryPostgreSQL(get_postgres_connection_string())
+        self.segment_repository = SegmentRepositoryPostgreSQL(get_postgres_connection_string())
+        self.segment_indexer = SegmentIndexer(self.segment_repository)
+        self._indexer_task = None
+        self._startup_checks: Set[asyncio.Task] = set()
     
     async def start(self):
         """Start worker."""
         self.logger.info("Starting RecordingWorker...")
         await self.message_broker.connect()
+        self._indexer_task = asyncio.create_task(self.segment_indexer.run())
         await self.message_broker.consume(
             queue="recordings",
             callback=self.process_message
@@ -31,6 +41,11 @@ class RecordingWorker:
     
     async def process_message(self, message: dict):
         """Process recording message."""
+        if "source_url" not in message:
+            # recording.stop carries only the recording id
+            await self.stop_recording(UUID(message["recording_id"]))
+            return
+        
         try:
             recording_id = UUID(message["recording_id"])
             source_url = message["source_url"]
@@ -53,7 +68,20 @@ class RecordingWorker:
             if success:
                 recording.storage_path = output_path
                 await self.recording_repository.save(recording)
-                self.logger.info(f"Recording {recording_id} started successfully")
+                
+                camera_id = message.get("camera_id")
+                self.segment_indexer.watch(
+                    recording_id,
+                    recording.stream_id,
+                    self.ffmpeg_service.segment_list_path(output_path),
+                    camera_id=UUID(camera_id) if camera_id else None,
+                    base_time=recording.started_at
+                )
+                
+                # Don't hold the consumer; late failures reach on_recorder_failed
+                check = asyncio.create_task(self._report_startup(recording_id))
+                self._startup_checks.add(check)
+                check.add_done_callback(self._startup_checks.discard)
             else:
                 recording.mark_error()
                 await self.recording_repository.save(recording)
@@ -63,9 +91,62 @@ class RecordingWorker:
             self.logger.error(f"Error processing recording message: {e}")
             raise
     
+    async def _report_startup(self, recording_id: UUID):
+        """Log whether the recorder reached RUNNING."""
+        health = await self.ffmpeg_service.wait_until_running(recording_id)
+        if health and health["state"] == RecorderState.RUNNING.value:
+            self.logger.info(
+                f"Recording {recording_id} running "
+                f"(pid={health['pid']}, fps={health['progress']['fps']}, "
+                f"bitrate={health['progress']['bitrate_kbps']}kbps)"
+            )
+        else:
+            self.logger.warning(
+                f"Recording {recording_id} not yet running: "
+                f"state={health['state'] if health else None}, "
+                f"last_error={health['last_error'] if health else None}"
+            )
+    
+    async def stop_recording(self, recording_id: UUID):
+        """Stop the recorder and index the rest of its segment list."""
+        self.logger.info(f"Stopping recording {recording_id}")
+        await self.ffmpeg_service.stop_recording(recording_id)
+        await self._unwatch(recording_id)
+    
+    async def on_recorder_failed(self, recording_id: UUID, health: dict):
+        """Mark recording as error once its recorder gives up restarting."""
+        self.logger.error(
+            f"Recorder {recording_id} failed after {health['restarts']} restarts: "
+            f"{health['last_error']}"
+        )
+        BusinessMetrics.increment_recording_errors()
+        await self._unwatch(recording_id)
+        recording = await self.recording_repository.find_by_id(recording_id)
+        if recording:
+            recording.mark_error()
+            await self.recording_repository.save(recording)
+    
+    async def _unwatch(self, recording_id: UUID):
+        try:
+            await self.segment_indexer.unwatch(recording_id)
+        except Exception as e:
+            self.logger.warning(f"Could not index last segments of {recording_id}: {e}")
+    
+    def health(self) -> list:
+        """Get health of every recorder on this node."""
+        return self.ffmpeg_service.supervisor.health_all()
+    
     async def stop(self):
         """Stop worker and cleanup."""
         self.logger.info("Stopping RecordingWorker...")
+        for check in list(self._startup_checks):
+            check.cancel()
+        await self.ffmpeg_service.supervisor.shutdown()
+        self.segment_indexer.stop()
+        if self._indexer_task:
+            await self._indexer_task
+        await self.segment_indexer.poll()
+        await self.segment_repository.close()
         await self.recording_repository.close()
         await self.message_broker.close()
         self.logger.info("RecordingWorker stopped")
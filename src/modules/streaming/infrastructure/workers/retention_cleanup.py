@@ -0,0 +1,239 @@
+"""Chunked, parallel deletion of recordings past their retention window."""
+import asyncio
+import os
+import time
+from datetime import datetime
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+from uuid import UUID
+
+from prometheus_client import Counter, Histogram
+
+from src.modules.streaming.domain.repositories.retention_repository import (
+    ExpiredRecording,
+    RetentionCursor,
+    RetentionRepository,
+)
+from src.modules.streaming.infrastructure.external_services.recording_lifecycle import (
+    is_lifecycle_managed,
+    object_key,
+    recordings_bucket,
+)
+from src.shared.infrastructure.logger import Logger
+
+
+# S3 DeleteObjects accepts at most 1000 keys per request
+DELETE_BATCH = 1000
+
+retention_recordings_total = Counter(
+    'retention_cleanup_recordings_total',
+    'Expired recordings processed by result (deleted, failed)',
+    ['result']
+)
+
+retention_objects_deleted_total = Counter(
+    'retention_cleanup_objects_deleted_total',
+    'Recording objects removed from storage by retention cleanup'
+)
+
+retention_bytes_freed_total = Counter(
+    'retention_cleanup_bytes_freed_total',
+    'Bytes of recordings removed by retention cleanup'
+)
+
+retention_chunk_seconds = Histogram(
+    'retention_cleanup_chunk_seconds',
+    'Time to delete the objects and rows of one chunk',
+    buckets=(0.1, 0.5, 1, 2, 5, 10, 30, 60, 120)
+)
+
+
+class CleanupStats(NamedTuple):
+    """Outcome of one cleanup run."""
+    chunks: int
+    deleted: int
+    failed: int
+    objects: int
+    bytes_freed: int
+    seconds: float
+    first_failure: Optional[datetime] = None  # expires_at of the earliest recording left behind
+
+    @property
+    def recordings_per_second(self) -> float:
+        return self.deleted / self.seconds if self.seconds else 0.0
+
+
+class RetentionCleanup:
+    """Deletes expired recordings until caught up.
+
+    Expired recordings are read in keyset-paged chunks of `chunk_size`
+    (the next chunk is fetched while the current one is deleted). Each
+    chunk's objects are removed with DeleteObjects in batches of 1000 keys,
+    `delete_workers` batches in parallel; then the recordings whose objects
+    are all gone are marked deleted with one UPDATE, their segment rows
+    dropped and their audit rows written in one COPY, in one transaction.
+    A recording with a failed object is left for the next run.
+
+    Objects are deleted from the tenant's recordings bucket; stored paths
+    are local (the recording's ffmpeg output under RECORDINGS_ROOT, or
+    segment paths relative to it) and are mapped to their key in that
+    bucket. Recordings without a tenant have no bucket and are kept.
+
+    Objects under a retention class prefix are left to the bucket's
+    lifecycle rule (see RecordingLifecycle); for those only the rows are
+    reconciled.
+    """
+
+    def __init__(
+        self,
+        repository: RetentionRepository,
+        s3_client,
+        recordings_root: Optional[str] = None,
+        chunk_size: Optional[int] = None,
+        delete_workers: Optional[int] = None,
+        deleted_by: str = "retention_cleanup"
+    ):
+        self.logger = Logger(__name__)
+        self.repository = repository
+        self.s3_client = s3_client
+        self.recordings_root = recordings_root or os.getenv("RECORDINGS_ROOT", "/recordings")
+        self.chunk_size = chunk_size or int(os.getenv("RETENTION_CHUNK_SIZE", "1000"))
+        self.delete_workers = delete_workers or int(os.getenv("RETENTION_DELETE_WORKERS", "4"))
+        self.deleted_by = deleted_by
+
+    async def run(
+        self,
+        now: Optional[datetime] = None,
+        tenant_id: Optional[UUID] = None,
+        after: Optional[RetentionCursor] = None
+    ) -> CleanupStats:
+        """Delete everything expired at `now` (default: current time).
+
+        `tenant_id` limits the run to one tenant and `after` skips the
+        recordings at or before that keyset position.
+        """
+        now = now or datetime.utcnow()
+        started = time.monotonic()
+        chunks = deleted = objects = bytes_freed = 0
+        failures: List[datetime] = []
+
+        def fetch(cursor: Optional[RetentionCursor]):
+            return asyncio.ensure_future(self.repository.find_expired(now, cursor, self.chunk_size, tenant_id))
+
+        next_chunk = fetch(after)
+        while True:
+            chunk = await next_chunk
+            if not chunk:
+                break
+            if len(chunk) == self.chunk_size:
+                next_chunk = fetch((chunk[-1].expires_at, chunk[-1].id))
+            else:
+                next_chunk = asyncio.ensure_future(self._no_more())
+
+            with retention_chunk_seconds.time():
+                marked, failed, removed = await self.process_chunk(chunk)
+            chunks += 1
+            deleted += len(marked)
+            failures += [r.expires_at for r in chunk if r.id in failed]
+            objects += removed
+            bytes_freed += sum(r.size_bytes for r in chunk if r.id in marked)
+
+        stats = CleanupStats(
+            chunks, deleted, len(failures), objects, bytes_freed, time.monotonic() - started,
+            min(failures, default=None)
+        )
+        if stats.deleted or stats.failed:
+            self.logger.info(
+                f"Retention cleanup: {stats.deleted} recordings, {stats.objects} objects, "
+                f"{stats.bytes_freed / 1024 ** 3:.2f} GB in {stats.seconds:.1f}s "
+                f"({stats.recordings_per_second:.0f} recordings/s), {stats.failed} failed"
+            )
+        return stats
+
+    async def process_chunk(self, chunk: List[ExpiredRecording]) -> Tuple[Set[UUID], Set[UUID], int]:
+        """Delete a chunk's objects and mark its rows; returns (marked ids, failed ids, objects removed)."""
+        owners: Dict[Tuple[str, str], ExpiredRecording] = {}
+        failed_ids: Set[UUID] = set()
+        for r in chunk:
+            keys = [object_key(path, self.recordings_root) for path in r.object_keys]
+            keys = [key for key in keys if not is_lifecycle_managed(key)]
+            if keys and r.tenant_id is None:
+                self.logger.warning(f"Recording {r.id} has objects but no tenant bucket; keeping it")
+                failed_ids.add(r.id)
+                continue
+            owners.update({(recordings_bucket(r.tenant_id), key): r for key in keys})
+        failed_keys = await self.delete_objects(list(owners))
+        failed_ids |= {owners[key].id for key in failed_keys}
+
+        done = [r for r in chunk if r.id not in failed_ids]
+        marked = set(await self.repository.mark_deleted(done, self.deleted_by)) if done else set()
+
+        retention_recordings_total.labels(result="deleted").inc(len(marked))
+        retention_recordings_total.labels(result="failed").inc(len(failed_ids))
+        retention_bytes_freed_total.inc(sum(r.size_bytes for r in done if r.id in marked))
+        removed = len(owners) - len(failed_keys)
+        retention_objects_deleted_total.inc(removed)
+        return marked, failed_ids, removed
+
+    async def delete_objects(self, objects: List[Tuple[str, str]]) -> Set[Tuple[str, str]]:
+        """Remove (bucket, key) pairs in per-bucket batches of 1000, `delete_workers` at a time.
+
+        Returns the pairs that failed.
+        """
+        slots = asyncio.Semaphore(self.delete_workers)
+
+        async def delete_batch(bucket: str, batch: List[str]) -> Set[Tuple[str, str]]:
+            async with slots:
+                try:
+                    response = await asyncio.to_thread(
+                        self.s3_client.delete_objects,
+                        Bucket=bucket,
+                        Delete={"Objects": [{"Key": key} for key in batch], "Quiet": True}
+                    )
+                except Exception as e:
+                    self.logger.error(f"Failed to delete {len(batch)} recording objects from {bucket}: {e}")
+                    return {(bucket, key) for key in batch}
+            errors = response.get("Errors", [])
+            for error in errors[:5]:
+                self.logger.warning(
+                    f"Failed to delete {bucket}/{error.get('Key')}: {error.get('Code')} {error.get('Message')}"
+                )
+            # A key that is already gone is what we wanted
+            return {(bucket, e["Key"]) for e in errors if e.get("Code") != "NoSuchKey"}
+
+        by_bucket: Dict[str, List[str]] = {}
+        for bucket, key in objects:
+            by_bucket.setdefault(bucket, []).append(key)
+        batches = [
+            (bucket, keys[i:i + DELETE_BATCH])
+            for bucket, keys in by_bucket.items()
+            for i in range(0, len(keys), DELETE_BATCH)
+        ]
+        results = await asyncio.gather(*(delete_batch(bucket, batch) for bucket, batch in batches))
+        return set().union(*results)
+
+    @staticmethod
+    async def _no_more() -> List[ExpiredRecording]:
+        return []
+
+
+async def main():
+    """Run one cleanup pass until caught up."""
+    import boto3
+    from src.shared.infrastructure.persistence.connection import get_postgres_connection_string
+    from src.modules.streaming.infrastructure.persistence.retention_repository_postgresql import RetentionRepositoryPostgreSQL
+
+    s3_client = boto3.client(
+        's3',
+        endpoint_url=os.getenv("STORAGE_ENDPOINT", "http://minio:9000"),
+        aws_access_key_id=os.getenv("STORAGE_ACCESS_KEY", "minioadmin"),
+        aws_secret_access_key=os.getenv("STORAGE_SECRET_KEY", "minioadmin")
+    )
+    repository = RetentionRepositoryPostgreSQL(get_postgres_connection_string())
+    try:
+        await RetentionCleanup(repository, s3_client).run()
+    finally:
+        await repository.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,240 @@
+"""Retention scheduler: deletes each tenant's recordings when they expire."""
+import asyncio
+import heapq
+import os
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from prometheus_client import Counter, Gauge
+
+from src.modules.streaming.domain.repositories.retention_repository import RetentionRepository, cursor_after
+from src.shared.infrastructure.logger import Logger
+
+
+retention_scheduler_runs_total = Counter(
+    'retention_scheduler_runs_total',
+    'Retention runs by kind (tenant, sweep) and result (success, partial, failed)',
+    ['kind', 'result']
+)
+
+retention_scheduler_tenants = Gauge(
+    'retention_scheduler_tenants',
+    'Tenants with an upcoming expiration in the retention schedule'
+)
+
+
+class RetentionScheduler:
+    """Wakes up exactly when the next recording expires.
+
+    The earliest pending expiry of every tenant is kept in a min-heap; the
+    loop sleeps until the top of the heap (or the next refresh/sweep) and
+    then runs the cleanup (a RetentionCleanup) for that tenant only, starting after the tenant's
+    watermark. Once the run is done the watermark moves to the run's time,
+    or to just before the earliest recording that failed, so a restart
+    resumes where it stopped and nothing is deleted or audited twice.
+    Recordings on incident/legal hold are never returned by the repository.
+
+    Every `refresh_seconds` the expirations are reloaded, which picks up new
+    tenants and retention changes (retention is at least 7 days, so an hour
+    is plenty). Every `sweep_seconds` a full pass over all tenants catches
+    what incremental runs skip: released holds behind the watermark and
+    recordings without a tenant.
+
+    With a `lifecycle` (RecordingLifecycle) every `arrange_seconds` the
+    bucket lifecycle rules are reconciled, the rows of segments past their
+    own retention dropped and misplaced segments moved under their
+    retention class or legal-hold prefix; the store then expires the
+    objects and the cleanup runs only reconcile rows.
+
+    Run a single instance.
+    """
+
+    def __init__(
+        self,
+        repository: RetentionRepository,
+        cleanup,
+        refresh_seconds: Optional[float] = None,
+        sweep_seconds: Optional[float] = None,
+        retry_seconds: float = 300.0,
+        lifecycle=None,
+        arrange_seconds: Optional[float] = None
+    ):
+        self.logger = Logger(__name__)
+        self.repository = repository
+        self.cleanup = cleanup
+        self.refresh_seconds = refresh_seconds or float(os.getenv("RETENTION_REFRESH_SECONDS", "3600"))
+        self.sweep_seconds = sweep_seconds or float(os.getenv("RETENTION_SWEEP_SECONDS", "86400"))
+        self.retry_seconds = retry_seconds
+        self.lifecycle = lifecycle
+        self.arrange_seconds = arrange_seconds or float(os.getenv("RETENTION_ARRANGE_SECONDS", "600"))
+        self._schedule: List[Tuple[datetime, UUID]] = []
+        self._due: Dict[UUID, datetime] = {}
+        self._next_refresh: Optional[datetime] = None
+        self._next_sweep: Optional[datetime] = None
+        self._next_arrange: Optional[datetime] = None
+        self._stopped = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    async def refresh(self, now: Optional[datetime] = None) -> None:
+        """Reload every tenant's next expiry into the schedule."""
+        now = now or datetime.utcnow()
+        self._next_refresh = now + timedelta(seconds=self.refresh_seconds)
+        for tenant_id, expires_at in (await self.repository.next_expirations()).items():
+            self._push(tenant_id, expires_at)
+        retention_scheduler_tenants.set(len(self._due))
+
+    async def run_due(self, now: Optional[datetime] = None) -> None:
+        """Run the cleanup of every tenant whose next expiry has passed."""
+        now = now or datetime.utcnow()
+        while self._schedule and self._schedule[0][0] <= now:
+            due, tenant_id = heapq.heappop(self._schedule)
+            if self._due.get(tenant_id) != due:
+                continue  # superseded by an earlier entry
+            del self._due[tenant_id]
+            try:
+                await self.run_tenant(tenant_id, now)
+            except Exception as e:
+                retention_scheduler_runs_total.labels(kind="tenant", result="failed").inc()
+                self.logger.error(f"Retention run of tenant {tenant_id} failed: {e}")
+                self._push(tenant_id, now + timedelta(seconds=self.retry_seconds))
+        retention_scheduler_tenants.set(len(self._due))
+
+    async def run_tenant(self, tenant_id: UUID, now: datetime):
+        """Delete the tenant's recordings expired at `now` and advance its watermark."""
+        watermark = await self.repository.get_watermark(tenant_id)
+        stats = await self.cleanup.run(
+            now,
+            tenant_id=tenant_id,
+            after=cursor_after(watermark) if watermark else None
+        )
+        through = now if stats.first_failure is None else stats.first_failure - timedelta(microseconds=1)
+        if watermark is None or through > watermark:
+            await self.repository.set_watermark(tenant_id, through)
+        retention_scheduler_runs_total.labels(kind="tenant", result="partial" if stats.failed else "success").inc()
+
+        next_expiry = await self.repository.next_expiration(tenant_id)
+        if next_expiry is not None:
+            if stats.failed:
+                # Failed recordings stay pending at their old expiry; retry them later
+                next_expiry = max(next_expiry, now + timedelta(seconds=self.retry_seconds))
+            self._push(tenant_id, next_expiry)
+        return stats
+
+    async def sweep(self, now: Optional[datetime] = None):
+        """Delete everything expired at `now`, regardless of watermarks."""
+        now = now or datetime.utcnow()
+        self._next_sweep = now + timedelta(seconds=self.sweep_seconds)
+        stats = await self.cleanup.run(now)
+        retention_scheduler_runs_total.labels(kind="sweep", result="partial" if stats.failed else "success").inc()
+        return stats
+
+    async def arrange(self, now: Optional[datetime] = None) -> int:
+        """Reconcile the lifecycle rules, expire old segments, then move misplaced ones; returns segments moved."""
+        now = now or datetime.utcnow()
+        self._next_arrange = now + timedelta(seconds=self.arrange_seconds)
+        # Never move objects under a prefix whose rule isn't installed
+        await self.lifecycle.reconcile_rules()
+        await self.lifecycle.expire_segments(now)
+        return await self.lifecycle.arrange(now)
+
+    def seconds_until_next(self, now: datetime) -> float:
+        """Time to sleep before something is due."""
+        wake_at = [t for t in (self._next_refresh, self._next_sweep, self._next_arrange) if t is not None]
+        if self._schedule:
+            wake_at.append(self._schedule[0][0])
+        if not wake_at:
+            return self.refresh_seconds
+        return max(0.0, (min(wake_at) - now).total_seconds())
+
+    def _push(self, tenant_id: UUID, due: datetime) -> None:
+        current = self._due.get(tenant_id)
+        if current is not None and current <= due:
+            return
+        self._due[tenant_id] = due
+        heapq.heappush(self._schedule, (due, tenant_id))
+
+    async def start(self):
+        """Load the schedule and start the loop; the first sweep is one sweep interval away."""
+        self.logger.info("Starting RetentionScheduler...")
+        now = datetime.utcnow()
+        self._next_sweep = now + timedelta(seconds=self.sweep_seconds)
+        await self.refresh(now)
+        self._task = asyncio.create_task(self._loop())
+
+    async def stop(self):
+        """Stop after the run in progress."""
+        self.logger.info("Stopping RetentionScheduler...")
+        self._stopped.set()
+        if self._task:
+            await asyncio.gather(self._task, return_exceptions=True)
+
+    async def _loop(self):
+        while not self._stopped.is_set():
+            now = datetime.utcnow()
+            await self._run_if_due(self.refresh, "_next_refresh", None, "refresh retention schedule", now)
+            await self._run_if_due(self.sweep, "_next_sweep", "sweep", "run retention sweep", now)
+            if self.lifecycle:
+                await self._run_if_due(
+                    self.arrange, "_next_arrange", None, "arrange recordings for lifecycle rules", now
+                )
+            await self.run_due(now)
+            try:
+                await asyncio.wait_for(
+                    self._stopped.wait(),
+                    timeout=self.seconds_until_next(datetime.utcnow())
+                )
+            except asyncio.TimeoutError:
+                pass
+
+    async def _run_if_due(
+        self,
+        job: Callable[[datetime], Awaitable],
+        next_attr: str,
+        metric_kind: Optional[str],
+        description: str,
+        now: datetime
+    ) -> None:
+        """Run a periodic job when its `_next_*` time has come; on failure retry after `retry_seconds`."""
+        due = getattr(self, next_attr)
+        if due is not None and now < due:
+            return
+        try:
+            await job(now)
+        except Exception as e:
+            setattr(self, next_attr, now + timedelta(seconds=self.retry_seconds))
+            if metric_kind:
+                retention_scheduler_runs_total.labels(kind=metric_kind, result="failed").inc()
+            self.logger.error(f"Failed to {description}: {e}")
+
+
+async def main():
+    """Main worker entry point."""
+    import boto3
+    from src.shared.infrastructure.persistence.connection import get_postgres_connection_string
+    from src.modules.streaming.infrastructure.persistence.retention_repository_postgresql import RetentionRepositoryPostgreSQL
+    from src.modules.streaming.infrastructure.external_services.recording_lifecycle import RecordingLifecycle
+    from src.modules.streaming.infrastructure.workers.retention_cleanup import RetentionCleanup
+
+    s3_client = boto3.client(
+        's3',
+        endpoint_url=os.getenv("STORAGE_ENDPOINT", "http://minio:9000"),
+        aws_access_key_id=os.getenv("STORAGE_ACCESS_KEY", "minioadmin"),
+        aws_secret_access_key=os.getenv("STORAGE_SECRET_KEY", "minioadmin")
+    )
+    repository = RetentionRepositoryPostgreSQL(get_postgres_connection_string())
+    scheduler = RetentionScheduler(
+        repository,
+        RetentionCleanup(repository, s3_client),
+        lifecycle=RecordingLifecycle(s3_client, repository)
+    )
+    try:
+        await scheduler.start()
+        await asyncio.Event().wait()
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        await scheduler.stop()
+        await repository.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
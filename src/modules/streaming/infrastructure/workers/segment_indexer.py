@@ -0,0 +1,176 @@
+"""Segment catalog indexer.
+
+Tails the CSV segment lists written by ffmpeg (`-segment_list ... -segment_list_type csv`)
+and bulk-inserts one `recording_segments` row per finished segment file.
+"""
+import asyncio
+import csv
+import os
+import re
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+from uuid import UUID, uuid5, NAMESPACE_URL
+
+from src.modules.streaming.domain.entities.recording_segment import RecordingSegment
+from src.modules.streaming.domain.repositories.segment_repository import SegmentRepository
+from src.shared.infrastructure.logger import Logger
+
+
+SEGMENT_TIMESTAMP = re.compile(r"_(\d{8}_\d{6})\.\w+$")
+
+
+def parse_segment_timestamp(filename: str) -> Optional[datetime]:
+    """Parse the wall-clock start embedded by `-strftime` (`*_%Y%m%d_%H%M%S.mp4`)."""
+    match = SEGMENT_TIMESTAMP.search(filename)
+    if not match:
+        return None
+    return datetime.strptime(match.group(1), "%Y%m%d_%H%M%S")
+
+
+class WatchedSegmentList:
+    """Segment list of one running recording."""
+    
+    def __init__(
+        self,
+        recording_id: UUID,
+        stream_id: UUID,
+        list_path: str,
+        camera_id: Optional[UUID] = None,
+        base_time: Optional[datetime] = None
+    ):
+        self.recording_id = recording_id
+        self.stream_id = stream_id
+        self.camera_id = camera_id
+        self.list_path = list_path
+        self.base_time = base_time or datetime.utcnow()
+        self.offset = 0
+
+
+class SegmentIndexer:
+    """Indexes finished segments into the segment catalog."""
+    
+    def __init__(
+        self,
+        segment_repository: SegmentRepository,
+        recordings_root: Optional[str] = None,
+        poll_interval: float = 5.0
+    ):
+        self.logger = Logger(__name__)
+        self.segment_repository = segment_repository
+        self.recordings_root = recordings_root or os.getenv("RECORDINGS_ROOT", "/recordings")
+        self.poll_interval = poll_interval
+        self.watched: Dict[UUID, WatchedSegmentList] = {}
+        self._stopped = asyncio.Event()
+    
+    def watch(
+        self,
+        recording_id: UUID,
+        stream_id: UUID,
+        list_path: str,
+        camera_id: Optional[UUID] = None,
+        base_time: Optional[datetime] = None
+    ):
+        """Start tailing a recording's segment list."""
+        self.watched[recording_id] = WatchedSegmentList(
+            recording_id, stream_id, list_path, camera_id, base_time
+        )
+    
+    async def unwatch(self, recording_id: UUID):
+        """Index remaining entries and stop tailing a segment list."""
+        watched = self.watched.pop(recording_id, None)
+        if watched:
+            await self.segment_repository.save_many(self._read_new_segments(watched))
+    
+    async def poll(self) -> int:
+        """Read new entries of every watched list and insert them in one batch."""
+        segments: List[RecordingSegment] = []
+        for watched in list(self.watched.values()):
+            try:
+                segments.extend(self._read_new_segments(watched))
+            except OSError as e:
+                self.logger.warning(f"Could not read segment list {watched.list_path}: {e}")
+        
+        if not segments:
+            return 0
+        
+        inserted = await self.segment_repository.save_many(segments)
+        self.logger.info(f"Indexed {inserted} segments")
+        return inserted
+    
+    async def run(self):
+        """Poll watched lists until stopped."""
+        while not self._stopped.is_set():
+            try:
+                await self.poll()
+            except Exception as e:
+                self.logger.error(f"Segment indexing failed: {e}")
+            try:
+                await asyncio.wait_for(self._stopped.wait(), timeout=self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+    
+    def stop(self):
+        """Stop the polling loop."""
+        self._stopped.set()
+    
+    def _read_new_segments(self, watched: WatchedSegmentList) -> List[RecordingSegment]:
+        """Read complete lines appended since the last poll."""
+        if not os.path.exists(watched.list_path):
+            return []
+        
+        size = os.path.getsize(watched.list_path)
+        if size < watched.offset:
+            # ffmpeg was restarted and truncated the list
+            watched.offset = 0
+        if size == watched.offset:
+            return []
+        
+        with open(watched.list_path, "rb") as f:
+            f.seek(watched.offset)
+            data = f.read()
+        
+        complete = data[:data.rfind(b"\n") + 1]
+        watched.offset += len(complete)
+        lines = complete.decode(errors="replace").splitlines()
+        
+        segment_dir = os.path.dirname(watched.list_path)
+        segments = []
+        for row in csv.reader(lines):
+            if len(row) < 3:
+                continue
+            segment = self._to_segment(watched, segment_dir, row[0], row[1], row[2])
+            if segment:
+                segments.append(segment)
+        return segments
+    
+    def _to_segment(
+        self,
+        watched: WatchedSegmentList,
+        segment_dir: str,
+        filename: str,
+        start_pts: str,
+        end_pts: str
+    ) -> Optional[RecordingSegment]:
+        """Build a segment from one `filename,start,end` CSV entry."""
+        try:
+            start_offset = float(start_pts)
+            duration = float(end_pts) - start_offset
+        except ValueError:
+            return None
+        
+        full_path = os.path.join(segment_dir, filename)
+        start_time = parse_segment_timestamp(filename) or (
+            watched.base_time + timedelta(seconds=start_offset)
+        )
+        storage_path = os.path.relpath(full_path, self.recordings_root)
+        
+        return RecordingSegment(
+            id=uuid5(NAMESPACE_URL, storage_path),
+            stream_id=watched.stream_id,
+            recording_id=watched.recording_id,
+            camera_id=watched.camera_id,
+            start_time=start_time,
+            end_time=start_time + timedelta(seconds=max(duration, 0.0)),
+            storage_path=storage_path,
+            size_bytes=os.path.getsize(full_path) if os.path.exists(full_path) else 0
+        )
@@ -0,0 +1,300 @@
+"""Live thumbnail scheduler: periodic snapshots of every active camera."""
+import asyncio
+import heapq
+import os
+import random
+import socket
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Set, Tuple
+from uuid import UUID
+
+from prometheus_client import Counter, Gauge
+
+from src.modules.streaming.application.queries.active_cameras import ActiveCameraQuery, CameraTarget
+from src.modules.streaming.infrastructure.external_services.clip_engine import ClipEngine, ClipExtractionError
+from src.shared.infrastructure.logger import Logger
+from src.shared.infrastructure.sharding import ConsistentHashRing, WorkerMembership
+
+
+thumbnail_captures_total = Counter(
+    'thumbnail_captures_total',
+    'Live thumbnail captures by result (success, failed, offline, backoff)',
+    ['result']
+)
+
+thumbnail_owned_cameras = Gauge(
+    'thumbnail_owned_cameras',
+    'Cameras assigned to this thumbnail worker'
+)
+
+
+async def read_all(stream: asyncio.StreamReader) -> bytes:
+    return await stream.read()
+
+
+class ThumbnailScheduler:
+    """Captures one thumbnail per camera every `interval_seconds`.
+
+    Active cameras are reloaded from the database every `refresh_seconds`
+    and sharded across the live workers (heartbeats in Redis) with a
+    consistent hash ring, so a worker joining or leaving only moves its
+    share of cameras. Each camera starts at a random offset within the
+    interval and every following capture is jittered, which spreads RTSP
+    sessions and uploads evenly instead of bursting on the tick.
+
+    Cameras reported offline are skipped, and a camera that keeps failing
+    is backed off for `failure_backoff_seconds`.
+
+    With a `frame_grabber` the image is the latest frame its persistent
+    decoder holds for the camera's MediaMTX path; without one each capture
+    is a one-shot ffmpeg against the camera source.
+
+    Images go to a ring buffer of `slots` keys per camera, slot =
+    n mod slots with n = capture time // interval, overwritten in place,
+    so nothing has to be listed or deleted.
+    """
+
+    FAILURES_BEFORE_BACKOFF = 3
+
+    def __init__(
+        self,
+        camera_query: ActiveCameraQuery,
+        s3_client,
+        bucket: str = "gtvision-thumbnails",
+        membership: Optional[WorkerMembership] = None,
+        worker_id: Optional[str] = None,
+        interval_seconds: Optional[float] = None,
+        slots: Optional[int] = None,
+        concurrency: Optional[int] = None,
+        refresh_seconds: float = 30.0,
+        jitter_ratio: float = 0.1,
+        failure_backoff_seconds: float = 60.0,
+        engine: Optional[ClipEngine] = None,
+        frame_grabber=None
+    ):
+        self.logger = Logger(__name__)
+        self.camera_query = camera_query
+        self.s3_client = s3_client
+        self.bucket = bucket
+        self.membership = membership
+        self.worker_id = worker_id or (membership.worker_id if membership else socket.gethostname())
+        self.interval_seconds = interval_seconds or float(os.getenv("THUMBNAIL_INTERVAL_SECONDS", "10"))
+        self.slots = slots or int(os.getenv("THUMBNAIL_RING_SLOTS", "100"))
+        self.concurrency = concurrency or int(os.getenv("THUMBNAIL_CONCURRENCY", "16"))
+        self.refresh_seconds = refresh_seconds
+        self.jitter_ratio = jitter_ratio
+        self.failure_backoff_seconds = failure_backoff_seconds
+        self.engine = engine or ClipEngine(max_workers=self.concurrency, timeout_seconds=10)
+        self.frame_grabber = frame_grabber
+        self.cameras: Dict[UUID, CameraTarget] = {}
+        self._schedule: List[Tuple[float, UUID]] = []
+        self._scheduled: Set[UUID] = set()
+        self._failures: Dict[UUID, int] = {}
+        self._backoff_until: Dict[UUID, float] = {}
+        self._in_flight: Set[asyncio.Task] = set()
+        self._stopped = asyncio.Event()
+        self._tasks: List[asyncio.Task] = []
+
+    def ring_key(self, camera: CameraTarget, captured_at: float) -> Tuple[int, str]:
+        """Ring-buffer slot and object key for a capture at epoch `captured_at`."""
+        slot = int(captured_at // self.interval_seconds) % self.slots
+        width = len(str(self.slots - 1))
+        return slot, f"{camera.tenant_id}/{camera.camera_id}/thumbnails/{slot:0{width}d}.jpg"
+
+    async def refresh(self) -> None:
+        """Reload cameras and membership and take over this worker's shard."""
+        members = [self.worker_id]
+        if self.membership:
+            await self.membership.heartbeat()
+            members = await self.membership.members() or members
+        ring = ConsistentHashRing(members)
+
+        cameras = await self.camera_query.list_active()
+        self.cameras = {
+            camera.camera_id: camera for camera in cameras
+            if ring.node_for(str(camera.camera_id)) == self.worker_id
+        }
+        thumbnail_owned_cameras.set(len(self.cameras))
+
+        now = time.monotonic()
+        for camera_id in self.cameras.keys() - self._scheduled:
+            # First capture anywhere in the interval, so cameras don't fire together
+            self._push(now + random.uniform(0, self.interval_seconds), camera_id)
+
+    async def run_due(self) -> None:
+        """Start captures for every camera whose time has come."""
+        now = time.monotonic()
+        while self._schedule and self._schedule[0][0] <= now:
+            due, camera_id = heapq.heappop(self._schedule)
+            self._scheduled.discard(camera_id)
+            camera = self.cameras.get(camera_id)
+            if camera is None:
+                continue  # moved to another worker or deactivated
+
+            jitter = random.uniform(-self.jitter_ratio, self.jitter_ratio) * self.interval_seconds
+            next_due = due + self.interval_seconds + jitter
+            if next_due <= now:
+                # Fell behind (busy loop, clock jump): skip missed ticks instead of bursting
+                next_due = now + self.interval_seconds + jitter
+            self._push(next_due, camera_id)
+
+            if not camera.online:
+                thumbnail_captures_total.labels(result="offline").inc()
+            elif self._backoff_until.get(camera_id, 0) > now:
+                thumbnail_captures_total.labels(result="backoff").inc()
+            elif len(self._in_flight) >= self.concurrency:
+                thumbnail_captures_total.labels(result="failed").inc()
+                self.logger.warning(f"Thumbnail capture of {camera_id} skipped, all {self.concurrency} slots busy")
+            else:
+                task = asyncio.create_task(self.capture(camera))
+                self._in_flight.add(task)
+                task.add_done_callback(self._in_flight.discard)
+
+    async def capture(self, camera: CameraTarget) -> Optional[str]:
+        """Grab one frame and overwrite the camera's current ring slot."""
+        captured_at = time.time()
+        try:
+            image = await self._grab(camera)
+            if not image:
+                raise ClipExtractionError("ffmpeg produced no frame")
+            slot, key = self.ring_key(camera, captured_at)
+            await asyncio.to_thread(
+                self.s3_client.put_object,
+                Bucket=self.bucket,
+                Key=key,
+                Body=image,
+                ContentType='image/jpeg',
+                CacheControl='no-cache',
+                Metadata={
+                    'camera_id': str(camera.camera_id),
+                    'tenant_id': camera.tenant_id,
+                    'timestamp': datetime.utcfromtimestamp(captured_at).isoformat(),
+                    'slot': str(slot)
+                }
+            )
+        except Exception as e:
+            self._record_failure(camera.camera_id, e)
+            return None
+
+        self._failures.pop(camera.camera_id, None)
+        self._backoff_until.pop(camera.camera_id, None)
+        thumbnail_captures_total.labels(result="success").inc()
+        return key
+
+    async def _grab(self, camera: CameraTarget) -> bytes:
+        if self.frame_grabber:
+            path = self.frame_grabber.path_for(camera.tenant_id, str(camera.camera_id))
+            frame = await self.frame_grabber.grab(path, timeout=self.interval_seconds)
+            return frame.image
+
+        cmd = [
+            self.engine.ffmpeg_binary,
+            "-nostdin",
+            "-hide_banner",
+            "-loglevel", "error",
+            "-rtsp_transport", "tcp",
+            "-i", camera.source_url,
+            "-frames:v", "1",
+            "-vf", "scale=320:-1",
+            "-f", "image2pipe",
+            "-vcodec", "mjpeg",
+            "-q:v", "5",
+            "-"
+        ]
+        return await self.engine.run(cmd, consume=read_all)
+
+    def _record_failure(self, camera_id: UUID, error: Exception) -> None:
+        thumbnail_captures_total.labels(result="failed").inc()
+        failures = self._failures.get(camera_id, 0) + 1
+        self._failures[camera_id] = failures
+        if failures >= self.FAILURES_BEFORE_BACKOFF:
+            self._backoff_until[camera_id] = time.monotonic() + self.failure_backoff_seconds
+            self.logger.warning(
+                f"Thumbnail capture of {camera_id} failed {failures} times, backing off: {error}"
+            )
+
+    def _push(self, due: float, camera_id: UUID) -> None:
+        heapq.heappush(self._schedule, (due, camera_id))
+        self._scheduled.add(camera_id)
+
+    async def start(self):
+        """Start the refresh and capture loops."""
+        self.logger.info(f"Starting ThumbnailScheduler {self.worker_id}...")
+        await self.refresh()
+        self._tasks = [
+            asyncio.create_task(self._refresh_loop()),
+            asyncio.create_task(self._capture_loop()),
+        ]
+
+    async def stop(self):
+        """Stop scheduling, wait for running captures and leave the group."""
+        self.logger.info("Stopping ThumbnailScheduler...")
+        self._stopped.set()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        await asyncio.gather(*self._in_flight, return_exceptions=True)
+        if self.membership:
+            await self.membership.leave()
+
+    async def _refresh_loop(self):
+        while not self._stopped.is_set():
+            try:
+                await asyncio.wait_for(self._stopped.wait(), timeout=self.refresh_seconds)
+            except asyncio.TimeoutError:
+                pass
+            if self._stopped.is_set():
+                break
+            try:
+                await self.refresh()
+            except Exception as e:
+                self.logger.error(f"Failed to refresh thumbnail cameras: {e}")
+
+    async def _capture_loop(self):
+        while not self._stopped.is_set():
+            await self.run_due()
+            delay = self._schedule[0][0] - time.monotonic() if self._schedule else self.interval_seconds
+            try:
+                await asyncio.wait_for(self._stopped.wait(), timeout=max(0.0, min(delay, 1.0)))
+            except asyncio.TimeoutError:
+                pass
+
+
+async def main():
+    """Main worker entry point."""
+    import boto3
+    import redis.asyncio as aioredis
+    from src.shared.infrastructure.persistence.connection import get_postgres_connection_string
+    from src.modules.streaming.infrastructure.external_services.frame_grabber import FrameGrabber
+    from src.modules.streaming.infrastructure.persistence.active_cameras_postgresql import ActiveCameraQueryPostgreSQL
+
+    s3_client = boto3.client(
+        's3',
+        endpoint_url=os.getenv("STORAGE_ENDPOINT", "http://minio:9000"),
+        aws_access_key_id=os.getenv("STORAGE_ACCESS_KEY", "minioadmin"),
+        aws_secret_access_key=os.getenv("STORAGE_SECRET_KEY", "minioadmin")
+    )
+    redis = aioredis.from_url(os.getenv(
+        "REDIS_URL",
+        f"redis://{os.getenv('REDIS_HOST', 'redis')}:{os.getenv('REDIS_PORT', '6379')}/{os.getenv('REDIS_DB', '0')}"
+    ))
+    camera_query = ActiveCameraQueryPostgreSQL(get_postgres_connection_string())
+    frame_grabber = FrameGrabber(width=320)
+    scheduler = ThumbnailScheduler(
+        camera_query,
+        s3_client,
+        frame_grabber=frame_grabber,
+        membership=WorkerMembership(redis, "thumbnails", os.getenv("THUMBNAIL_WORKER_ID", socket.gethostname()))
+    )
+    try:
+        frame_grabber.start()
+        await scheduler.start()
+        await asyncio.Event().wait()
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        await scheduler.stop()
+        await frame_grabber.stop()
+        await camera_query.close()
+        await redis.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
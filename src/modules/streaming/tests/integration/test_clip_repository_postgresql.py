@@ -86,3 +86,26 @@ async def test_list_by_status(repository):
     
     # Cleanup
     await repository.delete(clip.id)
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_save_many_and_delete_many(repository):
+    """Test bulk upsert and bulk delete of clips."""
+    # Arrange
+    recording_id = uuid4()
+    start = datetime.now()
+    clips = [
+        Clip(id=uuid4(), recording_id=recording_id, start_time=start, end_time=start + timedelta(minutes=5))
+        for _ in range(12)
+    ]
+    
+    # Act
+    written = await repository.save_many(clips, batch_size=5)
+    found = await repository.find_by_recording_id(recording_id)
+    deleted = await repository.delete_many([c.id for c in clips])
+    
+    # Assert
+    assert written == 12
+    assert len(found) == 12
+    assert deleted == 12
@@ -115,3 +115,30 @@ async def test_update_recording_metadata(repository):
     
     # Cleanup
     await repository.delete(recording.id)
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_save_many_and_delete_many(repository):
+    """Test bulk upsert across several batches and bulk delete."""
+    # Arrange
+    stream_id = uuid4()
+    recordings = [
+        Recording(id=uuid4(), stream_id=stream_id, retention_policy=RetentionPolicy(7))
+        for _ in range(25)
+    ]
+    
+    # Act
+    written = await repository.save_many(recordings, batch_size=10)
+    recordings[0].status = RecordingStatus.STOPPED
+    updated = await repository.save_many(recordings[:1])
+    found = await repository.find_by_stream_id(stream_id)
+    deleted = await repository.delete_many([r.id for r in recordings], batch_size=10)
+    
+    # Assert
+    assert written == 25
+    assert updated == 1
+    assert len(found) == 25
+    assert next(r for r in found if r.id == recordings[0].id).status == RecordingStatus.STOPPED
+    assert deleted == 25
+    assert await repository.find_by_stream_id(stream_id) == []
@@ -0,0 +1,164 @@
+"""Tests for the content-addressed clip cache."""
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from botocore.exceptions import ClientError
+
+from src.modules.streaming.domain.repositories.clip_cache_index import ClipCacheEntry
+from src.modules.streaming.infrastructure.external_services import clip_export_service
+from src.modules.streaming.infrastructure.external_services.clip_cache import (
+    ClipCache,
+    align_range,
+    cover_range,
+)
+from src.modules.streaming.infrastructure.external_services.clip_engine import SegmentSpan
+from src.modules.streaming.infrastructure.external_services.clip_export_service import ClipExportService
+from src.modules.streaming.infrastructure.persistence.clip_cache_index_impl import ClipCacheIndexImpl
+
+T0 = datetime(2025, 1, 10, 14, 0, 0)
+CAMERA_ID = uuid4()
+
+
+def at(seconds: float) -> datetime:
+    return T0 + timedelta(seconds=seconds)
+
+
+def entry(start: float, end: float, size: int = 100, accessed: datetime = T0, tenant: str = "t1") -> ClipCacheEntry:
+    key = f"{tenant}-{start}-{end}"
+    return ClipCacheEntry(
+        key, tenant, CAMERA_ID, at(start), at(end), "copy:fmp4",
+        f"gtvision-clips-{tenant}", f"cache/{CAMERA_ID}/{key}.mp4", size, accessed
+    )
+
+
+class FakeS3:
+    def __init__(self):
+        self.objects = {}
+        self.copies = []
+        self.deleted = []
+
+    def head_object(self, Bucket, Key):
+        if (Bucket, Key) not in self.objects:
+            raise ClientError({"Error": {"Code": "404"}}, "HeadObject")
+        return {}
+
+    def copy(self, CopySource, Bucket, Key):
+        self.copies.append((CopySource["Key"], Key))
+        self.objects[(Bucket, Key)] = self.objects[(CopySource["Bucket"], CopySource["Key"])]
+
+    def delete_objects(self, Bucket, Delete):
+        for obj in Delete["Objects"]:
+            self.deleted.append(obj["Key"])
+            self.objects.pop((Bucket, obj["Key"]), None)
+
+    def generate_presigned_url(self, operation, Params, ExpiresIn):
+        return f"http://minio/{Params['Bucket']}/{Params['Key']}"
+
+    def create_multipart_upload(self, Bucket, Key, **kwargs):
+        return {"UploadId": "u1"}
+
+    def complete_multipart_upload(self, Bucket, Key, **kwargs):
+        self.objects[(Bucket, Key)] = b"clip"
+
+    def abort_multipart_upload(self, **kwargs):
+        pass
+
+
+class FakeEngine:
+    """Records the concat parts instead of running ffmpeg."""
+
+    def __init__(self):
+        self.runs = []
+
+    async def cut_to_stream(self, parts, url_for, consume, on_progress=None):
+        self.runs.append([(url_for(p.key), p.inpoint, p.outpoint) for p in parts])
+        return 4096
+
+
+def test_align_range_widens_to_step():
+    """Test start is floored and end is ceiled to the alignment step."""
+    assert align_range(at(3.4), at(60.2), 2) == (at(2), at(62))
+    assert align_range(at(4), at(60), 2) == (at(4), at(60))
+
+
+def test_cover_range_reuses_cached_clips_and_fills_gaps():
+    """Test cached clips cover what they can and gaps fall back to segments."""
+    cached = [entry(0, 60), entry(50, 120), entry(200, 205)]
+
+    pieces = cover_range(cached, at(30), at(300), min_reuse_seconds=10)
+
+    assert [(e.cache_key if e else None, s, t) for e, s, t in pieces] == [
+        ("t1-0-60", at(30), at(60)),
+        ("t1-50-120", at(60), at(120)),
+        (None, at(120), at(300)),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_evict_drops_least_recently_used_idle_entries():
+    """Test eviction frees LRU entries until under budget, sparing recent ones."""
+    index = ClipCacheIndexImpl()
+    s3 = FakeS3()
+    cache = ClipCache(index, s3, tenant_budget_bytes=250, min_idle_seconds=60)
+    old = datetime.utcnow() - timedelta(hours=1)
+    await index.put(entry(0, 10, accessed=old - timedelta(minutes=2)))
+    await index.put(entry(10, 20, accessed=old - timedelta(minutes=1)))
+    await index.put(entry(20, 30, accessed=old))
+    await index.put(entry(30, 40, accessed=datetime.utcnow()))
+    await index.put(entry(0, 10, size=1000, tenant="t2", accessed=old))
+
+    assert await cache.evict("t1") == 200
+
+    assert await index.total_size("t1") == 200
+    assert s3.deleted == [f"cache/{CAMERA_ID}/t1-0-10.mp4", f"cache/{CAMERA_ID}/t1-10-20.mp4"]
+    assert await index.get("t1-30-40") is not None
+    assert await index.total_size("t2") == 1000
+
+
+@pytest.mark.asyncio
+async def test_export_hits_cache_without_running_ffmpeg(monkeypatch):
+    """Test a repeated export is served by a server-side copy."""
+    s3 = FakeS3()
+    monkeypatch.setattr(clip_export_service, "s3_client", s3)
+    engine = FakeEngine()
+    service = ClipExportService(None, engine, ClipCache(ClipCacheIndexImpl(), s3, align_seconds=2))
+    camera_id = str(uuid4())
+    list_segments = [SegmentSpan(f"{camera_id}/segments/rec_20250110_140000.mp4", at(0), at(3600))]
+
+    async def fake_list(*args):
+        return list_segments
+    monkeypatch.setattr(service, "_list_segments", fake_list)
+
+    first = await service.export_clip("t1", camera_id, at(60.5), at(120), "clip-1")
+    second = await service.export_clip("t1", camera_id, at(61), at(119.5), "clip-2")
+
+    assert first["status"] == "completed" and not first["cached"]
+    assert second["status"] == "completed" and second["cached"]
+    assert second["key"] == f"{camera_id}/clips/clip-2.mp4"
+    assert second["size_bytes"] == 4096
+    assert len(engine.runs) == 1
+    assert engine.runs[0] == [(f"http://minio/gtvision-recordings-t1/{list_segments[0].key}", 60.0, 120.0)]
+
+
+@pytest.mark.asyncio
+async def test_export_reuses_overlapping_cached_clip(monkeypatch):
+    """Test an overlapping export reads the cached part from the clips bucket."""
+    s3 = FakeS3()
+    monkeypatch.setattr(clip_export_service, "s3_client", s3)
+    engine = FakeEngine()
+    service = ClipExportService(None, engine, ClipCache(ClipCacheIndexImpl(), s3, min_reuse_seconds=10))
+    camera_id = str(uuid4())
+    segment = SegmentSpan(f"{camera_id}/segments/rec_20250110_140000.mp4", at(0), at(3600))
+
+    async def fake_list(*args):
+        return [segment]
+    monkeypatch.setattr(service, "_list_segments", fake_list)
+
+    await service.export_clip("t1", camera_id, at(0), at(60), "clip-1")
+    await service.export_clip("t1", camera_id, at(30), at(90), "clip-2")
+
+    cached_url, inpoint, outpoint = engine.runs[1][0]
+    assert cached_url.startswith(f"http://minio/gtvision-clips-t1/cache/{camera_id}/")
+    assert (inpoint, outpoint) == (30.0, None)
+    assert engine.runs[1][1] == (f"http://minio/gtvision-recordings-t1/{segment.key}", 60.0, 90.0)
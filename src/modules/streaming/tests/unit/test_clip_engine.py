@@ -0,0 +1,119 @@
+"""Tests for ClipEngine and clip planning."""
+import asyncio
+import sys
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.modules.streaming.infrastructure.external_services.clip_engine import (
+    ClipEngine,
+    ClipExtractionError,
+    ClipPart,
+    SegmentSpan,
+    build_concat_list,
+    plan_clip,
+    spans_from_listing,
+)
+
+T0 = datetime(2025, 1, 10, 14, 0, 0)
+
+
+def hour(n: int) -> SegmentSpan:
+    start = T0 + timedelta(hours=n)
+    return SegmentSpan(f"cam/segments/rec_{start:%Y%m%d_%H%M%S}.mp4", start, start + timedelta(hours=1))
+
+
+def test_plan_clip_within_one_segment():
+    """Test a short clip cuts a single segment on both sides."""
+    parts = plan_clip([hour(0), hour(1)], T0 + timedelta(minutes=10), T0 + timedelta(minutes=10, seconds=30))
+
+    assert parts == [ClipPart(hour(0).key, 600.0, 630.0)]
+
+
+def test_plan_clip_spanning_segments():
+    """Test edge segments get in/out points and middle ones are copied whole."""
+    spans = [hour(2), hour(0), hour(1), hour(3)]
+    parts = plan_clip(spans, T0 + timedelta(minutes=30), T0 + timedelta(hours=2, minutes=15))
+
+    assert parts == [
+        ClipPart(hour(0).key, 1800.0, None),
+        ClipPart(hour(1).key, None, None),
+        ClipPart(hour(2).key, None, 900.0),
+    ]
+
+
+def test_spans_from_listing_filters_by_file_time():
+    """Test the listing fallback keeps only overlapping, timestamped keys."""
+    keys = [hour(n).key for n in (3, 0, 1, 2)] + ["cam/segments/readme.txt"]
+    spans = spans_from_listing(keys, T0 + timedelta(minutes=90), T0 + timedelta(minutes=150))
+
+    assert [s.key for s in spans] == [hour(1).key, hour(2).key]
+    assert spans[0].end_time == hour(2).start_time
+
+
+def test_build_concat_list():
+    """Test ffconcat script uses URLs and escapes quotes."""
+    script = build_concat_list(
+        [ClipPart("a'b.mp4", 1.5, None), ClipPart("c.mp4", None, 10.0)],
+        lambda key: f"http://minio/{key}"
+    )
+
+    assert script.splitlines() == [
+        "ffconcat version 1.0",
+        "file 'http://minio/a'\\''b.mp4'",
+        "inpoint 1.500",
+        "file 'http://minio/c.mp4'",
+        "outpoint 10.000",
+    ]
+
+
+def test_build_command_stream_copies():
+    """Test the command concatenates with stream copy."""
+    cmd = ClipEngine(max_workers=1).build_command("/tmp/list.ffconcat", "/tmp/out.mp4")
+
+    assert cmd[cmd.index("-c") + 1] == "copy"
+    assert cmd[cmd.index("-f") + 1] == "concat"
+    assert "+faststart" in cmd
+    assert cmd[-1] == "/tmp/out.mp4"
+
+
+@pytest.mark.asyncio
+async def test_run_is_bounded_by_worker_pool():
+    """Test no more than max_workers ffmpeg processes run at once."""
+    engine = ClipEngine(max_workers=2)
+    peak = 0
+
+    async def watch():
+        nonlocal peak
+        while True:
+            peak = max(peak, engine.active)
+            await asyncio.sleep(0.01)
+
+    watcher = asyncio.create_task(watch())
+    await asyncio.gather(*(
+        engine.run([sys.executable, "-c", "import time; time.sleep(0.2)"]) for _ in range(5)
+    ))
+    watcher.cancel()
+
+    assert peak == 2
+    assert engine.active == 0
+
+
+@pytest.mark.asyncio
+async def test_run_raises_with_stderr_tail():
+    """Test a failing process raises with its last stderr lines."""
+    engine = ClipEngine(max_workers=1)
+    script = "import sys; sys.stderr.write('Invalid data found\\n'); sys.exit(1)"
+
+    with pytest.raises(ClipExtractionError, match="Invalid data found"):
+        await engine.run([sys.executable, "-c", script])
+
+
+@pytest.mark.asyncio
+async def test_run_kills_on_timeout():
+    """Test a hung process is killed after the timeout."""
+    engine = ClipEngine(max_workers=1, timeout_seconds=0.2)
+
+    with pytest.raises(ClipExtractionError, match="timed out"):
+        await engine.run([sys.executable, "-c", "import time; time.sleep(30)"])
+    assert engine.active == 0
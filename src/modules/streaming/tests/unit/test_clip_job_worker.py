@@ -0,0 +1,191 @@
+"""Tests for ClipJobWorker and the clip job queue."""
+import asyncio
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+from src.modules.streaming.domain.entities.clip_job import ClipJob
+from src.modules.streaming.domain.value_objects.clip_job_status import ClipJobStatus
+from src.modules.streaming.infrastructure.persistence.clip_job_repository_impl import ClipJobRepositoryImpl
+from src.modules.streaming.infrastructure.web.clip_routes import CreateClipRequest
+from src.modules.streaming.infrastructure.workers.clip_job_worker import ClipJobWorker
+
+START = datetime(2025, 1, 10, 14, 0, 0)
+
+
+def make_job(reason="export", camera_id=None, minutes=1, faststart=False):
+    return ClipJob(
+        id=uuid4(),
+        tenant_id="tenant-1",
+        camera_id=camera_id or uuid4(),
+        start_time=START,
+        end_time=START + timedelta(minutes=minutes),
+        reason=reason,
+        faststart=faststart
+    )
+
+
+class FakeExportService:
+    """Reports progress, then completes or fails; records peak concurrency."""
+
+    def __init__(self, fail_times=0, delay=0.0):
+        self.fail_times = fail_times
+        self.delay = delay
+        self.calls = []
+        self.running = 0
+        self.peak = 0
+
+    async def export_clip(self, tenant_id, camera_id, start_time, end_time, clip_id, faststart, on_progress=None):
+        self.calls.append(clip_id)
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            if on_progress:
+                on_progress(50.0)
+            await asyncio.sleep(self.delay)
+        finally:
+            self.running -= 1
+        if len(self.calls) <= self.fail_times:
+            return {"status": "failed", "error": "ffmpeg exited with code 1"}
+        return {
+            "status": "completed",
+            "bucket": f"gtvision-clips-{tenant_id}",
+            "key": f"{camera_id}/clips/{clip_id}.mp4",
+            "size_bytes": 1024
+        }
+
+
+class FakeBroker:
+    def __init__(self):
+        self.messages = []
+
+    async def publish(self, exchange, routing_key, message):
+        self.messages.append((exchange, routing_key, message))
+
+
+@pytest.mark.asyncio
+async def test_enqueue_deduplicates_and_raises_priority():
+    """Test identical requests share one job and an urgent duplicate bumps it."""
+    repository = ClipJobRepositoryImpl()
+    camera_id = uuid4()
+
+    job, created = await repository.enqueue(make_job("export", camera_id))
+    duplicate, duplicate_created = await repository.enqueue(make_job("incident", camera_id))
+    other_format, other_created = await repository.enqueue(make_job("export", camera_id, faststart=True))
+
+    assert created and not duplicate_created and other_created
+    assert duplicate.id == job.id
+    assert job.priority == ClipJob.PRIORITY_URGENT
+    assert other_format.id != job.id
+
+
+@pytest.mark.asyncio
+async def test_claim_prefers_urgent_jobs():
+    """Test incident/evidence clips are claimed before earlier exports."""
+    repository = ClipJobRepositoryImpl()
+    export, _ = await repository.enqueue(make_job("export"))
+    evidence, _ = await repository.enqueue(make_job("evidence"))
+
+    assert (await repository.claim(60)).id == evidence.id
+    assert (await repository.claim(60)).id == export.id
+    assert await repository.claim(60) is None
+
+
+@pytest.mark.asyncio
+async def test_process_completes_job_and_publishes_progress():
+    """Test a successful export completes the job and pushes progress."""
+    repository = ClipJobRepositoryImpl()
+    broker = FakeBroker()
+    worker = ClipJobWorker(repository, FakeExportService(delay=0.05), broker, progress_interval=0.01)
+    job, _ = await repository.enqueue(make_job())
+
+    await worker.process(await repository.claim(60))
+
+    assert job.status == ClipJobStatus.COMPLETED
+    assert job.storage_key.endswith(f"{job.id}.mp4")
+    events = [message for _, routing_key, message in broker.messages if routing_key == "clips.progress"]
+    assert [e["progress"] for e in events if e["status"] == "RUNNING"][:2] == [0.0, 50.0]
+    assert events[-1]["status"] == "COMPLETED"
+    assert all(e["tenant_id"] == "tenant-1" and e["clip_id"] == str(job.id) for e in events)
+
+
+@pytest.mark.asyncio
+async def test_failed_export_is_retried_then_failed():
+    """Test failures back off and become FAILED after max_attempts."""
+    repository = ClipJobRepositoryImpl()
+    worker = ClipJobWorker(
+        repository, FakeExportService(fail_times=5), max_attempts=2, retry_base_seconds=0
+    )
+    job, _ = await repository.enqueue(make_job())
+
+    await worker.process(await repository.claim(60))
+    assert job.status == ClipJobStatus.QUEUED
+
+    await worker.process(await repository.claim(60))
+    assert job.status == ClipJobStatus.FAILED
+    assert job.attempts == 2
+    assert "code 1" in job.error
+
+
+@pytest.mark.asyncio
+async def test_worker_bounds_concurrent_exports():
+    """Test no more than `concurrency` exports run at once."""
+    repository = ClipJobRepositoryImpl()
+    export_service = FakeExportService(delay=0.05)
+    worker = ClipJobWorker(repository, export_service, concurrency=2, poll_interval=0.01)
+    jobs = [(await repository.enqueue(make_job()))[0] for _ in range(5)]
+
+    await worker.start()
+    for _ in range(100):
+        if all(job.is_finished() for job in jobs):
+            break
+        await asyncio.sleep(0.02)
+    await worker.stop()
+
+    assert all(job.status == ClipJobStatus.COMPLETED for job in jobs)
+    assert export_service.peak == 2
+
+
+@pytest.mark.asyncio
+async def test_requeue_expired_lease():
+    """Test a job whose worker stopped heartbeating goes back to the queue."""
+    repository = ClipJobRepositoryImpl()
+    job, _ = await repository.enqueue(make_job())
+    await repository.claim(0)
+    await asyncio.sleep(0.01)
+
+    assert await repository.requeue_expired() == 1
+    assert job.status == ClipJobStatus.QUEUED
+    assert (await repository.claim(60)).id == job.id
+
+
+@pytest.mark.asyncio
+async def test_stale_claim_cannot_finish_requeued_job():
+    """Test a worker whose lease expired can't complete or fail the job claimed again."""
+    repository = ClipJobRepositoryImpl()
+    job, _ = await repository.enqueue(make_job())
+    await repository.claim(0)
+    stale_attempt = job.attempts
+    await asyncio.sleep(0.01)
+    await repository.requeue_expired()
+    await repository.claim(60)
+
+    assert not await repository.complete(job.id, stale_attempt, "bucket", "key", 1)
+    assert not await repository.fail(job.id, stale_attempt, "late")
+    assert not await repository.heartbeat(job.id, stale_attempt, 10.0, 60)
+    assert job.status == ClipJobStatus.RUNNING and job.storage_key is None
+    assert await repository.complete(job.id, job.attempts, "bucket", "key", 1)
+
+
+def test_clip_request_times_are_stored_as_naive_utc():
+    """Test times with an offset are converted for the TIMESTAMP columns of clip_jobs."""
+    request = CreateClipRequest(
+        camera_id=str(uuid4()),
+        start_time="2025-01-10T11:00:00-03:00",
+        end_time="2025-01-10T14:01:00",
+        reason="export"
+    )
+
+    assert request.start_time == START and request.start_time.tzinfo is None
+    assert request.end_time == START + timedelta(minutes=1)
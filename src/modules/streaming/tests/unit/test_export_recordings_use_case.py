@@ -0,0 +1,59 @@
+"""Tests for ExportRecordingsUseCase."""
+import csv
+import io
+import json
+import pytest
+from uuid import uuid4
+from datetime import datetime, timedelta
+from src.streaming.application.use_cases.export_recordings import ExportRecordingsUseCase, EXPORT_FIELDS
+from src.streaming.application.dtos.export_recordings_dto import ExportRecordingsDTO
+from src.streaming.domain.entities.recording import Recording
+from src.streaming.domain.value_objects.retention_policy import RetentionPolicy
+from src.streaming.infrastructure.persistence.recording_repository_impl import RecordingRepositoryImpl
+
+
+async def _repository(count, camera_id=None):
+    repository = RecordingRepositoryImpl()
+    for i in range(count):
+        await repository.save(Recording(
+            id=uuid4(),
+            stream_id=uuid4(),
+            retention_policy=RetentionPolicy(7),
+            started_at=datetime(2025, 1, 10) + timedelta(minutes=i),
+            camera_id=camera_id
+        ))
+    return repository
+
+
+async def _collect(use_case, dto):
+    return [chunk async for chunk in use_case.execute(dto)]
+
+
+@pytest.mark.asyncio
+async def test_export_ndjson_in_chunks():
+    """Test NDJSON export yields one chunk per batch."""
+    use_case = ExportRecordingsUseCase(await _repository(5))
+
+    chunks = await _collect(use_case, ExportRecordingsDTO(format="ndjson", batch_size=2))
+
+    assert len(chunks) == 3
+    rows = [json.loads(line) for line in "".join(chunks).splitlines()]
+    assert len(rows) == 5
+    assert list(rows[0]) == EXPORT_FIELDS
+    assert rows[0]["started_at"] > rows[-1]["started_at"]
+
+
+@pytest.mark.asyncio
+async def test_export_csv_with_filters():
+    """Test CSV export has a header and honors search filters."""
+    camera_id = uuid4()
+    repository = await _repository(3, camera_id=camera_id)
+    await repository.save(Recording(id=uuid4(), stream_id=uuid4(), retention_policy=RetentionPolicy(7)))
+    use_case = ExportRecordingsUseCase(repository)
+
+    chunks = await _collect(use_case, ExportRecordingsDTO(format="csv", camera_id=camera_id))
+
+    rows = list(csv.reader(io.StringIO("".join(chunks))))
+    assert rows[0] == EXPORT_FIELDS
+    assert len(rows) == 4
+    assert all(row[2] == str(camera_id) for row in rows[1:])
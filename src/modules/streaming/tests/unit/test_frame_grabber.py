@@ -0,0 +1,114 @@
+"""Tests for FrameGrabber."""
+import asyncio
+import sys
+
+import pytest
+
+from src.modules.streaming.infrastructure.external_services.frame_grabber import (
+    FrameGrabber,
+    FrameGrabError,
+    split_jpegs,
+)
+
+# Stands in for ffmpeg: streams numbered JPEG-looking frames, then idles
+FAKE_FFMPEG = """
+import sys, time
+for i in range(int(sys.argv[1])):
+    sys.stdout.buffer.write(b"\\xff\\xd8frame%d\\xff\\xd9" % i)
+    sys.stdout.flush()
+    time.sleep(0.01)
+time.sleep(30)
+"""
+
+
+def fake_ffmpeg(tmp_path, frames=3):
+    script = tmp_path / "ffmpeg.py"
+    script.write_text(FAKE_FFMPEG)
+    wrapper = tmp_path / "ffmpeg"
+    wrapper.write_text(f"#!/bin/sh\nexec {sys.executable} {script} {frames}\n")
+    wrapper.chmod(0o755)
+    return str(wrapper)
+
+
+def make_grabber(tmp_path, frames=3, **kwargs):
+    return FrameGrabber(
+        rtsp_base_url="rtsp://mediamtx:8554",
+        ffmpeg_binary=fake_ffmpeg(tmp_path, frames),
+        idle_seconds=60,
+        **kwargs
+    )
+
+
+def test_split_jpegs_keeps_partial_tail():
+    """Test complete images are cut out and a partial one is carried over."""
+    images, tail = split_jpegs(b"junk\xff\xd8a\xff\xd9\xff\xd8b\xff\xd9\xff\xd8c")
+
+    assert images == [b"\xff\xd8a\xff\xd9", b"\xff\xd8b\xff\xd9"]
+    assert tail == b"\xff\xd8c"
+    assert split_jpegs(tail + b"\xff\xd9") == ([b"\xff\xd8c\xff\xd9"], b"")
+
+
+def test_decoder_reads_mediamtx_path(tmp_path):
+    """Test the decoder pulls the MediaMTX path, not the camera, keyframes only."""
+    grabber = make_grabber(tmp_path, width=320)
+    path = grabber.path_for("tenant-1", "cam-1")
+
+    assert path == "tenant-1_cam-1_live"
+    assert grabber.source_url(path) == "rtsp://mediamtx:8554/tenant-1_cam-1_live"
+    assert FrameGrabber(hls_base_url="http://mediamtx:8888", source="hls").source_url(path) == (
+        "http://mediamtx:8888/tenant-1_cam-1_live/index.m3u8"
+    )
+
+
+@pytest.mark.asyncio
+async def test_grab_serves_latest_frame_from_one_decoder(tmp_path):
+    """Test repeated grabs share one decoder and return its newest frame."""
+    grabber = make_grabber(tmp_path)
+    try:
+        first = await grabber.grab("p1", timeout=5)
+        assert first.image.startswith(b"\xff\xd8frame")
+
+        decoder = grabber.decoders["p1"]
+        cmd = decoder.build_command()
+        assert cmd.index("-skip_frame") < cmd.index("-i")
+        assert cmd[cmd.index("-i") + 1] == "rtsp://mediamtx:8554/p1"
+
+        for _ in range(100):
+            if decoder.latest.image == b"\xff\xd8frame2\xff\xd9":
+                break
+            await asyncio.sleep(0.02)
+        latest = await grabber.grab("p1", timeout=0)
+        assert latest.image == b"\xff\xd8frame2\xff\xd9"
+        assert list(grabber.decoders) == ["p1"]
+    finally:
+        await grabber.stop()
+    assert grabber.decoders == {}
+
+
+@pytest.mark.asyncio
+async def test_grab_times_out_without_frames(tmp_path):
+    """Test a path that never yields a frame raises instead of hanging."""
+    grabber = make_grabber(tmp_path, frames=0)
+    try:
+        with pytest.raises(FrameGrabError):
+            await grabber.grab("p1", timeout=0.2)
+    finally:
+        await grabber.stop()
+
+
+@pytest.mark.asyncio
+async def test_idle_and_excess_decoders_are_stopped(tmp_path):
+    """Test idle decoders are reaped and the decoder cap evicts the least recently used."""
+    grabber = make_grabber(tmp_path, max_decoders=2)
+    try:
+        await grabber.grab("p1", timeout=5)
+        await grabber.grab("p2", timeout=5)
+        await grabber.grab("p1", timeout=5)
+        await grabber.grab("p3", timeout=5)
+        assert sorted(grabber.decoders) == ["p1", "p3"]
+
+        grabber.decoders["p1"].last_used -= 120
+        await grabber.reap_idle()
+        assert list(grabber.decoders) == ["p3"]
+    finally:
+        await grabber.stop()
@@ -0,0 +1,124 @@
+"""Tests for GenerateThumbnailsUseCase."""
+import pytest
+from uuid import uuid4
+from datetime import datetime, timedelta
+from src.shared.domain.domain_exception import DomainException
+from src.streaming.application.dtos.generate_thumbnails_dto import GenerateThumbnailsDTO
+from src.streaming.application.services.scrub_track import build_scrub_track, format_vtt_time
+from src.streaming.application.use_cases.generate_thumbnails import (
+    GenerateThumbnailsUseCase,
+    IMMUTABLE_CACHE_CONTROL,
+)
+from src.streaming.domain.entities.recording import Recording
+from src.streaming.domain.value_objects.retention_policy import RetentionPolicy
+from src.streaming.domain.value_objects.thumbnail import SpriteSheet, Thumbnail
+from src.streaming.infrastructure.persistence.recording_repository_impl import RecordingRepositoryImpl
+
+T0 = datetime(2025, 1, 10, 14, 0, 0)
+
+
+class FakeThumbnailService:
+    async def generate_thumbnail(self, video_path, offset_seconds, output_path):
+        return output_path
+
+    async def generate_thumbnails(self, video_path, start_time, end_time, interval_seconds=60):
+        return [Thumbnail(start_time + timedelta(seconds=k * interval_seconds), f"/tmp/{k:05d}.jpg") for k in range(3)]
+
+    async def generate_sprites(self, video_path, start_time, end_time, interval_seconds=60, columns=10):
+        return [
+            SpriteSheet("/tmp/sprites/000.jpg", start_time, interval_seconds, 60, 10, 6),
+            SpriteSheet("/tmp/sprites/001.jpg", start_time + timedelta(hours=1), interval_seconds, 30, 10, 6),
+        ]
+
+
+class FakeStorage:
+    def __init__(self):
+        self.uploads = {}
+
+    async def upload_file(self, local_path, remote_path, content_type=None, cache_control=None):
+        body = open(local_path).read() if local_path.endswith(".vtt") else None
+        self.uploads[remote_path] = (content_type, cache_control, body)
+        return f"s3://recordings/{remote_path}"
+
+    async def get_file_url(self, remote_path, expires_in=3600):
+        return f"http://minio/recordings/{remote_path}"
+
+
+async def _recording(stopped_at=T0 + timedelta(hours=1, minutes=30)):
+    repository = RecordingRepositoryImpl()
+    recording = Recording(
+        id=uuid4(),
+        stream_id=uuid4(),
+        retention_policy=RetentionPolicy(7),
+        started_at=T0,
+        stopped_at=stopped_at,
+        storage_path="/recordings/rec.mp4"
+    )
+    await repository.save(recording)
+    return repository, recording
+
+
+def test_format_vtt_time():
+    """Test WebVTT timestamps."""
+    assert format_vtt_time(3661.5) == "01:01:01.500"
+
+
+def test_scrub_track_maps_ranges_to_tiles():
+    """Test each interval maps to its tile and the track stops at the recording end."""
+    sheets = [SpriteSheet("a.jpg", T0, 60, 3, 2, 2)]
+
+    track = build_scrub_track(sheets, ["sprite_000.jpg"], T0, T0 + timedelta(seconds=150))
+
+    assert track.splitlines()[:9] == [
+        "WEBVTT",
+        "",
+        "00:00:00.000 --> 00:01:00.000",
+        "sprite_000.jpg#xywh=0,0,160,90",
+        "",
+        "00:01:00.000 --> 00:02:00.000",
+        "sprite_000.jpg#xywh=160,0,160,90",
+        "",
+        "00:02:00.000 --> 00:02:30.000",
+    ]
+    assert track.splitlines()[9] == "sprite_000.jpg#xywh=0,90,160,90"
+
+
+@pytest.mark.asyncio
+async def test_images_mode_stamps_each_thumbnail():
+    """Test thumbnails keep their own timestamps."""
+    repository, recording = await _recording()
+    use_case = GenerateThumbnailsUseCase(repository, FakeThumbnailService())
+
+    results = await use_case.execute(GenerateThumbnailsDTO(recording_id=recording.id))
+
+    assert [r.timestamp for r in results] == [T0, T0 + timedelta(minutes=1), T0 + timedelta(minutes=2)]
+
+
+@pytest.mark.asyncio
+async def test_sprite_mode_uploads_sheets_and_track_with_cache_headers():
+    """Test sprite mode stores sheets plus a WebVTT track, all immutable."""
+    repository, recording = await _recording()
+    storage = FakeStorage()
+    use_case = GenerateThumbnailsUseCase(repository, FakeThumbnailService(), storage)
+
+    result = await use_case.execute(GenerateThumbnailsDTO(recording_id=recording.id, mode="sprite"))
+
+    prefix = f"thumbnails/{recording.id}/60s"
+    assert [s.path for s in result.sprites] == [f"{prefix}/sprite_000.jpg", f"{prefix}/sprite_001.jpg"]
+    assert result.vtt_path == f"{prefix}/scrub.vtt"
+    assert storage.uploads[f"{prefix}/sprite_000.jpg"][:2] == ("image/jpeg", IMMUTABLE_CACHE_CONTROL)
+    content_type, cache_control, track = storage.uploads[result.vtt_path]
+    assert (content_type, cache_control) == ("text/vtt", IMMUTABLE_CACHE_CONTROL)
+    cues = [line for line in track.splitlines() if "#xywh=" in line]
+    assert len(cues) == 90
+    assert cues[60] == "sprite_001.jpg#xywh=0,0,160,90"
+
+
+@pytest.mark.asyncio
+async def test_sprite_mode_rejects_recording_in_progress():
+    """Test sprites are only built for finished recordings."""
+    repository, recording = await _recording(stopped_at=None)
+    use_case = GenerateThumbnailsUseCase(repository, FakeThumbnailService(), FakeStorage())
+
+    with pytest.raises(DomainException):
+        await use_case.execute(GenerateThumbnailsDTO(recording_id=recording.id, mode="sprite"))
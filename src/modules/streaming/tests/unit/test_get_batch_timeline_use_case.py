@@ -0,0 +1,93 @@
+"""Tests for GetBatchTimelineUseCase."""
+import pytest
+from uuid import uuid4
+from datetime import datetime, timedelta
+from src.streaming.application.use_cases.get_batch_timeline import GetBatchTimelineUseCase
+from src.streaming.application.dtos.get_batch_timeline_dto import GetBatchTimelineDTO
+from src.streaming.domain.entities.recording import Recording
+from src.streaming.domain.entities.recording_segment import RecordingSegment
+from src.streaming.domain.value_objects.retention_policy import RetentionPolicy
+from src.streaming.infrastructure.persistence.recording_repository_impl import RecordingRepositoryImpl
+from src.streaming.infrastructure.persistence.segment_repository_impl import SegmentRepositoryImpl
+
+
+@pytest.mark.asyncio
+async def test_batch_timeline_run_length_encoding():
+    """Test coverage of several streams is returned as run-length encoding."""
+    start_date = datetime(2025, 1, 10, 0, 0, 0)
+    end_date = start_date + timedelta(hours=4)
+    full_stream = uuid4()
+    partial_stream = uuid4()
+    empty_stream = uuid4()
+    
+    recording_repository = RecordingRepositoryImpl()
+    await recording_repository.save(Recording(
+        id=uuid4(),
+        stream_id=full_stream,
+        retention_policy=RetentionPolicy(7),
+        started_at=start_date - timedelta(hours=1),
+        stopped_at=end_date
+    ))
+    await recording_repository.save(Recording(
+        id=uuid4(),
+        stream_id=partial_stream,
+        retention_policy=RetentionPolicy(7),
+        started_at=start_date + timedelta(hours=1),
+        stopped_at=start_date + timedelta(hours=2)
+    ))
+    
+    dto = GetBatchTimelineDTO(
+        stream_ids=[full_stream, partial_stream, empty_stream],
+        start_date=start_date,
+        end_date=end_date,
+        buckets=4
+    )
+    result = await GetBatchTimelineUseCase(recording_repository).execute(dto)
+    
+    assert result.bucket_seconds == 3600
+    assert result.timelines[str(full_stream)]["runs"] == [[1, 4]]
+    assert result.timelines[str(full_stream)]["has_gaps"] is False
+    assert result.timelines[str(partial_stream)]["runs"] == [[0, 1], [1, 1], [0, 2]]
+    assert result.timelines[str(partial_stream)]["total_duration_seconds"] == 3600
+    assert result.timelines[str(empty_stream)]["runs"] == [[0, 4]]
+
+
+@pytest.mark.asyncio
+async def test_batch_timeline_merges_open_recordings_with_catalog():
+    """Test cataloged streams also count their open recording, and stopped ones are not read twice."""
+    start_date = datetime.utcnow() - timedelta(hours=2)
+    end_date = start_date + timedelta(hours=2)
+    stream_id = uuid4()
+    recording_repository = RecordingRepositoryImpl()
+    segment_repository = SegmentRepositoryImpl()
+    stopped = Recording(
+        id=uuid4(),
+        stream_id=stream_id,
+        retention_policy=RetentionPolicy(7),
+        started_at=start_date,
+        stopped_at=start_date + timedelta(minutes=30)
+    )
+    live = Recording(
+        id=uuid4(),
+        stream_id=stream_id,
+        retention_policy=RetentionPolicy(7),
+        started_at=start_date + timedelta(hours=1)
+    )
+    for recording in (stopped, live):
+        await recording_repository.save(recording)
+    # Only the first 10 minutes of the stopped recording were cataloged
+    await segment_repository.save(RecordingSegment(
+        id=uuid4(),
+        stream_id=stream_id,
+        recording_id=stopped.id,
+        start_time=start_date,
+        end_time=start_date + timedelta(minutes=10),
+        storage_path=f"{stream_id}/segments/000.mp4"
+    ))
+    
+    dto = GetBatchTimelineDTO(stream_ids=[stream_id], start_date=start_date, end_date=end_date, buckets=4)
+    result = await GetBatchTimelineUseCase(recording_repository, segment_repository).execute(dto)
+    
+    timeline = result.timelines[str(stream_id)]
+    assert 10 * 60 + 59 * 60 <= timeline["total_duration_seconds"] <= 10 * 60 + 60 * 60
+    assert timeline["runs"][-1] == [1, 2]
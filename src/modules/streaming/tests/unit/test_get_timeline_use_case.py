@@ -5,8 +5,10 @@ from datetime import datetime, timedelta
 from src.streaming.application.use_cases.get_timeline import GetTimelineUseCase
 from src.streaming.application.dtos.get_timeline_dto import GetTimelineDTO
 from src.streaming.domain.entities.recording import Recording
+from src.streaming.domain.entities.recording_segment import RecordingSegment
 from src.streaming.domain.value_objects.retention_policy import RetentionPolicy
 from src.streaming.infrastructure.persistence.recording_repository_impl import RecordingRepositoryImpl
+from src.streaming.infrastructure.persistence.segment_repository_impl import SegmentRepositoryImpl
 from src.shared.domain.domain_exception import DomainException
 
 
@@ -52,3 +54,86 @@ async def test_get_timeline_no_recordings():
     
     with pytest.raises(DomainException, match="No recordings found"):
         await use_case.execute(dto)
+
+
+@pytest.mark.asyncio
+async def test_get_timeline_reports_gaps():
+    """Test gaps between recordings are returned as segments."""
+    stream_id = uuid4()
+    start_date = datetime.utcnow() - timedelta(hours=4)
+    end_date = start_date + timedelta(hours=3)
+    
+    recording_repository = RecordingRepositoryImpl()
+    for offset in (0, 2):
+        await recording_repository.save(Recording(
+            id=uuid4(),
+            stream_id=stream_id,
+            retention_policy=RetentionPolicy(7),
+            started_at=start_date + timedelta(hours=offset),
+            stopped_at=start_date + timedelta(hours=offset + 1)
+        ))
+    
+    dto = GetTimelineDTO(stream_id=stream_id, start_date=start_date, end_date=end_date)
+    result = await GetTimelineUseCase(recording_repository).execute(dto)
+    
+    assert [s["has_recording"] for s in result.segments] == [True, False, True]
+    assert result.has_gaps is True
+    assert result.total_duration_seconds == 7200
+
+
+@pytest.mark.asyncio
+async def test_get_timeline_with_resolution():
+    """Test timeline aggregation by resolution."""
+    stream_id = uuid4()
+    start_date = datetime.utcnow() - timedelta(days=2)
+    end_date = start_date + timedelta(days=1)
+    
+    recording_repository = RecordingRepositoryImpl()
+    await recording_repository.save(Recording(
+        id=uuid4(),
+        stream_id=stream_id,
+        retention_policy=RetentionPolicy(7),
+        started_at=start_date,
+        stopped_at=end_date
+    ))
+    
+    dto = GetTimelineDTO(
+        stream_id=stream_id,
+        start_date=start_date,
+        end_date=end_date,
+        resolution="hour"
+    )
+    result = await GetTimelineUseCase(recording_repository).execute(dto)
+    
+    assert result.bucket_seconds == 3600
+    assert len(result.segments) == 1
+    assert result.has_gaps is False
+
+
+@pytest.mark.asyncio
+async def test_get_timeline_adds_open_recording_to_catalog():
+    """Test the open recording covers the segment still being written."""
+    stream_id = uuid4()
+    started_at = datetime.utcnow() - timedelta(minutes=30)
+    recording_repository = RecordingRepositoryImpl()
+    segment_repository = SegmentRepositoryImpl()
+    recording = Recording(
+        id=uuid4(),
+        stream_id=stream_id,
+        retention_policy=RetentionPolicy(7),
+        started_at=started_at
+    )
+    await recording_repository.save(recording)
+    await segment_repository.save(RecordingSegment(
+        id=uuid4(),
+        stream_id=stream_id,
+        recording_id=recording.id,
+        start_time=started_at,
+        end_time=started_at + timedelta(minutes=10),
+        storage_path=f"{stream_id}/segments/000.mp4"
+    ))
+    
+    dto = GetTimelineDTO(stream_id=stream_id, start_date=started_at, end_date=started_at + timedelta(hours=1))
+    result = await GetTimelineUseCase(recording_repository, segment_repository).execute(dto)
+    
+    assert result.total_duration_seconds >= 29 * 60
@@ -0,0 +1,125 @@
+"""Tests for MultipartUpload."""
+import asyncio
+import sys
+import threading
+import time
+
+import pytest
+
+from src.modules.streaming.infrastructure.external_services.clip_engine import (
+    ClipEngine,
+    ClipExtractionError,
+)
+from src.modules.streaming.infrastructure.external_services.multipart_upload import MultipartUpload
+
+MB = 1024 * 1024
+
+
+class FakeS3:
+    """Records multipart calls; upload_part blocks briefly like a network call."""
+
+    def __init__(self, fail_part: int = 0) -> None:
+        self.fail_part = fail_part
+        self.parts = {}
+        self.completed = None
+        self.aborted = False
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self._lock = threading.Lock()
+
+    def create_multipart_upload(self, **kwargs):
+        return {"UploadId": "upload-1"}
+
+    def upload_part(self, PartNumber, Body, **kwargs):
+        with self._lock:
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        time.sleep(0.02)
+        with self._lock:
+            self.in_flight -= 1
+        if PartNumber == self.fail_part:
+            raise IOError("connection reset")
+        self.parts[PartNumber] = Body
+        return {"ETag": f'"etag-{PartNumber}"'}
+
+    def complete_multipart_upload(self, MultipartUpload, **kwargs):
+        self.completed = MultipartUpload["Parts"]
+
+    def abort_multipart_upload(self, **kwargs):
+        self.aborted = True
+
+
+def stream_of(data: bytes) -> asyncio.StreamReader:
+    stream = asyncio.StreamReader()
+    stream.feed_data(data)
+    stream.feed_eof()
+    return stream
+
+
+@pytest.mark.asyncio
+async def test_uploads_parts_in_order_with_bounded_in_flight():
+    """Test the stream is split into parts and completed in order."""
+    s3 = FakeS3()
+    data = bytes(range(256)) * (23 * MB // 256)
+
+    async with MultipartUpload(s3, "clips", "c.mp4", part_size=5 * MB, max_in_flight=2) as upload:
+        written = await upload.write_from(stream_of(data))
+
+    assert written == len(data)
+    assert [p["PartNumber"] for p in s3.completed] == [1, 2, 3, 4, 5]
+    assert b"".join(s3.parts[n] for n in range(1, 6)) == data
+    assert s3.peak_in_flight <= 2
+    assert not s3.aborted
+
+
+@pytest.mark.asyncio
+async def test_empty_stream_uploads_one_part():
+    """Test an empty stream still produces a valid upload."""
+    s3 = FakeS3()
+
+    async with MultipartUpload(s3, "clips", "c.mp4") as upload:
+        assert await upload.write_from(stream_of(b"")) == 0
+
+    assert s3.completed == [{"PartNumber": 1, "ETag": '"etag-1"'}]
+
+
+@pytest.mark.asyncio
+async def test_part_failure_aborts_upload():
+    """Test a failed part aborts instead of completing."""
+    s3 = FakeS3(fail_part=2)
+
+    with pytest.raises(IOError):
+        async with MultipartUpload(s3, "clips", "c.mp4", part_size=5 * MB) as upload:
+            await upload.write_from(stream_of(b"x" * 12 * MB))
+
+    assert s3.aborted
+    assert s3.completed is None
+
+
+@pytest.mark.asyncio
+async def test_pipes_process_output_into_upload():
+    """Test process stdout is uploaded while the process runs."""
+    s3 = FakeS3()
+    engine = ClipEngine(max_workers=1)
+    script = "import sys; sys.stdout.buffer.write(b'm' * (6 * 1024 * 1024))"
+
+    async with MultipartUpload(s3, "clips", "c.mp4", part_size=5 * MB) as upload:
+        written = await engine.run([sys.executable, "-c", script], upload.write_from)
+
+    assert written == 6 * MB
+    assert len(s3.completed) == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_process_aborts_upload():
+    """Test a non-zero exit aborts even though all output was read."""
+    s3 = FakeS3()
+    engine = ClipEngine(max_workers=1)
+    script = "import sys; sys.stdout.buffer.write(b'partial'); sys.exit(1)"
+
+    with pytest.raises(ClipExtractionError):
+        async with MultipartUpload(s3, "clips", "c.mp4") as upload:
+            await engine.run([sys.executable, "-c", script], upload.write_from)
+
+    assert s3.aborted
+    assert s3.completed is None
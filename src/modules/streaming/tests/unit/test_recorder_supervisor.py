@@ -0,0 +1,137 @@
+"""Tests for RecorderSupervisor."""
+import asyncio
+import sys
+import pytest
+from uuid import uuid4
+from src.streaming.infrastructure.external_services.recorder_supervisor import (
+    FFmpegProgress,
+    RecorderState,
+    RecorderSupervisor,
+    compute_backoff,
+)
+
+PROGRESS_SCRIPT = (
+    "import sys, time\n"
+    "sys.stderr.write('x' * 200000)\n"
+    "print('frame=250\\nfps=25.00\\nbitrate=2048.5kbits/s\\ndrop_frames=3\\n"
+    "out_time_us=10000000\\nspeed=1.01x\\nprogress=continue', flush=True)\n"
+    "time.sleep(30)\n"
+)
+
+
+def test_progress_parsing():
+    """Test ffmpeg progress block parsing."""
+    progress = FFmpegProgress()
+    progress.update({
+        "frame": "250",
+        "fps": "25.00",
+        "bitrate": "2048.5kbits/s",
+        "drop_frames": "3",
+        "out_time_us": "10000000",
+        "speed": "1.01x",
+        "progress": "continue"
+    })
+
+    assert progress.frame == 250
+    assert progress.fps == 25.0
+    assert progress.bitrate_kbps == 2048.5
+    assert progress.drop_frames == 3
+    assert progress.out_time_seconds == 10.0
+    assert progress.speed == 1.01
+
+
+def test_progress_keeps_previous_values_on_na():
+    """Test N/A values do not reset progress."""
+    progress = FFmpegProgress()
+    progress.update({"fps": "25.0", "bitrate": "1000kbits/s"})
+    progress.update({"fps": "N/A", "bitrate": "N/A"})
+
+    assert progress.fps == 25.0
+    assert progress.bitrate_kbps == 1000.0
+
+
+def test_backoff_is_capped_and_jittered():
+    """Test backoff grows exponentially up to the cap."""
+    for attempt in range(1, 12):
+        delay = compute_backoff(attempt, 1.0, 30.0)
+        expected = min(30.0, 2 ** (attempt - 1))
+        assert expected * 0.5 <= delay <= expected
+
+
+@pytest.mark.asyncio
+async def test_recorder_reports_progress_and_drains_stderr():
+    """Test recorder becomes RUNNING with a full stderr pipe."""
+    supervisor = RecorderSupervisor(max_recorders=2)
+    recording_id = uuid4()
+
+    assert await supervisor.start(recording_id, [sys.executable, "-c", PROGRESS_SCRIPT])
+    health = await supervisor.wait_until_running(recording_id, timeout=10)
+
+    assert health["state"] == RecorderState.RUNNING.value
+    assert health["progress"]["fps"] == 25.0
+    assert health["progress"]["drop_frames"] == 3
+    assert supervisor.is_running(recording_id)
+
+    assert await supervisor.stop(recording_id)
+    assert supervisor.health(recording_id) is None
+
+
+@pytest.mark.asyncio
+async def test_recorder_gives_up_after_max_restarts():
+    """Test crashing recorder is restarted, marked FAILED and dropped."""
+    failed = []
+
+    async def on_failed(recording_id, health):
+        failed.append((recording_id, health))
+
+    supervisor = RecorderSupervisor(
+        backoff_base_seconds=0.01,
+        backoff_max_seconds=0.02,
+        max_restarts=2,
+        on_failed=on_failed
+    )
+    recording_id = uuid4()
+
+    await supervisor.start(recording_id, [sys.executable, "-c", "import sys; sys.exit(3)"])
+    await asyncio.wait_for(supervisor.recorders[recording_id].task, timeout=10)
+
+    assert failed and failed[0][0] == recording_id
+    health = failed[0][1]
+    assert health["state"] == RecorderState.FAILED.value
+    assert health["restarts"] == 2
+    assert health["last_exit_code"] == 3
+    assert supervisor.health(recording_id) is None
+    assert supervisor.health_all() == []
+
+
+@pytest.mark.asyncio
+async def test_failed_recorder_frees_its_slot():
+    """Test a recorder that gave up does not block new recordings."""
+    supervisor = RecorderSupervisor(
+        max_recorders=1,
+        backoff_base_seconds=0.01,
+        backoff_max_seconds=0.02,
+        max_restarts=1
+    )
+    recording_id = uuid4()
+
+    assert await supervisor.start(recording_id, [sys.executable, "-c", "import sys; sys.exit(1)"])
+    await asyncio.wait_for(supervisor.recorders[recording_id].task, timeout=10)
+
+    assert recording_id not in supervisor.recorders
+    assert await supervisor.start(uuid4(), [sys.executable, "-c", "import time; time.sleep(30)"])
+
+    await supervisor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_recorder_limit():
+    """Test supervisor rejects recorders beyond the node cap."""
+    supervisor = RecorderSupervisor(max_recorders=1)
+    cmd = [sys.executable, "-c", "import time; time.sleep(30)"]
+
+    assert await supervisor.start(uuid4(), cmd)
+    assert not await supervisor.start(uuid4(), cmd)
+
+    await supervisor.shutdown()
+    assert supervisor.active_count() == 0
@@ -0,0 +1,236 @@
+"""Tests for RecordingLifecycle."""
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from botocore.exceptions import ClientError
+
+from src.modules.streaming.domain.repositories.retention_repository import ExpiredRecording
+from src.modules.streaming.infrastructure.external_services.recording_lifecycle import (
+    RecordingLifecycle,
+    recordings_bucket,
+)
+from src.modules.streaming.infrastructure.persistence.retention_repository_impl import RetentionRepositoryImpl
+from src.modules.streaming.infrastructure.workers.retention_cleanup import RetentionCleanup
+
+NOW = datetime(2025, 2, 1, 3, 0, 0)
+TENANT = uuid4()
+BUCKET = recordings_bucket(TENANT)
+
+
+def make_recording(expires_at, retention_days=7, keys=2, tenant_id=TENANT):
+    recording_id = uuid4()
+    return ExpiredRecording(
+        id=recording_id,
+        tenant_id=tenant_id,
+        camera_id=uuid4(),
+        started_at=datetime(2025, 1, 20, 23, 30),
+        expires_at=expires_at,
+        retention_days=retention_days,
+        size_bytes=100,
+        object_keys=[f"{recording_id}/{i:03d}.mp4" for i in range(keys)]
+    )
+
+
+class FakeS3:
+    """Buckets with their objects and lifecycle configuration kept in dicts."""
+
+    def __init__(self, rules=None, failing_copies=(), buckets=(BUCKET,), broken_buckets=()):
+        self.buckets = {bucket: {} for bucket in buckets}
+        self.rules = {bucket: rules for bucket in buckets}
+        self.broken_buckets = set(broken_buckets)
+        self.puts = 0
+        self.failing_copies = set(failing_copies)
+        self.deleted = []
+
+    @property
+    def objects(self):
+        return self.buckets[BUCKET]
+
+    def list_buckets(self):
+        return {"Buckets": [{"Name": bucket} for bucket in self.buckets]}
+
+    def get_bucket_lifecycle_configuration(self, Bucket):
+        if Bucket in self.broken_buckets:
+            raise ClientError({"Error": {"Code": "AccessDenied"}}, "GetBucketLifecycleConfiguration")
+        if self.rules[Bucket] is None:
+            raise ClientError({"Error": {"Code": "NoSuchLifecycleConfiguration"}}, "GetBucketLifecycleConfiguration")
+        return {"Rules": list(self.rules[Bucket])}
+
+    def put_bucket_lifecycle_configuration(self, Bucket, LifecycleConfiguration):
+        self.puts += 1
+        self.rules[Bucket] = LifecycleConfiguration["Rules"]
+
+    def copy_object(self, Bucket, Key, CopySource):
+        objects = self.buckets[CopySource["Bucket"]]
+        source = CopySource["Key"]
+        if source in self.failing_copies or source not in objects:
+            raise ClientError({"Error": {"Code": "NoSuchKey"}}, "CopyObject")
+        self.buckets[Bucket][Key] = objects[source]
+
+    def delete_objects(self, Bucket, Delete):
+        keys = [o["Key"] for o in Delete["Objects"]]
+        self.deleted.extend(keys)
+        for key in keys:
+            self.buckets[Bucket].pop(key, None)
+        return {}
+
+
+def store(s3, repository, recording, **flags):
+    repository.add(recording, **flags)
+    for key in recording.object_keys:
+        s3.buckets[recordings_bucket(recording.tenant_id)][key] = b"segment"
+
+
+async def arranged(lifecycle, now=NOW):
+    await lifecycle.reconcile_rules()
+    return await lifecycle.arrange(now)
+
+
+@pytest.mark.asyncio
+async def test_reconcile_rules_installs_once_and_keeps_other_rules():
+    """Test one rule per class is installed next to foreign rules, and only when something changed."""
+    foreign = {"ID": "abort-multipart", "Status": "Enabled", "Filter": {"Prefix": ""},
+               "AbortIncompleteMultipartUpload": {"DaysAfterInitiation": 1}}
+    s3 = FakeS3(rules=[foreign], buckets=(BUCKET, f"gtvision-clips-{TENANT}"))
+    lifecycle = RecordingLifecycle(s3, RetentionRepositoryImpl(), grace_days=1)
+
+    assert await lifecycle.reconcile_rules() == [BUCKET]
+    rules = {rule["ID"]: rule for rule in s3.rules[BUCKET]}
+    assert rules["abort-multipart"] == foreign
+    assert rules["gtv-retention-7d"]["Filter"] == {"Prefix": "retention-7d/"}
+    assert [rules[f"gtv-retention-{d}d"]["Expiration"]["Days"] for d in (7, 15, 30)] == [8, 16, 31]
+
+    assert await lifecycle.reconcile_rules() == []
+    assert s3.puts == 1
+
+
+@pytest.mark.asyncio
+async def test_reconcile_rules_follows_plan_changes():
+    """Test a new plan gets its rule and a dropped plan keeps its rule for the recordings left in it."""
+    s3 = FakeS3()
+    lifecycle = RecordingLifecycle(s3, RetentionRepositoryImpl(), buckets=[BUCKET], allowed_days=[7, 15])
+    await lifecycle.reconcile_rules()
+
+    lifecycle.allowed_days = [7, 15, 30]
+    assert await lifecycle.reconcile_rules() == [BUCKET]
+    assert [rule["ID"] for rule in s3.rules[BUCKET]] == ["gtv-retention-7d", "gtv-retention-15d", "gtv-retention-30d"]
+
+    lifecycle.allowed_days = [15, 30]
+    assert await lifecycle.reconcile_rules() == []
+    assert "gtv-retention-7d" in {rule["ID"] for rule in s3.rules[BUCKET]}
+
+
+@pytest.mark.asyncio
+async def test_reconcile_rules_creates_missing_configuration():
+    """Test a bucket without lifecycle configuration gets our rules."""
+    s3 = FakeS3()
+    lifecycle = RecordingLifecycle(s3, RetentionRepositoryImpl(), grace_days=0)
+
+    await lifecycle.reconcile_rules()
+    assert [rule["Expiration"]["Days"] for rule in s3.rules[BUCKET]] == [7, 15, 30]
+
+
+@pytest.mark.asyncio
+async def test_arrange_moves_segments_under_class_and_hold_prefixes():
+    """Test segments are moved under their class/date prefix, held ones under legal-hold, and back on release."""
+    s3 = FakeS3()
+    repository = RetentionRepositoryImpl()
+    live = make_recording(NOW + timedelta(days=3), retention_days=15)
+    held = make_recording(NOW + timedelta(days=3))
+    expired = make_recording(NOW - timedelta(days=1))
+    for recording, flags in ((live, {}), (held, {"legal_hold": True}), (expired, {})):
+        store(s3, repository, recording, **flags)
+    lifecycle = RecordingLifecycle(s3, repository, chunk_size=2)
+
+    assert await arranged(lifecycle) == 4
+    assert repository.object_keys(live.id) == [f"retention-15d/2025/01/20/{key}" for key in live.object_keys]
+    assert repository.object_keys(held.id) == [f"legal-hold/2025/01/20/{key}" for key in held.object_keys]
+    # Expired and not held: left for the cleanup
+    assert repository.object_keys(expired.id) == expired.object_keys
+    assert set(s3.objects) == set(
+        repository.object_keys(live.id) + repository.object_keys(held.id) + expired.object_keys
+    )
+    assert await lifecycle.arrange(NOW) == 0
+
+    repository.set_hold(held.id, False)
+    assert await lifecycle.arrange(NOW) == 2
+    assert repository.object_keys(held.id) == [f"retention-7d/2025/01/20/{key}" for key in held.object_keys]
+
+
+@pytest.mark.asyncio
+async def test_arrange_moves_within_each_tenant_bucket_with_rules():
+    """Test segments move inside their tenant's bucket, and stay put where the rules couldn't be installed."""
+    other_tenant, broken_tenant = uuid4(), uuid4()
+    s3 = FakeS3(buckets=(BUCKET, recordings_bucket(other_tenant), recordings_bucket(broken_tenant)),
+                broken_buckets=(recordings_bucket(broken_tenant),))
+    repository = RetentionRepositoryImpl()
+    mine = make_recording(NOW + timedelta(days=3))
+    other = make_recording(NOW + timedelta(days=3), tenant_id=other_tenant)
+    stuck = make_recording(NOW + timedelta(days=3), tenant_id=broken_tenant)
+    for recording in (mine, other, stuck):
+        store(s3, repository, recording)
+
+    assert await arranged(RecordingLifecycle(s3, repository)) == 4
+    assert set(s3.buckets[BUCKET]) == set(repository.object_keys(mine.id))
+    assert set(s3.buckets[recordings_bucket(other_tenant)]) == set(repository.object_keys(other.id))
+    assert all(key.startswith("retention-7d/") for key in repository.object_keys(other.id))
+    assert repository.object_keys(stuck.id) == stuck.object_keys
+    assert set(s3.buckets[recordings_bucket(broken_tenant)]) == set(stuck.object_keys)
+
+
+@pytest.mark.asyncio
+async def test_segments_of_a_running_recording_expire_before_their_objects():
+    """Test a 24/7 recording loses each arranged segment row at its own retention, held ones stay."""
+    recording = make_recording(datetime.max, keys=3)  # never stopped
+    held = make_recording(datetime.max, keys=1)
+    starts = [NOW - timedelta(days=8), NOW - timedelta(days=7), NOW - timedelta(days=6, hours=23)]
+    s3 = FakeS3()
+    repository = RetentionRepositoryImpl()
+    store(s3, repository, recording, segment_starts=starts)
+    store(s3, repository, held, legal_hold=True, segment_starts=starts[:1])
+    unarranged = make_recording(datetime.max, keys=1)
+    repository.add(unarranged, segment_starts=starts[:1])  # object not in the bucket: copy fails
+    lifecycle = RecordingLifecycle(s3, repository, chunk_size=1)
+    await arranged(lifecycle)
+    keys = repository.object_keys(recording.id)
+
+    assert await lifecycle.expire_segments(NOW) == 2
+    assert repository.object_keys(recording.id) == keys[2:]
+    assert len(repository.object_keys(held.id)) == 1
+    assert repository.object_keys(unarranged.id) == unarranged.object_keys
+
+
+@pytest.mark.asyncio
+async def test_arrange_keeps_segments_whose_copy_failed():
+    """Test a failed copy leaves the segment row and object untouched."""
+    recording = make_recording(NOW + timedelta(days=3))
+    s3 = FakeS3(failing_copies=recording.object_keys[:1])
+    repository = RetentionRepositoryImpl()
+    store(s3, repository, recording)
+    lifecycle = RecordingLifecycle(s3, repository)
+
+    assert await arranged(lifecycle) == 1
+    first, second = repository.object_keys(recording.id)
+    assert first == recording.object_keys[0] and first in s3.objects
+    assert second.startswith("retention-7d/")
+    assert s3.deleted == recording.object_keys[1:]
+
+
+@pytest.mark.asyncio
+async def test_cleanup_leaves_lifecycle_objects_to_the_bucket():
+    """Test the cleanup only marks rows for objects a lifecycle rule expires."""
+    s3 = FakeS3()
+    repository = RetentionRepositoryImpl()
+    recording = make_recording(NOW + timedelta(days=1))
+    legacy = make_recording(NOW - timedelta(hours=1))
+    store(s3, repository, recording)
+    store(s3, repository, legacy)
+    await arranged(RecordingLifecycle(s3, repository))
+    s3.deleted.clear()
+
+    stats = await RetentionCleanup(repository, s3).run(NOW + timedelta(days=2))
+
+    assert stats.deleted == 2
+    assert set(repository.deleted) == {recording.id, legacy.id}
+    assert s3.deleted == legacy.object_keys
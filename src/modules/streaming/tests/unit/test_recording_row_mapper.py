@@ -0,0 +1,63 @@
+"""Tests for RecordingRowMapper."""
+import pytest
+from uuid import uuid4
+from datetime import datetime, timedelta
+from decimal import Decimal
+from src.streaming.infrastructure.persistence.recording_row_mapper import RecordingRowMapper
+
+
+def _row(**overrides):
+    started_at = datetime(2025, 1, 10, 8, 0, 0)
+    row = {
+        "id": uuid4(),
+        "stream_id": uuid4(),
+        "camera_id": uuid4(),
+        "tenant_id": uuid4(),
+        "retention_days": 15,
+        "status": "STOPPED",
+        "started_at": started_at,
+        "stopped_at": started_at + timedelta(hours=1),
+        "storage_path": "/recordings/a.mp4",
+        "file_size_mb": Decimal("12.50"),
+        "duration_seconds": 3600
+    }
+    row.update(overrides)
+    return row
+
+
+def test_to_entity_hydrates_all_fields():
+    """Test hydrated entities match the row without running __init__ defaults."""
+    row = _row()
+    recording = RecordingRowMapper().to_entity(row)
+
+    assert recording.id == row["id"]
+    assert recording.camera_id == row["camera_id"]
+    assert recording.tenant_id == row["tenant_id"]
+    assert recording.retention_policy.days == 15
+    assert recording.status.value == "STOPPED"
+    assert recording.file_size_mb == 12.5
+    assert recording.created_at == row["started_at"]
+    assert recording.updated_at == row["stopped_at"]
+    assert not recording.is_active()
+    with pytest.raises(AttributeError):
+        recording.unknown_attribute = 1
+
+
+def test_value_objects_are_shared():
+    """Test status and retention policy instances are cached per value."""
+    mapper = RecordingRowMapper()
+    first, second = mapper.to_entities([_row(), _row()])
+
+    assert first.retention_policy is second.retention_policy
+    assert first.status is second.status
+    assert len(mapper.retention_policy) == 1
+
+
+def test_to_read_model_defaults_nulls():
+    """Test read models coerce NULL size and duration like entities do."""
+    model = RecordingRowMapper().to_read_model(_row(file_size_mb=None, duration_seconds=None))
+
+    assert model.status == "STOPPED"
+    assert model.retention_days == 15
+    assert model.file_size_mb == 0.0
+    assert model.duration_seconds == 0
@@ -0,0 +1,42 @@
+"""Tests for ORJSONResponse."""
+import json
+from uuid import uuid4
+from datetime import datetime
+from decimal import Decimal
+from src.streaming.domain.entities.recording import Recording
+from src.streaming.domain.value_objects.retention_policy import RetentionPolicy
+from src.streaming.infrastructure.web.responses import ORJSONResponse
+
+
+def test_orjson_response_renders_native_values():
+    """Test UUID and datetime values render like the previous str()/isoformat() response."""
+    started_at = datetime(2025, 1, 10, 8, 0, 0, 123456)
+    recording = Recording(
+        id=uuid4(),
+        stream_id=uuid4(),
+        retention_policy=RetentionPolicy(15),
+        started_at=started_at
+    )
+
+    body = json.loads(ORJSONResponse({
+        "recording_id": recording.id,
+        "stream_id": recording.stream_id,
+        "status": recording.status.value,
+        "started_at": recording.started_at,
+        "stopped_at": recording.stopped_at
+    }).body)
+
+    assert body == {
+        "recording_id": str(recording.id),
+        "stream_id": str(recording.stream_id),
+        "status": "RECORDING",
+        "started_at": started_at.isoformat(),
+        "stopped_at": None
+    }
+
+
+def test_orjson_response_serializes_decimal():
+    """Test Decimal values are rendered as numbers."""
+    body = json.loads(ORJSONResponse({"file_size_mb": Decimal("12.50")}).body)
+
+    assert body == {"file_size_mb": 12.5}
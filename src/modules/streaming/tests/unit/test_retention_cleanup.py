@@ -0,0 +1,159 @@
+"""Tests for RetentionCleanup."""
+import threading
+import time
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+from src.modules.streaming.domain.repositories.retention_repository import ExpiredRecording
+from src.modules.streaming.infrastructure.external_services.recording_lifecycle import recordings_bucket
+from src.modules.streaming.infrastructure.persistence.retention_repository_impl import RetentionRepositoryImpl
+from src.modules.streaming.infrastructure.workers.retention_cleanup import RetentionCleanup
+
+NOW = datetime(2025, 2, 1, 3, 0, 0)
+
+
+def make_recording(days_ago=1, keys=2, size=100, tenant_id=None):
+    recording_id = uuid4()
+    return ExpiredRecording(
+        id=recording_id,
+        tenant_id=tenant_id or uuid4(),
+        camera_id=uuid4(),
+        started_at=NOW - timedelta(days=days_ago + 7, hours=1),
+        expires_at=NOW - timedelta(days=days_ago),
+        retention_days=7,
+        size_bytes=size,
+        object_keys=[f"{recording_id}/{i:03d}.mp4" for i in range(keys)]
+    )
+
+
+class FakeS3:
+    """delete_objects that records batch sizes and peak parallelism."""
+
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.deleted = set()
+        self.batches = []
+        self.buckets = set()
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def delete_objects(self, Bucket, Delete):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.01)
+        keys = [o["Key"] for o in Delete["Objects"]]
+        with self.lock:
+            self.active -= 1
+            self.batches.append(len(keys))
+            self.deleted.update(k for k in keys if k not in self.failing)
+            self.buckets.update((Bucket, k) for k in keys)
+        return {"Errors": [{"Key": k, "Code": "AccessDenied", "Message": "denied"} for k in keys if k in self.failing]}
+
+
+@pytest.mark.asyncio
+async def test_cleanup_runs_until_caught_up():
+    """Test every expired recording is deleted across chunks in one run."""
+    repository = RetentionRepositoryImpl()
+    recordings = [make_recording(days_ago=i % 30 + 1) for i in range(250)]
+    for recording in recordings:
+        repository.add(recording)
+    repository.add(make_recording(days_ago=-1))  # not expired yet
+    s3 = FakeS3()
+
+    stats = await RetentionCleanup(repository, s3, chunk_size=100, delete_workers=3).run(NOW)
+
+    assert stats.chunks == 3
+    assert stats.deleted == 250
+    assert stats.objects == 500
+    assert stats.bytes_freed == 250 * 100
+    assert set(repository.deleted) == {r.id for r in recordings}
+    assert len(repository.audit) == 250
+
+
+@pytest.mark.asyncio
+async def test_objects_deleted_in_parallel_batches_of_1000():
+    """Test DeleteObjects gets at most 1000 keys and several batches run at once."""
+    repository = RetentionRepositoryImpl()
+    tenant_id = uuid4()
+    for _ in range(500):
+        repository.add(make_recording(keys=10, tenant_id=tenant_id))
+    s3 = FakeS3()
+
+    await RetentionCleanup(repository, s3, chunk_size=500, delete_workers=4).run(NOW)
+
+    assert sorted(s3.batches) == [1000] * 5
+    assert s3.peak == 4
+
+
+@pytest.mark.asyncio
+async def test_held_recordings_are_kept():
+    """Test incident and legal hold recordings are never deleted."""
+    repository = RetentionRepositoryImpl()
+    incident, held, expired = make_recording(), make_recording(), make_recording()
+    repository.add(incident, incident=True)
+    repository.add(held, legal_hold=True)
+    repository.add(expired)
+    s3 = FakeS3()
+
+    await RetentionCleanup(repository, s3).run(NOW)
+
+    assert set(repository.deleted) == {expired.id}
+    assert s3.deleted == set(expired.object_keys)
+
+
+@pytest.mark.asyncio
+async def test_failed_objects_leave_recording_for_next_run():
+    """Test a recording is only marked deleted once all its objects are gone."""
+    repository = RetentionRepositoryImpl()
+    broken, fine = make_recording(), make_recording()
+    repository.add(broken)
+    repository.add(fine)
+
+    stats = await RetentionCleanup(repository, FakeS3(failing=[broken.object_keys[1]])).run(NOW)
+
+    assert stats.deleted == 1
+    assert stats.failed == 1
+    assert set(repository.deleted) == {fine.id}
+
+    stats = await RetentionCleanup(repository, FakeS3()).run(NOW)
+    assert stats.deleted == 1
+    assert broken.id in repository.deleted
+
+
+@pytest.mark.asyncio
+async def test_objects_deleted_from_tenant_bucket_by_object_key():
+    """Test each recording's objects are deleted from its tenant's bucket, local paths mapped to keys."""
+    repository = RetentionRepositoryImpl()
+    first, second = make_recording(), make_recording(keys=1)
+    first = first._replace(object_keys=first.object_keys + [f"/recordings/camera/{first.id}"])
+    repository.add(first)
+    repository.add(second)
+    s3 = FakeS3()
+
+    await RetentionCleanup(repository, s3, recordings_root="/recordings").run(NOW)
+
+    bucket = recordings_bucket(first.tenant_id)
+    assert s3.buckets == (
+        {(bucket, key) for key in first.object_keys[:2]}
+        | {(bucket, f"camera/{first.id}")}
+        | {(recordings_bucket(second.tenant_id), second.object_keys[0])}
+    )
+    assert set(repository.deleted) == {first.id, second.id}
+
+
+@pytest.mark.asyncio
+async def test_recording_without_tenant_is_kept():
+    """Test objects with no tenant bucket to delete them from keep their recording."""
+    repository = RetentionRepositoryImpl()
+    orphan = make_recording()._replace(tenant_id=None)
+    repository.add(orphan)
+    s3 = FakeS3()
+
+    stats = await RetentionCleanup(repository, s3).run(NOW)
+
+    assert stats.failed == 1
+    assert repository.deleted == {} and s3.deleted == set()
@@ -0,0 +1,138 @@
+"""Tests for RetentionScheduler."""
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+from src.modules.streaming.domain.repositories.retention_repository import ExpiredRecording
+from src.modules.streaming.infrastructure.persistence.retention_repository_impl import RetentionRepositoryImpl
+from src.modules.streaming.infrastructure.workers.retention_cleanup import RetentionCleanup
+from src.modules.streaming.infrastructure.workers.retention_scheduler import RetentionScheduler
+
+NOW = datetime(2025, 2, 1, 3, 0, 0)
+
+
+def make_recording(tenant_id, expires_at):
+    recording_id = uuid4()
+    return ExpiredRecording(
+        id=recording_id,
+        tenant_id=tenant_id,
+        camera_id=uuid4(),
+        started_at=expires_at - timedelta(days=7),
+        expires_at=expires_at,
+        retention_days=7,
+        size_bytes=100,
+        object_keys=[f"{recording_id}/000.mp4"]
+    )
+
+
+class FakeS3:
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.deleted = set()
+
+    def delete_objects(self, Bucket, Delete):
+        keys = [o["Key"] for o in Delete["Objects"]]
+        self.deleted.update(k for k in keys if k not in self.failing)
+        return {"Errors": [{"Key": k, "Code": "AccessDenied", "Message": "denied"} for k in keys if k in self.failing]}
+
+
+def make_scheduler(repository, s3=None):
+    cleanup = RetentionCleanup(repository, s3 or FakeS3(), chunk_size=10, delete_workers=2)
+    return RetentionScheduler(repository, cleanup, refresh_seconds=3600, sweep_seconds=86400)
+
+
+@pytest.mark.asyncio
+async def test_wakes_at_next_expiry_per_tenant():
+    """Test the schedule wakes exactly at the earliest expiry and runs only that tenant."""
+    repository = RetentionRepositoryImpl()
+    tenant_a, tenant_b = uuid4(), uuid4()
+    early = make_recording(tenant_a, NOW + timedelta(minutes=10))
+    late = make_recording(tenant_b, NOW + timedelta(minutes=30))
+    repository.add(early)
+    repository.add(late)
+    scheduler = make_scheduler(repository)
+    await scheduler.refresh(NOW)
+
+    assert scheduler.seconds_until_next(NOW) == 600
+
+    await scheduler.run_due(NOW + timedelta(minutes=9))
+    assert repository.deleted == {}
+
+    await scheduler.run_due(NOW + timedelta(minutes=10))
+    assert set(repository.deleted) == {early.id}
+    assert repository.watermarks == {tenant_a: NOW + timedelta(minutes=10)}
+    assert scheduler.seconds_until_next(NOW + timedelta(minutes=10)) == 1200
+
+
+@pytest.mark.asyncio
+async def test_holds_are_kept_until_released_and_swept():
+    """Test held recordings survive tenant runs and the sweep picks them up once released."""
+    repository = RetentionRepositoryImpl()
+    tenant_id = uuid4()
+    held = make_recording(tenant_id, NOW - timedelta(hours=2))
+    incident = make_recording(tenant_id, NOW - timedelta(hours=1))
+    free = make_recording(tenant_id, NOW - timedelta(minutes=30))
+    repository.add(held, legal_hold=True)
+    repository.add(incident, incident=True)
+    repository.add(free)
+    scheduler = make_scheduler(repository)
+
+    await scheduler.refresh(NOW)
+    await scheduler.run_due(NOW)
+    assert set(repository.deleted) == {free.id}
+
+    repository.set_hold(held.id, False)
+    await scheduler.refresh(NOW + timedelta(hours=1))
+    await scheduler.run_due(NOW + timedelta(hours=1))
+    assert held.id not in repository.deleted  # behind the watermark
+
+    await scheduler.sweep(NOW + timedelta(hours=1))
+    assert set(repository.deleted) == {free.id, held.id}
+
+
+@pytest.mark.asyncio
+async def test_restart_resumes_after_watermark():
+    """Test a new scheduler skips what was handled before and audits nothing twice."""
+    repository = RetentionRepositoryImpl()
+    tenant_id = uuid4()
+    first = make_recording(tenant_id, NOW - timedelta(minutes=5))
+    repository.add(first)
+    scheduler = make_scheduler(repository)
+    await scheduler.refresh(NOW)
+    await scheduler.run_due(NOW)
+
+    second = make_recording(tenant_id, NOW + timedelta(hours=1))
+    repository.add(second)
+    restarted = make_scheduler(repository)
+    await restarted.refresh(NOW + timedelta(minutes=1))
+    assert restarted.seconds_until_next(NOW + timedelta(minutes=1)) == 59 * 60
+
+    await restarted.run_due(NOW + timedelta(hours=1))
+    assert set(repository.deleted) == {first.id, second.id}
+    assert len(repository.audit) == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_delete_keeps_watermark_behind():
+    """Test a recording whose objects failed is retried instead of skipped."""
+    repository = RetentionRepositoryImpl()
+    tenant_id = uuid4()
+    stuck = make_recording(tenant_id, NOW - timedelta(hours=1))
+    done = make_recording(tenant_id, NOW - timedelta(minutes=30))
+    repository.add(stuck)
+    repository.add(done)
+    s3 = FakeS3(failing=stuck.object_keys)
+    scheduler = make_scheduler(repository, s3)
+
+    await scheduler.refresh(NOW)
+    await scheduler.run_due(NOW)
+    assert set(repository.deleted) == {done.id}
+    assert repository.watermarks[tenant_id] < stuck.expires_at
+    # Retried after the backoff, not in a tight loop
+    assert scheduler.seconds_until_next(NOW) == scheduler.retry_seconds
+
+    s3.failing.clear()
+    await scheduler.run_due(NOW + timedelta(seconds=scheduler.retry_seconds))
+    assert set(repository.deleted) == {done.id, stuck.id}
+    assert repository.watermarks[tenant_id] == NOW + timedelta(seconds=scheduler.retry_seconds)
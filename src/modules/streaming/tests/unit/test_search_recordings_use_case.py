@@ -0,0 +1,79 @@
+"""Tests for SearchRecordingsUseCase."""
+import pytest
+from uuid import uuid4
+from datetime import datetime, timedelta
+from src.streaming.application.use_cases.search_recordings import SearchRecordingsUseCase
+from src.streaming.application.dtos.search_recordings_dto import SearchRecordingsDTO
+from src.streaming.application.services.search_cursor import decode_cursor, encode_cursor
+from src.streaming.domain.entities.recording import Recording
+from src.streaming.domain.value_objects.retention_policy import RetentionPolicy
+from src.streaming.infrastructure.persistence.recording_repository_impl import RecordingRepositoryImpl
+
+
+async def _seed(repository, count, started_at, **kwargs):
+    recordings = []
+    for i in range(count):
+        recording = Recording(
+            id=uuid4(),
+            stream_id=kwargs.get("stream_id", uuid4()),
+            retention_policy=RetentionPolicy(7),
+            started_at=started_at + timedelta(minutes=i),
+            camera_id=kwargs.get("camera_id"),
+            tenant_id=kwargs.get("tenant_id")
+        )
+        await repository.save(recording)
+        recordings.append(recording)
+    return recordings
+
+
+def test_cursor_round_trip():
+    """Test cursors are opaque and decode to the same keyset."""
+    started_at = datetime(2025, 1, 10, 12, 30, 15, 250000)
+    recording_id = uuid4()
+
+    cursor = encode_cursor(started_at, recording_id)
+
+    assert str(recording_id) not in cursor
+    assert decode_cursor(cursor) == (started_at, recording_id)
+
+
+def test_invalid_cursor():
+    """Test tampered cursors are rejected."""
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor")
+
+
+@pytest.mark.asyncio
+async def test_search_pages_with_cursor():
+    """Test keyset pages are disjoint, newest first, and end with no cursor."""
+    repository = RecordingRepositoryImpl()
+    seeded = await _seed(repository, 5, datetime(2025, 1, 10))
+    use_case = SearchRecordingsUseCase(repository)
+
+    first = await use_case.execute(SearchRecordingsDTO(limit=2))
+    second = await use_case.execute(SearchRecordingsDTO(limit=2, cursor=first.next_cursor))
+    third = await use_case.execute(SearchRecordingsDTO(limit=2, cursor=second.next_cursor))
+
+    ids = [r.recording_id for page in (first, second, third) for r in page.recordings]
+    assert ids == [r.id for r in reversed(seeded)]
+    assert first.next_cursor and second.next_cursor
+    assert third.next_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_search_filters_by_camera_and_tenant():
+    """Test camera and tenant filters are applied by the repository."""
+    repository = RecordingRepositoryImpl()
+    camera_id = uuid4()
+    tenant_id = uuid4()
+    await _seed(repository, 3, datetime(2025, 1, 10), camera_id=camera_id, tenant_id=tenant_id)
+    await _seed(repository, 2, datetime(2025, 1, 10), camera_id=uuid4(), tenant_id=tenant_id)
+    use_case = SearchRecordingsUseCase(repository)
+
+    by_camera = await use_case.execute(SearchRecordingsDTO(camera_id=camera_id))
+    by_tenant = await use_case.execute(SearchRecordingsDTO(tenant_id=tenant_id))
+
+    assert len(by_camera.recordings) == 3
+    assert all(r.camera_id == camera_id for r in by_camera.recordings)
+    assert len(by_tenant.recordings) == 5
+    assert by_tenant.next_cursor is None
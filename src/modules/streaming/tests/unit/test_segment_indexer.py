@@ -0,0 +1,63 @@
+"""Tests for SegmentIndexer."""
+import pytest
+from uuid import uuid4
+from datetime import datetime
+from src.modules.streaming.infrastructure.workers.segment_indexer import SegmentIndexer, parse_segment_timestamp
+from src.modules.streaming.infrastructure.persistence.segment_repository_impl import SegmentRepositoryImpl
+
+
+def test_parse_segment_timestamp():
+    """Test wall-clock start is parsed from the segment filename."""
+    assert parse_segment_timestamp("rec_20250110_140000.mp4") == datetime(2025, 1, 10, 14, 0, 0)
+    assert parse_segment_timestamp("rec.mp4") is None
+
+
+@pytest.mark.asyncio
+async def test_poll_indexes_finished_segments(tmp_path):
+    """Test finished segments are indexed once, partial lines are skipped."""
+    stream_id = uuid4()
+    recording_id = uuid4()
+    (tmp_path / "rec_20250110_140000.mp4").write_bytes(b"x" * 1024)
+    list_path = tmp_path / "rec_segments.csv"
+    list_path.write_text("rec_20250110_140000.mp4,0.000000,3600.000000\nrec_2025")
+
+    repository = SegmentRepositoryImpl()
+    indexer = SegmentIndexer(repository, recordings_root=str(tmp_path))
+    indexer.watch(recording_id, stream_id, str(list_path))
+
+    assert await indexer.poll() == 1
+    assert await indexer.poll() == 0
+
+    segments = await repository.find_by_recording_id(recording_id)
+    assert len(segments) == 1
+    assert segments[0].start_time == datetime(2025, 1, 10, 14, 0, 0)
+    assert segments[0].end_time == datetime(2025, 1, 10, 15, 0, 0)
+    assert segments[0].size_bytes == 1024
+    assert segments[0].storage_path == "rec_20250110_140000.mp4"
+
+    with open(list_path, "a") as f:
+        f.write("0110_150000.mp4,3600.000000,7200.000000\n")
+
+    assert await indexer.poll() == 1
+    found = await repository.find_by_stream_range(
+        stream_id, datetime(2025, 1, 10, 15, 30), datetime(2025, 1, 10, 16, 0)
+    )
+    assert [s.start_time.hour for s in found] == [15]
+
+
+@pytest.mark.asyncio
+async def test_poll_handles_truncated_list(tmp_path):
+    """Test restarted ffmpeg truncating the list does not lose entries."""
+    list_path = tmp_path / "rec_segments.csv"
+    list_path.write_text(
+        "rec_20250110_140000.mp4,0.0,3600.0\nrec_20250110_150000.mp4,3600.0,7200.0\n"
+    )
+
+    repository = SegmentRepositoryImpl()
+    indexer = SegmentIndexer(repository, recordings_root=str(tmp_path))
+    indexer.watch(uuid4(), uuid4(), str(list_path))
+    assert await indexer.poll() == 2
+
+    list_path.write_text("rec_20250110_160500.mp4,0.0,600.0\n")
+    assert await indexer.poll() == 1
+    assert len(await repository.find_all()) == 3
@@ -0,0 +1,161 @@
+"""Tests for batch snapshots and the grid mosaic."""
+import asyncio
+import shutil
+import subprocess
+import sys
+from datetime import datetime
+
+import pytest
+
+from src.modules.streaming.infrastructure.external_services.clip_engine import ClipEngine
+from src.modules.streaming.infrastructure.external_services.frame_grabber import Frame
+from src.modules.streaming.infrastructure.external_services.snapshot_cache import Snapshot, SnapshotCache
+from src.modules.streaming.infrastructure.external_services.snapshot_mosaic import SnapshotMosaic, grid_shape
+from src.modules.streaming.infrastructure.web.snapshot_routes import SnapshotService, _multipart
+
+
+class FakeGrabber:
+    """Frames after a per-path delay; tracks peak concurrency."""
+
+    def __init__(self, delays):
+        self.delays = delays
+        self.active = 0
+        self.peak = 0
+        self.grabbed = []
+
+    def path_for(self, tenant_id, camera_id):
+        return camera_id
+
+    async def grab(self, path, timeout):
+        self.grabbed.append(path)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delays.get(path, 0.01))
+            return Frame(b"\xff\xd8" + path.encode(), datetime.utcnow(), 0.0)
+        finally:
+            self.active -= 1
+
+
+@pytest.mark.asyncio
+async def test_batch_returns_partial_result_on_timeout():
+    """Test a slow camera is left out instead of holding up the wall."""
+    grabber = FakeGrabber({"slow": 5})
+    service = SnapshotService(grabber, SnapshotCache(capture_timeout=10))
+
+    snapshots = await service.get_snapshots("t1", ["a", "slow", "b"], timeout=0.2)
+
+    assert sorted(snapshots) == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_batch_timeout_keeps_warming_the_cache():
+    """Test cameras still waiting for a slot are captured after the timeout and served from the cache."""
+    grabber = FakeGrabber({"a": 0.2, "b": 0.01})
+    service = SnapshotService(grabber, SnapshotCache(capture_timeout=10))
+
+    assert await service.get_snapshots("t1", ["a", "b"], timeout=0.05, concurrency=1) == {}
+    await asyncio.sleep(0.4)
+
+    snapshots = await service.get_snapshots("t1", ["a", "b"], max_age=60)
+    assert sorted(snapshots) == ["a", "b"]
+    assert grabber.grabbed == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_batch_is_bounded():
+    """Test at most `concurrency` cameras are fetched at once."""
+    grabber = FakeGrabber({})
+    service = SnapshotService(grabber, SnapshotCache())
+
+    snapshots = await service.get_snapshots("t1", [f"cam-{i}" for i in range(16)], concurrency=4)
+
+    assert len(snapshots) == 16
+    assert grabber.peak == 4
+
+
+def test_multipart_keeps_request_order_and_skips_missing():
+    """Test one part per available camera, in request order."""
+    now = datetime(2025, 1, 10, 14, 0, 0)
+    snapshots = {"b": Snapshot(b"B", now, '"b"')}
+    response = _multipart(["a", "b"], snapshots)
+
+    body = response.body
+    assert body.count(b"X-Camera-Id") == 1
+    assert b"X-Camera-Id: b\r\n" in body
+    assert response.media_type.startswith("multipart/mixed; boundary=")
+
+
+def test_grid_shape():
+    """Test grids are square-ish unless the caller fixes the columns."""
+    assert grid_shape(16) == (4, 4)
+    assert grid_shape(5) == (3, 2)
+    assert grid_shape(5, columns=5) == (5, 1)
+    assert grid_shape(2, columns=4) == (2, 1)
+
+
+@pytest.mark.asyncio
+async def test_compose_fills_missing_tiles(tmp_path):
+    """Test missing cameras get a placeholder so tile positions keep the order."""
+    # Stands in for ffmpeg: lists the sequence it was given on stdout
+    script = tmp_path / "ffmpeg.py"
+    script.write_text(
+        "import os, sys\n"
+        "args = sys.argv[1:]\n"
+        "if '-f' in args and args[args.index('-f') + 1] == 'lavfi':\n"
+        "    open(args[-1], 'wb').write(b'black')\n"
+        "else:\n"
+        "    d = os.path.dirname(args[args.index('-i') + 1])\n"
+        "    names = sorted(n for n in os.listdir(d) if n[:3].isdigit())\n"
+        "    sys.stdout.buffer.write(b','.join(open(os.path.join(d, n), 'rb').read() for n in names))\n"
+    )
+    wrapper = tmp_path / "ffmpeg"
+    wrapper.write_text(f"#!/bin/sh\nexec {sys.executable} {script} \"$@\"\n")
+    wrapper.chmod(0o755)
+    mosaic = SnapshotMosaic(engine=ClipEngine(max_workers=1, ffmpeg_binary=str(wrapper)))
+
+    grid, columns = await mosaic.compose([b"a", None, b"c", None])
+
+    assert grid == b"a,black,c,black"
+    assert columns == 2
+    cmd = mosaic.build_command("/tmp/%03d.jpg", 2, 2)
+    assert cmd[cmd.index("-vf") + 1].endswith("tile=2x2")
+    # Mixed input sizes must not rebuild the graph (and drop buffered tiles)
+    assert cmd[cmd.index("-reinit_filter") + 1] == "0"
+    assert cmd.index("-reinit_filter") < cmd.index("-i")
+
+
+def _ffmpeg(*args) -> bytes:
+    return subprocess.run(["ffmpeg", "-nostdin", "-loglevel", "error", *args], check=True, capture_output=True).stdout
+
+
+def _jpeg_size(data: bytes):
+    """(width, height) from the first SOF marker."""
+    i = 2
+    while i < len(data):
+        marker, length = data[i + 1], int.from_bytes(data[i + 2:i + 4], "big")
+        if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+            return int.from_bytes(data[i + 7:i + 9], "big"), int.from_bytes(data[i + 5:i + 7], "big")
+        i += 2 + length
+    raise ValueError("no SOF marker")
+
+
+@pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg not installed")
+@pytest.mark.asyncio
+async def test_compose_mixed_sizes_keeps_every_tile(tmp_path):
+    """Test snapshots of different resolutions and a missing camera all land in their tile."""
+    images = []
+    for size in ("640x360", "320x240", "1280x720"):
+        path = tmp_path / f"{size}.jpg"
+        _ffmpeg("-f", "lavfi", "-i", f"color=c=white:s={size}", "-frames:v", "1", str(path))
+        images.append(path.read_bytes())
+    mosaic = SnapshotMosaic(engine=ClipEngine(max_workers=1), tile_width=160, tile_height=90)
+
+    grid, columns = await mosaic.compose(images[:2] + [None] + images[2:])
+
+    assert columns == 2
+    assert _jpeg_size(grid) == (320, 180)
+    (tmp_path / "grid.jpg").write_bytes(grid)
+    pixels = _ffmpeg("-i", str(tmp_path / "grid.jpg"), "-f", "rawvideo", "-pix_fmt", "gray", "-")
+    centers = [pixels[(row * 90 + 45) * 320 + col * 160 + 80] for row in (0, 1) for col in (0, 1)]
+    assert [value > 128 for value in centers] == [True, True, False, True]
@@ -0,0 +1,107 @@
+"""Tests for SnapshotCache."""
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.modules.streaming.infrastructure.external_services.frame_grabber import Frame
+from src.modules.streaming.infrastructure.external_services.snapshot_cache import (
+    SnapshotCache,
+    SnapshotUnavailableError,
+)
+
+
+class FakeRedis:
+    def __init__(self):
+        self.values = {}
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.values[key] = value
+
+
+class Camera:
+    """Capture callable that counts calls and tracks peak concurrency."""
+
+    def __init__(self, delay=0.0, age=0.0):
+        self.delay = delay
+        self.age = age
+        self.calls = 0
+        self.active = 0
+        self.peak = 0
+
+    async def __call__(self):
+        self.calls += 1
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+            image = b"\xff\xd8" + str(self.calls).encode()
+            return Frame(image, datetime.utcnow() - timedelta(seconds=self.age), 0.0)
+        finally:
+            self.active -= 1
+
+
+@pytest.mark.asyncio
+async def test_max_age_decides_between_cache_and_capture():
+    """Test a snapshot is reused while young enough and recaptured after."""
+    cache = SnapshotCache()
+    camera = Camera(age=3)
+
+    first = await cache.get("t1", "cam-1", 10, camera)
+    again = await cache.get("t1", "cam-1", 10, camera)
+    fresh = await cache.get("t1", "cam-1", 1, camera)
+
+    assert again == first
+    assert fresh.image != first.image
+    assert camera.calls == 2
+    assert first.etag.startswith('"')
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_capture():
+    """Test 20 operators opening the same camera cause a single capture."""
+    cache = SnapshotCache()
+    camera = Camera(delay=0.05)
+
+    snapshots = await asyncio.gather(*[cache.get("t1", "cam-1", 0, camera) for _ in range(20)])
+
+    assert camera.calls == 1
+    assert len({s.etag for s in snapshots}) == 1
+
+
+@pytest.mark.asyncio
+async def test_captures_are_globally_bounded():
+    """Test captures of different cameras never exceed max_in_flight."""
+    cache = SnapshotCache(max_in_flight=2)
+    camera = Camera(delay=0.02)
+
+    await asyncio.gather(*[cache.get("t1", f"cam-{i}", 0, camera) for i in range(6)])
+
+    assert camera.calls == 6
+    assert camera.peak == 2
+
+
+@pytest.mark.asyncio
+async def test_redis_tier_is_shared_between_processes():
+    """Test a capture made by one process is served from Redis to another."""
+    redis = FakeRedis()
+    camera = Camera()
+    first = await SnapshotCache(redis=redis).get("t1", "cam-1", 5, camera)
+
+    other = await SnapshotCache(redis=redis).get("t1", "cam-1", 5, camera)
+
+    assert other == first
+    assert camera.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_slow_capture_raises_unavailable():
+    """Test a capture over the timeout fails instead of holding the request."""
+    cache = SnapshotCache(capture_timeout=0.05)
+
+    with pytest.raises(SnapshotUnavailableError):
+        await cache.get("t1", "cam-1", 0, Camera(delay=1))
+    assert cache._inflight == {}
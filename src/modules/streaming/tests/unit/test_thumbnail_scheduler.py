@@ -0,0 +1,192 @@
+"""Tests for ThumbnailScheduler."""
+import asyncio
+import sys
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from src.modules.streaming.application.queries.active_cameras import ActiveCameraQuery, CameraTarget
+from src.modules.streaming.infrastructure.external_services.clip_engine import ClipEngine
+from src.modules.streaming.infrastructure.workers.thumbnail_scheduler import ThumbnailScheduler
+from src.shared.infrastructure.sharding import ConsistentHashRing
+
+
+def make_camera(online=True):
+    return CameraTarget(camera_id=uuid4(), tenant_id="tenant-1", source_url="rtsp://cam/live", online=online)
+
+
+class FakeCameraQuery(ActiveCameraQuery):
+    def __init__(self, cameras):
+        self.cameras = cameras
+
+    async def list_active(self):
+        return list(self.cameras)
+
+
+class FakeS3:
+    def __init__(self):
+        self.objects = {}
+
+    def put_object(self, Bucket, Key, Body, **kwargs):
+        self.objects[Key] = Body
+
+
+class FakeMembership:
+    def __init__(self, worker_id, members):
+        self.worker_id = worker_id
+        self._members = members
+        self.heartbeats = 0
+
+    async def heartbeat(self):
+        self.heartbeats += 1
+
+    async def members(self):
+        return self._members
+
+    async def leave(self):
+        pass
+
+
+def fake_engine(tmp_path, output=b"\xff\xd8jpeg"):
+    """Stands in for ffmpeg: writes `output` to stdout."""
+    script = tmp_path / "ffmpeg.py"
+    script.write_text(f"import sys\nsys.stdout.buffer.write({output!r})\n")
+    wrapper = tmp_path / "ffmpeg"
+    wrapper.write_text(f"#!/bin/sh\nexec {sys.executable} {script} \"$@\"\n")
+    wrapper.chmod(0o755)
+    return ClipEngine(max_workers=2, ffmpeg_binary=str(wrapper))
+
+
+def make_scheduler(cameras, tmp_path, **kwargs):
+    if "engine" not in kwargs:
+        kwargs["engine"] = fake_engine(tmp_path)
+    kwargs.setdefault("worker_id", "w1")
+    return ThumbnailScheduler(
+        FakeCameraQuery(cameras),
+        FakeS3(),
+        interval_seconds=10,
+        slots=100,
+        concurrency=4,
+        **kwargs
+    )
+
+
+def make_due(scheduler):
+    scheduler._schedule = [(0.0, camera_id) for _, camera_id in scheduler._schedule]
+
+
+@pytest.mark.asyncio
+async def test_refresh_keeps_only_owned_cameras(tmp_path):
+    """Test each worker takes exactly its consistent-hash share."""
+    cameras = [make_camera() for _ in range(40)]
+    members = ["w1", "w2", "w3"]
+    owned = {}
+    for worker in members:
+        membership = FakeMembership(worker, members)
+        scheduler = make_scheduler(cameras, tmp_path, membership=membership, worker_id=worker)
+        await scheduler.refresh()
+        owned[worker] = set(scheduler.cameras)
+        assert membership.heartbeats == 1
+
+    ring = ConsistentHashRing(members)
+    for worker, camera_ids in owned.items():
+        assert camera_ids == {c.camera_id for c in cameras if ring.node_for(str(c.camera_id)) == worker}
+    assert set().union(*owned.values()) == {c.camera_id for c in cameras}
+
+
+@pytest.mark.asyncio
+async def test_first_captures_spread_over_interval(tmp_path):
+    """Test new cameras are scheduled at random offsets within one interval."""
+    scheduler = make_scheduler([make_camera() for _ in range(50)], tmp_path)
+
+    await scheduler.refresh()
+
+    offsets = sorted(due for due, _ in scheduler._schedule)
+    assert offsets[-1] - offsets[0] > 5
+    assert offsets[-1] - offsets[0] <= 10
+    await scheduler.refresh()
+    assert len(scheduler._schedule) == 50
+
+
+def test_ring_key_wraps_slots(tmp_path):
+    """Test slot = n mod slots, with n the capture's interval number."""
+    scheduler = make_scheduler([], tmp_path)
+    camera = make_camera()
+
+    assert scheduler.ring_key(camera, 1234.0) == (23, f"tenant-1/{camera.camera_id}/thumbnails/23.jpg")
+    assert scheduler.ring_key(camera, 1234.0 + 1000)[0] == 23
+    assert scheduler.ring_key(camera, 5.0)[1].endswith("/00.jpg")
+
+
+@pytest.mark.asyncio
+async def test_capture_overwrites_ring_slot(tmp_path, monkeypatch):
+    """Test repeated captures reuse the same key set instead of growing it."""
+    scheduler = make_scheduler([], tmp_path)
+    camera = make_camera()
+    clock = [1000.0]
+    monkeypatch.setattr("src.modules.streaming.infrastructure.workers.thumbnail_scheduler.time.time", lambda: clock[0])
+
+    for _ in range(150):
+        assert await scheduler.capture(camera)
+        clock[0] += 10
+
+    assert len(scheduler.s3_client.objects) == 100
+    assert set(scheduler.s3_client.objects.values()) == {b"\xff\xd8jpeg"}
+
+
+@pytest.mark.asyncio
+async def test_offline_cameras_are_skipped_but_rescheduled(tmp_path):
+    """Test offline cameras start no capture and stay on the schedule."""
+    online, offline = make_camera(), make_camera(online=False)
+    scheduler = make_scheduler([online, offline], tmp_path)
+    await scheduler.refresh()
+    make_due(scheduler)
+
+    await scheduler.run_due()
+    await asyncio.gather(*scheduler._in_flight)
+
+    assert [key.split("/")[1] for key in scheduler.s3_client.objects] == [str(online.camera_id)]
+    assert scheduler._scheduled == {online.camera_id, offline.camera_id}
+    assert all(due > 0 for due, _ in scheduler._schedule)
+
+
+@pytest.mark.asyncio
+async def test_failing_camera_backs_off(tmp_path):
+    """Test repeated failures pause the camera until the backoff expires."""
+    scheduler = make_scheduler([make_camera()], tmp_path, engine=fake_engine(tmp_path, output=b""))
+    await scheduler.refresh()
+    camera_id = next(iter(scheduler.cameras))
+
+    for _ in range(3):
+        make_due(scheduler)
+        await scheduler.run_due()
+        await asyncio.gather(*scheduler._in_flight)
+
+    assert scheduler._failures[camera_id] == 3
+    assert camera_id in scheduler._backoff_until
+    make_due(scheduler)
+    await scheduler.run_due()
+    assert not scheduler._in_flight
+    assert len(scheduler._schedule) == 1
+
+
+@pytest.mark.asyncio
+async def test_capture_uses_frame_grabber_path(tmp_path):
+    """Test captures come from the MediaMTX decoder instead of the camera."""
+    grabbed = []
+
+    class FakeGrabber:
+        def path_for(self, tenant_id, camera_id):
+            return f"{tenant_id}_{camera_id}_live"
+
+        async def grab(self, path, timeout):
+            grabbed.append(path)
+            return SimpleNamespace(image=b"\xff\xd8live")
+
+    camera = make_camera()
+    scheduler = make_scheduler([], tmp_path, engine=ClipEngine(max_workers=1, ffmpeg_binary="false"), frame_grabber=FakeGrabber())
+
+    assert await scheduler.capture(camera)
+    assert grabbed == [f"tenant-1_{camera.camera_id}_live"]
+    assert list(scheduler.s3_client.objects.values()) == [b"\xff\xd8live"]
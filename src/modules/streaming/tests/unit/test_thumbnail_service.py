@@ -0,0 +1,88 @@
+"""Tests for ThumbnailServiceImpl."""
+import os
+import sys
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.modules.streaming.infrastructure.external_services.clip_engine import ClipEngine
+from src.modules.streaming.infrastructure.external_services.thumbnail_service_impl import ThumbnailServiceImpl
+
+T0 = datetime(2025, 1, 10, 14, 0, 0)
+
+# Stands in for ffmpeg: writes `-frames:v` numbered images to the output pattern
+FAKE_FFMPEG = """
+import sys
+args = sys.argv[1:]
+frames = int(args[args.index("-frames:v") + 1])
+start = int(args[args.index("-start_number") + 1])
+for k in range(start, start + frames):
+    open(args[-1] % k, "wb").write(b"jpg")
+"""
+
+
+def fake_engine(tmp_path) -> ClipEngine:
+    script = tmp_path / "ffmpeg.py"
+    script.write_text(FAKE_FFMPEG)
+    wrapper = tmp_path / "ffmpeg"
+    wrapper.write_text(f"#!/bin/sh\nexec {sys.executable} {script} \"$@\"\n")
+    wrapper.chmod(0o755)
+    return ClipEngine(max_workers=1, ffmpeg_binary=str(wrapper))
+
+
+def test_build_command_single_pass(tmp_path):
+    """Test one command samples the whole range with fps and keyframe-only decoding."""
+    service = ThumbnailServiceImpl(output_dir=str(tmp_path), engine=ClipEngine(max_workers=1))
+
+    cmd = service.build_command("rec.mp4", "/out/%05d.jpg", 3600, 60)
+
+    assert cmd[cmd.index("-skip_frame") + 1] == "nokey"
+    assert cmd.index("-skip_frame") < cmd.index("-i")
+    assert cmd[cmd.index("-vf") + 1] == "fps=1/60,scale=160:90"
+    assert cmd[cmd.index("-frames:v") + 1] == "60"
+    assert cmd[-1] == "/out/%05d.jpg"
+
+
+@pytest.mark.asyncio
+async def test_generate_thumbnails_maps_offsets_to_timestamps(tmp_path):
+    """Test image k is stamped start_time + k * interval."""
+    service = ThumbnailServiceImpl(output_dir=str(tmp_path / "out"), engine=fake_engine(tmp_path))
+
+    thumbnails = await service.generate_thumbnails(
+        "rec.mp4", T0, T0 + timedelta(minutes=10, seconds=30), interval_seconds=60
+    )
+
+    assert [t.timestamp for t in thumbnails] == [T0 + timedelta(minutes=k) for k in range(11)]
+    assert all(os.path.exists(t.url) for t in thumbnails)
+
+
+@pytest.mark.asyncio
+async def test_generate_thumbnails_empty_range(tmp_path):
+    """Test a recording without duration yields no thumbnails and no ffmpeg run."""
+    service = ThumbnailServiceImpl(output_dir=str(tmp_path), engine=ClipEngine(max_workers=1, ffmpeg_binary="false"))
+
+    assert await service.generate_thumbnails("rec.mp4", T0, T0) == []
+
+
+def test_build_command_tiles_sprites(tmp_path):
+    """Test sprite mode appends a tile filter and counts sheets, not images."""
+    service = ThumbnailServiceImpl(output_dir=str(tmp_path), engine=ClipEngine(max_workers=1))
+
+    cmd = service.build_command("rec.mp4", "/out/%03d.jpg", 2 * 3600 + 60, 60, tile=(10, 6))
+
+    assert cmd[cmd.index("-vf") + 1] == "fps=1/60,scale=160:90,tile=10x6"
+    assert cmd[cmd.index("-frames:v") + 1] == "3"
+
+
+@pytest.mark.asyncio
+async def test_generate_sprites_one_sheet_per_hour(tmp_path):
+    """Test sheets start on hour boundaries and the last one is partial."""
+    service = ThumbnailServiceImpl(output_dir=str(tmp_path / "out"), engine=fake_engine(tmp_path))
+
+    sheets = await service.generate_sprites("rec.mp4", T0, T0 + timedelta(hours=1, minutes=30), 60, columns=10)
+
+    assert [(s.start_time, s.count, s.columns, s.rows) for s in sheets] == [
+        (T0, 60, 10, 6),
+        (T0 + timedelta(hours=1), 30, 10, 6),
+    ]
+    assert sheets[1].tile_position(23) == (3 * 160, 2 * 90)
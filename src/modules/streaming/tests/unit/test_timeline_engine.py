@@ -0,0 +1,103 @@
+"""Tests for TimelineEngine."""
+from datetime import datetime, timedelta
+from src.streaming.domain.services.timeline_engine import TimelineEngine
+
+START = datetime(2025, 1, 10, 0, 0, 0)
+END = START + timedelta(hours=6)
+NOW = END + timedelta(days=1)
+
+
+def hours(value: float) -> timedelta:
+    return timedelta(hours=value)
+
+
+def test_merges_overlapping_and_touching_intervals():
+    """Test overlapping intervals collapse into one segment."""
+    engine = TimelineEngine(START, END, now=NOW)
+    engine.add(START + hours(1), START + hours(2))
+    engine.add(START, START + hours(1))
+    engine.add(START + hours(0.5), START + hours(1.5))
+
+    assert engine.merged() == [(engine.window_start, engine.window_start + 7200)]
+    assert engine.total_recorded_seconds() == 7200
+
+
+def test_emits_gap_segments():
+    """Test gaps between and around recordings are explicit."""
+    engine = TimelineEngine(START, END, now=NOW)
+    engine.add(START + hours(1), START + hours(2))
+    engine.add(START + hours(3), START + hours(4))
+
+    segments = engine.segments()
+
+    assert [(s.start_time, s.end_time, s.has_recording) for s in segments] == [
+        (START, START + hours(1), False),
+        (START + hours(1), START + hours(2), True),
+        (START + hours(2), START + hours(3), False),
+        (START + hours(3), START + hours(4), True),
+        (START + hours(4), END, False),
+    ]
+
+
+def test_no_gaps_reported_in_the_future():
+    """Test the part of the window after now is not a gap."""
+    engine = TimelineEngine(START, END, now=START + hours(2))
+    engine.add(START, START + hours(2))
+
+    segments = engine.segments()
+
+    assert len(segments) == 1
+    assert segments[0].has_recording
+
+
+def test_clips_to_window():
+    """Test intervals outside the window are clipped."""
+    engine = TimelineEngine(START, END, now=NOW)
+    engine.add(START - hours(1), START + hours(1))
+    engine.add(END + hours(1), END + hours(2))
+
+    assert engine.total_recorded_seconds() == 3600
+
+
+def test_bucketed_is_bounded_and_run_length_encoded():
+    """Test thousands of short segments collapse into buckets."""
+    window_end = START + timedelta(days=30)
+    engine = TimelineEngine(START, window_end, now=window_end)
+    cursor = START
+    while cursor < window_end:
+        # 50 minutes recorded, 10 minutes missing every hour
+        engine.add(cursor, cursor + timedelta(minutes=50))
+        cursor += hours(1)
+
+    assert len(engine.segments()) > 1000
+
+    hourly = engine.bucketed(3600)
+    assert len(hourly) == 1
+    assert hourly[0].has_recording
+
+    downsampled = engine.downsample(500)
+    assert len(downsampled) <= 500
+
+
+def test_bucketed_marks_uncovered_buckets():
+    """Test buckets below coverage threshold become gaps."""
+    engine = TimelineEngine(START, END, now=NOW)
+    engine.add(START, START + hours(2))
+    engine.add(START + hours(4) + timedelta(minutes=50), START + hours(5))
+
+    segments = engine.bucketed(3600)
+
+    assert [(s.has_recording, s.duration_seconds) for s in segments] == [
+        (True, 7200),
+        (False, 14400),
+    ]
+
+
+def test_coverage_bitmap_stops_at_now():
+    """Test buckets after now are left out of the bitmap rather than reported as gaps."""
+    engine = TimelineEngine(START, END, now=START + hours(2.5))
+    engine.add(START, START + hours(2.5))
+
+    assert list(engine.coverage_bitmap(6)) == [1, 1, 1]
+    assert list(TimelineEngine(START, END, now=NOW).coverage_bitmap(6)) == [0] * 6
+    assert list(TimelineEngine(START, END, now=START - hours(1)).coverage_bitmap(6)) == []
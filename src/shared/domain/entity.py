@@ -8,11 +8,14 @@ from uuid import UUID, uuid4
 class Entity(ABC):
     """Base class for all entities in the domain."""
 
+    __slots__ = ("_id", "_created_at", "_updated_at")
+
     def __init__(self, entity_id: UUID | None = None) -> None:
         """Initialize entity with unique identifier."""
+        now = datetime.utcnow()
         self._id: UUID = entity_id or uuid4()
-        self._created_at: datetime = datetime.utcnow()
-        self._updated_at: datetime = datetime.utcnow()
+        self._created_at: datetime = now
+        self._updated_at: datetime = now
 
     @property
     def id(self) -> UUID:
@@ -7,9 +7,12 @@ import redis.asyncio as aioredis
 class CacheConfig:
     """Redis cache configuration."""
 
-    def __init__(self, redis_url: str) -> None:
-        """Initialize cache config."""
-        self.redis = aioredis.from_url(redis_url, decode_responses=True)
+    def __init__(self, redis_url: str, decode_responses: bool = True) -> None:
+        """Initialize cache config.
+
+        Pass decode_responses=False for binary payloads (e.g. msgpack).
+        """
+        self.redis = aioredis.from_url(redis_url, decode_responses=decode_responses)
 
     async def get(self, key: str) -> Optional[str]:
         """Get value from cache."""
@@ -0,0 +1,441 @@
+"""Read-through/write-through cache service on top of CacheConfig."""
+import asyncio
+import os
+import uuid
+from datetime import date, datetime
+from time import perf_counter
+from typing import Any, Awaitable, Callable, Dict, Generic, Optional, TypeVar
+
+import msgpack
+from prometheus_client import Counter, Gauge, Histogram
+
+from src.shared.infrastructure.cache import CacheConfig
+from src.shared.infrastructure.local_cache import LocalCache
+from src.shared.infrastructure.logger import Logger
+
+T = TypeVar("T")
+
+
+# Cache Metrics
+cache_hits_total = Counter(
+    'cache_hits_total',
+    'Cache hits (including cached negative lookups)',
+    ['namespace']
+)
+
+cache_misses_total = Counter(
+    'cache_misses_total',
+    'Cache misses that went to the loader',
+    ['namespace']
+)
+
+cache_load_seconds = Histogram(
+    'cache_load_seconds',
+    'Time spent in the loader on a cache miss',
+    ['namespace']
+)
+
+cache_local_hits_total = Counter(
+    'cache_local_hits_total',
+    'Hits served by the in-process tier without a Redis round trip',
+    ['namespace']
+)
+
+cache_local_evictions_total = Counter(
+    'cache_local_evictions_total',
+    'Entries evicted from the in-process tier to stay within max_entries',
+    ['namespace']
+)
+
+cache_local_size = Gauge(
+    'cache_local_size',
+    'Entries held by the in-process tier',
+    ['namespace']
+)
+
+
+_EXT_UUID = 1
+_EXT_DATETIME = 2
+_EXT_DATE = 3
+
+# msgpack encoding of None: stored for "not found" results
+_NEGATIVE = msgpack.packb(None)
+
+_RELEASE_LOCK = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, uuid.UUID):
+        return msgpack.ExtType(_EXT_UUID, value.bytes)
+    if isinstance(value, datetime):
+        return msgpack.ExtType(_EXT_DATETIME, value.isoformat().encode())
+    if isinstance(value, date):
+        return msgpack.ExtType(_EXT_DATE, value.isoformat().encode())
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+def _ext_hook(code: int, data: bytes) -> Any:
+    if code == _EXT_UUID:
+        return uuid.UUID(bytes=data)
+    if code == _EXT_DATETIME:
+        return datetime.fromisoformat(data.decode())
+    if code == _EXT_DATE:
+        return date.fromisoformat(data.decode())
+    return msgpack.ExtType(code, data)
+
+
+def pack(value: Any) -> bytes:
+    """Serialize with msgpack, supporting UUID, datetime and date."""
+    return msgpack.packb(value, default=_default, use_bin_type=True)
+
+
+def unpack(data: bytes) -> Any:
+    """Inverse of `pack`."""
+    return msgpack.unpackb(data, ext_hook=_ext_hook, raw=False)
+
+
+class CacheNamespace(Generic[T]):
+    """Typed view of one cache namespace.
+
+    Keys are `{prefix}:{namespace}:{tenant}:{key}` so a tenant's entries can be
+    dropped together. `encode`/`decode` convert values to and from
+    msgpack-friendly structures (dicts, lists, scalars, UUID, datetime).
+
+    With `local_max_entries > 0` the namespace keeps an in-process LRU of the
+    serialized values in front of Redis, each entry living at most
+    `local_ttl` seconds. Values are decoded on every hit, so callers never
+    share mutable objects.
+    """
+
+    def __init__(
+        self,
+        service: "CacheService",
+        name: str,
+        ttl: int,
+        negative_ttl: int,
+        encode: Callable[[T], Any],
+        decode: Callable[[Any], T],
+        local: Optional[LocalCache] = None
+    ):
+        self.service = service
+        self.name = name
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.encode = encode
+        self.decode = decode
+        self.local = local
+
+    def key(self, tenant_id: Any, key: Any) -> str:
+        return f"{self.service.prefix}:{self.name}:{tenant_id or '_'}:{key}"
+
+    async def get_or_load(
+        self,
+        tenant_id: Any,
+        key: Any,
+        loader: Callable[[], Awaitable[Optional[T]]]
+    ) -> Optional[T]:
+        """Read-through lookup. `loader` runs at most once per key at a time."""
+        return await self.service._get_or_load(self, self.key(tenant_id, key), loader)
+
+    async def set(self, tenant_id: Any, key: Any, value: Optional[T]) -> None:
+        """Write-through: store a freshly saved value."""
+        await self.service._store(self, self.key(tenant_id, key), value)
+
+    async def invalidate(self, tenant_id: Any, key: Any) -> None:
+        """Drop one entry."""
+        full_key = self.key(tenant_id, key)
+        self._forget(full_key)
+        await self.service.redis.unlink(full_key)
+        await self.service._publish_invalidation(self, key=full_key)
+
+    async def invalidate_tenant(self, tenant_id: Any) -> int:
+        """Drop every entry of a tenant in this namespace."""
+        prefix = self.key(tenant_id, "")
+        self._forget_prefix(prefix)
+        removed = await self.service._unlink_pattern(f"{prefix}*")
+        await self.service._publish_invalidation(self, prefix=prefix)
+        return removed
+
+    def _remember(self, key: str, raw: bytes) -> None:
+        if self.local is None:
+            return
+        ttl = min(self.local.ttl, self.negative_ttl if raw == _NEGATIVE else self.ttl)
+        evictions = self.local.evictions
+        self.local.set(key, raw, ttl)
+        if self.local.evictions > evictions:
+            cache_local_evictions_total.labels(namespace=self.name).inc(
+                self.local.evictions - evictions
+            )
+        cache_local_size.labels(namespace=self.name).set(len(self.local))
+
+    def _forget(self, key: str) -> None:
+        if self.local is not None and self.local.delete(key):
+            cache_local_size.labels(namespace=self.name).set(len(self.local))
+
+    def _forget_prefix(self, prefix: str) -> None:
+        if self.local is not None and self.local.delete_prefix(prefix):
+            cache_local_size.labels(namespace=self.name).set(len(self.local))
+
+    def stats(self) -> dict:
+        """Configuration and in-process tier counters."""
+        return {
+            "ttl": self.ttl,
+            "negative_ttl": self.negative_ttl,
+            "local": self.local.stats() if self.local is not None else None
+        }
+
+
+class CacheService:
+    """Redis-backed cache with single-flight loading and negative caching.
+
+    On a miss the first caller takes a short Redis lock (`SET NX PX`) and runs
+    the loader; concurrent callers in the same process await the same task,
+    and callers in other processes poll for the value until the lock expires.
+    Loaders returning None are cached for `negative_ttl` so repeated lookups of
+    missing rows do not reach the database either.
+
+    Namespaces with an in-process tier stay coherent across workers through
+    the `{prefix}:invalidate` pub/sub channel: every write or invalidation is
+    published and the other processes drop their local copy. Messages missed
+    while the subscriber reconnects are bounded by the local TTL, and the
+    local tiers are cleared after a reconnect.
+
+    The in-process tier and its listener need a long-lived event loop. Code
+    that runs on a fresh loop per call (Django views under WSGI, through
+    async_to_sync) builds the service with `local_tier=False`, so it only
+    talks to Redis, and closes it before the loop goes away.
+    """
+
+    LISTENER_RETRY_SECONDS = 1.0
+
+    def __init__(
+        self,
+        cache_config: CacheConfig,
+        prefix: str = "gtv",
+        lock_ttl_ms: int = 5000,
+        lock_poll_seconds: float = 0.05,
+        local_tier: bool = True
+    ):
+        self.logger = Logger(__name__)
+        self.cache_config = cache_config
+        self.redis = cache_config.redis
+        self.prefix = prefix
+        self.lock_ttl_ms = lock_ttl_ms
+        self.lock_poll_seconds = lock_poll_seconds
+        self.local_tier = local_tier
+        self.channel = f"{prefix}:invalidate"
+        self.origin = uuid.uuid4().hex
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._namespaces: Dict[str, CacheNamespace] = {}
+        self._listener: Optional[asyncio.Task] = None
+
+    @classmethod
+    def from_env(cls, local_tier: bool = True) -> "CacheService":
+        """Build from REDIS_URL or REDIS_HOST/REDIS_PORT/REDIS_DB."""
+        redis_url = os.getenv(
+            "REDIS_URL",
+            f"redis://{os.getenv('REDIS_HOST', 'redis')}:{os.getenv('REDIS_PORT', '6379')}/{os.getenv('REDIS_DB', '0')}"
+        )
+        return cls(CacheConfig(redis_url, decode_responses=False), local_tier=local_tier)
+
+    def namespace(
+        self,
+        name: str,
+        ttl: int = 300,
+        negative_ttl: int = 30,
+        encode: Callable[[T], Any] = lambda value: value,
+        decode: Callable[[Any], T] = lambda value: value,
+        local_ttl: float = 30.0,
+        local_max_entries: int = 0
+    ) -> CacheNamespace[T]:
+        """Declare a typed namespace.
+
+        The in-process tier is enabled with `local_max_entries > 0` on a
+        service built with `local_tier`; both local settings can be overridden
+        per namespace with CACHE_<NAME>_LOCAL_TTL and
+        CACHE_<NAME>_LOCAL_MAX_ENTRIES.
+        """
+        env_name = name.upper()
+        local_ttl = float(os.getenv(f"CACHE_{env_name}_LOCAL_TTL", local_ttl))
+        local_max_entries = int(os.getenv(f"CACHE_{env_name}_LOCAL_MAX_ENTRIES", local_max_entries))
+
+        existing = self._namespaces.get(name)
+        local = existing.local if existing else None
+        if self.local_tier and local_max_entries > 0 and local is None:
+            local = LocalCache(local_max_entries, local_ttl)
+
+        namespace = CacheNamespace(self, name, ttl, negative_ttl, encode, decode, local)
+        self._namespaces[name] = namespace
+        return namespace
+
+    def stats(self) -> Dict[str, dict]:
+        """Per-namespace settings and in-process tier counters."""
+        return {name: ns.stats() for name, ns in self._namespaces.items()}
+
+    async def _get_or_load(
+        self,
+        namespace: CacheNamespace[T],
+        key: str,
+        loader: Callable[[], Awaitable[Optional[T]]]
+    ) -> Optional[T]:
+        if namespace.local is not None:
+            self._ensure_listener()
+            raw = namespace.local.get(key)
+            if raw is not None:
+                cache_local_hits_total.labels(namespace=namespace.name).inc()
+                return self._decode(namespace, raw)
+
+        raw = await self.redis.get(key)
+        if raw is not None:
+            cache_hits_total.labels(namespace=namespace.name).inc()
+            namespace._remember(key, raw)
+            return self._decode(namespace, raw)
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._load(namespace, key, loader))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _load(
+        self,
+        namespace: CacheNamespace[T],
+        key: str,
+        loader: Callable[[], Awaitable[Optional[T]]]
+    ) -> Optional[T]:
+        lock_key = f"{key}:lock"
+        token = uuid.uuid4().hex
+        if not await self.redis.set(lock_key, token, nx=True, px=self.lock_ttl_ms):
+            waited = 0.0
+            while waited * 1000 < self.lock_ttl_ms:
+                await asyncio.sleep(self.lock_poll_seconds)
+                waited += self.lock_poll_seconds
+                raw = await self.redis.get(key)
+                if raw is not None:
+                    cache_hits_total.labels(namespace=namespace.name).inc()
+                    namespace._remember(key, raw)
+                    return self._decode(namespace, raw)
+            token = None
+
+        cache_misses_total.labels(namespace=namespace.name).inc()
+        try:
+            start = perf_counter()
+            value = await loader()
+            cache_load_seconds.labels(namespace=namespace.name).observe(perf_counter() - start)
+            await self._store(namespace, key, value, publish=False)
+            return value
+        finally:
+            if token:
+                await self.redis.eval(_RELEASE_LOCK, 1, lock_key, token)
+
+    async def _store(
+        self,
+        namespace: CacheNamespace[T],
+        key: str,
+        value: Optional[T],
+        publish: bool = True
+    ) -> None:
+        """Write to Redis and the local tier.
+
+        Fresh loads skip the invalidation broadcast: other processes cannot
+        hold a newer copy than the one just read from the source.
+        """
+        if value is None:
+            raw = _NEGATIVE
+            await self.redis.set(key, raw, ex=namespace.negative_ttl)
+        else:
+            raw = pack(namespace.encode(value))
+            await self.redis.set(key, raw, ex=namespace.ttl)
+        if namespace.local is not None:
+            self._ensure_listener()
+            namespace._remember(key, raw)
+            if publish:
+                await self._publish_invalidation(namespace, key=key)
+
+    @staticmethod
+    def _decode(namespace: CacheNamespace[T], raw: bytes) -> Optional[T]:
+        if raw == _NEGATIVE:
+            return None
+        return namespace.decode(unpack(raw))
+
+    async def _unlink_pattern(self, pattern: str, batch_size: int = 500) -> int:
+        removed = 0
+        batch = []
+        async for key in self.redis.scan_iter(match=pattern, count=batch_size):
+            batch.append(key)
+            if len(batch) >= batch_size:
+                removed += await self.redis.unlink(*batch)
+                batch = []
+        if batch:
+            removed += await self.redis.unlink(*batch)
+        return removed
+
+    async def _publish_invalidation(
+        self,
+        namespace: CacheNamespace,
+        key: Optional[str] = None,
+        prefix: Optional[str] = None
+    ) -> None:
+        if namespace.local is None:
+            return
+        message = {"origin": self.origin, "namespace": namespace.name, "key": key, "prefix": prefix}
+        await self.redis.publish(self.channel, pack(message))
+
+    def _apply_invalidation(self, message: dict) -> None:
+        if message.get("origin") == self.origin:
+            return
+        namespace = self._namespaces.get(message.get("namespace"))
+        if namespace is None:
+            return
+        if message.get("key"):
+            namespace._forget(message["key"])
+        elif message.get("prefix"):
+            namespace._forget_prefix(message["prefix"])
+
+    def _ensure_listener(self) -> None:
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.ensure_future(self._listen())
+
+    async def _listen(self) -> None:
+        """Subscribe to the invalidation channel, reconnecting on errors."""
+        connected_before = False
+        while True:
+            pubsub = self.redis.pubsub()
+            try:
+                await pubsub.subscribe(self.channel)
+                if connected_before:
+                    self._clear_local()
+                connected_before = True
+                async for message in pubsub.listen():
+                    if message.get("type") == "message":
+                        self._apply_invalidation(unpack(message["data"]))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.warning(f"Cache invalidation listener error: {e}")
+                await asyncio.sleep(self.LISTENER_RETRY_SECONDS)
+            finally:
+                await pubsub.close()
+
+    def _clear_local(self) -> None:
+        for namespace in self._namespaces.values():
+            if namespace.local is not None:
+                namespace.local.clear()
+                cache_local_size.labels(namespace=namespace.name).set(0)
+
+    async def close(self) -> None:
+        """Stop the invalidation listener and close the Redis connection."""
+        if self._listener:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+        await self.cache_config.close()
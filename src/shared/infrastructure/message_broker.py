@@ -11,10 +11,14 @@ from aio_pika.abc import AbstractIncomingMessage
 class MessageBrokerConfig:
     """RabbitMQ message broker configuration."""
 
-    def __init__(self, rabbitmq_url: str, max_retries: int = 3) -> None:
-        """Initialize message broker config."""
+    def __init__(self, rabbitmq_url: str, max_retries: int = 3, prefetch_count: int = 1) -> None:
+        """Initialize message broker config.
+
+        `prefetch_count` bounds how many unacked messages a consumer runs at once.
+        """
         self.rabbitmq_url = rabbitmq_url
         self.max_retries = max_retries
+        self.prefetch_count = prefetch_count
         self.connection: Optional[aio_pika.abc.AbstractRobustConnection] = None
         self.channel: Optional[aio_pika.abc.AbstractChannel] = None
 
@@ -28,7 +32,7 @@ class MessageBrokerConfig:
             timeout=10
         )
         self.channel = await self.connection.channel()
-        await self.channel.set_qos(prefetch_count=1)
+        await self.channel.set_qos(prefetch_count=self.prefetch_count)
 
     async def declare_queue_with_dlx(self, queue_name: str) -> aio_pika.abc.AbstractQueue:
         """Declare queue with dead letter exchange."""
@@ -0,0 +1,185 @@
+"""Process-wide asyncpg pool registry."""
+import asyncio
+import os
+from contextlib import asynccontextmanager
+from time import perf_counter
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+import asyncpg
+from prometheus_client import Counter, Gauge, Histogram
+
+
+# Pool Metrics
+db_pool_acquire_seconds = Histogram(
+    'db_pool_acquire_seconds',
+    'Time spent waiting for a pooled connection',
+    ['database'],
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+)
+
+db_pool_acquire_timeouts_total = Counter(
+    'db_pool_acquire_timeouts_total',
+    'Connection acquisitions that timed out',
+    ['database']
+)
+
+db_pool_size = Gauge(
+    'db_pool_size',
+    'Open connections in the pool',
+    ['database']
+)
+
+db_pool_idle = Gauge(
+    'db_pool_idle',
+    'Idle connections in the pool',
+    ['database']
+)
+
+
+class PoolConfig:
+    """asyncpg pool sizing and recycling settings."""
+
+    def __init__(
+        self,
+        min_size: int = 1,
+        max_size: int = 10,
+        command_timeout: float = 60,
+        acquire_timeout: float = 10,
+        max_queries: int = 50000,
+        max_inactive_connection_lifetime: float = 300.0,
+        statement_cache_size: int = 256,
+        max_cacheable_statement_size: int = 16 * 1024
+    ):
+        self.min_size = min_size
+        self.max_size = max_size
+        self.command_timeout = command_timeout
+        self.acquire_timeout = acquire_timeout
+        self.max_queries = max_queries
+        self.max_inactive_connection_lifetime = max_inactive_connection_lifetime
+        self.statement_cache_size = statement_cache_size
+        self.max_cacheable_statement_size = max_cacheable_statement_size
+
+    @classmethod
+    def from_env(cls) -> "PoolConfig":
+        """Build config from POSTGRES_POOL_* environment variables.
+
+        Set POSTGRES_STATEMENT_CACHE_SIZE=0 behind PgBouncer in transaction mode.
+        """
+        return cls(
+            min_size=int(os.getenv("POSTGRES_POOL_MIN_SIZE", "1")),
+            max_size=int(os.getenv("POSTGRES_POOL_MAX_SIZE", "10")),
+            command_timeout=float(os.getenv("POSTGRES_COMMAND_TIMEOUT", "60")),
+            acquire_timeout=float(os.getenv("POSTGRES_POOL_ACQUIRE_TIMEOUT", "10")),
+            max_queries=int(os.getenv("POSTGRES_POOL_MAX_QUERIES", "50000")),
+            max_inactive_connection_lifetime=float(
+                os.getenv("POSTGRES_POOL_MAX_INACTIVE_LIFETIME", "300")
+            ),
+            statement_cache_size=int(os.getenv("POSTGRES_STATEMENT_CACHE_SIZE", "256"))
+        )
+
+
+def _database_label(dsn: str) -> str:
+    """Metric label for a DSN without credentials."""
+    parsed = urlparse(dsn)
+    return f"{parsed.hostname or 'localhost'}/{parsed.path.lstrip('/')}"
+
+
+class PoolRegistry:
+    """Hands out one shared pool per DSN per event loop.
+
+    Repositories pointing at the same database share a single pool instead of
+    each opening their own, so a process holds at most `max_size` connections
+    per database. Pools are reference counted: the pool is closed when the
+    last user releases it.
+
+    asyncpg caches prepared statements per connection, so the repositories'
+    fixed queries are parsed and planned once per connection rather than on
+    every call. Connections are recycled after `max_queries` queries or
+    `max_inactive_connection_lifetime` seconds idle.
+    """
+
+    def __init__(self, config: Optional[PoolConfig] = None):
+        self.config = config or PoolConfig.from_env()
+        self._pools: Dict[Tuple[str, int], asyncpg.Pool] = {}
+        self._refs: Dict[Tuple[str, int], int] = {}
+        self._locks: Dict[Tuple[str, int], asyncio.Lock] = {}
+
+    @staticmethod
+    def _key(dsn: str) -> Tuple[str, int]:
+        return dsn, id(asyncio.get_running_loop())
+
+    async def get(self, dsn: str) -> asyncpg.Pool:
+        """Get the pool for a DSN, creating it once. Each call takes a reference."""
+        key = self._key(dsn)
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            pool = self._pools.get(key)
+            if pool is None:
+                pool = await asyncpg.create_pool(
+                    dsn,
+                    min_size=self.config.min_size,
+                    max_size=self.config.max_size,
+                    command_timeout=self.config.command_timeout,
+                    max_queries=self.config.max_queries,
+                    max_inactive_connection_lifetime=self.config.max_inactive_connection_lifetime,
+                    statement_cache_size=self.config.statement_cache_size,
+                    max_cacheable_statement_size=self.config.max_cacheable_statement_size
+                )
+                self._pools[key] = pool
+            self._refs[key] = self._refs.get(key, 0) + 1
+        return pool
+
+    async def release(self, dsn: str) -> None:
+        """Drop a reference taken by `get`, closing the pool on the last one."""
+        key = self._key(dsn)
+        refs = self._refs.get(key, 0) - 1
+        if refs > 0:
+            self._refs[key] = refs
+            return
+        self._refs.pop(key, None)
+        self._locks.pop(key, None)
+        pool = self._pools.pop(key, None)
+        if pool:
+            await pool.close()
+
+    @asynccontextmanager
+    async def acquire(self, pool: asyncpg.Pool, dsn: str):
+        """Acquire a connection, recording wait time and pool occupancy."""
+        label = _database_label(dsn)
+        start = perf_counter()
+        try:
+            conn = await pool.acquire(timeout=self.config.acquire_timeout)
+        except asyncio.TimeoutError:
+            db_pool_acquire_timeouts_total.labels(database=label).inc()
+            raise
+        db_pool_acquire_seconds.labels(database=label).observe(perf_counter() - start)
+        db_pool_size.labels(database=label).set(pool.get_size())
+        db_pool_idle.labels(database=label).set(pool.get_idle_size())
+        try:
+            yield conn
+        finally:
+            await pool.release(conn)
+
+    def stats(self) -> Dict[str, dict]:
+        """Size/idle snapshot of every open pool."""
+        return {
+            _database_label(dsn): {
+                "size": pool.get_size(),
+                "idle": pool.get_idle_size(),
+                "max_size": pool.get_max_size(),
+                "references": self._refs.get((dsn, loop_id), 0)
+            }
+            for (dsn, loop_id), pool in self._pools.items()
+        }
+
+    async def close_all(self) -> None:
+        """Close every pool owned by the running loop."""
+        loop_id = id(asyncio.get_running_loop())
+        for key in [k for k in self._pools if k[1] == loop_id]:
+            self._refs.pop(key, None)
+            self._locks.pop(key, None)
+            await self._pools.pop(key).close()
+
+
+pool_registry = PoolRegistry()
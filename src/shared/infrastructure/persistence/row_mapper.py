@@ -0,0 +1,43 @@
+"""Row-to-entity mapping helpers for persistence adapters."""
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Generic, Iterable, List, TypeVar
+
+T = TypeVar('T')
+V = TypeVar('V')
+
+
+class ValueCache(Generic[V]):
+    """Memoizes immutable value objects by their raw column value.
+    
+    Columns such as status or retention days have a handful of distinct
+    values, so hydrating many rows can share one instance per value instead
+    of validating and constructing a new object per row.
+    """
+    
+    def __init__(self, factory: Callable[[Any], V]):
+        self._factory = factory
+        self._cache: Dict[Any, V] = {}
+    
+    def __call__(self, raw: Any) -> V:
+        try:
+            return self._cache[raw]
+        except KeyError:
+            value = self._cache[raw] = self._factory(raw)
+            return value
+    
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+class RowMapper(ABC, Generic[T]):
+    """Maps database records (asyncpg.Record or mappings) to domain objects."""
+    
+    @abstractmethod
+    def to_entity(self, row) -> T:
+        """Map one row to an entity."""
+        pass
+    
+    def to_entities(self, rows: Iterable) -> List[T]:
+        """Map many rows to entities."""
+        to_entity = self.to_entity
+        return [to_entity(row) for row in rows]
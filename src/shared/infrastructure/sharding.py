@@ -0,0 +1,74 @@
+"""Consistent hashing and worker membership for sharded background work."""
+import bisect
+import hashlib
+import time
+from typing import Iterable, List, Optional, Tuple
+
+
+def _hash(value: str) -> int:
+    return int.from_bytes(hashlib.md5(value.encode()).digest()[:8], "big")
+
+
+class ConsistentHashRing:
+    """Maps keys to nodes so that adding or removing a node moves ~1/N of the keys.
+
+    Each node is placed on the ring `replicas` times (virtual nodes) to even
+    out the share each one gets.
+    """
+
+    def __init__(self, nodes: Iterable[str] = (), replicas: int = 100) -> None:
+        self.replicas = replicas
+        self._ring: List[Tuple[int, str]] = []
+        self._nodes = set()
+        for node in nodes:
+            self.add(node)
+
+    @property
+    def nodes(self) -> List[str]:
+        return sorted(self._nodes)
+
+    def add(self, node: str) -> None:
+        if node in self._nodes:
+            return
+        self._nodes.add(node)
+        for i in range(self.replicas):
+            bisect.insort(self._ring, (_hash(f"{node}#{i}"), node))
+
+    def remove(self, node: str) -> None:
+        if node not in self._nodes:
+            return
+        self._nodes.discard(node)
+        self._ring = [(h, n) for h, n in self._ring if n != node]
+
+    def node_for(self, key: str) -> Optional[str]:
+        """Node owning `key`: the first virtual node clockwise from its hash."""
+        if not self._ring:
+            return None
+        index = bisect.bisect(self._ring, (_hash(key), ""))
+        return self._ring[index % len(self._ring)][1]
+
+
+class WorkerMembership:
+    """Live workers of a group, tracked as heartbeats in a Redis sorted set.
+
+    Each worker calls `heartbeat()` more often than `ttl`; members whose last
+    heartbeat is older than `ttl` are considered gone.
+    """
+
+    def __init__(self, redis, group: str, worker_id: str, ttl: float = 30.0) -> None:
+        self.redis = redis
+        self.key = f"workers:{group}"
+        self.worker_id = worker_id
+        self.ttl = ttl
+
+    async def heartbeat(self) -> None:
+        now = time.time()
+        await self.redis.zadd(self.key, {self.worker_id: now})
+        await self.redis.zremrangebyscore(self.key, "-inf", now - self.ttl)
+
+    async def members(self) -> List[str]:
+        members = await self.redis.zrangebyscore(self.key, time.time() - self.ttl, "+inf")
+        return sorted(m.decode() if isinstance(m, bytes) else m for m in members)
+
+    async def leave(self) -> None:
+        await self.redis.zrem(self.key, self.worker_id)
@@ -0,0 +1,289 @@
+"""Tests for CacheService."""
+import asyncio
+import fnmatch
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+from prometheus_client import REGISTRY
+
+from src.shared.infrastructure.cache_service import CacheService, pack, unpack
+
+
+class FakePubSub:
+    def __init__(self, redis) -> None:
+        self.redis = redis
+        self.queue = asyncio.Queue()
+
+    async def subscribe(self, channel) -> None:
+        self.redis.subscribers.setdefault(channel, []).append(self.queue)
+        await self.queue.put({"type": "subscribe", "data": 1})
+
+    async def listen(self):
+        while True:
+            yield await self.queue.get()
+
+    async def close(self) -> None:
+        for queues in self.redis.subscribers.values():
+            if self.queue in queues:
+                queues.remove(self.queue)
+
+
+class FakeRedis:
+    """Minimal in-memory stand-in for redis.asyncio.Redis."""
+
+    def __init__(self) -> None:
+        self.data = {}
+        self.ttls = {}
+        self.subscribers = {}
+        self.gets = 0
+
+    async def get(self, key):
+        self.gets += 1
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None, px=None, nx=False):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        self.ttls[key] = ex if ex is not None else px
+        return True
+
+    async def unlink(self, *keys):
+        return sum(1 for key in keys if self.data.pop(key, None) is not None)
+
+    async def scan_iter(self, match=None, count=None):
+        for key in list(self.data):
+            if fnmatch.fnmatch(key, match):
+                yield key
+
+    async def eval(self, script, numkeys, key, token):
+        if self.data.get(key) == token:
+            del self.data[key]
+            return 1
+        return 0
+
+    async def publish(self, channel, data):
+        queues = self.subscribers.get(channel, [])
+        for queue in queues:
+            await queue.put({"type": "message", "data": data})
+        return len(queues)
+
+    def pubsub(self):
+        return FakePubSub(self)
+
+    async def close(self) -> None:
+        pass
+
+
+class FakeCacheConfig:
+    def __init__(self, redis=None) -> None:
+        self.redis = redis or FakeRedis()
+
+    async def close(self) -> None:
+        await self.redis.close()
+
+
+@pytest.fixture
+def cache():
+    return CacheService(FakeCacheConfig(), lock_poll_seconds=0.01)
+
+
+def sample(name: str, metric: str) -> float:
+    return REGISTRY.get_sample_value(metric, {"namespace": name}) or 0.0
+
+
+def test_pack_roundtrip_uuid_and_datetime():
+    """Test msgpack extension types survive a round trip."""
+    value = {"id": uuid4(), "at": datetime(2024, 1, 2, 3, 4, 5), "tags": ["a", 1]}
+    assert unpack(pack(value)) == value
+
+
+@pytest.mark.asyncio
+async def test_read_through_counts_hits_and_misses(cache):
+    """Test first lookup loads, second is served from Redis."""
+    ns = cache.namespace("test_read_through")
+    calls = []
+
+    async def loader():
+        calls.append(1)
+        return {"nome": "Camera 1"}
+
+    hits = sample("test_read_through", "cache_hits_total")
+    misses = sample("test_read_through", "cache_misses_total")
+
+    assert await ns.get_or_load("t1", "k", loader) == {"nome": "Camera 1"}
+    assert await ns.get_or_load("t1", "k", loader) == {"nome": "Camera 1"}
+
+    assert len(calls) == 1
+    assert sample("test_read_through", "cache_misses_total") == misses + 1
+    assert sample("test_read_through", "cache_hits_total") == hits + 1
+    assert "gtv:test_read_through:t1:k" in cache.redis.data
+
+
+@pytest.mark.asyncio
+async def test_single_flight(cache):
+    """Test concurrent misses run the loader once."""
+    ns = cache.namespace("test_single_flight")
+    calls = []
+
+    async def loader():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return 42
+
+    results = await asyncio.gather(*(ns.get_or_load(None, "k", loader) for _ in range(20)))
+
+    assert results == [42] * 20
+    assert len(calls) == 1
+    assert not any(key.endswith(":lock") for key in cache.redis.data)
+
+
+@pytest.mark.asyncio
+async def test_waits_for_lock_held_elsewhere(cache):
+    """Test a caller that loses the Redis lock picks up the other's value."""
+    ns = cache.namespace("test_lock_elsewhere")
+    key = ns.key(None, "k")
+    cache.redis.data[f"{key}:lock"] = "other-process"
+
+    async def other_process():
+        await asyncio.sleep(0.03)
+        cache.redis.data[key] = pack("loaded elsewhere")
+
+    async def loader():
+        raise AssertionError("loader should not run")
+
+    _, value = await asyncio.gather(other_process(), ns.get_or_load(None, "k", loader))
+    assert value == "loaded elsewhere"
+
+
+@pytest.mark.asyncio
+async def test_negative_caching(cache):
+    """Test None results are cached with the negative TTL."""
+    ns = cache.namespace("test_negative", negative_ttl=7)
+    calls = []
+
+    async def loader():
+        calls.append(1)
+        return None
+
+    assert await ns.get_or_load(None, "missing", loader) is None
+    assert await ns.get_or_load(None, "missing", loader) is None
+
+    assert len(calls) == 1
+    assert cache.redis.ttls[ns.key(None, "missing")] == 7
+
+
+@pytest.mark.asyncio
+async def test_write_through_and_invalidation(cache):
+    """Test set/invalidate and per-tenant invalidation."""
+    ns = cache.namespace(
+        "test_invalidation",
+        encode=lambda v: {"value": v},
+        decode=lambda d: d["value"]
+    )
+    await ns.set("t1", "a", 1)
+    await ns.set("t1", "b", 2)
+    await ns.set("t2", "a", 3)
+
+    async def loader():
+        return 0
+
+    assert await ns.get_or_load("t1", "a", loader) == 1
+
+    await ns.invalidate("t1", "a")
+    assert await cache.redis.get(ns.key("t1", "a")) is None
+
+    assert await ns.invalidate_tenant("t1") == 1
+    assert await cache.redis.get(ns.key("t1", "b")) is None
+    assert await ns.get_or_load("t2", "a", loader) == 3
+
+
+@pytest.mark.asyncio
+async def test_local_tier_serves_hits_without_redis(cache):
+    """Test repeated reads stay in process and return fresh objects."""
+    ns = cache.namespace("test_local_hits", local_max_entries=10)
+
+    async def loader():
+        return {"url": "rtsp://camera/1"}
+
+    first = await ns.get_or_load(None, "k", loader)
+    gets = cache.redis.gets
+    second = await ns.get_or_load(None, "k", loader)
+
+    assert second == first and second is not first
+    assert cache.redis.gets == gets
+    assert ns.stats()["local"]["hits"] == 1
+    await cache.close()
+
+
+@pytest.mark.asyncio
+async def test_local_tier_evicts_least_recently_used(cache):
+    """Test the local tier stays within max_entries."""
+    ns = cache.namespace("test_local_lru", local_max_entries=2)
+    for key in ("a", "b", "c"):
+        await ns.set(None, key, key)
+
+    local = ns.stats()["local"]
+    assert local["size"] == 2
+    assert local["evictions"] == 1
+    assert ns.local.get(ns.key(None, "a")) is None
+    await cache.close()
+
+
+def test_local_tier_configured_from_env(cache, monkeypatch):
+    """Test per-namespace environment overrides."""
+    monkeypatch.setenv("CACHE_TEST_ENV_LOCAL_MAX_ENTRIES", "5")
+    monkeypatch.setenv("CACHE_TEST_ENV_LOCAL_TTL", "2.5")
+
+    local = cache.namespace("test_env").stats()["local"]
+
+    assert local["max_entries"] == 5
+    assert local["ttl"] == 2.5
+
+
+@pytest.mark.asyncio
+async def test_pubsub_invalidates_other_workers():
+    """Test a write in one process drops the stale local copy in another."""
+    redis = FakeRedis()
+    worker_a = CacheService(FakeCacheConfig(redis))
+    worker_b = CacheService(FakeCacheConfig(redis))
+    ns_a = worker_a.namespace("test_pubsub", local_max_entries=10)
+    ns_b = worker_b.namespace("test_pubsub", local_max_entries=10)
+
+    async def loader():
+        return "v1"
+
+    assert await ns_a.get_or_load("t1", "k", loader) == "v1"
+    assert await ns_b.get_or_load("t1", "k", loader) == "v1"
+    await asyncio.sleep(0)
+
+    await ns_a.set("t1", "k", "v2")
+    await asyncio.sleep(0.01)
+    assert await ns_b.get_or_load("t1", "k", loader) == "v2"
+
+    await ns_b.invalidate_tenant("t1")
+    await asyncio.sleep(0.01)
+    assert ns_a.local.get(ns_a.key("t1", "k")) is None
+
+    await worker_a.close()
+    await worker_b.close()
+
+
+def test_service_without_local_tier_stays_on_redis():
+    """Test a per-request service keeps no local copies and starts no listener."""
+
+    async def request():
+        cache = CacheService(FakeCacheConfig(), local_tier=False)
+        ns = cache.namespace("test_no_local", local_max_entries=10)
+
+        async def loader():
+            return "value"
+
+        assert await ns.get_or_load(None, "k", loader) == "value"
+        assert await ns.get_or_load(None, "k", loader) == "value"
+        assert ns.local is None and cache._listener is None
+        await cache.close()
+
+    asyncio.run(request())
+    asyncio.run(request())
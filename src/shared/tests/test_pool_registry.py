@@ -0,0 +1,89 @@
+"""Tests for PoolRegistry."""
+import pytest
+from prometheus_client import REGISTRY
+
+from src.shared.infrastructure.persistence import pool_registry as module
+from src.shared.infrastructure.persistence.pool_registry import PoolConfig, PoolRegistry
+
+DSN = "postgresql://user:secret@db:5432/gtvision"
+
+
+class FakePool:
+    """Minimal stand-in for asyncpg.Pool."""
+
+    def __init__(self) -> None:
+        self.closed = False
+        self.acquired = 0
+
+    async def acquire(self, timeout=None):
+        self.acquired += 1
+        return object()
+
+    async def release(self, conn) -> None:
+        self.acquired -= 1
+
+    async def close(self) -> None:
+        self.closed = True
+
+    def get_size(self) -> int:
+        return 2
+
+    def get_idle_size(self) -> int:
+        return 2 - self.acquired
+
+    def get_max_size(self) -> int:
+        return 10
+
+
+@pytest.fixture
+def created(monkeypatch):
+    pools = []
+
+    async def create_pool(dsn, **kwargs):
+        pools.append((dsn, kwargs))
+        return FakePool()
+
+    monkeypatch.setattr(module.asyncpg, "create_pool", create_pool)
+    return pools
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_one_pool_per_dsn(created) -> None:
+    """Test repositories sharing a DSN share one pool until the last release."""
+    registry = PoolRegistry(PoolConfig(max_size=4, statement_cache_size=0))
+
+    first = await registry.get(DSN)
+    second = await registry.get(DSN)
+
+    assert first is second
+    assert len(created) == 1
+    assert created[0][1]["max_size"] == 4
+    assert created[0][1]["statement_cache_size"] == 0
+
+    await registry.release(DSN)
+    assert not first.closed
+    await registry.release(DSN)
+    assert first.closed
+    assert registry.stats() == {}
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_acquire_records_wait_time(created) -> None:
+    """Test acquisitions are observed and stats hide credentials."""
+    registry = PoolRegistry(PoolConfig())
+    pool = await registry.get(DSN)
+    labels = {"database": "db/gtvision"}
+    before = REGISTRY.get_sample_value("db_pool_acquire_seconds_count", labels) or 0
+
+    async with registry.acquire(pool, DSN):
+        assert pool.acquired == 1
+
+    assert pool.acquired == 0
+    assert REGISTRY.get_sample_value("db_pool_acquire_seconds_count", labels) == before + 1
+    assert registry.stats() == {
+        "db/gtvision": {"size": 2, "idle": 2, "max_size": 10, "references": 1}
+    }
+    await registry.close_all()
+    assert pool.closed
@@ -0,0 +1,79 @@
+"""Tests for ConsistentHashRing and WorkerMembership."""
+from collections import Counter
+
+import pytest
+
+from src.shared.infrastructure.sharding import ConsistentHashRing, WorkerMembership
+
+KEYS = [f"camera-{i}" for i in range(3000)]
+
+
+class FakeRedis:
+    """Sorted-set subset of redis.asyncio.Redis."""
+
+    def __init__(self) -> None:
+        self.zsets = {}
+
+    async def zadd(self, key, mapping) -> None:
+        self.zsets.setdefault(key, {}).update(mapping)
+
+    async def zremrangebyscore(self, key, low, high) -> None:
+        low, high = float(low), float(high)
+        zset = self.zsets.get(key, {})
+        for member in [m for m, s in zset.items() if low <= s <= high]:
+            del zset[member]
+
+    async def zrangebyscore(self, key, low, high):
+        low, high = float(low), float(high)
+        return [m.encode() for m, s in self.zsets.get(key, {}).items() if low <= s <= high]
+
+    async def zrem(self, key, member) -> None:
+        self.zsets.get(key, {}).pop(member, None)
+
+
+@pytest.mark.unit
+def test_ring_spreads_keys_evenly() -> None:
+    """Test every node gets a fair share of the keys."""
+    ring = ConsistentHashRing(["w1", "w2", "w3", "w4"])
+
+    shares = Counter(ring.node_for(key) for key in KEYS)
+
+    assert set(shares) == {"w1", "w2", "w3", "w4"}
+    assert all(600 <= count <= 900 for count in shares.values())
+
+
+@pytest.mark.unit
+def test_ring_moves_only_the_leaving_nodes_keys() -> None:
+    """Test removing a node reassigns its keys and nothing else."""
+    ring = ConsistentHashRing(["w1", "w2", "w3"])
+    before = {key: ring.node_for(key) for key in KEYS}
+
+    ring.remove("w2")
+    after = {key: ring.node_for(key) for key in KEYS}
+
+    moved = {key for key in KEYS if before[key] != after[key]}
+    assert moved == {key for key in KEYS if before[key] == "w2"}
+    assert ConsistentHashRing().node_for("camera-1") is None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_membership_expires_silent_workers(monkeypatch) -> None:
+    """Test members are the workers that heartbeated within the ttl."""
+    redis = FakeRedis()
+    clock = [1000.0]
+    monkeypatch.setattr("src.shared.infrastructure.sharding.time.time", lambda: clock[0])
+    a = WorkerMembership(redis, "thumbnails", "a", ttl=30)
+    b = WorkerMembership(redis, "thumbnails", "b", ttl=30)
+
+    await a.heartbeat()
+    await b.heartbeat()
+    assert await a.members() == ["a", "b"]
+
+    clock[0] += 20
+    await a.heartbeat()
+    clock[0] += 20
+    assert await a.members() == ["a"]
+
+    await a.leave()
+    assert await b.members() == []